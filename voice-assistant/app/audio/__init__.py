@@ -0,0 +1,15 @@
+"""Audio helpers that run locally before anything is sent to OpenAI."""
+
+from .endpointing import EndOfSpeechDetector, pcm16_to_wav
+from .normalize import NormalizedAudio, normalize_audio
+from .probe import probe_duration
+from .vad import SpeechDetector
+
+__all__ = [
+    "EndOfSpeechDetector",
+    "NormalizedAudio",
+    "SpeechDetector",
+    "normalize_audio",
+    "pcm16_to_wav",
+    "probe_duration",
+]
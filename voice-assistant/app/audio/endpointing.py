@@ -0,0 +1,135 @@
+"""Energy-based end-of-speech detection for streamed PCM microphone frames."""
+
+from __future__ import annotations
+
+import io
+import wave
+from typing import Optional
+
+import numpy as np
+
+
+class EndOfSpeechDetector:
+    """Buffer 16-bit mono PCM and report when a spoken utterance has ended.
+
+    Audio is scored in fixed frames by RMS level. Leading silence is discarded
+    (apart from a short pre-roll), and an utterance is closed once speech has
+    been heard and is followed by ``silence_ms`` of quiet, or once it reaches
+    ``max_seconds``.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        silence_ms: int = 700,
+        threshold_dbfs: float = -40.0,
+        frame_ms: int = 20,
+        min_speech_ms: int = 200,
+        pre_roll_ms: int = 200,
+        max_seconds: float = 90.0,
+    ) -> None:
+        if sample_rate <= 0:
+            raise ValueError("Sample rate must be positive.")
+
+        self.sample_rate = sample_rate
+        self._frame_bytes = max(1, sample_rate * frame_ms // 1000) * 2
+        self._silence_frames = max(1, silence_ms // frame_ms)
+        self._min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self._pre_roll_bytes = max(0, pre_roll_ms // frame_ms) * self._frame_bytes
+        self._max_bytes = int(max_seconds * sample_rate) * 2
+        # RMS threshold on int16 samples, converted from dBFS.
+        self._threshold = 32768.0 * (10.0 ** (threshold_dbfs / 20.0))
+
+        self._pending = bytearray()
+        self._utterance = bytearray()
+        self._speech_frames = 0
+        self._trailing_silence = 0
+
+    @property
+    def in_speech(self) -> bool:
+        """Whether enough speech has been heard to start an utterance."""
+
+        return self._speech_frames >= self._min_speech_frames
+
+    def feed(self, pcm: bytes) -> Optional[bytes]:
+        """Add PCM bytes; return the finished utterance when end-of-speech is detected."""
+
+        self._pending += pcm
+        usable = len(self._pending) - len(self._pending) % self._frame_bytes
+        if not usable:
+            return None
+
+        chunk = bytes(self._pending[:usable])
+        del self._pending[:usable]
+
+        samples = np.frombuffer(chunk, dtype="<i2").astype(np.float32).reshape(-1, self._frame_bytes // 2)
+        voiced = np.sqrt(np.mean(samples * samples, axis=1)) >= self._threshold
+
+        for index, is_voiced in enumerate(voiced):
+            frame = chunk[index * self._frame_bytes : (index + 1) * self._frame_bytes]
+            self._utterance += frame
+
+            if is_voiced:
+                self._speech_frames += 1
+                self._trailing_silence = 0
+            elif self._speech_frames:
+                self._trailing_silence += 1
+                if not self.in_speech and self._trailing_silence >= self._silence_frames:
+                    # A click or cough, not speech: forget it.
+                    self._speech_frames = 0
+                    self._trailing_silence = 0
+
+            if not self._speech_frames and len(self._utterance) > self._pre_roll_bytes:
+                del self._utterance[: len(self._utterance) - self._pre_roll_bytes]
+
+            if self.in_speech and (
+                self._trailing_silence >= self._silence_frames or len(self._utterance) >= self._max_bytes
+            ):
+                utterance = self._take()
+                # Anything after the closing frame starts the next utterance.
+                rest = chunk[(index + 1) * self._frame_bytes :]
+                self._pending[:0] = rest
+                return utterance
+
+        return None
+
+    def flush(self) -> Optional[bytes]:
+        """Close the current utterance on demand (e.g. push-to-talk release)."""
+
+        # Score whole frames still waiting from the previous feed first.
+        utterance = self.feed(b"")
+        if utterance is not None:
+            return utterance
+
+        self._utterance += self._pending
+        self._pending.clear()
+        if not self.in_speech:
+            self._reset()
+            return None
+        return self._take()
+
+    def _take(self) -> bytes:
+        utterance = bytes(self._utterance)
+        self._reset()
+        return utterance
+
+    def _reset(self) -> None:
+        self._utterance.clear()
+        self._speech_frames = 0
+        self._trailing_silence = 0
+
+
+def pcm16_to_wav(pcm: bytes, sample_rate: int, channels: int = 1) -> bytes:
+    """Wrap raw little-endian 16-bit PCM in a WAV container."""
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return buffer.getvalue()
+
+
+__all__ = ["EndOfSpeechDetector", "pcm16_to_wav"]
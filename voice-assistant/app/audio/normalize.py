@@ -0,0 +1,270 @@
+"""Downmix and resample uploaded clips to what Whisper actually needs.
+
+Browsers commonly record 44.1/48 kHz stereo; speech recognition only uses
+16 kHz mono. PCM WAV uploads are decoded with NumPy (no copies beyond the
+float conversion), averaged to mono, resampled with a polyphase filter and
+re-encoded as one of:
+
+* ``pcm16`` - 16-bit PCM WAV (6x smaller than 48 kHz stereo input).
+* ``mulaw`` - 8-bit G.711 mu-law WAV, half the size of ``pcm16``.
+* ``flac``  - lossless FLAC; needs the optional ``soundfile`` package and falls
+  back to ``pcm16`` without it.
+
+Leading and trailing silence can be trimmed on the way (see :mod:`.vad`).
+Compressed uploads (WebM/Opus, OGG, MP3, FLAC) are passed through untouched, as
+is anything that would not get smaller.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import struct
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from math import gcd
+from pathlib import PurePath
+from typing import Any, Optional
+
+import numpy as np
+from scipy.signal import resample_poly
+
+from .vad import SpeechDetector
+
+
+logger = logging.getLogger(__name__)
+
+ENCODINGS = ("pcm16", "mulaw", "flac")
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_MULAW = 0x0007
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+@dataclass
+class NormalizedAudio:
+    """Result of :func:`normalize_audio`; ``changed`` is False on pass-through."""
+
+    audio_bytes: bytes
+    filename: str
+    mime_type: str
+    changed: bool
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    # None when no speech check ran (detector disabled or undecodable upload).
+    speech_detected: Optional[bool] = None
+    trimmed_seconds: float = 0.0
+    decode_ms: Optional[float] = None
+
+
+def decode_wav(data: bytes) -> Optional[tuple[np.ndarray, int]]:
+    """Decode a PCM/float WAV into ``(float32 samples[frames, channels], sample_rate)``.
+
+    Returns ``None`` for anything that is not an uncompressed WAV.
+    """
+
+    fmt = _wav_format(data)
+    if fmt is None:
+        return None
+
+    view = memoryview(data)
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id = bytes(view[pos : pos + 4])
+        (chunk_size,) = struct.unpack_from("<I", data, pos + 4)
+        body = pos + 8
+        if chunk_id == b"data":
+            if chunk_size in (0, 0xFFFFFFFF) or body + chunk_size > len(data):
+                chunk_size = len(data) - body
+            samples = _pcm_to_float(view[body : body + chunk_size], *fmt)
+            if samples is None:
+                return None
+            return samples, fmt[2]
+        pos = body + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _pcm_to_float(raw: memoryview, format_tag: int, channels: int, sample_rate: int, bits: int) -> Optional[np.ndarray]:
+    if not channels or not sample_rate:
+        return None
+
+    width = bits // 8
+    usable = len(raw) - len(raw) % (width * channels)
+    raw = raw[:usable]
+    if format_tag == _WAVE_FORMAT_PCM and bits == 16:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif format_tag == _WAVE_FORMAT_PCM and bits == 8:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif format_tag == _WAVE_FORMAT_PCM and bits == 24:
+        triples = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        packed = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
+        samples = ((packed << 8) >> 8).astype(np.float32) / 8388608.0  # sign-extend 24-bit
+    elif format_tag == _WAVE_FORMAT_PCM and bits == 32:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    elif format_tag == _WAVE_FORMAT_IEEE_FLOAT and bits in (32, 64):
+        samples = np.frombuffer(raw, dtype="<f4" if bits == 32 else "<f8").astype(np.float32)
+    else:
+        return None
+    return samples.reshape(-1, channels)
+
+
+def normalize_audio(
+    data: bytes,
+    *,
+    filename: str,
+    mime_type: str,
+    sample_rate: int = 16_000,
+    encoding: str = "pcm16",
+    detector: Optional[SpeechDetector] = None,
+    reencode: bool = True,
+) -> NormalizedAudio:
+    """Downmix and resample a WAV upload to ``sample_rate`` mono and re-encode it.
+
+    With a ``detector``, leading/trailing silence is trimmed first and a clip
+    without speech comes back unchanged with ``speech_detected=False``. With
+    ``reencode=False`` only that speech check runs.
+    """
+
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unsupported normalisation encoding {encoding!r}; expected one of {ENCODINGS}.")
+
+    unchanged = NormalizedAudio(audio_bytes=data, filename=filename, mime_type=mime_type, changed=False)
+    if detector is None and encoding == "pcm16" and _wav_format(data) == (_WAVE_FORMAT_PCM, 1, sample_rate, 16):
+        return unchanged  # already what we would produce; skip the decode entirely
+
+    decode_start = time.perf_counter()
+    decoded = decode_wav(data)
+    if decoded is None:
+        return unchanged
+    unchanged.decode_ms = (time.perf_counter() - decode_start) * 1000
+
+    samples, source_rate = decoded
+    channels = samples.shape[1]
+    mono = samples[:, 0] if channels == 1 else samples.mean(axis=1, dtype=np.float32)
+
+    trimmed_seconds = 0.0
+    if detector is not None:
+        span = detector.find_speech(mono, source_rate)
+        if span is None:
+            unchanged.speech_detected = False
+            return unchanged
+        unchanged.speech_detected = True
+        start, end = span
+        trimmed_seconds = (len(mono) - (end - start)) / source_rate
+        mono = mono[start:end]
+
+    if not reencode:
+        return unchanged
+
+    if source_rate != sample_rate:
+        divisor = gcd(sample_rate, source_rate)
+        mono = resample_poly(mono, sample_rate // divisor, source_rate // divisor).astype(np.float32, copy=False)
+
+    encoded, extension, encoded_mime = _encode(mono, sample_rate, encoding)
+    if len(encoded) >= len(data):
+        return unchanged
+
+    logger.debug(
+        "Normalised audio | %s Hz x%s -> %s Hz mono %s | trimmed %.2fs | bytes %s -> %s",
+        source_rate,
+        channels,
+        sample_rate,
+        encoding,
+        trimmed_seconds,
+        len(data),
+        len(encoded),
+    )
+    return NormalizedAudio(
+        audio_bytes=encoded,
+        filename=str(PurePath(filename or "farmer-query").with_suffix(extension)),
+        mime_type=encoded_mime,
+        changed=True,
+        sample_rate=sample_rate,
+        channels=1,
+        speech_detected=unchanged.speech_detected,
+        trimmed_seconds=trimmed_seconds,
+        decode_ms=unchanged.decode_ms,
+    )
+
+
+def _wav_format(data: bytes) -> Optional[tuple[int, int, int, int]]:
+    """Return ``(format_tag, channels, sample_rate, bits)`` from a WAV ``fmt `` chunk."""
+
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    pos = 12
+    while pos + 24 <= len(data):
+        chunk_id = data[pos : pos + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, pos + 4)
+        if chunk_id == b"fmt ":
+            format_tag, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", data, pos + 8)
+            if format_tag == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                (format_tag,) = struct.unpack_from("<H", data, pos + 32)
+            return format_tag, channels, rate, bits
+        pos += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _encode(mono: np.ndarray, sample_rate: int, encoding: str) -> tuple[bytes, str, str]:
+    if encoding == "flac":
+        flac = _encode_flac(mono, sample_rate)
+        if flac is not None:
+            return flac, ".flac", "audio/flac"
+        encoding = "pcm16"
+
+    if encoding == "mulaw":
+        return _wav(_mulaw(mono).tobytes(), sample_rate, _WAVE_FORMAT_MULAW, 8), ".wav", "audio/wav"
+
+    pcm = (np.clip(mono, -1.0, 1.0) * 32767.0).astype("<i2")
+    return _wav(pcm.tobytes(), sample_rate, _WAVE_FORMAT_PCM, 16), ".wav", "audio/wav"
+
+
+def _wav(payload: bytes, sample_rate: int, format_tag: int, bits: int) -> bytes:
+    block_align = bits // 8
+    fmt = struct.pack("<HHIIHH", format_tag, 1, sample_rate, sample_rate * block_align, block_align, bits)
+    if format_tag != _WAVE_FORMAT_PCM:
+        # Non-PCM formats carry a cbSize field and a fact chunk with the frame count.
+        fmt += b"\0\0"
+        fact = b"fact" + struct.pack("<II", 4, len(payload) // block_align)
+    else:
+        fact = b""
+    pad = b"\0" if len(payload) & 1 else b""
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + fact
+    body += b"data" + struct.pack("<I", len(payload)) + payload + pad
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def _mulaw(mono: np.ndarray) -> np.ndarray:
+    """Encode float samples as G.711 mu-law bytes."""
+
+    pcm = (np.clip(mono, -1.0, 1.0) * 32635.0).astype(np.int32)
+    sign = np.where(pcm < 0, 0x80, 0)
+    magnitude = np.abs(pcm) + 0x84
+    exponent = np.floor(np.log2(magnitude)).astype(np.int32) - 7
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    return (~(sign | (exponent << 4) | mantissa) & 0xFF).astype(np.uint8)
+
+
+@lru_cache(maxsize=1)
+def _soundfile() -> Any:
+    try:
+        import soundfile
+    except ImportError:
+        logger.warning("FLAC normalisation needs the optional 'soundfile' package; using pcm16 instead.")
+        return None
+    return soundfile
+
+
+def _encode_flac(mono: np.ndarray, sample_rate: int) -> Optional[bytes]:
+    soundfile = _soundfile()
+    if soundfile is None:
+        return None
+
+    buffer = io.BytesIO()
+    soundfile.write(buffer, mono, sample_rate, format="FLAC", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+__all__ = ["ENCODINGS", "NormalizedAudio", "decode_wav", "normalize_audio"]
@@ -0,0 +1,302 @@
+"""Cheap duration probes for uploaded audio that never decode samples.
+
+Each container is handled from its headers or, where the header does not carry
+a duration, by a bounded scan of the file tail:
+
+* WAV  - ``fmt `` byte rate and ``data`` chunk size.
+* FLAC - STREAMINFO sample rate and total samples.
+* OGG  - Vorbis/Opus identification header rate and the last page's granule.
+* WebM - Segment Info ``Duration``; else the last cluster's timecode.
+* MP3  - Xing/Info or VBRI frame count; else CBR bitrate over the payload size.
+
+All probes take a seekable binary file and restore its position afterwards.
+They return ``None`` when a duration cannot be determined cheaply.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+from typing import BinaryIO, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+_HEAD_BYTES = 64 * 1024
+_TAIL_BYTES = 256 * 1024
+
+
+def probe_duration(fileobj: BinaryIO) -> Optional[float]:
+    """Return the clip duration in seconds, or ``None`` if it is unknown."""
+
+    position = fileobj.tell()
+    try:
+        fileobj.seek(0, 2)
+        size = fileobj.tell()
+        fileobj.seek(0)
+        magic = fileobj.read(12)
+        prober = _select_prober(magic)
+        if prober is None:
+            return None
+        fileobj.seek(0)
+        try:
+            return prober(fileobj, size)
+        except (struct.error, ValueError, IndexError, ZeroDivisionError):
+            logger.debug("Audio probe failed", exc_info=True)
+            return None
+    finally:
+        fileobj.seek(position)
+
+
+def _select_prober(magic: bytes) -> Optional[Callable[[BinaryIO, int], Optional[float]]]:
+    if magic[:4] == b"RIFF" and magic[8:12] == b"WAVE":
+        return _probe_wav
+    if magic[:4] == b"fLaC":
+        return _probe_flac
+    if magic[:4] == b"OggS":
+        return _probe_ogg
+    if magic[:4] == b"\x1a\x45\xdf\xa3":
+        return _probe_webm
+    if magic[:3] == b"ID3" or (len(magic) > 1 and magic[0] == 0xFF and magic[1] & 0xE0 == 0xE0):
+        return _probe_mp3
+    return None
+
+
+# --------------------------------------------------------------------------- WAV
+
+
+def _probe_wav(f: BinaryIO, size: int) -> Optional[float]:
+    f.seek(12)
+    byte_rate = 0
+    for _ in range(64):
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            return None
+        chunk_id, chunk_size = chunk[:4], int.from_bytes(chunk[4:], "little")
+        if chunk_id == b"fmt ":
+            fmt = f.read(chunk_size)
+            byte_rate = int.from_bytes(fmt[8:12], "little")
+            if chunk_size & 1:
+                f.seek(1, 1)
+        elif chunk_id == b"data":
+            data_start = f.tell()
+            # Streaming writers leave the size as 0 or 0xFFFFFFFF; trust the file length then.
+            if chunk_size in (0, 0xFFFFFFFF) or data_start + chunk_size > size:
+                chunk_size = size - data_start
+            return chunk_size / byte_rate if byte_rate else None
+        else:
+            f.seek(chunk_size + (chunk_size & 1), 1)
+    return None
+
+
+# -------------------------------------------------------------------------- FLAC
+
+
+def _probe_flac(f: BinaryIO, _size: int) -> Optional[float]:
+    header = f.read(4 + 4 + 34)
+    if header[4] & 0x7F != 0:  # first metadata block must be STREAMINFO
+        return None
+    packed = int.from_bytes(header[8 + 10 : 8 + 18], "big")
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if not sample_rate or not total_samples:
+        return None
+    return total_samples / sample_rate
+
+
+# --------------------------------------------------------------------------- OGG
+
+
+def _probe_ogg(f: BinaryIO, size: int) -> Optional[float]:
+    head = f.read(min(size, _HEAD_BYTES))
+
+    pre_skip = 0
+    vorbis = head.find(b"\x01vorbis")
+    opus = head.find(b"OpusHead")
+    if vorbis >= 0:
+        sample_rate = int.from_bytes(head[vorbis + 12 : vorbis + 16], "little")
+    elif opus >= 0:
+        sample_rate = 48_000  # Opus granule positions always count 48 kHz samples
+        pre_skip = int.from_bytes(head[opus + 10 : opus + 12], "little")
+    else:
+        return None
+
+    tail_start = max(0, size - _TAIL_BYTES)
+    f.seek(tail_start)
+    tail = f.read()
+    index = len(tail)
+    while True:
+        index = tail.rfind(b"OggS", 0, index)
+        if index < 0:
+            return None
+        (granule,) = struct.unpack_from("<q", tail, index + 6)
+        if granule >= 0:
+            return max(0, granule - pre_skip) / sample_rate
+
+
+# -------------------------------------------------------------------------- WebM
+
+_EBML_SEGMENT = 0x18538067
+_EBML_INFO = 0x1549A966
+_EBML_TIMECODE_SCALE = 0x2AD7B1
+_EBML_DURATION = 0x4489
+_EBML_CLUSTER = 0x1F43B675
+_EBML_TIMECODE = 0xE7
+_EBML_SIMPLE_BLOCK = 0xA3
+_EBML_BLOCK_GROUP = 0xA0
+_EBML_BLOCK = 0xA1
+_EBML_UNKNOWN_SIZE = -1
+
+
+def _read_vint(buf: bytes, pos: int, *, keep_marker: bool) -> tuple[int, int]:
+    """Read an EBML variable-length integer; returns (value, new_pos)."""
+
+    first = buf[pos]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 8:
+        raise ValueError("Invalid EBML vint")
+    value = first if keep_marker else first & (mask - 1)
+    all_ones = value == mask - 1
+    for byte in buf[pos + 1 : pos + length]:
+        value = (value << 8) | byte
+        all_ones = all_ones and byte == 0xFF
+    if not keep_marker and all_ones:
+        return _EBML_UNKNOWN_SIZE, pos + length
+    return value, pos + length
+
+
+def _read_element(buf: bytes, pos: int) -> tuple[int, int, int]:
+    """Return (element_id, data_size, data_start)."""
+
+    element_id, pos = _read_vint(buf, pos, keep_marker=True)
+    size, pos = _read_vint(buf, pos, keep_marker=False)
+    return element_id, size, pos
+
+
+def _probe_webm(f: BinaryIO, size: int) -> Optional[float]:
+    head = f.read(min(size, _HEAD_BYTES))
+
+    _, ebml_size, pos = _read_element(head, 0)
+    pos += ebml_size
+    segment_id, _, pos = _read_element(head, pos)
+    if segment_id != _EBML_SEGMENT:
+        return None
+
+    timecode_scale = 1_000_000
+    while pos < len(head) - 12:
+        element_id, element_size, data_start = _read_element(head, pos)
+        if element_id == _EBML_CLUSTER or element_size == _EBML_UNKNOWN_SIZE:
+            break
+        if element_id == _EBML_INFO:
+            duration = None
+            child = data_start
+            end = min(data_start + element_size, len(head))
+            while child < end:
+                child_id, child_size, child_start = _read_element(head, child)
+                raw = head[child_start : child_start + child_size]
+                if child_id == _EBML_TIMECODE_SCALE:
+                    timecode_scale = int.from_bytes(raw, "big")
+                elif child_id == _EBML_DURATION:
+                    duration = struct.unpack(">f" if child_size == 4 else ">d", raw)[0]
+                child = child_start + child_size
+            if duration:
+                return duration * timecode_scale / 1e9
+        pos = data_start + element_size
+
+    # MediaRecorder output usually has no Duration: scan the last cluster instead.
+    tail_start = max(0, size - _TAIL_BYTES)
+    f.seek(tail_start)
+    tail = f.read()
+    marker = _EBML_CLUSTER.to_bytes(4, "big")
+    index = tail.rfind(marker)
+    if index < 0:
+        return None
+
+    _, cluster_size, pos = _read_element(tail, index)
+    end = len(tail) if cluster_size == _EBML_UNKNOWN_SIZE else min(len(tail), pos + cluster_size)
+    cluster_timecode = 0
+    last_block = 0
+    while pos < end - 4:
+        element_id, element_size, data_start = _read_element(tail, pos)
+        if element_id == _EBML_TIMECODE:
+            cluster_timecode = int.from_bytes(tail[data_start : data_start + element_size], "big")
+        elif element_id in (_EBML_SIMPLE_BLOCK, _EBML_BLOCK):
+            _, track_end = _read_vint(tail, data_start, keep_marker=False)
+            (relative,) = struct.unpack_from(">h", tail, track_end)
+            last_block = max(last_block, relative)
+        elif element_id == _EBML_BLOCK_GROUP:
+            pos = data_start  # descend into the group to reach its Block
+            continue
+        if element_size == _EBML_UNKNOWN_SIZE:
+            break
+        pos = data_start + element_size
+    return (cluster_timecode + last_block) * timecode_scale / 1e9
+
+
+# --------------------------------------------------------------------------- MP3
+
+_MP3_BITRATES = {
+    # (mpeg1?, layer) -> kbps by index
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44_100, 48_000, 32_000), 2: (22_050, 24_000, 16_000), 0: (11_025, 12_000, 8_000)}
+
+
+def _probe_mp3(f: BinaryIO, size: int) -> Optional[float]:
+    base = 0
+    head = f.read(10)
+    if head[:3] == b"ID3":
+        tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+        base = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+    f.seek(base)
+    head = f.read(_HEAD_BYTES)
+
+    for frame in range(len(head) - 4):
+        if head[frame] != 0xFF or head[frame + 1] & 0xE0 != 0xE0:
+            continue
+        b1, b2, b3 = head[frame + 1], head[frame + 2], head[frame + 3]
+        version = (b1 >> 3) & 3
+        layer = 4 - ((b1 >> 1) & 3)
+        bitrate_index = b2 >> 4
+        rate_index = (b2 >> 2) & 3
+        if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+            continue
+        break
+    else:
+        return None
+
+    mpeg1 = version == 3
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    bitrate = _MP3_BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    samples_per_frame = 384 if layer == 1 else 1152 if (layer == 2 or mpeg1) else 576
+    mono = b3 >> 6 == 3
+
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    xing = frame + 4 + side_info
+    if head[xing : xing + 4] in (b"Xing", b"Info"):
+        (flags,) = struct.unpack_from(">I", head, xing + 4)
+        if flags & 1:
+            (frames,) = struct.unpack_from(">I", head, xing + 8)
+            return frames * samples_per_frame / sample_rate
+    vbri = frame + 4 + 32
+    if head[vbri : vbri + 4] == b"VBRI":
+        (frames,) = struct.unpack_from(">I", head, vbri + 14)
+        return frames * samples_per_frame / sample_rate
+
+    payload = size - base - frame
+    f.seek(max(0, size - 128))
+    if f.read(3) == b"TAG":
+        payload -= 128
+    return payload * 8 / bitrate
+
+
+__all__ = ["probe_duration"]
@@ -0,0 +1,99 @@
+"""Zero-copy access to spooled upload files.
+
+FastAPI spools uploads into a ``SpooledTemporaryFile``: a ``BytesIO`` for small
+clips, a real temporary file once it rolls over. :func:`file_view` exposes
+either as a read-only buffer (``memoryview`` or ``mmap``) so the audio can be
+inspected or decoded without first reading it into a ``bytes`` copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import mmap
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Union
+
+
+logger = logging.getLogger(__name__)
+
+Buffer = Union[bytes, memoryview, mmap.mmap]
+
+COPY_CHUNK_BYTES = 64 * 1024
+
+
+def file_size(fileobj: BinaryIO) -> int:
+    """Return the size of a seekable file without moving its position."""
+
+    position = fileobj.tell()
+    try:
+        return fileobj.seek(0, io.SEEK_END)
+    finally:
+        fileobj.seek(position)
+
+
+def spool_copy(fileobj: BinaryIO) -> tuple[str, BinaryIO]:
+    """Copy a file into an on-disk temporary file, chunk by chunk; returns its SHA-256 and the rewound copy.
+
+    For callers that outlive the upload (which FastAPI closes as soon as the
+    endpoint returns) but should not hold the clip in memory meanwhile.
+    """
+
+    digest = hashlib.sha256()
+    copy = tempfile.TemporaryFile()
+    try:
+        fileobj.seek(0)
+        while chunk := fileobj.read(COPY_CHUNK_BYTES):
+            digest.update(chunk)
+            copy.write(chunk)
+        copy.seek(0)
+    except BaseException:
+        copy.close()
+        raise
+    return digest.hexdigest(), copy
+
+
+@contextmanager
+def file_view(fileobj: BinaryIO) -> Iterator[Buffer]:
+    """Yield the whole file as a buffer, mapping it instead of copying where possible."""
+
+    # Unwrap SpooledTemporaryFile without forcing a rollover (its fileno() would).
+    inner = getattr(fileobj, "_file", fileobj)
+
+    if isinstance(inner, io.BytesIO):
+        view = inner.getbuffer()
+        try:
+            yield view
+        finally:
+            _release(view)
+        return
+
+    try:
+        mapped = mmap.mmap(inner.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        # Not backed by a real file (or empty): fall back to a plain read.
+        position = fileobj.tell()
+        fileobj.seek(0)
+        try:
+            yield fileobj.read()
+        finally:
+            fileobj.seek(position)
+        return
+
+    try:
+        yield mapped
+    finally:
+        _release(mapped)
+
+
+def _release(buffer: Union[memoryview, mmap.mmap]) -> None:
+    try:
+        buffer.release() if isinstance(buffer, memoryview) else buffer.close()
+    except BufferError:
+        # A caller still holds a NumPy view into the buffer; it is freed with that view.
+        logger.debug("Upload buffer still exported; leaving it to the garbage collector")
+
+
+__all__ = ["Buffer", "file_size", "file_view", "spool_copy"]
@@ -0,0 +1,59 @@
+"""Energy-based voice activity detection over whole clips.
+
+Used to trim leading/trailing silence from uploads and to reject clips with no
+speech before anything is sent to OpenAI. Frame energies are computed in one
+vectorised pass; the speech threshold adapts to the clip's own noise floor so
+a noisy field recording is not mistaken for continuous speech.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SpeechDetector:
+    """Locate the speech span in a mono clip.
+
+    A frame is voiced when its RMS level exceeds both ``threshold_dbfs`` and
+    the clip's noise floor (10th percentile frame level) by ``margin_db``; the
+    relative part is capped at ``peak_headroom_db`` below the loudest frame so
+    clips that are speech throughout are kept whole. Clips with fewer than
+    ``min_speech_ms`` of voiced frames are treated as silent.
+    """
+
+    threshold_dbfs: float = -45.0
+    margin_db: float = 10.0
+    peak_headroom_db: float = 20.0
+    frame_ms: int = 20
+    padding_ms: int = 250
+    min_speech_ms: int = 200
+
+    def find_speech(self, samples: np.ndarray, sample_rate: int) -> Optional[tuple[int, int]]:
+        """Return ``(start, end)`` sample indices of the speech span, or ``None`` if silent."""
+
+        frame = max(1, sample_rate * self.frame_ms // 1000)
+        count = len(samples) // frame
+        if count == 0:
+            return None
+
+        frames = samples[: count * frame].reshape(count, frame)
+        power = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame
+        level = 10.0 * np.log10(np.maximum(power, 1e-12))
+
+        noise_floor = np.percentile(level, 10)
+        relative = min(noise_floor + self.margin_db, level.max() - self.peak_headroom_db)
+        voiced = np.flatnonzero(level > max(self.threshold_dbfs, relative))
+        if len(voiced) * self.frame_ms < self.min_speech_ms:
+            return None
+
+        padding = sample_rate * self.padding_ms // 1000
+        start = max(0, int(voiced[0]) * frame - padding)
+        end = min(len(samples), (int(voiced[-1]) + 1) * frame + padding)
+        return start, end
+
+
+__all__ = ["SpeechDetector"]
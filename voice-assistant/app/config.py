@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Tuple
+from typing import Optional, Tuple
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -44,12 +44,127 @@ class Settings(BaseSettings):
         alias="TTS_FORMAT",
         description="Audio container/codec for synthesized speech.",
     )
+    max_reply_languages: int = Field(
+        3,
+        alias="MAX_REPLY_LANGUAGES",
+        description="Most reply languages one request may ask for; each adds a concurrent LLM + TTS branch.",
+    )
+
+    openai_base_url: Optional[str] = Field(
+        None,
+        alias="OPENAI_BASE_URL",
+        description="Override the OpenAI API base URL, e.g. to point at a local stand-in server.",
+    )
+    openai_request_budget_seconds: float = Field(
+        30.0,
+        alias="OPENAI_REQUEST_BUDGET_SECONDS",
+        description="Total time all OpenAI calls for one voice request may take, retries included.",
+    )
+    openai_stt_timeout_seconds: float = Field(
+        15.0,
+        alias="OPENAI_STT_TIMEOUT_SECONDS",
+        description="Cap on a single transcription attempt; clipped to the remaining request budget.",
+    )
+    openai_llm_timeout_seconds: float = Field(
+        20.0,
+        alias="OPENAI_LLM_TIMEOUT_SECONDS",
+        description="Cap on a single reply generation attempt; clipped to the remaining request budget.",
+    )
+    openai_tts_timeout_seconds: float = Field(
+        15.0,
+        alias="OPENAI_TTS_TIMEOUT_SECONDS",
+        description="Cap on a single speech synthesis attempt; clipped to the remaining request budget.",
+    )
+    openai_max_retries: int = Field(
+        2,
+        alias="OPENAI_MAX_RETRIES",
+        description="Retries after timeouts, connection errors, 408/409/429 and 5xx responses.",
+    )
+    openai_retry_base_delay_seconds: float = Field(
+        0.25,
+        alias="OPENAI_RETRY_BASE_DELAY_SECONDS",
+        description="Base of the full-jitter exponential backoff between retries.",
+    )
+    openai_retry_max_delay_seconds: float = Field(
+        2.0,
+        alias="OPENAI_RETRY_MAX_DELAY_SECONDS",
+        description="Upper bound on a single backoff delay.",
+    )
+    openai_hedge_operations: Tuple[str, ...] = Field(
+        (),
+        alias="OPENAI_HEDGE_OPERATIONS",
+        description="Operations to hedge ('transcribe', 'generate_response', 'synthesize'); empty disables hedging.",
+    )
+    openai_hedge_quantile: float = Field(
+        0.95,
+        alias="OPENAI_HEDGE_QUANTILE",
+        description="Latency quantile after which a hedged duplicate request is sent.",
+    )
+    openai_hedge_min_samples: int = Field(
+        20,
+        alias="OPENAI_HEDGE_MIN_SAMPLES",
+        description="Successful calls observed per operation before hedging starts.",
+    )
+    openai_single_flight_operations: Tuple[str, ...] = Field(
+        ("generate_response", "synthesize"),
+        alias="OPENAI_SINGLE_FLIGHT_OPERATIONS",
+        description="Operations whose identical in-flight calls share one upstream call; empty disables sharing.",
+    )
+    llm_empty_reply_fallback: str = Field(
+        "sequential",
+        alias="LLM_EMPTY_REPLY_FALLBACK",
+        description="When the Responses API replies empty: 'sequential', 'race', 'remember' or 'none'.",
+    )
+    llm_fallback_memory_seconds: float = Field(
+        600.0,
+        alias="LLM_FALLBACK_MEMORY_SECONDS",
+        description="How long 'remember' sends a model straight to chat.completions.",
+    )
+
+    openai_max_connections: int = Field(
+        100,
+        alias="OPENAI_MAX_CONNECTIONS",
+        description="Connection limit of each OpenAI client pool; further requests queue for a free connection.",
+    )
+    openai_max_keepalive_connections: int = Field(
+        20,
+        alias="OPENAI_MAX_KEEPALIVE_CONNECTIONS",
+        description="Idle connections kept open for reuse.",
+    )
+    openai_keepalive_expiry_seconds: float = Field(
+        30.0,
+        alias="OPENAI_KEEPALIVE_EXPIRY_SECONDS",
+        description="How long an idle pooled connection is kept before closing.",
+    )
+    openai_http2: bool = Field(
+        False,
+        alias="OPENAI_HTTP2",
+        description="Multiplex requests over HTTP/2 connections (needs the 'h2' package).",
+    )
+    openai_warmup_connections: int = Field(
+        4,
+        alias="OPENAI_WARMUP_CONNECTIONS",
+        description="Connections opened at startup so the first requests skip the TLS handshake; 0 disables.",
+    )
+    openai_warmup_timeout_seconds: float = Field(
+        5.0,
+        alias="OPENAI_WARMUP_TIMEOUT_SECONDS",
+        description="Upper bound on how long startup waits for the connection warmup.",
+    )
 
     max_audio_seconds: int = Field(
         90,
         alias="MAX_AUDIO_SECONDS",
         description="Hard cap on incoming audio duration (seconds).",
     )
+    max_audio_bytes_per_second: int = Field(
+        384_000,
+        alias="MAX_AUDIO_BYTES_PER_SECOND",
+        description=(
+            "Upper bound on plausible upload byte rate (48 kHz stereo 32-bit PCM). "
+            "Uploads larger than MAX_AUDIO_SECONDS at this rate are rejected while still streaming."
+        ),
+    )
     allowed_audio_mime_types: Tuple[str, ...] = Field(
         (
             "audio/wav",
@@ -63,6 +178,264 @@ class Settings(BaseSettings):
         alias="ALLOWED_AUDIO_MIME_TYPES",
         description="Accepted MIME types for uploaded farmer audio clips.",
     )
+    batch_max_clips: int = Field(
+        50,
+        alias="BATCH_MAX_CLIPS",
+        description="Most clips accepted by one /v1/voice-interact/batch upload.",
+    )
+    batch_concurrency: int = Field(
+        4,
+        alias="BATCH_CONCURRENCY",
+        description="Clips of one batch run through the graph at the same time.",
+    )
+
+    job_store_backend: str = Field(
+        "memory",
+        alias="JOB_STORE_BACKEND",
+        description="Where /v1/voice-interact/jobs records live: 'memory' or 'sqlite'.",
+    )
+    job_store_path: str = Field(
+        ".cache/jobs.sqlite3",
+        alias="JOB_STORE_PATH",
+        description="Database file used by the sqlite job store.",
+    )
+    job_workers: int = Field(
+        4,
+        alias="JOB_WORKERS",
+        description="Jobs run through the graph at the same time.",
+    )
+    job_queue_max: int = Field(
+        100,
+        alias="JOB_QUEUE_MAX",
+        description="Jobs allowed to wait for a worker; further submissions get 503 with Retry-After.",
+    )
+    job_result_ttl_seconds: float = Field(
+        3600.0,
+        alias="JOB_RESULT_TTL_SECONDS",
+        description="How long finished jobs and their results are kept for fetching.",
+    )
+    job_max_wait_seconds: float = Field(
+        30.0,
+        alias="JOB_MAX_WAIT_SECONDS",
+        description="Upper bound on the ?wait= long-poll of GET /v1/voice-interact/jobs/{job_id}.",
+    )
+
+    memory_max_sessions: int = Field(
+        50_000,
+        alias="MEMORY_MAX_SESSIONS",
+        description="Conversation histories kept (least recently used evicted first); 0 disables memory.",
+    )
+    memory_turns: int = Field(
+        3,
+        alias="MEMORY_TURNS",
+        description="Recent question/answer turns kept verbatim per session; older ones are summarised.",
+    )
+    memory_turn_chars: int = Field(
+        240,
+        alias="MEMORY_TURN_CHARS",
+        description="Each remembered question and answer is clipped to this many characters.",
+    )
+    memory_summary_chars: int = Field(
+        180,
+        alias="MEMORY_SUMMARY_CHARS",
+        description="Length cap of the rolling summary of older questions.",
+    )
+    memory_ttl_seconds: float = Field(
+        1800.0,
+        alias="MEMORY_TTL_SECONDS",
+        description="Idle time after which a session's history is forgotten.",
+    )
+    memory_context_tokens: int = Field(
+        400,
+        alias="MEMORY_CONTEXT_TOKENS",
+        description="Estimated token budget for the history injected into the LLM prompt.",
+    )
+
+    grounding_enabled: bool = Field(
+        True,
+        alias="GROUNDING_ENABLED",
+        description="Answer or ground price and weather questions from the local market index.",
+    )
+    grounding_snapshot_path: str = Field(
+        ".cache/market_snapshot.json",
+        alias="GROUNDING_SNAPSHOT_PATH",
+        description="JSON snapshot of the backend's market items, prices and weather the index is built from.",
+    )
+    grounding_backend_url: Optional[str] = Field(
+        None,
+        alias="GROUNDING_BACKEND_URL",
+        description="Backend base URL to pull fresh snapshots from; unset only re-reads the snapshot file.",
+    )
+    grounding_refresh_seconds: float = Field(
+        900.0,
+        alias="GROUNDING_REFRESH_SECONDS",
+        description="Interval of the background index refresh.",
+    )
+    grounding_max_age_days: int = Field(
+        3,
+        alias="GROUNDING_MAX_AGE_DAYS",
+        description="Prices older than this are passed to the LLM with their date instead of answered directly.",
+    )
+
+    intent_router_enabled: bool = Field(
+        True,
+        alias="INTENT_ROUTER_ENABLED",
+        description=(
+            "Route greetings, thanks, goodbyes, 'say that again' and plain price/weather questions to templated"
+            " replies without the LLM."
+        ),
+    )
+    intent_classifier_path: Optional[str] = Field(
+        None,
+        alias="INTENT_CLASSIFIER_PATH",
+        description="JSONL of labelled transcripts ({'text', 'intent'}) to train the fallback intent classifier on.",
+    )
+    intent_classifier_threshold: float = Field(
+        0.9,
+        alias="INTENT_CLASSIFIER_THRESHOLD",
+        description="Minimum classifier probability for routing a transcript the keyword tables did not match.",
+    )
+
+    audio_normalize: bool = Field(
+        True,
+        alias="AUDIO_NORMALIZE",
+        description="Downmix and resample WAV uploads before transcription.",
+    )
+    audio_normalize_sample_rate: int = Field(
+        16_000,
+        alias="AUDIO_NORMALIZE_SAMPLE_RATE",
+        description="Target sample rate for normalised uploads; Whisper works at 16 kHz.",
+    )
+    audio_normalize_encoding: str = Field(
+        "pcm16",
+        alias="AUDIO_NORMALIZE_ENCODING",
+        description="Codec for normalised uploads: 'pcm16', 'mulaw', or 'flac' (needs soundfile).",
+    )
+
+    vad_enabled: bool = Field(
+        True,
+        alias="VAD_ENABLED",
+        description="Trim silence from WAV uploads and skip OpenAI entirely for clips without speech.",
+    )
+    vad_threshold_dbfs: float = Field(
+        -45.0,
+        alias="VAD_THRESHOLD_DBFS",
+        description="Minimum frame RMS level (dBFS) that can count as speech.",
+    )
+    vad_padding_ms: int = Field(
+        250,
+        alias="VAD_PADDING_MS",
+        description="Audio kept either side of the detected speech span.",
+    )
+    vad_min_speech_ms: int = Field(
+        200,
+        alias="VAD_MIN_SPEECH_MS",
+        description="Clips with less voiced audio than this are treated as silent.",
+    )
+
+    session_sample_rate: int = Field(
+        16_000,
+        alias="SESSION_SAMPLE_RATE",
+        description="Sample rate of the 16-bit mono PCM frames streamed over /v1/voice-session.",
+    )
+    session_silence_ms: int = Field(
+        700,
+        alias="SESSION_SILENCE_MS",
+        description="Trailing silence (ms) that marks the end of a spoken turn in a voice session.",
+    )
+    session_threshold_dbfs: float = Field(
+        -40.0,
+        alias="SESSION_THRESHOLD_DBFS",
+        description="Frame RMS level (dBFS) above which session audio counts as speech.",
+    )
+
+    response_cache_backend: str = Field(
+        "memory",
+        alias="RESPONSE_CACHE_BACKEND",
+        description="Reply/audio cache backend: 'memory', 'disk', or 'none' to disable.",
+    )
+    response_cache_ttl_seconds: float = Field(
+        600.0,
+        alias="RESPONSE_CACHE_TTL_SECONDS",
+        description="How long a cached reply and its audio stay valid.",
+    )
+    response_cache_max_bytes: int = Field(
+        64 * 1024 * 1024,
+        alias="RESPONSE_CACHE_MAX_BYTES",
+        description="Size cap for cached replies and audio; least recently used entries are evicted first.",
+    )
+    response_cache_dir: str = Field(
+        ".cache/responses",
+        alias="RESPONSE_CACHE_DIR",
+        description="Directory used by the disk cache backend.",
+    )
+
+    semantic_cache_enabled: bool = Field(
+        False,
+        alias="SEMANTIC_CACHE_ENABLED",
+        description="Reuse LLM replies for differently worded versions of an earlier question.",
+    )
+    semantic_cache_embedder: str = Field(
+        "hashing",
+        alias="SEMANTIC_CACHE_EMBEDDER",
+        description="'hashing' (local character n-gram vectors) or 'openai' (the embeddings endpoint).",
+    )
+    semantic_cache_embedding_model: str = Field(
+        "text-embedding-3-small",
+        alias="SEMANTIC_CACHE_EMBEDDING_MODEL",
+        description="Embeddings model used when SEMANTIC_CACHE_EMBEDDER=openai.",
+    )
+    semantic_cache_dimensions: int = Field(
+        256,
+        alias="SEMANTIC_CACHE_DIMENSIONS",
+        description="Vector size; each cached question costs 4 bytes per dimension.",
+    )
+    semantic_cache_threshold: float = Field(
+        0.9,
+        alias="SEMANTIC_CACHE_THRESHOLD",
+        description="Minimum cosine similarity for reusing a cached reply.",
+    )
+    semantic_cache_max_entries: int = Field(
+        100_000,
+        alias="SEMANTIC_CACHE_MAX_ENTRIES",
+        description="Questions kept per language and model; the oldest are overwritten first.",
+    )
+    semantic_cache_ttl_seconds: float = Field(
+        3600.0,
+        alias="SEMANTIC_CACHE_TTL_SECONDS",
+        description="How long a reply can be reused for similar questions.",
+    )
+    semantic_cache_approximate_threshold: int = Field(
+        50_000,
+        alias="SEMANTIC_CACHE_APPROXIMATE_THRESHOLD",
+        description="Entries at which search switches from brute force to a clustered (IVF) index; 0 never does.",
+    )
+    semantic_cache_clusters: int = Field(
+        256,
+        alias="SEMANTIC_CACHE_CLUSTERS",
+        description="Clusters of the approximate index.",
+    )
+    semantic_cache_probes: int = Field(
+        8,
+        alias="SEMANTIC_CACHE_PROBES",
+        description="Clusters searched per lookup in the approximate index.",
+    )
+
+    tts_store_dir: str = Field(
+        ".cache/tts",
+        alias="TTS_STORE_DIR",
+        description="Directory of the content-addressed TTS clip store; empty disables it.",
+    )
+    tts_store_max_bytes: int = Field(
+        256 * 1024 * 1024,
+        alias="TTS_STORE_MAX_BYTES",
+        description="Size cap for stored TTS clips; pinned phrases are never evicted.",
+    )
+    tts_prewarm_phrases: Tuple[str, ...] = Field(
+        (),
+        alias="TTS_PREWARM_PHRASES",
+        description="Extra canned answers to synthesise and pin at startup, in the default language.",
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -71,6 +444,19 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @property
+    def max_upload_bytes(self) -> int:
+        """Largest request body accepted for a single voice clip."""
+
+        # Leave headroom for multipart framing and container headers.
+        return self.max_audio_seconds * self.max_audio_bytes_per_second + 64 * 1024
+
+    @property
+    def max_batch_upload_bytes(self) -> int:
+        """Largest request body accepted for a batch of voice clips."""
+
+        return self.batch_max_clips * self.max_upload_bytes
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
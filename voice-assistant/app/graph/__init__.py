@@ -1,7 +1,8 @@
 """Graph module exposes the LangGraph workflow for voice interactions."""
 
 from .voice_graph import invoke_voice_graph, run_voice_graph
+from .voice_stream import stream_voice_reply
 
-__all__ = ["invoke_voice_graph", "run_voice_graph"]
+__all__ = ["invoke_voice_graph", "run_voice_graph", "stream_voice_reply"]
 
 
@@ -3,27 +3,76 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import Optional, TypedDict
+import operator
+import time
+from contextlib import nullcontext
+from typing import Annotated, Any, BinaryIO, ContextManager, Optional, TypedDict, Union
 
 from langgraph.graph import END, StateGraph
 
+try:
+    from langgraph.types import Send
+except ImportError:  # pragma: no cover - langgraph < 0.2
+    from langgraph.constants import Send
+
+from ..audio.normalize import normalize_audio
+from ..audio.upload import Buffer, file_view
+from ..audio.vad import SpeechDetector
 from ..config import get_settings
+from ..metrics import STAGE_SECONDS
+from ..services.cache import get_response_cache
+from ..services.grounding import ToolResult, get_market_data
+from ..services.intents import MARKET, REPEAT, REPLIES, SMALL_TALK, get_intent_router, language_code
+from ..services.resilience import request_budget
+from ..services.semantic_cache import Vector, get_semantic_cache
+from ..services.session_memory import get_session_memory
 from ..services.openai_client import (
     LLMResult,
+    OpenAIError,
     SpeechResult,
     TranscriptionResult,
+    get_async_openai_service,
     get_openai_service,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Canned replies used when a stage produces nothing. They are pre-synthesised
+# at startup (see ``FALLBACK_PHRASES``) so these paths never hit the network.
+UNHEARD_REPLY = "معذرت، مجھے آپ کی آواز واضح طور پر سنائی نہیں دی۔ براہ کرم دوبارہ بولیں۔"
+NO_REPLY_UR = "معذرت، اس وقت جواب تیار نہیں ہو سکا۔"
+NO_REPLY_EN = "Sorry, I could not prepare a reply."
+FALLBACK_PHRASES: tuple[tuple[str, str], ...] = (
+    (UNHEARD_REPLY, "ur"),
+    (NO_REPLY_UR, "ur"),
+    (NO_REPLY_EN, "en"),
+)
+
+
+class ReplyVariant(TypedDict, total=False):
+    """The reply and its speech in one of several requested languages."""
+
+    language: str
+    response_text: str
+    tts_audio: bytes
+    llm_model: str
+    tts_model: str
+    tts_voice: str
+    tts_format: str
+    reply_cached: bool
+    audio_cached: bool
+    stage_ms: dict[str, float]
+
 
 class VoiceGraphState(TypedDict, total=False):
     """Mutable state carried through the LangGraph workflow."""
 
     audio_bytes: bytes
+    # Seekable upload streamed to STT in place of ``audio_bytes`` (which wins if both are set).
+    audio_file: BinaryIO
     audio_filename: str
     audio_mime_type: str
     language: str
@@ -36,6 +85,133 @@ class VoiceGraphState(TypedDict, total=False):
     tts_model: str
     tts_voice: str
     tts_format: str
+    reply_cached: bool
+    audio_cached: bool
+    speech_detected: bool
+    # Milliseconds spent per stage in this request (graph nodes plus audio decode).
+    stage_ms: dict[str, float]
+    # Reply languages; when set, the LLM and TTS stages fan out into a
+    # concurrent branch per language and the first one fills the fields above.
+    target_languages: list[str]
+    # Appended by each branch as it finishes; see ``reply_variants`` for request order.
+    variants: Annotated[list[ReplyVariant], operator.add]
+    # Client conversation ID; earlier turns of the session are sent to the LLM as context.
+    session_id: str
+    # Set by ``route_intent``: a small-talk intent, "market" for a plain price/weather question, absent for the LLM.
+    intent: str
+    # Templated replies (small talk) or what the market price / weather index knows about
+    # the question; ``tool_answered`` means the reply came from one and the LLM was skipped.
+    tool_result: ToolResult
+    tool_answered: bool
+
+
+def _normalize(state: VoiceGraphState) -> VoiceGraphState:
+    """Trim silence and downmix/resample the upload to 16 kHz mono before Whisper.
+
+    Clips in which the VAD finds no speech get an empty transcript here, and
+    the graph skips straight to the fallback reply without calling OpenAI.
+    """
+
+    settings = get_settings()
+    if not (settings.audio_normalize or settings.vad_enabled):
+        return {}
+
+    detector = None
+    if settings.vad_enabled:
+        detector = SpeechDetector(
+            threshold_dbfs=settings.vad_threshold_dbfs,
+            padding_ms=settings.vad_padding_ms,
+            min_speech_ms=settings.vad_min_speech_ms,
+        )
+    with _audio_buffer(state) as audio:
+        source_bytes = len(audio)
+        normalized = normalize_audio(
+            audio,
+            filename=state.get("audio_filename", "farmer-query.wav"),
+            mime_type=state.get("audio_mime_type") or "audio/wav",
+            sample_rate=settings.audio_normalize_sample_rate,
+            encoding=settings.audio_normalize_encoding,
+            detector=detector,
+            reencode=settings.audio_normalize,
+        )
+
+    timings: VoiceGraphState = {}
+    if normalized.decode_ms is not None:
+        STAGE_SECONDS.observe(normalized.decode_ms / 1000, stage="decode")
+        timings["stage_ms"] = {"decode": normalized.decode_ms}
+
+    if normalized.speech_detected is False:
+        logger.info("No speech detected in upload | bytes=%s", source_bytes)
+        return {
+            **timings,
+            "speech_detected": False,
+            "transcript": "",
+            "confidence": 0.0,
+            "language": state.get("language") or settings.default_language,
+        }
+    if not normalized.changed:
+        return timings
+
+    logger.info(
+        "Normalised upload | bytes %s -> %s (%s Hz mono %s) trimmed=%.2fs",
+        source_bytes,
+        len(normalized.audio_bytes),
+        normalized.sample_rate,
+        settings.audio_normalize_encoding,
+        normalized.trimmed_seconds,
+    )
+    return {
+        **timings,
+        "audio_bytes": normalized.audio_bytes,
+        "audio_filename": normalized.filename,
+        "audio_mime_type": normalized.mime_type,
+    }
+
+
+def _audio_buffer(state: VoiceGraphState) -> ContextManager[Buffer]:
+    """View the clip as a buffer: the bytes themselves, or the spooled upload mapped without a copy."""
+
+    if "audio_bytes" in state:
+        return nullcontext(state["audio_bytes"])
+    return file_view(state["audio_file"])
+
+
+async def _anormalize(state: VoiceGraphState) -> VoiceGraphState:
+    """Run :func:`_normalize` off the event loop; decoding and resampling are CPU-bound."""
+
+    settings = get_settings()
+    if not (settings.audio_normalize or settings.vad_enabled):
+        return {}
+    return await asyncio.to_thread(_normalize, state)
+
+
+def _after_normalize(state: VoiceGraphState) -> Union[str, list[Send]]:
+    if state.get("speech_detected") is False:
+        return _after_transcribe(state)
+    return "transcribe"
+
+
+def _after_route(state: VoiceGraphState) -> Union[str, list[Send]]:
+    if state.get("tool_answered"):
+        return "synthesize"
+    if _wants_tools(state):
+        return "lookup_tools"
+    return _after_transcribe(state)
+
+
+def _after_tools(state: VoiceGraphState) -> Union[str, list[Send]]:
+    if state.get("tool_answered"):
+        return "synthesize"
+    return _after_transcribe(state)
+
+
+def _after_transcribe(state: VoiceGraphState) -> Union[str, list[Send]]:
+    """Go on to the single reply, or fan out one ``reply_variant`` branch per target language."""
+
+    languages = state.get("target_languages")
+    if not languages:
+        return "generate_response"
+    return [Send("reply_variant", {**state, "language": language}) for language in languages]
 
 
 def _transcribe(state: VoiceGraphState) -> VoiceGraphState:
@@ -46,12 +222,33 @@ def _transcribe(state: VoiceGraphState) -> VoiceGraphState:
 
     service = get_openai_service()
     transcription: TranscriptionResult = service.transcribe_audio(
-        audio_bytes=state["audio_bytes"],
+        audio_bytes=state.get("audio_bytes"),
+        audio_file=None if "audio_bytes" in state else state.get("audio_file"),
         filename=state.get("audio_filename", "farmer-query.wav"),
         language=language,
         mime_type=state.get("audio_mime_type"),
     )
+    return _transcription_update(transcription, language)
 
+
+async def _atranscribe(state: VoiceGraphState) -> VoiceGraphState:
+    """Async twin of :func:`_transcribe` backed by ``AsyncOpenAI``."""
+
+    settings = get_settings()
+    language = state.get("language") or settings.default_language
+
+    service = get_async_openai_service()
+    transcription: TranscriptionResult = await service.transcribe_audio(
+        audio_bytes=state.get("audio_bytes"),
+        audio_file=None if "audio_bytes" in state else state.get("audio_file"),
+        filename=state.get("audio_filename", "farmer-query.wav"),
+        language=language,
+        mime_type=state.get("audio_mime_type"),
+    )
+    return _transcription_update(transcription, language)
+
+
+def _transcription_update(transcription: TranscriptionResult, language: str) -> VoiceGraphState:
     transcript = transcription.text or ""
     logger.info(
         "Transcribed audio | language=%s text_len=%s confidence=%s",
@@ -68,6 +265,200 @@ def _transcribe(state: VoiceGraphState) -> VoiceGraphState:
     }
 
 
+def _empty_transcript_update() -> VoiceGraphState:
+    settings = get_settings()
+    logger.warning("Transcript empty | sending fallback response")
+    return {
+        "response_text": UNHEARD_REPLY,
+        "llm_model": settings.llm_model,
+        "reply_cached": False,
+    }
+
+
+def _reply_cache_lookup(transcript: str, language: str, model: str) -> tuple[Optional[str], Optional[VoiceGraphState]]:
+    """Return the reply cache key and, on a hit, the node update to use instead of the LLM."""
+
+    cache = get_response_cache()
+    if cache is None:
+        return None, None
+
+    key = cache.reply_key(transcript=transcript, language=language, model=model)
+    hit = cache.get_reply(key)
+    if hit is None:
+        return key, None
+
+    text, cached_model = hit
+    logger.info("LLM response served from cache | model=%s language=%s text_len=%s", cached_model, language, len(text))
+    return key, {
+        "response_text": text,
+        "llm_model": cached_model,
+        "language": language,
+        "reply_cached": True,
+    }
+
+
+def _reply_cache_store(key: Optional[str], llm_result: LLMResult) -> None:
+    cache = get_response_cache()
+    if cache is not None and key is not None:
+        cache.set_reply(key, llm_result.text or "", llm_result.model)
+
+
+async def _off_loop(fn: Any, *args: Any) -> Any:
+    """Call a response cache helper, in a worker thread when the cache lives on disk."""
+
+    cache = get_response_cache()
+    if cache is not None and cache.blocking:
+        return await asyncio.to_thread(fn, *args)
+    return fn(*args)
+
+
+def _semantic_cache_hit(
+    vector: Optional[Vector], transcript: str, language: str, model: str, cache_key: Optional[str]
+) -> Optional[VoiceGraphState]:
+    """Node update reusing the reply to a near-identical earlier question, if there is one."""
+
+    cache = get_semantic_cache()
+    if cache is None or vector is None:
+        return None
+    hit = cache.lookup(vector, transcript=transcript, language=language, model=model)
+    if hit is None:
+        return None
+    logger.info("LLM response served from the semantic cache | similarity=%.3f language=%s", hit.similarity, language)
+    # This exact wording is now a known question too.
+    _reply_cache_store(cache_key, LLMResult(text=hit.text, model=hit.model))
+    return {
+        "response_text": hit.text,
+        "llm_model": hit.model,
+        "language": language,
+        "reply_cached": True,
+    }
+
+
+def _semantic_cache_store(vector: Optional[Vector], transcript: str, language: str, llm_result: LLMResult) -> None:
+    cache = get_semantic_cache()
+    if cache is not None and vector is not None:
+        text = llm_result.text or ""
+        cache.store(vector, transcript=transcript, language=language, model=llm_result.model, text=text)
+
+
+def _route_intent(state: VoiceGraphState) -> VoiceGraphState:
+    """Router node: answer small talk from templates; flag price and weather questions for the index."""
+
+    router = get_intent_router()
+    transcript = state.get("transcript", "").strip()
+    if router is None or not transcript:
+        return {}
+    intent = router.route(transcript).intent
+    if intent is None:
+        return {}
+    update: VoiceGraphState = {"intent": intent}
+    if intent in SMALL_TALK:
+        result = ToolResult(intent, "", _small_talk_answers(intent, state))
+        update["tool_result"] = result
+        update.update(_direct_answer(state, result))
+    return update
+
+
+def _small_talk_answers(intent: str, state: VoiceGraphState) -> dict[str, str]:
+    if intent == REPEAT:
+        session_id = state.get("session_id")
+        memory = get_session_memory()
+        previous = memory.last_reply(session_id) if session_id and memory is not None else None
+        if previous:
+            # Repeated as it was said, whatever language that was.
+            return {language_code(state.get("language") or get_settings().default_language): previous}
+    return REPLIES[intent]
+
+
+def _wants_tools(state: VoiceGraphState) -> bool:
+    """Whether the index should see the question: anything but small talk.
+
+    Only questions routed as ``market`` may be answered from it; the rest may
+    still mention a price or the weather and are grounded in its figures.
+    """
+
+    return state.get("intent") not in SMALL_TALK
+
+
+def _lookup_tools(state: VoiceGraphState) -> VoiceGraphState:
+    """Tool node: look the question up in the local market price and weather index.
+
+    For a question the router flagged as ``market``, a hit the index can
+    answer in the request language becomes the reply outright; fan-out
+    branches pick their own language's answer later. Other questions only
+    get the figures as LLM context.
+    """
+
+    data = get_market_data()
+    transcript = state.get("transcript", "").strip()
+    if data is None or not transcript:
+        return {}
+    result = data.lookup(transcript, answer=state.get("intent") == MARKET)
+    if result is None:
+        return {}
+    update: VoiceGraphState = {"tool_result": result}
+    update.update(_direct_answer(state, result))
+    return update
+
+
+def _direct_answer(state: VoiceGraphState, result: ToolResult) -> VoiceGraphState:
+    """The ready answer in the request language; fan-out branches pick their own later."""
+
+    if state.get("target_languages"):
+        return {}
+    return _tool_answer_update(result, state.get("language", get_settings().default_language)) or {}
+
+
+def _tool_answer_update(result: ToolResult, language: str) -> Optional[VoiceGraphState]:
+    answer = result.answers.get(language_code(language))
+    if answer is None:
+        return None
+    logger.info("Answered without the LLM | tool=%s language=%s", result.tool, language)
+    return {
+        "response_text": answer,
+        "language": language,
+        "reply_cached": False,
+        "tool_answered": True,
+    }
+
+
+def _reply_context(state: VoiceGraphState) -> Optional[str]:
+    """LLM context: index facts when the question hit a tool, plus the session history."""
+
+    tool_result = state.get("tool_result")
+    if tool_result is not None and tool_result.facts and tool_result.answers:
+        # The figures settle the question; the LLM only has to phrase them in another language.
+        return f"Answer only from these figures:\n{tool_result.facts}"
+    history = _conversation_context(state)
+    if tool_result is not None and tool_result.facts:
+        return f"Reference data:\n{tool_result.facts}" + (f"\n\n{history}" if history else "")
+    return history
+
+
+def _conversation_context(state: VoiceGraphState) -> Optional[str]:
+    session_id = state.get("session_id")
+    memory = get_session_memory()
+    if not session_id or memory is None:
+        return None
+    return memory.context(session_id, get_settings().memory_context_tokens)
+
+
+def remember_turn(state: VoiceGraphState) -> None:
+    """Add a finished exchange to its session's history, if the request named a session.
+
+    Small talk is left out so it does not push real questions out of the window.
+    """
+
+    if state.get("intent") in SMALL_TALK:
+        return
+    session_id = state.get("session_id")
+    memory = get_session_memory()
+    transcript = state.get("transcript", "").strip()
+    response_text = state.get("response_text", "").strip()
+    if session_id and memory is not None and transcript and response_text:
+        memory.record(session_id, transcript, response_text)
+
+
 def _generate_response(state: VoiceGraphState) -> VoiceGraphState:
     """Ask GPT to craft a contextual reply."""
 
@@ -78,19 +469,82 @@ def _generate_response(state: VoiceGraphState) -> VoiceGraphState:
     language = state.get("language", settings.default_language)
 
     if not transcript:
-        logger.warning("Transcript empty | sending fallback response")
-        fallback = "معذرت، مجھے آپ کی آواز واضح طور پر سنائی نہیں دی۔ براہ کرم دوبارہ بولیں۔"
-        return {
-            "response_text": fallback,
-            "llm_model": settings.llm_model,
-        }
+        return _empty_transcript_update()
+
+    tool_result = state.get("tool_result")
+    answered = _tool_answer_update(tool_result, language) if tool_result is not None else None
+    if answered is not None:
+        return answered
+
+    context = _reply_context(state)
+    # Follow-ups and grounded replies depend on their context, so only context-free questions are cached.
+    cache_key, cached = (None, None) if context else _reply_cache_lookup(transcript, language, settings.llm_model)
+    if cached is not None:
+        return cached
+    semantic = get_semantic_cache()
+    vector = semantic.embedder.embed(transcript) if semantic is not None and not context else None
+    cached = _semantic_cache_hit(vector, transcript, language, settings.llm_model, cache_key)
+    if cached is not None:
+        return cached
 
     llm_result: LLMResult = service.generate_response(
         transcript=transcript,
         language=language,
+        context=context,
         model=settings.llm_model,
     )
+    _reply_cache_store(cache_key, llm_result)
+    _semantic_cache_store(vector, transcript, language, llm_result)
+    return _response_update(llm_result, language)
+
 
+async def _agenerate_response(state: VoiceGraphState) -> VoiceGraphState:
+    """Async twin of :func:`_generate_response`."""
+
+    settings = get_settings()
+    service = get_async_openai_service()
+
+    transcript = state.get("transcript", "").strip()
+    language = state.get("language", settings.default_language)
+
+    if not transcript:
+        return _empty_transcript_update()
+
+    tool_result = state.get("tool_result")
+    answered = _tool_answer_update(tool_result, language) if tool_result is not None else None
+    if answered is not None:
+        return answered
+
+    context = _reply_context(state)
+    # Follow-ups and grounded replies depend on their context, so only context-free questions are cached.
+    cache_key, cached = (
+        (None, None) if context else await _off_loop(_reply_cache_lookup, transcript, language, settings.llm_model)
+    )
+    if cached is not None:
+        return cached
+    semantic = get_semantic_cache()
+    vector = await semantic.embedder.aembed(transcript) if semantic is not None and not context else None
+    if vector is not None:
+        # The similarity search (and, on store, the index's k-means training) is NumPy work.
+        cached = await asyncio.to_thread(
+            _semantic_cache_hit, vector, transcript, language, settings.llm_model, cache_key
+        )
+        if cached is not None:
+            return cached
+
+    llm_result: LLMResult = await service.generate_response(
+        transcript=transcript,
+        language=language,
+        context=context,
+        model=settings.llm_model,
+    )
+    await _off_loop(_reply_cache_store, cache_key, llm_result)
+    if vector is not None:
+        await asyncio.to_thread(_semantic_cache_store, vector, transcript, language, llm_result)
+    return _response_update(llm_result, language)
+
+
+def _response_update(llm_result: LLMResult, language: str) -> VoiceGraphState:
     response_text = llm_result.text or ""
     logger.info(
         "LLM response | model=%s language=%s text_len=%s",
@@ -103,21 +557,34 @@ def _generate_response(state: VoiceGraphState) -> VoiceGraphState:
         "response_text": response_text,
         "llm_model": llm_result.model,
         "language": language,
+        "reply_cached": False,
     }
 
 
+def _speech_text(state: VoiceGraphState, language: str) -> str:
+    response_text = state.get("response_text", "").strip()
+    if not response_text:
+        logger.warning("Response text empty; sending fallback audio message.")
+        response_text = _no_reply_text(language)
+    return response_text
+
+
+def _no_reply_text(language: str) -> str:
+    return NO_REPLY_UR if language.startswith("ur") else NO_REPLY_EN
+
+
 def _synthesize(state: VoiceGraphState) -> VoiceGraphState:
     """Generate TTS audio from the assistant's reply."""
 
     settings = get_settings()
     service = get_openai_service()
 
-    response_text = state.get("response_text", "").strip()
     language = state.get("language", settings.default_language)
+    response_text = _speech_text(state, language)
 
-    if not response_text:
-        logger.warning("Response text empty; sending fallback audio message.")
-        response_text = "معذرت، اس وقت جواب تیار نہیں ہو سکا۔" if language.startswith("ur") else "Sorry, I could not prepare a reply."
+    cache_key, cached = _audio_cache_lookup(state, response_text, language)
+    if cached is not None:
+        return cached
 
     speech: SpeechResult = service.synthesize_speech(
         text=response_text,
@@ -126,7 +593,74 @@ def _synthesize(state: VoiceGraphState) -> VoiceGraphState:
         audio_format=settings.tts_format,
         model=settings.tts_model,
     )
+    _audio_cache_store(cache_key, speech)
+    return _speech_update(speech, language)
+
+
+async def _asynthesize(state: VoiceGraphState) -> VoiceGraphState:
+    """Async twin of :func:`_synthesize`."""
+
+    settings = get_settings()
+    service = get_async_openai_service()
+
+    language = state.get("language", settings.default_language)
+    response_text = _speech_text(state, language)
+
+    cache_key, cached = await _off_loop(_audio_cache_lookup, state, response_text, language)
+    if cached is not None:
+        return cached
+
+    speech: SpeechResult = await service.synthesize_speech(
+        text=response_text,
+        language=language,
+        voice=settings.tts_voice,
+        audio_format=settings.tts_format,
+        model=settings.tts_model,
+    )
+    await _off_loop(_audio_cache_store, cache_key, speech)
+    return _speech_update(speech, language)
+
+
+def _audio_cache_lookup(
+    state: VoiceGraphState, response_text: str, language: str
+) -> tuple[Optional[str], Optional[VoiceGraphState]]:
+    """Return the audio cache key and, on a hit, the node update to use instead of TTS."""
+
+    cache = get_response_cache()
+    if cache is None:
+        return None, None
+
+    settings = get_settings()
+    key = cache.audio_key(
+        transcript=state.get("transcript", ""),
+        response_text=response_text,
+        language=language,
+        model=settings.tts_model,
+        voice=settings.tts_voice,
+        audio_format=settings.tts_format,
+    )
+    audio = cache.get_audio(key)
+    if audio is None:
+        return key, None
+
+    logger.info("Synthesised speech served from cache | format=%s bytes=%s", settings.tts_format, len(audio))
+    return key, {
+        "tts_audio": audio,
+        "tts_model": settings.tts_model,
+        "tts_voice": settings.tts_voice,
+        "tts_format": settings.tts_format,
+        "language": language,
+        "audio_cached": True,
+    }
+
+
+def _audio_cache_store(key: Optional[str], speech: SpeechResult) -> None:
+    cache = get_response_cache()
+    if cache is not None and key is not None:
+        cache.set_audio(key, speech.audio_bytes)
 
+
+def _speech_update(speech: SpeechResult, language: str) -> VoiceGraphState:
     logger.info(
         "Synthesised speech | model=%s voice=%s format=%s bytes=%s",
         speech.model,
@@ -141,38 +675,186 @@ def _synthesize(state: VoiceGraphState) -> VoiceGraphState:
         "tts_voice": speech.voice,
         "tts_format": speech.format,
         "language": language,
+        "audio_cached": False,
     }
 
 
-# Build the LangGraph workflow once at import time.
-_graph = StateGraph(VoiceGraphState)
-_graph.add_node("transcribe", _transcribe)
-_graph.add_node("generate_response", _generate_response)
-_graph.add_node("synthesize", _synthesize)
+def _variant(reply: VoiceGraphState, speech: VoiceGraphState, stage_ms: dict[str, float]) -> VoiceGraphState:
+    merged = {**reply, **speech}
+    variant: ReplyVariant = {key: merged[key] for key in ReplyVariant.__annotations__ if key in merged}  # type: ignore[misc]
+    variant["stage_ms"] = stage_ms
+    # Branches only append to ``variants``; concurrent writes to any other key would conflict.
+    return {"variants": [variant]}
+
+
+def _reply_variant(state: VoiceGraphState) -> VoiceGraphState:
+    """One fan-out branch: reply and speech in ``state["language"]``."""
+
+    start = time.perf_counter()
+    reply = _generate_response(state)
+    replied = time.perf_counter()
+    speech = _synthesize({**state, **reply})
+    return _variant(reply, speech, _branch_timings(start, replied, time.perf_counter()))
+
+
+async def _areply_variant(state: VoiceGraphState) -> VoiceGraphState:
+    """Async twin of :func:`_reply_variant`."""
+
+    start = time.perf_counter()
+    reply = await _agenerate_response(state)
+    replied = time.perf_counter()
+    speech = await _asynthesize({**state, **reply})
+    return _variant(reply, speech, _branch_timings(start, replied, time.perf_counter()))
+
+
+def _branch_timings(start: float, replied: float, done: float) -> dict[str, float]:
+    STAGE_SECONDS.observe(replied - start, stage="generate_response")
+    STAGE_SECONDS.observe(done - replied, stage="synthesize")
+    return {"generate_response": (replied - start) * 1000, "synthesize": (done - replied) * 1000}
+
+
+def reply_variants(state: VoiceGraphState) -> list[ReplyVariant]:
+    """The fan-out replies in the order their languages were requested."""
+
+    order = {language: index for index, language in enumerate(state.get("target_languages") or [])}
+    return sorted(state.get("variants") or [], key=lambda variant: order.get(variant.get("language", ""), len(order)))
+
+
+def _collect_variants(state: VoiceGraphState) -> VoiceGraphState:
+    """Join the fan-out: the first requested language becomes the primary reply.
+
+    Stage times are the slowest branch's, which is what the request waited for.
+    """
+
+    variants = reply_variants(state)
+    primary = {key: value for key, value in variants[0].items() if key != "stage_ms"}
+    stage_ms = dict(state.get("stage_ms", {}))
+    for stage in ("generate_response", "synthesize"):
+        stage_ms[stage] = max(variant.get("stage_ms", {}).get(stage, 0.0) for variant in variants)
+    return {**primary, "stage_ms": stage_ms}  # type: ignore[misc]
+
+
+def _timed(stage: str, node: Any) -> Any:
+    """Wrap a sync or async node so its duration lands in the stage histogram and ``stage_ms``."""
 
-_graph.set_entry_point("transcribe")
-_graph.add_edge("transcribe", "generate_response")
-_graph.add_edge("generate_response", "synthesize")
-_graph.add_edge("synthesize", END)
+    def _with_timing(state: VoiceGraphState, update: VoiceGraphState, start: float) -> VoiceGraphState:
+        elapsed = time.perf_counter() - start
+        STAGE_SECONDS.observe(elapsed, stage=stage)
+        stage_ms = {**state.get("stage_ms", {}), **update.get("stage_ms", {}), stage: elapsed * 1000}
+        return {**update, "stage_ms": stage_ms}
 
-_VOICE_WORKFLOW = _graph.compile()
+    if asyncio.iscoroutinefunction(node):
+
+        @functools.wraps(node)
+        async def _async_node(state: VoiceGraphState) -> VoiceGraphState:
+            start = time.perf_counter()
+            return _with_timing(state, await node(state), start)
+
+        return _async_node
+
+    @functools.wraps(node)
+    def _node(state: VoiceGraphState) -> VoiceGraphState:
+        start = time.perf_counter()
+        return _with_timing(state, node(state), start)
+
+    return _node
+
+
+def _build_workflow(
+    normalize: Any, transcribe: Any, generate_response: Any, synthesize: Any, reply_variant: Any
+) -> Any:
+    graph = StateGraph(VoiceGraphState)
+    graph.add_node("normalize", _timed("normalize", normalize))
+    graph.add_node("transcribe", _timed("transcribe", transcribe))
+    # Routing and index lookups are in-memory and microseconds long, so one sync node each serves both graphs.
+    graph.add_node("route_intent", _timed("route_intent", _route_intent))
+    graph.add_node("lookup_tools", _timed("lookup_tools", _lookup_tools))
+    graph.add_node("generate_response", _timed("generate_response", generate_response))
+    graph.add_node("synthesize", _timed("synthesize", synthesize))
+    # Branches run concurrently (tasks under ``ainvoke``, threads under ``invoke``) and time themselves.
+    graph.add_node("reply_variant", reply_variant)
+    graph.add_node("collect_variants", _collect_variants)
+
+    graph.set_entry_point("normalize")
+    graph.add_conditional_edges(
+        "normalize",
+        _after_normalize,
+        ["transcribe", "generate_response", "reply_variant"],
+    )
+    graph.add_edge("transcribe", "route_intent")
+    graph.add_conditional_edges(
+        "route_intent",
+        _after_route,
+        ["lookup_tools", "generate_response", "synthesize", "reply_variant"],
+    )
+    graph.add_conditional_edges("lookup_tools", _after_tools, ["generate_response", "synthesize", "reply_variant"])
+    graph.add_edge("generate_response", "synthesize")
+    graph.add_edge("synthesize", END)
+    graph.add_edge("reply_variant", "collect_variants")
+    graph.add_edge("collect_variants", END)
+
+    return graph.compile()
+
+
+# Build the LangGraph workflows once at import time. The sync graph serves
+# thread-pool callers; the async graph is what the API awaits via ``ainvoke``.
+_VOICE_WORKFLOW = _build_workflow(_normalize, _transcribe, _generate_response, _synthesize, _reply_variant)
+_ASYNC_VOICE_WORKFLOW = _build_workflow(
+    _anormalize, _atranscribe, _agenerate_response, _asynthesize, _areply_variant
+)
+
+
+async def warm_fallback_speech() -> int:
+    """Pre-synthesise and pin the fallback replies and configured canned answers.
+
+    Returns how many phrases are ready. Failures are logged and skipped so a
+    cold or offline start never blocks the service.
+    """
+
+    settings = get_settings()
+    service = get_async_openai_service()
+    phrases = [*FALLBACK_PHRASES, *((text, settings.default_language) for text in settings.tts_prewarm_phrases)]
+
+    ready = 0
+    for text, language in phrases:
+        try:
+            await service.warm_speech(text=text, language=language)
+        except OpenAIError as exc:  # pragma: no cover - network path only
+            logger.warning("Could not pre-warm speech for %r: %s", text[:40], exc)
+            continue
+        ready += 1
+
+    logger.info("Pre-warmed fallback speech | ready=%s total=%s", ready, len(phrases))
+    return ready
 
 
 def invoke_voice_graph(initial_state: VoiceGraphState) -> VoiceGraphState:
-    """Run the workflow synchronously."""
+    """Run the workflow synchronously; all OpenAI calls share one request budget."""
 
-    result = _VOICE_WORKFLOW.invoke(initial_state)
+    with request_budget():
+        result = _VOICE_WORKFLOW.invoke(initial_state)
     merged: VoiceGraphState = {**initial_state, **result}
+    remember_turn(merged)
     return merged
 
 
 async def run_voice_graph(initial_state: VoiceGraphState) -> VoiceGraphState:
-    """Run the workflow without blocking the event loop."""
-
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, invoke_voice_graph, initial_state)
+    """Run the async workflow on the event loop without borrowing a worker thread."""
 
-
-__all__ = ["VoiceGraphState", "invoke_voice_graph", "run_voice_graph"]
+    with request_budget():
+        result = await _ASYNC_VOICE_WORKFLOW.ainvoke(initial_state)
+    merged: VoiceGraphState = {**initial_state, **result}
+    remember_turn(merged)
+    return merged
 
 
+__all__ = [
+    "FALLBACK_PHRASES",
+    "ReplyVariant",
+    "VoiceGraphState",
+    "invoke_voice_graph",
+    "remember_turn",
+    "reply_variants",
+    "run_voice_graph",
+    "warm_fallback_speech",
+]
@@ -0,0 +1,220 @@
+"""Sentence-pipelined variant of the voice loop for streaming responses.
+
+Normalisation and transcription run exactly as in the LangGraph workflow. The reply is then
+streamed from the LLM, cut at sentence boundaries, and each sentence is handed
+to TTS while the next one is still being generated. Audio is emitted strictly
+in sentence order so the client can play chunks back to back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional
+
+from ..config import get_settings
+from ..metrics import STAGE_SECONDS
+from ..services.openai_client import SpeechResult, get_async_openai_service
+from ..services.resilience import request_budget
+from .voice_graph import (
+    UNHEARD_REPLY,
+    VoiceGraphState,
+    _anormalize,
+    _atranscribe,
+    _lookup_tools,
+    _no_reply_text,
+    _reply_context,
+    _route_intent,
+    _timed,
+    _wants_tools,
+    remember_turn,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Latin, Urdu (U+06D4) and Arabic (U+061F) sentence terminators, plus newlines.
+_SENTENCE_END = re.compile(r"[.!?۔؟]+[\"')\]]*\s+|\n+")
+
+
+class SentenceChunker:
+    """Incrementally split streamed text into complete sentences.
+
+    A terminator only closes a sentence once the following whitespace has
+    arrived, so decimals such as ``2.5`` are never cut mid-number.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+
+    def feed(self, delta: str) -> list[str]:
+        """Add a text delta and return any sentences it completed."""
+
+        self._buffer += delta
+        sentences: list[str] = []
+        start = 0
+        for match in _SENTENCE_END.finditer(self._buffer):
+            sentence = self._buffer[start : match.end()].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> Optional[str]:
+        """Return the trailing partial sentence, if any."""
+
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        return remainder or None
+
+
+@dataclass
+class VoiceStreamEvent:
+    """One event emitted by :func:`stream_voice_reply`."""
+
+    event: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+async def stream_voice_reply(initial_state: VoiceGraphState) -> AsyncIterator[VoiceStreamEvent]:
+    """Run the voice loop, yielding transcript, text and audio events as they are ready.
+
+    Events, in order: one ``transcript``; then per sentence a ``text`` event as
+    soon as it is complete and an ``audio`` event once its speech is ready;
+    finally one ``done`` carrying the merged state (without audio bytes). All
+    OpenAI calls share one request budget.
+    """
+
+    with request_budget():
+        async for event in _stream_voice_reply(initial_state):
+            yield event
+
+
+async def _stream_voice_reply(initial_state: VoiceGraphState) -> AsyncIterator[VoiceStreamEvent]:
+    settings = get_settings()
+    service = get_async_openai_service()
+
+    state: VoiceGraphState = {**initial_state}
+    state.update(await _timed("normalize", _anormalize)(state))
+    if state.get("speech_detected") is not False:
+        state.update(await _timed("transcribe", _atranscribe)(state))
+        state.update(_timed("route_intent", _route_intent)(state))
+        if not state.get("tool_answered") and _wants_tools(state):
+            state.update(_timed("lookup_tools", _lookup_tools)(state))
+
+    yield VoiceStreamEvent(
+        "transcript",
+        {"transcript": state.get("transcript", ""), "language": state.get("language")},
+    )
+
+    language = state.get("language") or settings.default_language
+    transcript = state.get("transcript", "").strip()
+    state["llm_model"] = settings.llm_model
+
+    pending: asyncio.Queue[Optional[tuple[int, str, asyncio.Task[SpeechResult]]]] = asyncio.Queue()
+    # Summed across sentences; LLM streaming and per-sentence TTS overlap in time.
+    stage_ms = {**state.get("stage_ms", {}), "generate_response": 0.0, "synthesize": 0.0}
+
+    async def _speak(sentence: str) -> SpeechResult:
+        start = time.perf_counter()
+        try:
+            return await service.synthesize_speech(
+                text=sentence,
+                language=language,
+                voice=settings.tts_voice,
+                audio_format=settings.tts_format,
+                model=settings.tts_model,
+            )
+        finally:
+            elapsed = time.perf_counter() - start
+            STAGE_SECONDS.observe(elapsed, stage="synthesize")
+            stage_ms["synthesize"] += elapsed * 1000
+
+    def _start_tts(index: int, sentence: str) -> None:
+        pending.put_nowait((index, sentence, asyncio.create_task(_speak(sentence))))
+
+    async def _produce_sentences() -> None:
+        index = 0
+        start = time.perf_counter()
+        try:
+            if not transcript:
+                _start_tts(index, UNHEARD_REPLY)
+                return
+            if state.get("tool_answered"):
+                _start_tts(index, state["response_text"])
+                return
+
+            chunker = SentenceChunker()
+            async for delta in service.stream_response(
+                transcript=transcript,
+                language=language,
+                context=_reply_context(state),
+                model=settings.llm_model,
+            ):
+                for sentence in chunker.feed(delta):
+                    _start_tts(index, sentence)
+                    index += 1
+
+            tail = chunker.flush()
+            if tail:
+                _start_tts(index, tail)
+                index += 1
+
+            elapsed = time.perf_counter() - start
+            STAGE_SECONDS.observe(elapsed, stage="generate_response")
+            stage_ms["generate_response"] = elapsed * 1000
+
+            if index == 0:
+                logger.warning("Streamed reply empty; sending fallback audio message.")
+                _start_tts(index, _no_reply_text(language))
+        finally:
+            pending.put_nowait(None)
+
+    producer = asyncio.create_task(_produce_sentences())
+    sentences: list[str] = []
+    try:
+        while True:
+            item = await pending.get()
+            if item is None:
+                break
+            index, sentence, task = item
+            sentences.append(sentence)
+            yield VoiceStreamEvent("text", {"index": index, "text": sentence})
+
+            speech = await task
+            state.update(
+                {
+                    "tts_model": speech.model,
+                    "tts_voice": speech.voice,
+                    "tts_format": speech.format,
+                }
+            )
+            logger.info("Streamed speech chunk | index=%s bytes=%s", index, len(speech.audio_bytes))
+            yield VoiceStreamEvent(
+                "audio",
+                {"index": index, "audio_bytes": speech.audio_bytes, "format": speech.format},
+            )
+
+        # Surface producer failures (e.g. OpenAIError) to the caller.
+        await producer
+    finally:
+        if not producer.done():
+            producer.cancel()
+        while not pending.empty():
+            item = pending.get_nowait()
+            if item is not None:
+                item[2].cancel()
+
+    state["response_text"] = " ".join(sentences)
+    state["language"] = language
+    state["stage_ms"] = stage_ms
+    remember_turn(state)
+    state.pop("audio_bytes", None)
+    yield VoiceStreamEvent("done", dict(state))
+
+
+__all__ = ["SentenceChunker", "VoiceStreamEvent", "stream_voice_reply"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
 
@@ -9,7 +10,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_settings
-from .routes import router as voice_router
+from .graph.voice_graph import warm_fallback_speech
+from .middleware import MetricsMiddleware, UploadSizeLimitMiddleware
+from .negotiation import EXPOSED_HEADERS
+from .routes import BATCH_PATH, router as voice_router
+from .services.grounding import refresh_market_data_forever
+from .services.jobs import get_job_queue
+from .services.openai_client import get_async_openai_service
 
 
 logger = logging.getLogger(__name__)
@@ -47,8 +54,17 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=list(EXPOSED_HEADERS),
     )
 
+    app.add_middleware(
+        UploadSizeLimitMiddleware,
+        max_bytes=settings.max_upload_bytes,
+        path_limits={BATCH_PATH: settings.max_batch_upload_bytes},
+    )
+    # Outermost, so rejected uploads and CORS failures are counted too.
+    app.add_middleware(MetricsMiddleware, endpoints=tuple(route.path for route in voice_router.routes))
+
     app.include_router(voice_router)
 
     @app.on_event("startup")
@@ -59,6 +75,28 @@ def create_app() -> FastAPI:
             settings.stt_model,
             settings.tts_model,
         )
+        if settings.openai_warmup_connections:
+            # Awaited (and time-boxed) so the first farmer requests find open connections.
+            warmed = await get_async_openai_service().warm_connections(
+                settings.openai_warmup_connections, timeout=settings.openai_warmup_timeout_seconds
+            )
+            logger.info("Warmed OpenAI connections | ready=%s requested=%s", warmed, settings.openai_warmup_connections)
+        # Pin fallback speech in the background so an offline start does not delay boot.
+        app.state.speech_warmup = asyncio.create_task(warm_fallback_speech())
+        if settings.grounding_enabled:
+            app.state.market_refresh = asyncio.create_task(refresh_market_data_forever())
+
+    @app.on_event("shutdown")
+    async def _shutdown() -> None:
+        tasks = [getattr(app.state, name, None) for name in ("speech_warmup", "market_refresh")]
+        tasks = [task for task in tasks if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Only close a queue this process actually opened; the next app gets a fresh one.
+        if get_job_queue.cache_info().currsize:
+            get_job_queue().close()
+            get_job_queue.cache_clear()
 
     return app
 
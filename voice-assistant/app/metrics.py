@@ -0,0 +1,361 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+A deliberately small registry (counters, gauges, histograms with labels) so
+the service does not need ``prometheus_client``. All metric objects are
+thread-safe: the sync graph runs nodes on worker threads.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Iterator, Optional, Sequence
+
+
+LabelValues = tuple[str, ...]
+
+# Seconds; spans sub-millisecond local stages up to slow upstream calls.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _label_text(self, values: LabelValues, extra: Optional[tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, values))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> list[str]:  # pragma: no cover - overridden
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing total."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._label_text(key)} {_number(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, such as requests in flight."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    @contextmanager
+    def track(self, **labels: str) -> Iterator[None]:
+        """Increment for the duration of the block."""
+
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._label_text(key)} {_number(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram with sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last)], sum, count.
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, totals = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0, 0.0]))
+            counts[index] += 1
+            totals[0] += value
+            totals[1] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock duration of the block in seconds."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return int(series[1][1]) if series else 0
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), list(totals))) for key, (counts, totals) in self._series.items())
+        lines = []
+        for key, (counts, (total, count)) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == math.inf else _number(bound)
+                lines.append(f"{self.name}_bucket{self._label_text(key, ('le', le))} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_number(total)}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {int(count)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "voice_stage_duration_seconds",
+    "Time spent per pipeline stage (graph nodes, audio decode, response serialisation).",
+    ["stage"],
+)
+REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "voice_requests_in_flight",
+    "HTTP requests and WebSocket sessions currently being handled.",
+    ["endpoint"],
+)
+REQUESTS_TOTAL = REGISTRY.counter(
+    "voice_requests_total",
+    "Completed HTTP requests by endpoint and status code.",
+    ["endpoint", "status"],
+)
+UPLOAD_BYTES = REGISTRY.counter(
+    "voice_upload_bytes_total",
+    "Bytes of farmer audio accepted for processing.",
+    ["endpoint"],
+)
+REPLY_BYTES = REGISTRY.counter(
+    "voice_reply_bytes_total",
+    "Response body bytes sent, by reply encoding.",
+    ["mode"],
+)
+BATCH_CLIPS = REGISTRY.counter(
+    "voice_batch_clips_total",
+    "Clips received by the batch endpoint: processed, duplicate (served from another clip's run) or rejected.",
+    ["result"],
+)
+JOBS_QUEUED = REGISTRY.gauge(
+    "voice_jobs_queued",
+    "Background jobs waiting for a worker.",
+)
+JOBS_RUNNING = REGISTRY.gauge(
+    "voice_jobs_running",
+    "Background jobs currently running through the graph.",
+)
+JOBS_TOTAL = REGISTRY.counter(
+    "voice_jobs_total",
+    "Background jobs by outcome: succeeded, failed, cancelled, or rejected because the queue was full.",
+    ["status"],
+)
+JOB_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "voice_job_queue_wait_seconds",
+    "Time a background job waited in the queue before a worker picked it up.",
+    buckets=(0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+TOOL_LOOKUPS = REGISTRY.counter(
+    "voice_tool_lookups_total",
+    "Market price and weather index lookups: answered without the LLM, grounded the LLM, or missed.",
+    ["tool", "result"],
+)
+INTENT_ROUTES = REGISTRY.counter(
+    "voice_intent_routes_total",
+    "Transcripts by routed intent ('none' goes to the LLM) and what matched them.",
+    ["intent", "source"],
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "voice_cache_lookups_total",
+    "Reply/audio cache and TTS clip store lookups by result.",
+    ["cache", "result"],
+)
+UPSTREAM_EVENTS = REGISTRY.counter(
+    "voice_openai_events_total",
+    "OpenAI call retries, hedges, hedges that won, exhausted request budgets, and calls coalesced in flight.",
+    ["operation", "event"],
+)
+LLM_REPLY_PATHS = REGISTRY.counter(
+    "voice_llm_reply_path_total",
+    "Which API produced each LLM reply, per model; 'empty' when none did.",
+    ["model", "path"],
+)
+OPENAI_POOL_IN_FLIGHT = REGISTRY.gauge(
+    "voice_openai_pool_requests_in_flight",
+    "Requests holding or waiting for an OpenAI client pool connection.",
+    ["client"],
+)
+OPENAI_POOL_MAX_CONNECTIONS = REGISTRY.gauge(
+    "voice_openai_pool_max_connections",
+    "Configured connection limit of each OpenAI client pool.",
+    ["client"],
+)
+OPENAI_POOL_WAIT_SECONDS = REGISTRY.histogram(
+    "voice_openai_pool_wait_seconds",
+    "Time a request waited for a pooled connection before connecting or sending.",
+    ["client"],
+)
+OPENAI_CONNECTIONS_OPENED = REGISTRY.counter(
+    "voice_openai_connections_opened_total",
+    "New TCP connections opened to the OpenAI API (each a fresh TLS handshake).",
+    ["client"],
+)
+ERRORS = REGISTRY.counter(
+    "voice_errors_total",
+    "Errors by type: exception class names and HTTP error statuses.",
+    ["type"],
+)
+
+
+def record_error(kind: str) -> None:
+    ERRORS.inc(type=kind)
+
+
+__all__ = [
+    "BATCH_CLIPS",
+    "CACHE_LOOKUPS",
+    "CONTENT_TYPE",
+    "Counter",
+    "ERRORS",
+    "Gauge",
+    "Histogram",
+    "INTENT_ROUTES",
+    "JOBS_QUEUED",
+    "JOBS_RUNNING",
+    "JOBS_TOTAL",
+    "JOB_QUEUE_WAIT_SECONDS",
+    "LLM_REPLY_PATHS",
+    "MetricsRegistry",
+    "OPENAI_CONNECTIONS_OPENED",
+    "OPENAI_POOL_IN_FLIGHT",
+    "OPENAI_POOL_MAX_CONNECTIONS",
+    "OPENAI_POOL_WAIT_SECONDS",
+    "REGISTRY",
+    "REPLY_BYTES",
+    "REQUESTS_IN_FLIGHT",
+    "REQUESTS_TOTAL",
+    "STAGE_SECONDS",
+    "TOOL_LOOKUPS",
+    "UPLOAD_BYTES",
+    "UPSTREAM_EVENTS",
+    "record_error",
+]
@@ -0,0 +1,107 @@
+"""ASGI middleware shared by the voice assistant routes."""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Mapping, MutableMapping, Optional
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+
+from .metrics import REQUESTS_IN_FLIGHT, REQUESTS_TOTAL, record_error
+
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class UploadSizeLimitMiddleware:
+    """Reject oversized voice uploads before the body is fully received.
+
+    A declared ``Content-Length`` over the limit is answered with 413 without
+    reading the body at all. Chunked uploads are counted as they stream in and
+    aborted with 413 as soon as they cross the limit. ``path_limits`` gives
+    exact paths (such as the batch endpoint) their own limit.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        *,
+        max_bytes: int,
+        path_prefixes: tuple[str, ...] = ("/v1/voice-interact",),
+        path_limits: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_prefixes = path_prefixes
+        self.path_limits = dict(path_limits or {})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        max_bytes = self.path_limits.get(scope["path"], self.max_bytes)
+        detail = f"Audio upload exceeds the {max_bytes} byte limit."
+        for name, value in scope.get("headers", ()):
+            if name == b"content-length" and value.isdigit() and int(value) > max_bytes:
+                response = JSONResponse({"detail": detail}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def _limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+            return message
+
+        await self.app(scope, _limited_receive, send)
+
+
+class MetricsMiddleware:
+    """Track in-flight requests/sessions, completed requests by status, and errors.
+
+    Endpoints outside ``endpoints`` share the ``other`` label so arbitrary
+    paths cannot blow up label cardinality. Error responses are counted as
+    ``http_<status>``; exceptions escaping the app by class name.
+    """
+
+    def __init__(self, app: Any, *, endpoints: tuple[str, ...]) -> None:
+        self.app = app
+        self.endpoints = frozenset(endpoints)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        endpoint = scope["path"] if scope["path"] in self.endpoints else "other"
+        status_code = 500
+
+        async def _send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with REQUESTS_IN_FLIGHT.track(endpoint=endpoint):
+            try:
+                await self.app(scope, receive, _send)
+            except Exception as exc:
+                record_error(type(exc).__name__)
+                raise
+            finally:
+                if scope["type"] == "http":
+                    REQUESTS_TOTAL.inc(endpoint=endpoint, status=str(status_code))
+                    if status_code >= 400:
+                        record_error(f"http_{status_code}")
+
+
+__all__ = ["MetricsMiddleware", "UploadSizeLimitMiddleware"]
@@ -0,0 +1,153 @@
+"""Content negotiation for voice replies: JSON, raw audio, or multipart/mixed."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Iterator, Literal, Optional, Sequence
+from urllib.parse import quote
+
+from fastapi.responses import Response, StreamingResponse
+
+from .schemas import VoiceInteractionResponse
+
+
+ResponseMode = Literal["json", "audio", "multipart"]
+
+# Maps OpenAI TTS ``response_format`` values to MIME types.
+AUDIO_MEDIA_TYPES = {
+    "mp3": "audio/mpeg",
+    "wav": "audio/wav",
+    "opus": "audio/ogg",
+    "aac": "audio/aac",
+    "flac": "audio/flac",
+    "pcm": "audio/pcm",
+}
+
+#: Response headers carrying the non-audio fields in ``audio/*`` mode.
+TRANSCRIPT_HEADER = "X-Transcript"
+RESPONSE_TEXT_HEADER = "X-Response-Text"
+LANGUAGE_HEADER = "X-Language"
+METADATA_HEADER = "X-Voice-Metadata"
+EXPOSED_HEADERS = (TRANSCRIPT_HEADER, RESPONSE_TEXT_HEADER, LANGUAGE_HEADER, METADATA_HEADER)
+
+
+def audio_media_type(audio_format: str) -> str:
+    """Return the MIME type for a TTS output format."""
+
+    return AUDIO_MEDIA_TYPES.get(audio_format.lower(), f"audio/{audio_format.lower()}")
+
+
+def preferred_response_mode(accept: Optional[str]) -> ResponseMode:
+    """Pick the response encoding from an ``Accept`` header.
+
+    Media ranges are ranked by their ``q`` value (ties keep header order). JSON
+    is the default whenever nothing more specific is asked for.
+    """
+
+    if not accept:
+        return "json"
+
+    ranked: list[tuple[float, int, str]] = []
+    for position, part in enumerate(accept.split(",")):
+        media_range, *params = (piece.strip() for piece in part.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_range and quality > 0:
+            ranked.append((-quality, position, media_range.lower()))
+
+    for _, _, media_range in sorted(ranked):
+        if media_range.startswith("audio/"):
+            return "audio"
+        if media_range == "multipart/mixed":
+            return "multipart"
+        if media_range in {"application/json", "application/*", "*/*"}:
+            return "json"
+
+    return "json"
+
+
+def audio_response(body: VoiceInteractionResponse, audio: Optional[bytes], audio_format: str) -> Response:
+    """Return the TTS clip as the raw body with the text fields in headers.
+
+    Header values are percent-encoded UTF-8 because HTTP headers are latin-1
+    only and transcripts are usually Urdu.
+    """
+
+    headers = {
+        LANGUAGE_HEADER: body.language,
+        TRANSCRIPT_HEADER: quote(body.transcript, safe=""),
+        RESPONSE_TEXT_HEADER: quote(body.response_text, safe=""),
+        METADATA_HEADER: body.metadata.model_dump_json(),
+    }
+    if not audio:
+        return Response(status_code=204, headers=headers)
+    return Response(content=audio, media_type=audio_media_type(audio_format), headers=headers)
+
+
+def multipart_response(
+    body: VoiceInteractionResponse,
+    audio: Optional[bytes],
+    audio_format: str,
+    variant_audio: Sequence[tuple[str, bytes]] = (),
+) -> Response:
+    """Return a ``multipart/mixed`` body: the JSON payload, then the binary clip.
+
+    Clips of additional reply languages (``variant_audio``) follow as further
+    parts labelled with ``Content-Language``. The parts are streamed as
+    separate chunks so the audio buffers are written to the socket as-is
+    instead of being concatenated into a new body.
+    """
+
+    boundary = uuid.uuid4().hex
+    json_part = body.model_dump_json(exclude={"audio_base64"}).encode("utf-8")
+    head = (
+        f"--{boundary}\r\nContent-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(json_part)}\r\n\r\n"
+    ).encode("ascii") + json_part + b"\r\n"
+
+    chunks: list[bytes] = [head]
+    if audio:
+        chunks.append(
+            (
+                f"--{boundary}\r\nContent-Type: {audio_media_type(audio_format)}\r\n"
+                f"Content-Length: {len(audio)}\r\n\r\n"
+            ).encode("ascii")
+        )
+        chunks.append(audio)
+        chunks.append(b"\r\n")
+    for language, clip in variant_audio:
+        chunks.append(
+            (
+                f"--{boundary}\r\nContent-Type: {audio_media_type(audio_format)}\r\n"
+                f"Content-Language: {language}\r\nContent-Length: {len(clip)}\r\n\r\n"
+            ).encode("ascii")
+        )
+        chunks.append(clip)
+        chunks.append(b"\r\n")
+    chunks.append(f"--{boundary}--\r\n".encode("ascii"))
+
+    def _iter_chunks() -> Iterator[bytes]:
+        yield from chunks
+
+    return StreamingResponse(
+        _iter_chunks(),
+        media_type=f"multipart/mixed; boundary={boundary}",
+        headers={"Content-Length": str(sum(len(chunk) for chunk in chunks))},
+    )
+
+
+__all__ = [
+    "AUDIO_MEDIA_TYPES",
+    "EXPOSED_HEADERS",
+    "ResponseMode",
+    "audio_media_type",
+    "audio_response",
+    "multipart_response",
+    "preferred_response_mode",
+]
@@ -2,23 +2,74 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import json
 import logging
+import re
 import time
-from typing import Optional
+import uuid
+from typing import Any, AsyncIterator, BinaryIO, Callable, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import Response, StreamingResponse
+from openai import APITimeoutError
 
+from .audio.endpointing import EndOfSpeechDetector, pcm16_to_wav
+from .audio.probe import probe_duration
+from .audio.upload import file_size, spool_copy
 from .config import Settings, get_settings
-from .graph.voice_graph import run_voice_graph
-from .schemas import HealthResponse, VoiceInteractionError, VoiceInteractionMetadata, VoiceInteractionResponse
+from .graph.voice_graph import ReplyVariant, VoiceGraphState, invoke_voice_graph, reply_variants, run_voice_graph
+from .graph.voice_stream import stream_voice_reply
+from .metrics import (
+    BATCH_CLIPS,
+    CONTENT_TYPE,
+    REGISTRY,
+    REPLY_BYTES,
+    STAGE_SECONDS,
+    UPLOAD_BYTES,
+    record_error,
+)
+from .negotiation import audio_response, multipart_response, preferred_response_mode
+from .schemas import (
+    CacheStatsResponse,
+    HealthResponse,
+    VoiceBatchItem,
+    VoiceInteractionError,
+    VoiceInteractionMetadata,
+    VoiceInteractionResponse,
+    VoiceJobStatus,
+    VoiceReplyVariant,
+)
+from .services.cache import get_response_cache
+from .services.jobs import CANCELLED, RETRY_AFTER_SECONDS, Job, QueueFull, get_job_queue
 from .services.openai_client import OpenAIError
+from .services.resilience import DeadlineExceeded
 
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="", tags=["voice-assistant"])
 
+BATCH_PATH = "/v1/voice-interact/batch"
+JOBS_PATH = "/v1/voice-interact/jobs"
+
+# BCP 47-style codes such as ``ur``, ``pa`` or ``en-GB``; they are echoed into headers.
+LANGUAGE_CODE = re.compile(r"^[a-z]{2,3}(-[a-z0-9]{2,8})*$")
+# Opaque client conversation IDs (UUIDs, app install IDs); kept short since they key the memory store.
+SESSION_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health() -> HealthResponse:
@@ -27,33 +78,192 @@ async def health() -> HealthResponse:
     return HealthResponse()
 
 
+@router.get("/v1/cache/stats", response_model=CacheStatsResponse)
+async def cache_stats() -> CacheStatsResponse:
+    """Expose reply/audio cache hit and miss counters."""
+
+    cache = get_response_cache()
+    if cache is None:
+        return CacheStatsResponse(enabled=False)
+    return CacheStatsResponse(enabled=True, **cache.stats())
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus text exposition of the in-process metrics."""
+
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+def _interaction_response(
+    result: dict[str, Any],
+    *,
+    selected_language: str,
+    settings: Settings,
+    processing_ms: float,
+    audio_base64: Optional[str] = None,
+    time_to_first_audio_ms: Optional[float] = None,
+    variants: Optional[list[VoiceReplyVariant]] = None,
+) -> VoiceInteractionResponse:
+    """Build the public response model from a finished graph state."""
+
+    metadata = VoiceInteractionMetadata(
+        confidence=result.get("confidence"),
+        llm_model=result.get("llm_model", settings.llm_model),
+        stt_model=result.get("stt_model", settings.stt_model),
+        tts_model=result.get("tts_model", settings.tts_model),
+        tts_voice=result.get("tts_voice", settings.tts_voice),
+        tts_format=result.get("tts_format", settings.tts_format),
+        processing_ms=processing_ms,
+        time_to_first_audio_ms=time_to_first_audio_ms,
+        reply_cached=result.get("reply_cached"),
+        audio_cached=result.get("audio_cached"),
+        tool=result["tool_result"].tool if result.get("tool_result") else None,
+        tool_answered=result.get("tool_answered"),
+        intent=result.get("intent"),
+        stages_ms={stage: round(ms, 2) for stage, ms in result.get("stage_ms", {}).items()} or None,
+    )
+
+    return VoiceInteractionResponse(
+        language=result.get("language", selected_language),
+        transcript=result.get("transcript", "").strip(),
+        response_text=result.get("response_text", "").strip(),
+        audio_base64=audio_base64,
+        variants=variants,
+        metadata=metadata,
+    )
+
+
+def _variant_models(variants: list[ReplyVariant], *, include_audio: bool) -> list[VoiceReplyVariant]:
+    """Public models for the non-primary reply languages, with base64 audio when requested."""
+
+    return [
+        VoiceReplyVariant(
+            language=variant.get("language", ""),
+            response_text=variant.get("response_text", "").strip(),
+            audio_base64=(
+                base64.b64encode(variant["tts_audio"]).decode("utf-8")
+                if variant.get("tts_audio") and include_audio
+                else None
+            ),
+            reply_cached=variant.get("reply_cached"),
+            audio_cached=variant.get("audio_cached"),
+        )
+        for variant in variants
+    ]
+
+
+def _target_languages(languages: Optional[str], settings: Settings) -> Optional[list[str]]:
+    """Parse the comma-separated ``languages`` parameter into unique, validated codes."""
+
+    if not languages:
+        return None
+    codes = list(dict.fromkeys(code.strip().lower() for code in languages.split(",") if code.strip()))
+    invalid = [code for code in codes if not LANGUAGE_CODE.match(code)]
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid language code(s): {', '.join(invalid)}.",
+        )
+    if len(codes) > settings.max_reply_languages:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {settings.max_reply_languages} reply languages can be requested.",
+        )
+    return codes or None
+
+
+def _session_id(value: Optional[str]) -> Optional[str]:
+    """Validate the ``X-Session-ID`` header that ties a request to its conversation history."""
+
+    if value is None:
+        return None
+    if not SESSION_ID.match(value):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="X-Session-ID must be 1-128 letters, digits or '._:-'.",
+        )
+    return value
+
+
+def _validate_audio_upload(audio: UploadFile, settings: Settings) -> int:
+    """Check the uploaded clip's MIME type, duration and size without reading it; returns its size."""
+
+    if audio.content_type not in settings.allowed_audio_mime_types:
+        logger.debug("Rejected audio with MIME type %s", audio.content_type)
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Unsupported audio type. Please upload WAV, WEBM, MP3, OGG, or FLAC.",
+        )
+
+    # Probe the spooled upload's headers instead of pulling the whole clip into memory.
+    duration = probe_duration(audio.file)
+    if duration is not None and duration > settings.max_audio_seconds:
+        logger.info("Rejected audio clip | duration_s=%.1f limit_s=%s", duration, settings.max_audio_seconds)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Audio clip is {duration:.0f} seconds long; the limit is {settings.max_audio_seconds} seconds.",
+        )
+
+    size = file_size(audio.file)
+    if not size:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Audio clip is empty.")
+    audio.file.seek(0)
+    return size
+
+
+async def _read_audio_upload(audio: UploadFile, settings: Settings) -> bytes:
+    """Validate the uploaded clip and return its bytes, for callers that outlive the upload."""
+
+    _validate_audio_upload(audio, settings)
+    return await audio.read()
+
+
 @router.post(
     "/v1/voice-interact",
     response_model=VoiceInteractionResponse,
     responses={
+        status.HTTP_200_OK: {
+            "content": {
+                "audio/*": {},
+                "multipart/mixed": {},
+            },
+            "description": "JSON by default; raw audio for `Accept: audio/*`; JSON + audio parts for `multipart/mixed`.",
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {"model": VoiceInteractionError},
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": VoiceInteractionError},
         status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": VoiceInteractionError},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": VoiceInteractionError},
+        status.HTTP_504_GATEWAY_TIMEOUT: {"model": VoiceInteractionError},
     },
 )
 async def voice_interact(
     audio: UploadFile = File(..., description="Farmer audio utterance."),
     language: Optional[str] = None,
+    languages: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+    x_session_id: Optional[str] = Header(None),
     settings: Settings = Depends(get_settings),
-) -> VoiceInteractionResponse:
-    """Run the full voice assistant loop for the provided audio clip."""
+) -> VoiceInteractionResponse | Response:
+    """Run the full voice assistant loop for the provided audio clip.
 
-    if audio.content_type not in settings.allowed_audio_mime_types:
-        logger.debug("Rejected audio with MIME type %s", audio.content_type)
-        raise HTTPException(
-            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            detail="Unsupported audio type. Please upload WAV, WEBM, MP3, OGG, or FLAC.",
-        )
+    The reply encoding follows the ``Accept`` header: JSON with base64 audio
+    (default), the raw clip with text fields in ``X-*`` headers
+    (``audio/*``), or a ``multipart/mixed`` JSON part plus binary part.
 
-    raw_audio = await audio.read()
-    if not raw_audio:
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Audio clip is empty.")
+    ``languages`` (e.g. ``ur,pa,en``) asks for the reply in several
+    languages at once. The LLM and TTS calls run concurrently, one branch
+    per language. The first language is the main reply and the rest are
+    returned in ``variants``; ``audio/*`` replies carry the main clip only.
+
+    Requests sharing an ``X-Session-ID`` header are one conversation: earlier
+    turns are given to the LLM so follow-up questions keep their context.
+    """
 
+    target_languages = _target_languages(languages, settings)
+    session_id = _session_id(x_session_id)
+    upload_bytes = _validate_audio_upload(audio, settings)
+    UPLOAD_BYTES.inc(upload_bytes, endpoint="/v1/voice-interact")
     selected_language = (language or settings.default_language).lower()
 
     start_time = time.perf_counter()
@@ -62,21 +272,33 @@ async def voice_interact(
         "Voice request received | filename=%s mime=%s bytes=%s language=%s",
         audio.filename,
         audio.content_type,
-        len(raw_audio),
+        upload_bytes,
         selected_language,
     )
 
     try:
+        # The spooled upload is handed over as a file and streamed into the STT
+        # request; it is never read into a bytes copy.
         graph_result = await run_voice_graph(
             {
-                "audio_bytes": raw_audio,
+                "audio_file": audio.file,
                 "audio_filename": audio.filename or "farmer-query.wav",
                 "audio_mime_type": audio.content_type or "audio/wav",
                 "language": selected_language,
+                **({"target_languages": target_languages} if target_languages else {}),
+                **({"session_id": session_id} if session_id else {}),
             }
         )
+    except (DeadlineExceeded, APITimeoutError) as exc:
+        logger.warning("OpenAI did not answer within the request budget: %s", exc)
+        record_error(type(exc).__name__)
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="The assistant took too long to answer. Please try again.",
+        ) from exc
     except OpenAIError as exc:  # pragma: no cover - network path only
         logger.exception("OpenAI error while processing voice request: %s", exc)
+        record_error(type(exc).__name__)
         raise HTTPException(status_code=500, detail="OpenAI request failed. Please try again shortly.") from exc
     finally:
         await audio.close()
@@ -96,24 +318,619 @@ async def voice_interact(
         graph_result.get("tts_model"),
     )
 
-    audio_base64 = base64.b64encode(tts_audio).decode("utf-8") if tts_audio else None
+    mode = preferred_response_mode(accept)
+    with STAGE_SECONDS.time(stage="serialize"):
+        audio_base64 = base64.b64encode(tts_audio).decode("utf-8") if tts_audio and mode == "json" else None
+        extra_variants = reply_variants(graph_result)[1:]
+        variants = _variant_models(extra_variants, include_audio=mode == "json")
 
-    metadata = VoiceInteractionMetadata(
-        confidence=graph_result.get("confidence"),
-        llm_model=graph_result.get("llm_model", settings.llm_model),
-        stt_model=graph_result.get("stt_model", settings.stt_model),
-        tts_model=graph_result.get("tts_model", settings.tts_model),
-        tts_voice=graph_result.get("tts_voice", settings.tts_voice),
-        tts_format=graph_result.get("tts_format", settings.tts_format),
-        processing_ms=processing_ms,
+        body = _interaction_response(
+            graph_result,
+            selected_language=selected_language,
+            settings=settings,
+            processing_ms=processing_ms,
+            audio_base64=audio_base64,
+            # The buffered endpoint only has audio once the whole pipeline is done.
+            time_to_first_audio_ms=processing_ms if tts_audio else None,
+            variants=variants or None,
+        )
+
+        if mode == "audio":
+            response = audio_response(body, tts_audio, body.metadata.tts_format)
+        elif mode == "multipart":
+            variant_audio = [
+                (variant.get("language", ""), variant["tts_audio"])
+                for variant in extra_variants
+                if variant.get("tts_audio")
+            ]
+            response = multipart_response(body, tts_audio, body.metadata.tts_format, variant_audio)
+        else:
+            # Serialised here rather than by FastAPI so the encode is timed and sized.
+            response = Response(body.model_dump_json(), media_type="application/json")
+
+    REPLY_BYTES.inc(int(response.headers.get("content-length", 0)), mode=mode)
+    return response
+
+
+@router.post(
+    BATCH_PATH,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One `VoiceBatchItem` JSON object per line, in completion order.",
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {"model": VoiceInteractionError},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": VoiceInteractionError},
+    },
+)
+async def voice_interact_batch(
+    audio: list[UploadFile] = File(..., description="Recorded farmer clips, one file part each."),
+    language: Optional[str] = None,
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    """Run many clips through the voice loop and stream results as NDJSON.
+
+    Clips are processed at most ``BATCH_CONCURRENCY`` at a time, and each
+    result line is sent as soon as its clip finishes. Identical clips
+    (same SHA-256) run once; every copy still gets its own line, with
+    ``duplicate_of`` pointing at the first. Clips that fail validation or
+    processing get a line with their ``status_code`` and ``error`` instead of
+    failing the batch. Unique clips are copied to temporary files up front,
+    because the response outlives the uploads, and each is read into memory
+    only while it is being processed.
+    """
+
+    if len(audio) > settings.batch_max_clips:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.batch_max_clips} clips can be uploaded in one batch.",
+        )
+
+    selected_language = (language or settings.default_language).lower()
+    rejected: list[VoiceBatchItem] = []
+    # Content hash -> indexes of the clips with that content; the first one is processed.
+    copies: dict[str, list[int]] = {}
+    clips: dict[str, tuple[BinaryIO, UploadFile]] = {}
+    total_bytes = 0
+    try:
+        for index, upload in enumerate(audio):
+            try:
+                size = _validate_audio_upload(upload, settings)
+                digest, spool = await asyncio.to_thread(spool_copy, upload.file)
+            except HTTPException as exc:
+                BATCH_CLIPS.inc(result="rejected")
+                rejected.append(
+                    VoiceBatchItem(index=index, filename=upload.filename, status_code=exc.status_code, error=exc.detail)
+                )
+                continue
+            finally:
+                await upload.close()
+            total_bytes += size
+            copies.setdefault(digest, []).append(index)
+            if digest in clips:
+                spool.close()
+            else:
+                clips[digest] = (spool, upload)
+    except BaseException:
+        for spool, _ in clips.values():
+            spool.close()
+        raise
+
+    UPLOAD_BYTES.inc(total_bytes, endpoint=BATCH_PATH)
+    logger.info(
+        "Batch voice request received | clips=%s unique=%s rejected=%s bytes=%s language=%s",
+        len(audio),
+        len(clips),
+        len(rejected),
+        total_bytes,
+        selected_language,
     )
 
-    return VoiceInteractionResponse(
-        language=graph_result.get("language", selected_language),
-        transcript=transcript,
-        response_text=response_text,
-        audio_base64=audio_base64,
-        metadata=metadata,
+    semaphore = asyncio.Semaphore(max(1, settings.batch_concurrency))
+
+    async def _process(digest: str) -> tuple[str, VoiceBatchItem]:
+        spool, upload = clips[digest]
+        index = copies[digest][0]
+        async with semaphore:
+            start_time = time.perf_counter()
+            try:
+                graph_result = await run_voice_graph(
+                    {
+                        "audio_bytes": await asyncio.to_thread(spool.read),
+                        "audio_filename": upload.filename or "farmer-query.wav",
+                        "audio_mime_type": upload.content_type or "audio/wav",
+                        "language": selected_language,
+                    }
+                )
+            except (DeadlineExceeded, APITimeoutError) as exc:
+                record_error(type(exc).__name__)
+                return digest, VoiceBatchItem(
+                    index=index, filename=upload.filename, status_code=504, error="The assistant took too long."
+                )
+            except OpenAIError as exc:  # pragma: no cover - network path only
+                logger.exception("OpenAI error while processing batch clip %s: %s", index, exc)
+                record_error(type(exc).__name__)
+                return digest, VoiceBatchItem(
+                    index=index, filename=upload.filename, status_code=500, error="OpenAI request failed."
+                )
+            except Exception as exc:
+                # One bad clip (say, one that will not decode) must not end the stream for the rest.
+                logger.exception("Batch clip %s failed: %s", index, exc)
+                record_error(type(exc).__name__)
+                return digest, VoiceBatchItem(
+                    index=index, filename=upload.filename, status_code=500, error="The clip could not be processed."
+                )
+
+        processing_ms = (time.perf_counter() - start_time) * 1000
+        tts_audio = graph_result.get("tts_audio")
+        result = _interaction_response(
+            graph_result,
+            selected_language=selected_language,
+            settings=settings,
+            processing_ms=processing_ms,
+            audio_base64=base64.b64encode(tts_audio).decode("utf-8") if tts_audio else None,
+            time_to_first_audio_ms=processing_ms if tts_audio else None,
+        )
+        return digest, VoiceBatchItem(index=index, filename=upload.filename, result=result)
+
+    def _line(item: VoiceBatchItem) -> bytes:
+        line = item.model_dump_json().encode("utf-8") + b"\n"
+        REPLY_BYTES.inc(len(line), mode="ndjson")
+        return line
+
+    async def _lines() -> AsyncIterator[bytes]:
+        for item in rejected:
+            yield _line(item)
+        tasks = [asyncio.ensure_future(_process(digest)) for digest in clips]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                digest, item = await next_done
+                BATCH_CLIPS.inc(result="processed")
+                yield _line(item)
+                for duplicate in copies[digest][1:]:
+                    BATCH_CLIPS.inc(result="duplicate")
+                    yield _line(
+                        item.model_copy(
+                            update={"index": duplicate, "filename": audio[duplicate].filename, "duplicate_of": item.index}
+                        )
+                    )
+        finally:
+            # A client that disconnects mid-batch should not keep clips running upstream.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for spool, _ in clips.values():
+                spool.close()
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson", headers={"X-Accel-Buffering": "no"})
+
+
+def _job_status(job: Job) -> VoiceJobStatus:
+    return VoiceJobStatus(
+        job_id=job.job_id,
+        status=job.status,  # type: ignore[arg-type]
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        status_code=job.status_code,
+        result=VoiceInteractionResponse.model_validate_json(job.result) if job.result else None,
+        error=job.error,
+    )
+
+
+def _job_task(state: VoiceGraphState, *, selected_language: str, settings: Settings) -> Callable[[], str]:
+    """Wrap one graph run as a queue task that returns the serialised JSON reply."""
+
+    def _run() -> str:
+        start_time = time.perf_counter()
+        try:
+            graph_result = invoke_voice_graph(state)
+        except (DeadlineExceeded, APITimeoutError) as exc:
+            record_error(type(exc).__name__)
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="The assistant took too long to answer. Please resubmit.",
+            ) from exc
+        except OpenAIError as exc:  # pragma: no cover - network path only
+            record_error(type(exc).__name__)
+            raise HTTPException(status_code=500, detail="OpenAI request failed. Please resubmit shortly.") from exc
+
+        processing_ms = (time.perf_counter() - start_time) * 1000
+        tts_audio = graph_result.get("tts_audio")
+        variants = _variant_models(reply_variants(graph_result)[1:], include_audio=True)
+        body = _interaction_response(
+            graph_result,
+            selected_language=selected_language,
+            settings=settings,
+            processing_ms=processing_ms,
+            audio_base64=base64.b64encode(tts_audio).decode("utf-8") if tts_audio else None,
+            time_to_first_audio_ms=processing_ms if tts_audio else None,
+            variants=variants or None,
+        )
+        return body.model_dump_json()
+
+    return _run
+
+
+@router.post(
+    JOBS_PATH,
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=VoiceJobStatus,
+    responses={
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {"model": VoiceInteractionError},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": VoiceInteractionError},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": VoiceInteractionError},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": VoiceInteractionError},
+    },
+)
+async def submit_voice_job(
+    audio: UploadFile = File(..., description="Farmer audio utterance."),
+    language: Optional[str] = None,
+    languages: Optional[str] = None,
+    x_session_id: Optional[str] = Header(None),
+    settings: Settings = Depends(get_settings),
+) -> Response:
+    """Queue the clip for the voice loop and return a job ID straight away.
+
+    The connection is released once the upload is read, so slow or flaky
+    links only need to stay up for the upload and short polls. The reply is
+    fetched from ``Location`` (``GET /v1/voice-interact/jobs/{job_id}``), which takes
+    ``?wait=`` seconds to long-poll. Accepts the same ``language`` and
+    ``languages`` parameters and ``X-Session-ID`` header as
+    ``/v1/voice-interact``; results are always JSON.
+    When ``JOB_QUEUE_MAX`` jobs are already waiting, answers 503 with
+    ``Retry-After``.
+    """
+
+    target_languages = _target_languages(languages, settings)
+    session_id = _session_id(x_session_id)
+    try:
+        data = await _read_audio_upload(audio, settings)
+    finally:
+        await audio.close()
+    UPLOAD_BYTES.inc(len(data), endpoint=JOBS_PATH)
+    selected_language = (language or settings.default_language).lower()
+
+    state: VoiceGraphState = {
+        "audio_bytes": data,
+        "audio_filename": audio.filename or "farmer-query.wav",
+        "audio_mime_type": audio.content_type or "audio/wav",
+        "language": selected_language,
+        **({"target_languages": target_languages} if target_languages else {}),
+        **({"session_id": session_id} if session_id else {}),
+    }
+    queue = get_job_queue()
+    try:
+        task = _job_task(state, selected_language=selected_language, settings=settings)
+        job = queue.submit(task, language=selected_language)
+    except QueueFull as exc:
+        logger.warning("Voice job rejected | %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many voice requests are waiting. Please retry shortly.",
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        ) from exc
+
+    logger.info(
+        "Voice job queued | job_id=%s bytes=%s language=%s depth=%s",
+        job.job_id,
+        len(data),
+        selected_language,
+        queue.depth,
+    )
+    return Response(
+        _job_status(job).model_dump_json(),
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/json",
+        headers={"Location": f"{JOBS_PATH}/{job.job_id}"},
+    )
+
+
+@router.get(
+    JOBS_PATH + "/{job_id}",
+    response_model=VoiceJobStatus,
+    responses={status.HTTP_404_NOT_FOUND: {"model": VoiceInteractionError}},
+)
+async def voice_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="Seconds to hold the request open until the job finishes."),
+    settings: Settings = Depends(get_settings),
+) -> VoiceJobStatus:
+    """Return a job's state, and its result once it has succeeded.
+
+    With ``wait``, the request is held until the job finishes or the wait
+    (capped at ``JOB_MAX_WAIT_SECONDS``) runs out, whichever comes first.
+    """
+
+    queue = get_job_queue()
+    job = await queue.wait(job_id, min(wait, settings.job_max_wait_seconds)) if wait else queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown or expired job.")
+    return _job_status(job)
+
+
+@router.delete(
+    JOBS_PATH + "/{job_id}",
+    response_model=VoiceJobStatus,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"model": VoiceInteractionError},
+        status.HTTP_409_CONFLICT: {"model": VoiceInteractionError},
+    },
+)
+async def cancel_voice_job(job_id: str) -> VoiceJobStatus:
+    """Cancel a queued or running job; a running job's result is discarded."""
+
+    job = get_job_queue().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown or expired job.")
+    if job.status != CANCELLED:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Job already {job.status}.")
+    return _job_status(job)
+
+
+def _sse(event: str, payload: Any) -> str:
+    """Format one Server-Sent Events frame."""
+
+    data = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.post(
+    "/v1/voice-interact/stream",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {"text/event-stream": {}}},
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {"model": VoiceInteractionError},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": VoiceInteractionError},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": VoiceInteractionError},
+    },
+)
+async def voice_interact_stream(
+    audio: UploadFile = File(..., description="Farmer audio utterance."),
+    language: Optional[str] = None,
+    x_session_id: Optional[str] = Header(None),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    """Run the voice loop and stream the reply as Server-Sent Events.
+
+    Emits ``transcript``, then per sentence ``text`` and ``audio`` (base64)
+    events in order, and a final ``done`` event carrying the full
+    :class:`VoiceInteractionResponse` without audio. Failures after the stream
+    has started are reported as an ``error`` event whose ``status_code`` is
+    504 when the request budget ran out and 500 for other upstream failures.
+    ``X-Session-ID`` works as on ``/v1/voice-interact``.
+    """
+
+    session_id = _session_id(x_session_id)
+    start_time = time.perf_counter()
+    try:
+        raw_audio = await _read_audio_upload(audio, settings)
+    finally:
+        await audio.close()
+
+    UPLOAD_BYTES.inc(len(raw_audio), endpoint="/v1/voice-interact/stream")
+    selected_language = (language or settings.default_language).lower()
+    initial_state = {
+        "audio_bytes": raw_audio,
+        "audio_filename": audio.filename or "farmer-query.wav",
+        "audio_mime_type": audio.content_type or "audio/wav",
+        "language": selected_language,
+        **({"session_id": session_id} if session_id else {}),
+    }
+
+    logger.info(
+        "Streaming voice request received | filename=%s mime=%s bytes=%s language=%s",
+        audio.filename,
+        audio.content_type,
+        len(raw_audio),
+        selected_language,
+    )
+
+    async def _events() -> AsyncIterator[str]:
+        first_audio_ms: Optional[float] = None
+        try:
+            async for item in stream_voice_reply(initial_state):
+                with STAGE_SECONDS.time(stage="serialize"):
+                    if item.event == "audio":
+                        if first_audio_ms is None:
+                            first_audio_ms = (time.perf_counter() - start_time) * 1000
+                            logger.info("Time to first audio | ms=%.2f", first_audio_ms)
+                        frame = _sse(
+                            "audio",
+                            {
+                                "index": item.data["index"],
+                                "format": item.data["format"],
+                                "audio_base64": base64.b64encode(item.data["audio_bytes"]).decode("utf-8"),
+                            },
+                        )
+                    elif item.event == "done":
+                        processing_ms = (time.perf_counter() - start_time) * 1000
+                        response = _interaction_response(
+                            item.data,
+                            selected_language=selected_language,
+                            settings=settings,
+                            processing_ms=processing_ms,
+                            time_to_first_audio_ms=first_audio_ms,
+                        )
+                        logger.info(
+                            "Streaming voice interaction complete | processing_ms=%.2f time_to_first_audio_ms=%s",
+                            processing_ms,
+                            first_audio_ms,
+                        )
+                        frame = _sse("done", response.model_dump_json())
+                    else:
+                        frame = _sse(item.event, item.data)
+                REPLY_BYTES.inc(len(frame.encode("utf-8")), mode="sse")
+                yield frame
+        except (DeadlineExceeded, APITimeoutError) as exc:
+            logger.warning("OpenAI did not answer the streamed request within the budget: %s", exc)
+            record_error(type(exc).__name__)
+            yield _sse(
+                "error",
+                {
+                    "status_code": status.HTTP_504_GATEWAY_TIMEOUT,
+                    "detail": "The assistant took too long to answer. Please try again.",
+                },
+            )
+        except OpenAIError as exc:  # pragma: no cover - network path only
+            logger.exception("OpenAI error while streaming voice request: %s", exc)
+            record_error(type(exc).__name__)
+            yield _sse(
+                "error",
+                {
+                    "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "detail": "OpenAI request failed. Please try again shortly.",
+                },
+            )
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+@router.websocket("/v1/voice-session")
+async def voice_session(
+    websocket: WebSocket,
+    language: Optional[str] = None,
+    sample_rate: Optional[int] = None,
+    session_id: Optional[str] = None,
+    settings: Settings = Depends(get_settings),
+) -> None:
+    """Full-duplex, multi-turn voice session over a WebSocket.
+
+    The client streams 16-bit little-endian mono PCM as binary frames while
+    speaking. The server closes each turn on trailing silence (or on a
+    ``{"type": "end"}`` text message), transcribes it straight away and replies
+    on the same socket: JSON text messages for ``transcript``/``text``/
+    ``done``, and for audio a JSON ``audio`` header followed by one binary
+    frame. ``{"type": "stop"}`` ends the session after pending turns finish.
+
+    Turns share conversation memory under ``session_id``; one is generated
+    when omitted and announced in the ``ready`` message, so a client can
+    reconnect and carry on the same conversation.
+    """
+
+    await websocket.accept()
+
+    rate = sample_rate or settings.session_sample_rate
+    selected_language = (language or settings.default_language).lower()
+    try:
+        detector = EndOfSpeechDetector(
+            sample_rate=rate,
+            silence_ms=settings.session_silence_ms,
+            threshold_dbfs=settings.session_threshold_dbfs,
+            max_seconds=settings.max_audio_seconds,
+        )
+        session_id = _session_id(session_id) or uuid.uuid4().hex
+    except (ValueError, HTTPException) as exc:
+        detail = exc.detail if isinstance(exc, HTTPException) else str(exc)
+        await websocket.send_json({"type": "error", "detail": detail})
+        await websocket.close(code=1003)
+        return
+
+    utterances: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+    await websocket.send_json(
+        {"type": "ready", "sample_rate": rate, "language": selected_language, "session_id": session_id}
+    )
+    logger.info("Voice session opened | sample_rate=%s language=%s", rate, selected_language)
+
+    async def _receive() -> None:
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message.get("bytes"):
+                    utterance = detector.feed(message["bytes"])
+                    if utterance:
+                        await utterances.put(utterance)
+                elif message.get("text"):
+                    try:
+                        control = json.loads(message["text"])
+                    except json.JSONDecodeError:
+                        control = {}
+                    if control.get("type") == "end":
+                        utterance = detector.flush()
+                        if utterance:
+                            await utterances.put(utterance)
+                    elif control.get("type") == "stop":
+                        break
+        finally:
+            await utterances.put(None)
+
+    async def _respond() -> None:
+        turn = 0
+        while True:
+            utterance = await utterances.get()
+            if utterance is None:
+                return
+
+            turn_start = time.perf_counter()
+            await websocket.send_json(
+                {"type": "speech_end", "turn": turn, "audio_ms": len(utterance) * 1000 / (2 * rate)}
+            )
+
+            initial_state = {
+                "audio_bytes": pcm16_to_wav(utterance, rate),
+                "audio_filename": f"session-turn-{turn}.wav",
+                "audio_mime_type": "audio/wav",
+                "language": selected_language,
+                "session_id": session_id,
+            }
+
+            first_audio_ms: Optional[float] = None
+            try:
+                async for item in stream_voice_reply(initial_state):
+                    if item.event == "audio":
+                        if first_audio_ms is None:
+                            first_audio_ms = (time.perf_counter() - turn_start) * 1000
+                        await websocket.send_json(
+                            {
+                                "type": "audio",
+                                "turn": turn,
+                                "index": item.data["index"],
+                                "format": item.data["format"],
+                                "bytes": len(item.data["audio_bytes"]),
+                            }
+                        )
+                        await websocket.send_bytes(item.data["audio_bytes"])
+                        REPLY_BYTES.inc(len(item.data["audio_bytes"]), mode="websocket")
+                    elif item.event == "done":
+                        response = _interaction_response(
+                            item.data,
+                            selected_language=selected_language,
+                            settings=settings,
+                            processing_ms=(time.perf_counter() - turn_start) * 1000,
+                            time_to_first_audio_ms=first_audio_ms,
+                        )
+                        await websocket.send_json({"type": "done", "turn": turn, **response.model_dump()})
+                    else:
+                        await websocket.send_json({"type": item.event, "turn": turn, **item.data})
+            except OpenAIError as exc:  # pragma: no cover - network path only
+                logger.exception("OpenAI error during voice session turn: %s", exc)
+                record_error(type(exc).__name__)
+                await websocket.send_json(
+                    {"type": "error", "turn": turn, "detail": "OpenAI request failed. Please try again shortly."}
+                )
+            turn += 1
+
+    receiver = asyncio.create_task(_receive())
+    try:
+        await _respond()
+    except WebSocketDisconnect:
+        logger.info("Voice session client disconnected mid-reply")
+    finally:
+        receiver.cancel()
+        try:
+            await receiver
+        except (asyncio.CancelledError, WebSocketDisconnect):
+            pass
+
+    try:
+        await websocket.close()
+    except RuntimeError:  # already closed by the client
+        pass
+    logger.info("Voice session closed")
@@ -31,6 +31,47 @@ class VoiceInteractionMetadata(BaseModel):
         None,
         description="Total processing time in milliseconds.",
     )
+    time_to_first_audio_ms: Optional[float] = Field(
+        None,
+        description="Milliseconds from request receipt until the first audio bytes were ready to send.",
+    )
+    reply_cached: Optional[bool] = Field(
+        None,
+        description="Whether the text reply was served from the response cache.",
+    )
+    audio_cached: Optional[bool] = Field(
+        None,
+        description="Whether the synthesised audio was served from the response cache.",
+    )
+    tool: Optional[str] = Field(
+        None,
+        description="Local index or template the question matched: 'market_price', 'weather' or a small-talk intent.",
+    )
+    tool_answered: Optional[bool] = Field(
+        None,
+        description="Whether the reply came straight from the index or a template, without an LLM call.",
+    )
+    intent: Optional[str] = Field(
+        None,
+        description="Intent the router picked ('greeting', 'thanks', 'goodbye', 'repeat' or 'market'); unset for the LLM.",
+    )
+    stages_ms: Optional[dict[str, float]] = Field(
+        None,
+        description="Milliseconds spent in each pipeline stage (decode, normalize, transcribe, generate_response, synthesize).",
+    )
+
+
+class VoiceReplyVariant(BaseModel):
+    """The assistant reply rendered in one additional requested language."""
+
+    language: str = Field(..., description="Language code of this reply.")
+    response_text: str = Field(..., description="Assistant reply as plain text.")
+    audio_base64: Optional[str] = Field(
+        None,
+        description="Synthesised speech returned as base64-encoded audio (JSON replies only).",
+    )
+    reply_cached: Optional[bool] = Field(None, description="Whether the text reply was served from the response cache.")
+    audio_cached: Optional[bool] = Field(None, description="Whether the audio was served from the response cache.")
 
 
 class VoiceInteractionResponse(BaseModel):
@@ -43,9 +84,49 @@ class VoiceInteractionResponse(BaseModel):
         None,
         description="Synthesised speech returned as base64-encoded audio.",
     )
+    variants: Optional[list[VoiceReplyVariant]] = Field(
+        None,
+        description="Replies in the other requested languages; the first requested language is the main reply.",
+    )
     metadata: VoiceInteractionMetadata
 
 
+class VoiceBatchItem(BaseModel):
+    """One NDJSON line of a /v1/voice-interact/batch reply."""
+
+    index: int = Field(..., description="Position of the clip in the upload.")
+    filename: Optional[str] = Field(None, description="Filename the clip was uploaded with.")
+    status_code: int = Field(200, description="HTTP status the clip would have received on its own.")
+    duplicate_of: Optional[int] = Field(
+        None,
+        description="Index of an identical clip whose result is reused; duplicates are processed once.",
+    )
+    result: Optional[VoiceInteractionResponse] = Field(None, description="The interaction result on success.")
+    error: Optional[str] = Field(None, description="Why the clip failed.")
+
+
+class VoiceJobStatus(BaseModel):
+    """State of a background voice job from /v1/voice-interact/jobs."""
+
+    job_id: str = Field(..., description="Identifier to poll or cancel the job with.")
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"] = Field(..., description="Job state.")
+    created_at: float = Field(..., description="Submission time as a Unix timestamp.")
+    started_at: Optional[float] = Field(None, description="When a worker picked the job up.")
+    finished_at: Optional[float] = Field(None, description="When the job succeeded, failed or was cancelled.")
+    status_code: Optional[int] = Field(None, description="HTTP status the request would have received inline.")
+    result: Optional[VoiceInteractionResponse] = Field(None, description="The interaction result on success.")
+    error: Optional[str] = Field(None, description="Why the job failed.")
+
+
+class CacheStatsResponse(BaseModel):
+    """Hit/miss counters for the reply and audio cache."""
+
+    enabled: bool = Field(..., description="Whether response caching is configured.")
+    hits: dict[str, int] = Field(default_factory=dict, description="Cache hits per stage.")
+    misses: dict[str, int] = Field(default_factory=dict, description="Cache misses per stage.")
+    size_bytes: int = Field(0, description="Bytes currently held by the cache backend.")
+
+
 class VoiceInteractionError(BaseModel):
     """Standardised error payload."""
 
@@ -0,0 +1,144 @@
+"""Content-addressed store for synthesised speech.
+
+Each clip is stored once per ``(text, voice, model, format)``: the parameters
+are hashed into a key, and the encoded audio lives on disk under that key as a
+plain audio file (sharded by the first two hex digits). Writes are atomic
+(temp file + rename). Pinned phrases, such as the graph's fallback replies,
+are also held in memory and are never evicted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from ..config import get_settings
+from ..metrics import CACHE_LOOKUPS
+
+
+logger = logging.getLogger(__name__)
+
+
+class AudioStore:
+    """Disk-backed TTS clip store bounded by total bytes (LRU)."""
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._pinned: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._load_index()
+
+    @staticmethod
+    def key(*, text: str, voice: str, model: str, audio_format: str) -> str:
+        """Hash the synthesis parameters into the clip's address."""
+
+        payload = json.dumps([model, voice, audio_format, text], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            pinned = self._pinned.get(key)
+        if pinned is not None:
+            CACHE_LOOKUPS.inc(cache="tts_store", result="hit")
+            return pinned
+
+        try:
+            audio = self._path(key).read_bytes()
+        except FileNotFoundError:
+            CACHE_LOOKUPS.inc(cache="tts_store", result="miss")
+            return None
+        CACHE_LOOKUPS.inc(cache="tts_store", result="hit")
+
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        return audio
+
+    def put(self, key: str, audio: bytes, *, pin: bool = False) -> None:
+        """Persist a clip atomically; pinned clips are also kept in memory."""
+
+        if pin:
+            with self._lock:
+                self._pinned[key] = audio
+        if not audio or len(audio) > self._max_bytes:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(audio)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        evicted: list[str] = []
+        with self._lock:
+            self._size -= self._index.pop(key, 0)
+            self._index[key] = len(audio)
+            self._size += len(audio)
+            for old_key in list(self._index):
+                if self._size <= self._max_bytes:
+                    break
+                if old_key in self._pinned:
+                    continue
+                self._size -= self._index.pop(old_key)
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._path(old_key).unlink(missing_ok=True)
+
+    def pin(self, key: str) -> bool:
+        """Load a stored clip into memory so it is always served without disk I/O."""
+
+        audio = self.get(key)
+        if audio is None:
+            return False
+        with self._lock:
+            self._pinned[key] = audio
+        return True
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / key
+
+    def _load_index(self) -> None:
+        entries = []
+        for path in self._dir.glob("??/*"):
+            if path.suffix == ".tmp":
+                path.unlink(missing_ok=True)
+                continue
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.name, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+
+
+@lru_cache(maxsize=1)
+def get_audio_store() -> Optional[AudioStore]:
+    """Return the configured TTS clip store, or ``None`` when disabled."""
+
+    settings = get_settings()
+    if not settings.tts_store_dir:
+        return None
+    return AudioStore(Path(settings.tts_store_dir), settings.tts_store_max_bytes)
+
+
+__all__ = ["AudioStore", "get_audio_store"]
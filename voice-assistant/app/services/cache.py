@@ -0,0 +1,332 @@
+"""Pluggable byte cache used to short-circuit repeated LLM replies and TTS clips."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Protocol
+
+from ..config import get_settings
+from ..metrics import CACHE_LOOKUPS
+
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Minimal byte-oriented key/value store with TTL."""
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None: ...
+
+    def clear(self) -> None: ...
+
+    @property
+    def size_bytes(self) -> int: ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache bounded by total value bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if len(value) > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._size += len(value)
+            while self._size > self._max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _drop(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._size -= len(value)
+
+
+class DiskCacheBackend:
+    """Directory-backed LRU cache that survives restarts.
+
+    Each entry is one file named after the key, prefixed with its expiry as a
+    wall-clock timestamp. Writes go to a temp file and are renamed into place,
+    so readers never see a partial entry. Recency and sizes are tracked in
+    memory and rebuilt from file mtimes on startup.
+    """
+
+    _HEADER = struct.Struct("<d")
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._load_index()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if len(payload) < self._HEADER.size:
+            # Empty or truncated, e.g. after a crash mid-write: drop it and report a miss.
+            logger.warning("Dropping corrupt response cache entry | key=%s bytes=%s", key[:12], len(payload))
+            self._remove(key)
+            return None
+
+        (expires_at,) = self._HEADER.unpack_from(payload)
+        if expires_at <= time.time():
+            self._remove(key)
+            return None
+
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        return payload[self._HEADER.size :]
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if len(value) > self._max_bytes:
+            return
+
+        fd, tmp_name = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(self._HEADER.pack(time.time() + ttl_seconds))
+                handle.write(value)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._size -= self._index.pop(key, 0)
+            self._index[key] = len(value)
+            self._size += len(value)
+            evicted = []
+            while self._size > self._max_bytes:
+                old_key, old_size = self._index.popitem(last=False)
+                self._size -= old_size
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._path(old_key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = list(self._index)
+            self._index.clear()
+            self._size = 0
+        for key in keys:
+            self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{key}.bin"
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            self._size -= self._index.pop(key, 0)
+        self._path(key).unlink(missing_ok=True)
+
+    def _load_index(self) -> None:
+        entries = []
+        for path in self._dir.glob("*.bin"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.stem, max(0, stat.st_size - self._HEADER.size)))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+
+
+def normalize_transcript(text: str) -> str:
+    """Fold a transcript so trivially different phrasings share a cache key.
+
+    Applies NFKC, case folding, Arabic→Urdu letter variants, strips
+    punctuation and collapses whitespace.
+    """
+
+    folded = unicodedata.normalize("NFKC", text).casefold()
+    folded = folded.translate(_URDU_FOLD)
+    folded = "".join(" " if unicodedata.category(ch).startswith("P") else ch for ch in folded)
+    return _WHITESPACE.sub(" ", folded).strip()
+
+
+_URDU_FOLD = str.maketrans({"ي": "ی", "ى": "ی", "ك": "ک", "ه": "ہ"})
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters per cached stage."""
+
+    hits: dict[str, int] = field(default_factory=lambda: {"reply": 0, "audio": 0})
+    misses: dict[str, int] = field(default_factory=lambda: {"reply": 0, "audio": 0})
+
+
+class ResponseCache:
+    """Cache of LLM replies and their TTS audio keyed on the farmer's question."""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float) -> None:
+        self._backend = backend
+        self._ttl = ttl_seconds
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    @property
+    def blocking(self) -> bool:
+        """Whether lookups and writes touch the disk, so async callers should run them in a thread."""
+
+        return isinstance(self._backend, DiskCacheBackend)
+
+    def reply_key(self, *, transcript: str, language: str, model: str) -> str:
+        return _digest("reply", language, model, normalize_transcript(transcript))
+
+    def audio_key(
+        self,
+        *,
+        transcript: str,
+        response_text: str,
+        language: str,
+        model: str,
+        voice: str,
+        audio_format: str,
+    ) -> str:
+        # The reply text is part of the key so audio never outlives the reply it speaks.
+        return _digest("audio", language, model, voice, audio_format, normalize_transcript(transcript), response_text)
+
+    def get_reply(self, key: str) -> Optional[tuple[str, str]]:
+        """Return ``(text, model)`` for a cached reply."""
+
+        payload = self._lookup("reply", key)
+        if payload is None:
+            return None
+        data = json.loads(payload)
+        return data["text"], data["model"]
+
+    def set_reply(self, key: str, text: str, model: str) -> None:
+        if text.strip():
+            self._store("reply", key, json.dumps({"text": text, "model": model}).encode("utf-8"))
+
+    def get_audio(self, key: str) -> Optional[bytes]:
+        return self._lookup("audio", key)
+
+    def set_audio(self, key: str, audio: bytes) -> None:
+        if audio:
+            self._store("audio", key, audio)
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "hits": dict(self._stats.hits),
+                "misses": dict(self._stats.misses),
+                "size_bytes": self._backend.size_bytes,
+            }
+
+    def _lookup(self, stage: str, key: str) -> Optional[bytes]:
+        try:
+            value = self._backend.get(key)
+        except OSError:  # pragma: no cover - disk faults degrade to a miss
+            logger.exception("Response cache read failed | stage=%s", stage)
+            value = None
+        with self._lock:
+            counter = self._stats.hits if value is not None else self._stats.misses
+            counter[stage] += 1
+        CACHE_LOOKUPS.inc(cache=stage, result="hit" if value is not None else "miss")
+        return value
+
+
+    def _store(self, stage: str, key: str, value: bytes) -> None:
+        try:
+            self._backend.set(key, value, self._ttl)
+        except OSError:
+            # A full or read-only disk costs the cache entry, not the reply already produced.
+            logger.exception("Response cache write failed | stage=%s", stage)
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the configured response cache, or ``None`` when caching is disabled."""
+
+    settings = get_settings()
+    backend_name = settings.response_cache_backend.lower()
+    if backend_name == "none":
+        return None
+
+    backend: CacheBackend
+    if backend_name == "disk":
+        backend = DiskCacheBackend(Path(settings.response_cache_dir), settings.response_cache_max_bytes)
+    elif backend_name == "memory":
+        backend = MemoryCacheBackend(settings.response_cache_max_bytes)
+    else:
+        raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {settings.response_cache_backend!r}")
+
+    logger.info(
+        "Response cache enabled | backend=%s ttl_s=%s max_bytes=%s",
+        backend_name,
+        settings.response_cache_ttl_seconds,
+        settings.response_cache_max_bytes,
+    )
+    return ResponseCache(backend, settings.response_cache_ttl_seconds)
+
+
+__all__ = [
+    "CacheBackend",
+    "DiskCacheBackend",
+    "MemoryCacheBackend",
+    "ResponseCache",
+    "get_response_cache",
+    "normalize_transcript",
+]
@@ -0,0 +1,463 @@
+"""Local market price and weather index used to ground, or directly answer, farmer questions.
+
+The index is built from a JSON snapshot of the backend's ``MarketItem`` /
+``MarketPrice`` collections and its ``/api/weather`` city list::
+
+    {"items": [{"_id": "...", "name": "Tomato", "unit": "kg", "aliases": ["..."]}, ...],
+     "prices": [{"item": "...", "city": "Lahore", "date": "2025-11-02", "price": 220, "currency": "PKR"}, ...],
+     "weather": [{"city": "Lahore", "condition": "Warm with haze", "temperature": 31, ...}, ...]}
+
+Commodities and cities are matched on normalised Urdu, Roman Urdu and English
+aliases. When the caller allows it (the intent router decided the question is
+a plain price or weather question), one commodity in one city or one city's
+weather gets a templated answer; otherwise the matching rows come back as a
+few compact fact lines for the LLM instead of nothing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+import httpx
+
+from ..config import get_settings
+from ..metrics import TOOL_LOOKUPS
+from .cache import normalize_transcript
+
+
+logger = logging.getLogger(__name__)
+
+MARKET_PRICE = "market_price"
+WEATHER = "weather"
+
+# At most this many fact lines are sent to the LLM for a broad question.
+MAX_FACTS = 6
+
+# Canonical (lower-case English) name -> aliases. The first Urdu alias is used in Urdu answers.
+COMMODITY_ALIASES: dict[str, tuple[str, ...]] = {
+    "tomato": ("ٹماٹر", "ٹماٹروں", "tamatar", "tamater", "tomatoes"),
+    "potato": ("آلو", "aloo", "alu", "potatoes"),
+    "onion": ("پیاز", "piyaz", "pyaz", "onions"),
+    "wheat": ("گندم", "gandum", "gandam", "atta"),
+    "rice": ("چاول", "chawal", "chaawal", "basmati"),
+    "cotton": ("کپاس", "پھٹی", "kapas", "phutti"),
+    "sugarcane": ("گنا", "گنے", "ganna", "ganne"),
+    "maize": ("مکئی", "makai", "makki", "corn"),
+    "chili": ("مرچ", "mirch", "chilli", "chillies"),
+    "garlic": ("لہسن", "lehsan", "lahsan"),
+    "ginger": ("ادرک", "adrak"),
+    "okra": ("بھنڈی", "bhindi", "lady finger"),
+    "cauliflower": ("گوبھی", "gobhi", "phool gobhi"),
+    "apple": ("سیب", "saib", "seb", "apples"),
+    "mango": ("آم", "aam", "mangoes"),
+    "banana": ("کیلا", "کیلے", "kela", "kele", "bananas"),
+    "orange": ("کینو", "kinnow", "kinno", "oranges"),
+}
+CITY_ALIASES: dict[str, tuple[str, ...]] = {
+    "lahore": ("لاہور", "lahor"),
+    "karachi": ("کراچی",),
+    "islamabad": ("اسلام آباد", "isloo"),
+    "rawalpindi": ("راولپنڈی", "pindi"),
+    "peshawar": ("پشاور", "pishawar"),
+    "quetta": ("کوئٹہ", "koita"),
+    "multan": ("ملتان",),
+    "faisalabad": ("فیصل آباد", "lyallpur"),
+    "hyderabad": ("حیدرآباد", "حیدر آباد"),
+    "sukkur": ("سکھر",),
+    "sahiwal": ("ساہیوال",),
+    "gujranwala": ("گوجرانوالہ",),
+    "sialkot": ("سیالکوٹ",),
+    "bahawalpur": ("بہاولپور",),
+}
+PRICE_WORDS = frozenset(
+    ("ریٹ", "ریٹس", "قیمت", "قیمتیں", "بھاؤ", "بھاو", "نرخ")
+    + ("rate", "rates", "price", "prices", "bhao", "bhaao", "qeemat", "qimat", "keemat")
+)
+WEATHER_WORDS = frozenset(
+    ("موسم", "بارش", "گرمی", "سردی", "درجہ")
+    + ("mausam", "mosam", "barish", "baarish", "garmi", "weather", "rain", "forecast", "temperature")
+)
+UNITS_UR = {"kg": "کلو", "40kg": "من", "maund": "من", "dozen": "درجن", "litre": "لیٹر", "liter": "لیٹر"}
+WEATHER_UR = {"heat": "گرم", "rain": "بارش کا", "normal": "معتدل"}
+
+
+def tokens(text: str) -> list[str]:
+    """Normalised word tokens: NFKC, case-folded, punctuation and Urdu diacritics removed."""
+
+    folded = "".join(ch for ch in normalize_transcript(text) if unicodedata.category(ch) != "Mn")
+    return folded.split()
+
+
+def _is_urdu(text: str) -> bool:
+    return any("؀" <= ch <= "ۿ" for ch in text)
+
+
+class PhraseIndex:
+    """Maps one- or multi-word aliases to keys; matches longest phrases first, left to right."""
+
+    def __init__(self) -> None:
+        self._phrases: dict[str, list[tuple[tuple[str, ...], str]]] = {}
+
+    def add(self, alias: str, key: str) -> None:
+        words = tuple(tokens(alias))
+        if not words:
+            return
+        candidates = self._phrases.setdefault(words[0], [])
+        if (words, key) not in candidates:
+            candidates.append((words, key))
+            candidates.sort(key=lambda candidate: -len(candidate[0]))
+
+    def spans(self, words: list[str]) -> Iterator[tuple[int, int, str]]:
+        """Yield ``(start, end, key)`` for each matched phrase, without overlaps."""
+
+        index = 0
+        while index < len(words):
+            step = 1
+            for phrase, key in self._phrases.get(words[index], ()):
+                if tuple(words[index : index + len(phrase)]) == phrase:
+                    yield index, index + len(phrase), key
+                    step = len(phrase)
+                    break
+            index += step
+
+    def find(self, words: list[str]) -> list[str]:
+        found: list[str] = []
+        for _, _, key in self.spans(words):
+            if key not in found:
+                found.append(key)
+        return found
+
+
+@dataclass(frozen=True)
+class PriceQuote:
+    commodity: str
+    city: str
+    price: float
+    unit: str
+    currency: str
+    date: date
+
+
+@dataclass(frozen=True)
+class WeatherReport:
+    city: str
+    condition: str
+    category: str
+    temperature: Optional[float]
+    humidity: Optional[float]
+    precipitation_chance: Optional[float]
+
+
+@dataclass(frozen=True)
+class ToolResult:
+    """What a tool found: fact lines for the LLM and, when it can, ready answers per language."""
+
+    tool: str
+    facts: str
+    answers: dict[str, str] = field(default_factory=dict)
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.2f}".rstrip("0")
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+class MarketIndex:
+    """Latest price per (commodity, city) and weather per city, with alias lookup."""
+
+    def __init__(
+        self,
+        prices: dict[tuple[str, str], PriceQuote],
+        weather: dict[str, WeatherReport],
+        *,
+        commodity_aliases: Optional[dict[str, Iterable[str]]] = None,
+        max_age_days: int = 3,
+    ) -> None:
+        self.prices = prices
+        self.weather = weather
+        self._max_age_days = max_age_days
+        self._names_ur: dict[str, str] = {}
+        self._commodities = PhraseIndex()
+        self._cities = PhraseIndex()
+        extra = commodity_aliases or {}
+        for key in {commodity for commodity, _ in prices}:
+            self._register(self._commodities, key, (key, *COMMODITY_ALIASES.get(key, ()), *extra.get(key, ())))
+        # Cities without data are still recognised, so a question about one
+        # misses instead of being grounded in other cities' figures.
+        for key in {city for _, city in prices} | set(weather) | set(CITY_ALIASES):
+            self._register(self._cities, key, (key, *CITY_ALIASES.get(key, ())))
+
+    def _register(self, phrases: PhraseIndex, key: str, aliases: Iterable[str]) -> None:
+        for alias in aliases:
+            phrases.add(alias, key)
+            if key not in self._names_ur and _is_urdu(alias):
+                self._names_ur[key] = alias
+
+    def __len__(self) -> int:
+        return len(self.prices) + len(self.weather)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any], *, max_age_days: int = 3) -> "MarketIndex":
+        items = {
+            str(item.get("_id", item.get("name"))): item
+            for item in snapshot.get("items", [])
+            if item.get("enabled", True) and item.get("name")
+        }
+        prices: dict[tuple[str, str], PriceQuote] = {}
+        for row in snapshot.get("prices", []):
+            item = items.get(str(row.get("item")))
+            day = _parse_date(row.get("date"))
+            if item is None or day is None or row.get("price") is None or not row.get("city"):
+                continue
+            key = (item["name"].strip().lower(), row["city"].strip().lower())
+            if key in prices and prices[key].date >= day:
+                continue
+            prices[key] = PriceQuote(
+                commodity=item["name"].strip(),
+                city=row["city"].strip(),
+                price=float(row["price"]),
+                unit=item.get("unit") or "kg",
+                currency=row.get("currency") or "PKR",
+                date=day,
+            )
+        weather = {
+            str(row["city"]).strip().lower(): WeatherReport(
+                city=str(row["city"]).strip(),
+                condition=row.get("condition", ""),
+                category=row.get("category", "normal"),
+                temperature=row.get("temperature"),
+                humidity=row.get("humidity"),
+                precipitation_chance=row.get("precipitationChance"),
+            )
+            for row in snapshot.get("weather", [])
+            if row.get("city")
+        }
+        aliases = {item["name"].strip().lower(): item.get("aliases", ()) for item in items.values()}
+        return cls(prices, weather, commodity_aliases=aliases, max_age_days=max_age_days)
+
+    def lookup(self, transcript: str, *, answer: bool = True, today: Optional[date] = None) -> Optional[ToolResult]:
+        """Answer or ground a price or weather question; ``None`` when the index has nothing relevant.
+
+        With ``answer`` false only fact lines come back, never a ready answer.
+        """
+
+        words = tokens(transcript)
+        vocabulary = set(words)
+        cities = self._cities.find(words)
+        if vocabulary & PRICE_WORDS:
+            commodities = self._commodities.find(words)
+            if commodities:
+                return self._price_result(commodities, cities, today or date.today(), answer=answer)
+        if vocabulary & WEATHER_WORDS:
+            return self._weather_result(cities, answer=answer)
+        return None
+
+    def _price_result(
+        self, commodities: list[str], cities: list[str], today: date, *, answer: bool
+    ) -> Optional[ToolResult]:
+        quotes = [
+            quote
+            for (commodity, city), quote in sorted(self.prices.items())
+            if commodity in commodities and (not cities or city in cities)
+        ][:MAX_FACTS]
+        if not quotes:
+            return None
+        facts = "\n".join(
+            f"Market price: {quote.commodity} in {quote.city}, {_number(quote.price)} {quote.currency}/{quote.unit}"
+            f" on {quote.date.isoformat()}"
+            for quote in quotes
+        )
+        answers: dict[str, str] = {}
+        quote = quotes[0]
+        if answer and len(commodities) == 1 and len(cities) == 1 and (today - quote.date).days <= self._max_age_days:
+            commodity_key, city_key = quote.commodity.lower(), quote.city.lower()
+            currency_ur = "روپے" if quote.currency == "PKR" else quote.currency
+            answers = {
+                "ur": (
+                    f"{self._names_ur.get(city_key, quote.city)} میں {self._names_ur.get(commodity_key, quote.commodity)}"
+                    f" کا ریٹ {_number(quote.price)} {currency_ur} فی {UNITS_UR.get(quote.unit, quote.unit)} ہے"
+                    f" ({quote.date.isoformat()} کا ریٹ)۔"
+                ),
+                "en": (
+                    f"{quote.commodity} in {quote.city} is {_number(quote.price)} {quote.currency} per {quote.unit}"
+                    f" (as of {quote.date.isoformat()})."
+                ),
+            }
+        return ToolResult(MARKET_PRICE, facts, answers)
+
+    def _weather_result(self, cities: list[str], *, answer: bool) -> Optional[ToolResult]:
+        reports = [self.weather[city] for city in cities if city in self.weather]
+        if cities and not reports:
+            return None
+        reports = (reports or list(self.weather.values()))[:MAX_FACTS]
+        if not reports:
+            return None
+        facts = "\n".join(
+            f"Weather: {report.city}, {report.condition}, {_number(report.temperature or 0)}°C, "
+            f"humidity {_number(report.humidity or 0)}%, rain chance {_number(report.precipitation_chance or 0)}%"
+            for report in reports
+        )
+        answers: dict[str, str] = {}
+        if answer and len(cities) == 1:
+            report = reports[0]
+            answers = {
+                "ur": (
+                    f"{self._names_ur.get(report.city.lower(), report.city)} میں موسم"
+                    f" {WEATHER_UR.get(report.category, 'معتدل')} ہے: درجہ حرارت {_number(report.temperature or 0)} ڈگری،"
+                    f" نمی {_number(report.humidity or 0)} فیصد اور بارش کا امکان"
+                    f" {_number(report.precipitation_chance or 0)} فیصد ہے۔"
+                ),
+                "en": (
+                    f"Weather in {report.city}: {report.condition}, {_number(report.temperature or 0)}°C,"
+                    f" humidity {_number(report.humidity or 0)}%, {_number(report.precipitation_chance or 0)}%"
+                    " chance of rain."
+                ),
+            }
+        return ToolResult(WEATHER, facts, answers)
+
+
+def fetch_snapshot(backend_url: str, *, timeout: float = 10.0) -> dict[str, Any]:
+    """Pull items, their prices and the weather list from the backend's public API."""
+
+    with httpx.Client(base_url=backend_url.rstrip("/"), timeout=timeout) as client:
+
+        def _get(path: str) -> Any:
+            response = client.get(path)
+            response.raise_for_status()
+            return response.json()
+
+        items = _get("/api/market/items")
+        prices: list[dict[str, Any]] = []
+        for item in items:
+            prices.extend(_get(f"/api/market/prices/item/{item['_id']}"))
+        weather = _get("/api/weather").get("cities", [])
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "items": items,
+        "prices": prices,
+        "weather": weather,
+    }
+
+
+def write_snapshot(path: Path, snapshot: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".snapshot-")
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        json.dump(snapshot, handle, ensure_ascii=False)
+    os.replace(tmp_name, path)
+
+
+class MarketData:
+    """Holds the current index and swaps in a rebuilt one on refresh.
+
+    With a backend URL, a refresh pulls a fresh snapshot and saves it to
+    ``snapshot_path`` so a restart starts warm; otherwise the snapshot file is
+    re-read whenever it changes. Readers never see a half-built index.
+    """
+
+    def __init__(self, snapshot_path: Path, *, backend_url: Optional[str] = None, max_age_days: int = 3) -> None:
+        self._path = snapshot_path
+        self._backend_url = backend_url
+        self._max_age_days = max_age_days
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+        self.index = MarketIndex({}, {}, max_age_days=max_age_days)
+
+    def refresh(self, *, fetch: bool = True) -> bool:
+        """Rebuild the index if there is newer data; returns whether it changed."""
+
+        with self._lock:
+            if fetch and self._backend_url:
+                write_snapshot(self._path, fetch_snapshot(self._backend_url))
+            try:
+                mtime = self._path.stat().st_mtime
+            except FileNotFoundError:
+                return False
+            if mtime == self._mtime:
+                return False
+            snapshot = json.loads(self._path.read_text(encoding="utf-8"))
+            self.index = MarketIndex.from_snapshot(snapshot, max_age_days=self._max_age_days)
+            self._mtime = mtime
+        logger.info("Market index loaded | entries=%s path=%s", len(self.index), self._path)
+        return True
+
+    def lookup(self, transcript: str, *, answer: bool = True) -> Optional[ToolResult]:
+        result = self.index.lookup(transcript, answer=answer)
+        if result is None:
+            TOOL_LOOKUPS.inc(tool="none", result="miss")
+        else:
+            TOOL_LOOKUPS.inc(tool=result.tool, result="answered" if result.answers else "grounded")
+        return result
+
+
+@lru_cache(maxsize=1)
+def get_market_data() -> Optional[MarketData]:
+    """Return the process-wide market index, loaded from the local snapshot; ``None`` when disabled."""
+
+    settings = get_settings()
+    if not settings.grounding_enabled:
+        return None
+    data = MarketData(
+        Path(settings.grounding_snapshot_path),
+        backend_url=settings.grounding_backend_url,
+        max_age_days=settings.grounding_max_age_days,
+    )
+    try:
+        # Only the local snapshot here; the backend is polled by the background refresh.
+        data.refresh(fetch=False)
+    except (OSError, ValueError) as exc:
+        logger.warning("Could not load market snapshot %s: %s", settings.grounding_snapshot_path, exc)
+    return data
+
+
+async def refresh_market_data_forever() -> None:
+    """Background task: refresh the market index every ``GROUNDING_REFRESH_SECONDS``."""
+
+    settings = get_settings()
+    data = get_market_data()
+    if data is None:
+        return
+    while True:
+        try:
+            await asyncio.to_thread(data.refresh)
+        except (OSError, ValueError, httpx.HTTPError) as exc:
+            logger.warning("Market index refresh failed: %s", exc)
+        await asyncio.sleep(settings.grounding_refresh_seconds)
+
+
+__all__ = [
+    "CITY_ALIASES",
+    "COMMODITY_ALIASES",
+    "MARKET_PRICE",
+    "MarketData",
+    "MarketIndex",
+    "PRICE_WORDS",
+    "PhraseIndex",
+    "ToolResult",
+    "WEATHER",
+    "WEATHER_WORDS",
+    "fetch_snapshot",
+    "get_market_data",
+    "refresh_market_data_forever",
+    "tokens",
+    "write_snapshot",
+]
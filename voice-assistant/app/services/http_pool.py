@@ -0,0 +1,154 @@
+"""Configured httpx connection pools for the OpenAI clients.
+
+Both SDK clients get explicit pool limits, keep-alive expiry and optional
+HTTP/2 from settings, and their transports report pool usage: requests in
+flight, time spent waiting for a pooled connection, and new connections
+opened (each one a TCP + TLS handshake that a warm pool avoids).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import socket
+import time
+from typing import Any
+
+import httpx
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+
+from ..config import Settings
+from ..metrics import (
+    OPENAI_CONNECTIONS_OPENED,
+    OPENAI_POOL_IN_FLIGHT,
+    OPENAI_POOL_MAX_CONNECTIONS,
+    OPENAI_POOL_WAIT_SECONDS,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# httpcore trace events. The first of "connect started" (new connection) or
+# "send request headers" (reused connection) marks the end of the pool wait.
+_CONNECT_STARTED = "connection.connect_tcp.started"
+_CONNECT_COMPLETE = "connection.connect_tcp.complete"
+
+# httpcore writes request headers and body separately. On a reused connection
+# Nagle's algorithm can then hold the body until the server's delayed ACK
+# (~40 ms on Linux), which showed up as a tail on warm bursts.
+SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+
+def pool_limits(settings: Settings) -> httpx.Limits:
+    """Pool limits from settings."""
+
+    return httpx.Limits(
+        max_connections=settings.openai_max_connections,
+        max_keepalive_connections=settings.openai_max_keepalive_connections,
+        keepalive_expiry=settings.openai_keepalive_expiry_seconds,
+    )
+
+
+def http2_enabled(settings: Settings) -> bool:
+    """Whether to negotiate HTTP/2; needs the optional ``h2`` package."""
+
+    if not settings.openai_http2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("OPENAI_HTTP2 is set but the 'h2' package is missing; using HTTP/1.1")
+        return False
+    return True
+
+
+class _PoolTrace:
+    """Per-request trace hook recording pool wait time and new connections."""
+
+    def __init__(self, client: str) -> None:
+        self.client = client
+        self.start = time.perf_counter()
+        self.waited = False
+
+    def event(self, name: str) -> None:
+        if not self.waited and (name == _CONNECT_STARTED or name.endswith(".send_request_headers.started")):
+            self.waited = True
+            OPENAI_POOL_WAIT_SECONDS.observe(time.perf_counter() - self.start, client=self.client)
+        if name == _CONNECT_COMPLETE:
+            OPENAI_CONNECTIONS_OPENED.inc(client=self.client)
+
+
+class PoolMetricsTransport(httpx.BaseTransport):
+    """Sync transport wrapper that reports pool usage."""
+
+    def __init__(self, transport: httpx.BaseTransport, *, client: str = "sync") -> None:
+        self._transport = transport
+        self._client = client
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        trace = _PoolTrace(self._client)
+        inner = request.extensions.get("trace")
+
+        def _hook(name: str, info: dict[str, Any]) -> None:
+            trace.event(name)
+            if inner is not None:
+                inner(name, info)
+
+        request.extensions["trace"] = _hook
+        with OPENAI_POOL_IN_FLIGHT.track(client=self._client):
+            return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncPoolMetricsTransport(httpx.AsyncBaseTransport):
+    """Async transport wrapper that reports pool usage."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, *, client: str = "async") -> None:
+        self._transport = transport
+        self._client = client
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        trace = _PoolTrace(self._client)
+        inner = request.extensions.get("trace")
+
+        async def _hook(name: str, info: dict[str, Any]) -> None:
+            trace.event(name)
+            if inner is not None:
+                await inner(name, info)
+
+        request.extensions["trace"] = _hook
+        with OPENAI_POOL_IN_FLIGHT.track(client=self._client):
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def build_http_client(settings: Settings) -> httpx.Client:
+    """Sync httpx client for :class:`~app.services.openai_client.OpenAIService`."""
+
+    limits = pool_limits(settings)
+    OPENAI_POOL_MAX_CONNECTIONS.set(limits.max_connections or 0, client="sync")
+    transport = httpx.HTTPTransport(limits=limits, http2=http2_enabled(settings), socket_options=SOCKET_OPTIONS)
+    return DefaultHttpxClient(transport=PoolMetricsTransport(transport, client="sync"))
+
+
+def build_async_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Async httpx client for :class:`~app.services.openai_client.AsyncOpenAIService`."""
+
+    limits = pool_limits(settings)
+    OPENAI_POOL_MAX_CONNECTIONS.set(limits.max_connections or 0, client="async")
+    transport = httpx.AsyncHTTPTransport(
+        limits=limits, http2=http2_enabled(settings), socket_options=SOCKET_OPTIONS
+    )
+    return DefaultAsyncHttpxClient(transport=AsyncPoolMetricsTransport(transport, client="async"))
+
+
+__all__ = [
+    "AsyncPoolMetricsTransport",
+    "PoolMetricsTransport",
+    "build_async_http_client",
+    "build_http_client",
+    "http2_enabled",
+    "pool_limits",
+]
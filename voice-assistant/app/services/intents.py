@@ -0,0 +1,270 @@
+"""Fast intent routing that keeps common turns away from the LLM.
+
+Runs on the transcript before ``generate_response``:
+
+- Short small-talk turns (greetings, thanks, goodbyes, "say that again") are
+  answered from templates, or from the session's last reply.
+- Plain price and weather questions are routed to the market index tool,
+  which answers them from its templates; the same whole-utterance rule
+  applies, so "after the rain, which fertiliser" is left to the classifier
+  or the LLM (grounded in the index's figures either way).
+- Everything else goes to the LLM as before.
+
+Matching is phrase lookup over normalised Urdu, Roman Urdu and English tokens,
+so it costs microseconds. An optional naive Bayes classifier, trained from a
+JSONL file of labelled transcripts, catches phrasings the tables miss.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..config import get_settings
+from ..metrics import INTENT_ROUTES
+from .grounding import CITY_ALIASES, COMMODITY_ALIASES, PRICE_WORDS, WEATHER_WORDS, PhraseIndex, tokens
+
+
+logger = logging.getLogger(__name__)
+
+GREETING = "greeting"
+THANKS = "thanks"
+GOODBYE = "goodbye"
+REPEAT = "repeat"
+MARKET = "market"
+SMALL_TALK = frozenset((GREETING, THANKS, GOODBYE, REPEAT))
+# Classifier label for transcripts that should go to the LLM.
+OTHER = "other"
+
+# Small talk is only routed when the whole utterance is this short and made of
+# the phrase plus filler; "salam, my wheat leaves are yellow" goes to the LLM.
+MAX_SMALL_TALK_WORDS = 8
+
+INTENT_PHRASES: dict[str, tuple[str, ...]] = {
+    GREETING: (
+        "السلام علیکم", "اسلام علیکم", "السلام و علیکم", "سلام", "آداب", "ہیلو", "صبح بخیر", "کیا حال ہے", "کیسے ہیں",
+        "assalam o alaikum", "assalamualaikum", "asalam o alaikum", "salam", "salaam", "aoa", "kya haal hai",
+        "hello", "hi", "hey", "good morning", "how are you",
+    ),
+    THANKS: (
+        "شکریہ", "مہربانی", "جزاک اللہ", "shukriya", "shukria", "meharbani", "jazakallah", "thanks", "thank you",
+    ),
+    GOODBYE: (
+        "اللہ حافظ", "خدا حافظ", "فی امان اللہ", "allah hafiz", "khuda hafiz", "bye", "goodbye",
+    ),
+    REPEAT: (
+        "دوبارہ بتائیں", "دوبارہ بتاؤ", "دوبارہ بولیں", "دوبارہ کہیں", "پھر سے بتائیں", "پھر سے بولیں", "کیا کہا",
+        "سمجھ نہیں آیا", "dobara batain", "dobara bolen", "phir se batao", "phir se bolo", "kya kaha",
+        "repeat", "say that again", "say again", "come again", "pardon",
+    ),
+}
+FILLER_WORDS = frozenset(
+    ("جی", "جناب", "بھائی", "صاحب", "آپ", "کا", "کو", "بھی", "بہت", "ذرا", "براہ", "کرم", "اچھا", "ٹھیک", "ہے")
+    + ("وعلیکم",)
+    + ("ji", "jee", "janab", "bhai", "sahab", "aap", "ap", "bhi", "bohat", "bahut", "zara", "acha", "theek", "hai")
+    + ("sir", "please", "ok", "okay", "so", "very", "much", "a", "lot", "it", "again", "and", "there")
+)
+# Besides commodity and city names and price/weather words, a plain market
+# question is made only of these; anything else ("after the rain, which
+# fertiliser...") is a broader question for the LLM, which still gets the figures.
+QUESTION_WORDS = frozenset(
+    ("کیا", "ہے", "ہیں", "کا", "کی", "کے", "میں", "آج", "کل", "ابھی", "اب", "کیسا", "کیسی", "کیسے", "کتنا", "کتنی")
+    + ("کتنے", "رہے", "رہا", "گا", "گی", "ہو", "ہوگا", "ہوگی", "بتائیں", "بتاؤ", "جی", "منڈی", "فی", "کلو", "من")
+    + ("kya", "hai", "ka", "ki", "ke", "mein", "main", "me", "aaj", "aj", "kal", "abhi", "kaisa", "kaisi", "kitna")
+    + ("kitni", "rahega", "rahegi", "hoga", "hogi", "batain", "batao", "ji", "mandi", "per", "kg")
+    + ("what", "s", "is", "the", "in", "of", "for", "today", "tomorrow", "now", "how", "will", "be", "like", "current")
+)
+# Precedence when one utterance holds several ("shukriya, allah hafiz" is a goodbye).
+INTENT_PRECEDENCE = (REPEAT, GOODBYE, THANKS, GREETING)
+
+REPLIES: dict[str, dict[str, str]] = {
+    GREETING: {
+        "ur": "وعلیکم السلام! میں آپ کا زرعی معاون ہوں۔ فصل، موسم یا منڈی کے ریٹ کے بارے میں پوچھیں۔",
+        "en": "Hello! I am your farming assistant. Ask me about your crops, the weather or market rates.",
+    },
+    THANKS: {
+        "ur": "آپ کا بھی شکریہ! کوئی اور سوال ہو تو ضرور پوچھیں۔",
+        "en": "You are welcome! Ask me anything else you need.",
+    },
+    GOODBYE: {
+        "ur": "اللہ حافظ! آپ کی فصل اچھی ہو۔",
+        "en": "Goodbye, and good luck with your harvest!",
+    },
+    # Used only when the session has no earlier reply to repeat.
+    REPEAT: {
+        "ur": "معذرت، پچھلا جواب میرے پاس محفوظ نہیں۔ براہ کرم اپنا سوال دوبارہ پوچھیں۔",
+        "en": "Sorry, I do not have an earlier answer to repeat. Please ask your question again.",
+    },
+}
+
+# Whisper's verbose_json reports language names; templates are keyed by ISO code.
+LANGUAGE_CODES = {"urdu": "ur", "english": "en", "punjabi": "pa", "sindhi": "sd", "pashto": "ps", "saraiki": "skr"}
+
+
+def language_code(language: str) -> str:
+    """ISO code for a language code or a Whisper language name."""
+
+    language = language.strip().lower()
+    return LANGUAGE_CODES.get(language, language)
+
+
+def _features(words: list[str]) -> list[str]:
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+class IntentClassifier:
+    """Multinomial naive Bayes over word unigrams and bigrams."""
+
+    def __init__(self, log_priors: dict[str, float], log_likelihoods: dict[str, dict[str, float]]) -> None:
+        self._log_priors = log_priors
+        self._log_likelihoods = log_likelihoods
+        self._vocabulary = set().union(*log_likelihoods.values()) if log_likelihoods else set()
+
+    @classmethod
+    def train(cls, examples: Iterable[tuple[str, str]], *, alpha: float = 1.0) -> "IntentClassifier":
+        """Fit on ``(text, intent)`` pairs; intents outside the router's set count as :data:`OTHER`."""
+
+        documents: Counter[str] = Counter()
+        counts: dict[str, Counter[str]] = {}
+        for text, intent in examples:
+            label = intent if intent in SMALL_TALK or intent == MARKET else OTHER
+            documents[label] += 1
+            counts.setdefault(label, Counter()).update(_features(tokens(text)))
+        if not documents:
+            raise ValueError("No training examples")
+        vocabulary = set().union(*counts.values())
+        total = sum(documents.values())
+        log_priors = {label: math.log(count / total) for label, count in documents.items()}
+        log_likelihoods = {}
+        for label, features in counts.items():
+            denominator = sum(features.values()) + alpha * len(vocabulary)
+            log_likelihoods[label] = {
+                feature: math.log((features[feature] + alpha) / denominator) for feature in vocabulary
+            }
+        return cls(log_priors, log_likelihoods)
+
+    @classmethod
+    def load(cls, path: Path) -> "IntentClassifier":
+        """Train from a JSONL file of ``{"text": ..., "intent": ...}`` lines."""
+
+        with path.open(encoding="utf-8") as handle:
+            rows = [json.loads(line) for line in handle if line.strip()]
+        return cls.train((row["text"], row["intent"]) for row in rows)
+
+    def predict(self, words: list[str]) -> tuple[str, float]:
+        """Most likely label and its posterior probability; unseen words are ignored."""
+
+        features = [feature for feature in _features(words) if feature in self._vocabulary]
+        scores = {
+            label: prior + sum(self._log_likelihoods[label][feature] for feature in features)
+            for label, prior in self._log_priors.items()
+        }
+        best = max(scores, key=scores.__getitem__)
+        total = sum(math.exp(score - scores[best]) for score in scores.values())
+        return best, 1.0 / total
+
+
+@dataclass(frozen=True)
+class Route:
+    """Where a transcript goes: ``intent`` is ``None`` for the LLM; ``source`` is what decided it."""
+
+    intent: Optional[str]
+    source: str
+
+
+class IntentRouter:
+    """Keyword tables first, then the optional classifier; anything unsure goes to the LLM."""
+
+    def __init__(self, classifier: Optional[IntentClassifier] = None, *, threshold: float = 0.9) -> None:
+        self._classifier = classifier
+        self._threshold = threshold
+        self._phrases = PhraseIndex()
+        for intent, phrases in INTENT_PHRASES.items():
+            for phrase in phrases:
+                self._phrases.add(phrase, intent)
+        # The built-in commodity and city names; the index adds snapshot aliases on top.
+        self._market_names = PhraseIndex()
+        for aliases in (COMMODITY_ALIASES, CITY_ALIASES):
+            for name, others in aliases.items():
+                for alias in (name, *others):
+                    self._market_names.add(alias, name)
+
+    def route(self, transcript: str) -> Route:
+        route = self._route(tokens(transcript))
+        INTENT_ROUTES.inc(intent=route.intent or "none", source=route.source)
+        return route
+
+    def _route(self, words: list[str]) -> Route:
+        if not words:
+            return Route(None, "none")
+        intent = self._small_talk(words)
+        if intent is not None:
+            return Route(intent, "keyword")
+        if self._plain_market(words):
+            return Route(MARKET, "keyword")
+        if self._classifier is not None:
+            label, probability = self._classifier.predict(words)
+            if label != OTHER and probability >= self._threshold:
+                if label == MARKET or len(words) <= MAX_SMALL_TALK_WORDS:
+                    return Route(label, "classifier")
+        return Route(None, "none")
+
+    def _plain_market(self, words: list[str]) -> bool:
+        """A price or weather question and nothing else: names, price/weather and question words only."""
+
+        if not set(words) & (PRICE_WORDS | WEATHER_WORDS):
+            return False
+        covered = [word in PRICE_WORDS or word in WEATHER_WORDS or word in QUESTION_WORDS for word in words]
+        for start, end, _ in self._market_names.spans(words):
+            covered[start:end] = [True] * (end - start)
+        return all(covered)
+
+    def _small_talk(self, words: list[str]) -> Optional[str]:
+        if len(words) > MAX_SMALL_TALK_WORDS:
+            return None
+        covered = [False] * len(words)
+        found = set()
+        for start, end, intent in self._phrases.spans(words):
+            covered[start:end] = [True] * (end - start)
+            found.add(intent)
+        if not found or any(not hit and word not in FILLER_WORDS for word, hit in zip(words, covered)):
+            return None
+        return next(intent for intent in INTENT_PRECEDENCE if intent in found)
+
+
+@lru_cache(maxsize=1)
+def get_intent_router() -> Optional[IntentRouter]:
+    """Return the process-wide router, or ``None`` when ``INTENT_ROUTER_ENABLED`` is off."""
+
+    settings = get_settings()
+    if not settings.intent_router_enabled:
+        return None
+    classifier = None
+    if settings.intent_classifier_path:
+        try:
+            classifier = IntentClassifier.load(Path(settings.intent_classifier_path))
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Could not train intent classifier from %s: %s", settings.intent_classifier_path, exc)
+    return IntentRouter(classifier, threshold=settings.intent_classifier_threshold)
+
+
+__all__ = [
+    "GOODBYE",
+    "GREETING",
+    "IntentClassifier",
+    "IntentRouter",
+    "MARKET",
+    "REPEAT",
+    "REPLIES",
+    "Route",
+    "SMALL_TALK",
+    "THANKS",
+    "get_intent_router",
+    "language_code",
+]
@@ -0,0 +1,343 @@
+"""Background job queue for voice requests that should not hold a connection open.
+
+A job is submitted with the clip already read into memory and runs on a small
+worker pool; clients poll (or long-poll) for the result. Job records live in a
+pluggable store so finished results survive long enough to be fetched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Protocol
+
+from ..config import get_settings
+from ..metrics import JOB_QUEUE_WAIT_SECONDS, JOBS_QUEUED, JOBS_RUNNING, JOBS_TOTAL
+
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+# How often stores are swept for expired results, and how often long-polls re-read a job.
+PURGE_INTERVAL_SECONDS = 60.0
+POLL_INTERVAL_SECONDS = 0.1
+# Suggested back-off for clients turned away by a full queue.
+RETRY_AFTER_SECONDS = 5
+
+
+@dataclass(frozen=True)
+class Job:
+    """Snapshot of one job; ``result`` is the serialised interaction response."""
+
+    job_id: str
+    status: str
+    language: str
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    status_code: Optional[int] = None
+    result: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+
+_COLUMNS = tuple(field.name for field in fields(Job))
+
+
+class JobStore(Protocol):
+    """Persistence for job records; transitions are atomic compare-and-set updates."""
+
+    def create(self, job: Job) -> None: ...
+
+    def get(self, job_id: str) -> Optional[Job]: ...
+
+    def transition(self, job_id: str, from_statuses: tuple[str, ...], **changes: Any) -> Optional[Job]:
+        """Apply ``changes`` only if the job is in one of ``from_statuses``; return the updated job."""
+        ...
+
+    def purge(self, finished_before: float) -> int: ...
+
+    def close(self) -> None: ...
+
+
+class MemoryJobStore:
+    """Process-local job records; lost on restart."""
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def create(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def transition(self, job_id: str, from_statuses: tuple[str, ...], **changes: Any) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in from_statuses:
+                return None
+            job = self._jobs[job_id] = replace(job, **changes)
+            return job
+
+    def purge(self, finished_before: float) -> int:
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.finished and (job.finished_at or job.created_at) < finished_before
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteJobStore:
+    """Job records in a local SQLite file, so results outlive a restart.
+
+    Jobs that were queued or running when the process stopped cannot resume
+    (their audio was only held in memory) and are marked failed on open.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, language TEXT NOT NULL, created_at REAL NOT NULL, "
+            "started_at REAL, finished_at REAL, status_code INTEGER, result TEXT, error TEXT)"
+        )
+        interrupted = self._conn.execute(
+            "UPDATE jobs SET status = ?, status_code = 503, error = ?, finished_at = ? WHERE status IN (?, ?)",
+            (FAILED, "Interrupted by a service restart; please resubmit.", time.time(), QUEUED, RUNNING),
+        ).rowcount
+        if interrupted:
+            logger.warning("Marked %s interrupted jobs as failed | path=%s", interrupted, path)
+
+    def create(self, job: Job) -> None:
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO jobs ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                tuple(getattr(job, column) for column in _COLUMNS),
+            )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._get(job_id)
+
+    def _get(self, job_id: str) -> Optional[Job]:
+        row = self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return Job(*row) if row else None
+
+    def transition(self, job_id: str, from_statuses: tuple[str, ...], **changes: Any) -> Optional[Job]:
+        unknown = set(changes) - set(_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown job fields: {sorted(unknown)}")
+        assignments = ", ".join(f"{column} = ?" for column in changes)
+        statuses = ", ".join("?" for _ in from_statuses)
+        with self._lock:
+            updated = self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE job_id = ? AND status IN ({statuses})",
+                (*changes.values(), job_id, *from_statuses),
+            ).rowcount
+            return self._get(job_id) if updated else None
+
+    def purge(self, finished_before: float) -> int:
+        statuses = ", ".join("?" for _ in FINISHED)
+        with self._lock:
+            return self._conn.execute(
+                f"DELETE FROM jobs WHERE status IN ({statuses}) AND COALESCE(finished_at, created_at) < ?",
+                (*FINISHED, finished_before),
+            ).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class QueueFull(RuntimeError):
+    """Raised when the job queue is at capacity; callers should retry later."""
+
+
+class JobQueue:
+    """Bounded queue of voice jobs run on a thread pool.
+
+    ``submit`` takes a zero-argument task returning the serialised result.
+    A task that raises fails its job with the exception's ``status_code`` and
+    ``detail`` when present (as ``HTTPException`` carries them), else 500.
+    Cancelling a queued job drops it before it starts; a running job cannot
+    be interrupted, so it is marked cancelled and its result is discarded.
+    """
+
+    def __init__(self, store: JobStore, *, workers: int, max_queued: int, result_ttl_seconds: float) -> None:
+        self._store = store
+        self._max_queued = max_queued
+        self._result_ttl_seconds = result_ttl_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="voice-job")
+        self._futures: dict[str, Future[None]] = {}
+        self._queued = 0
+        self._lock = threading.Lock()
+        self._last_purge = time.monotonic()
+
+    @property
+    def depth(self) -> int:
+        """Jobs accepted but not yet picked up by a worker."""
+
+        return self._queued
+
+    def submit(self, task: Callable[[], str], *, language: str) -> Job:
+        with self._lock:
+            if self._queued >= self._max_queued:
+                JOBS_TOTAL.inc(status="rejected")
+                raise QueueFull(f"{self._queued} jobs are already waiting")
+            self._queued += 1
+            JOBS_QUEUED.set(self._queued)
+
+        self._maybe_purge()
+        job = Job(job_id=uuid.uuid4().hex, status=QUEUED, language=language, created_at=time.time())
+        self._store.create(job)
+        future = self._executor.submit(self._run, job.job_id, task, time.monotonic())
+        self._futures[job.job_id] = future
+        future.add_done_callback(lambda _: self._futures.pop(job.job_id, None))
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._store.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Job]:
+        """Return the job once it finishes or ``timeout`` elapses, whichever is first."""
+
+        deadline = time.monotonic() + timeout
+        job = self._store.get(job_id)
+        while job is not None and not job.finished and time.monotonic() < deadline:
+            await asyncio.sleep(min(POLL_INTERVAL_SECONDS, max(0.0, deadline - time.monotonic())))
+            job = self._store.get(job_id)
+        return job
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel an unfinished job; returns the job as it now stands, or ``None`` if unknown."""
+
+        job = self._store.transition(job_id, (QUEUED, RUNNING), status=CANCELLED, finished_at=time.time())
+        if job is None:
+            return self._store.get(job_id)
+        future = self._futures.get(job_id)
+        if future is not None and future.cancel():
+            # The worker never saw it, so the queue slot is released here.
+            self._release_slot()
+        JOBS_TOTAL.inc(status=CANCELLED)
+        logger.info("Job cancelled | job_id=%s", job_id)
+        return job
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._store.close()
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._queued -= 1
+            JOBS_QUEUED.set(self._queued)
+
+    def _run(self, job_id: str, task: Callable[[], str], enqueued_at: float) -> None:
+        self._release_slot()
+        JOB_QUEUE_WAIT_SECONDS.observe(time.monotonic() - enqueued_at)
+        if self._store.transition(job_id, (QUEUED,), status=RUNNING, started_at=time.time()) is None:
+            return  # cancelled while queued
+
+        changes: dict[str, Any]
+        with JOBS_RUNNING.track():
+            try:
+                changes = {"status": SUCCEEDED, "status_code": 200, "result": task()}
+            except Exception as exc:
+                status_code = getattr(exc, "status_code", 500)
+                if status_code >= 500:
+                    logger.warning("Job failed | job_id=%s error=%r", job_id, exc)
+                changes = {
+                    "status": FAILED,
+                    "status_code": status_code,
+                    "error": str(getattr(exc, "detail", None) or "The job failed. Please resubmit."),
+                }
+
+        if self._store.transition(job_id, (RUNNING,), finished_at=time.time(), **changes) is None:
+            logger.info("Discarded result of cancelled job | job_id=%s", job_id)
+            return
+        JOBS_TOTAL.inc(status=changes["status"])
+
+    def _maybe_purge(self) -> None:
+        now = time.monotonic()
+        if now - self._last_purge < PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+        purged = self._store.purge(time.time() - self._result_ttl_seconds)
+        if purged:
+            logger.info("Purged expired jobs | count=%s", purged)
+
+
+@lru_cache(maxsize=1)
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue with the configured store."""
+
+    settings = get_settings()
+    backend_name = settings.job_store_backend.lower()
+    store: JobStore
+    if backend_name == "memory":
+        store = MemoryJobStore()
+    elif backend_name == "sqlite":
+        store = SqliteJobStore(Path(settings.job_store_path))
+    else:
+        raise ValueError(f"Unknown JOB_STORE_BACKEND: {settings.job_store_backend!r}")
+
+    logger.info(
+        "Job queue enabled | backend=%s workers=%s max_queued=%s",
+        backend_name,
+        settings.job_workers,
+        settings.job_queue_max,
+    )
+    return JobQueue(
+        store,
+        workers=settings.job_workers,
+        max_queued=settings.job_queue_max,
+        result_ttl_seconds=settings.job_result_ttl_seconds,
+    )
+
+
+__all__ = [
+    "CANCELLED",
+    "FAILED",
+    "Job",
+    "JobQueue",
+    "JobStore",
+    "MemoryJobStore",
+    "QUEUED",
+    "QueueFull",
+    "RETRY_AFTER_SECONDS",
+    "RUNNING",
+    "SUCCEEDED",
+    "SqliteJobStore",
+    "get_job_queue",
+]
@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import math
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Any, Iterable, Optional
+from typing import Any, AsyncIterator, BinaryIO, Iterable, Optional
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from openai import OpenAIError
 
 from ..config import get_settings
+from .audio_store import AudioStore, get_audio_store
+from .cache import normalize_transcript
+from .http_pool import build_async_http_client, build_http_client
+from .reply_fallback import (
+    CHAT_FALLBACK,
+    CHAT_RACED,
+    CHAT_REMEMBERED,
+    EMPTY,
+    RESPONSES,
+    ReplyFallback,
+    build_reply_fallback,
+)
+from .resilience import Resilience, build_resilience
+from .single_flight import SingleFlight, build_single_flight
 
 
 logger = logging.getLogger(__name__)
@@ -45,54 +62,68 @@ class SpeechResult:
     format: str
 
 
-class OpenAIService:
-    """Convenience service that aggregates the OpenAI workflows we need."""
+class _OpenAIServiceBase:
+    """Model configuration and payload helpers shared by the sync and async services."""
+
+    _audio_store: Optional[AudioStore] = None
+    _resilience: Resilience = Resilience()
+    _reply_fallback: ReplyFallback = ReplyFallback()
+    _single_flight: SingleFlight = SingleFlight(())
 
     def __init__(
         self,
-        api_key: str,
         stt_model: str,
         llm_model: str,
         tts_model: str,
         tts_voice: str,
         tts_format: str = "mp3",
+        audio_store: Optional[AudioStore] = None,
+        resilience: Optional[Resilience] = None,
+        reply_fallback: Optional[ReplyFallback] = None,
+        single_flight: Optional[SingleFlight] = None,
     ) -> None:
-        self._client = OpenAI(api_key=api_key)
         self._stt_model = stt_model
         self._llm_model = llm_model
         self._tts_model = tts_model
         self._tts_voice = tts_voice
         self._tts_format = tts_format
-
-    @property
-    def client(self) -> OpenAI:
-        return self._client
-
-    def transcribe_audio(
+        self._audio_store = audio_store
+        if resilience is not None:
+            self._resilience = resilience
+        if reply_fallback is not None:
+            self._reply_fallback = reply_fallback
+        if single_flight is not None:
+            self._single_flight = single_flight
+
+    def _transcription_request(
         self,
         *,
-        audio_bytes: bytes,
+        audio_bytes: Optional[bytes],
+        audio_file: Optional[BinaryIO],
         filename: str,
-        language: Optional[str] = None,
-        mime_type: Optional[str] = None,
-    ) -> TranscriptionResult:
-        """Send audio bytes to Whisper for transcription."""
-
+        language: Optional[str],
+        mime_type: Optional[str],
+    ) -> dict[str, Any]:
+        # A file object is streamed into the multipart body in chunks by httpx
+        # (rewound first, so retries resend it whole) instead of being copied.
+        audio = audio_file if audio_file is not None else audio_bytes
+        if audio is None:
+            raise ValueError("Either audio_bytes or audio_file is required.")
         logger.debug(
-            "Requesting transcription | filename=%s bytes=%s language=%s mime=%s",
+            "Requesting transcription | filename=%s source=%s language=%s mime=%s",
             filename,
-            len(audio_bytes),
+            "file" if audio_file is not None else f"{len(audio_bytes)} bytes",
             language,
             mime_type,
         )
-
-        response = self._client.audio.transcriptions.create(
-            model=self._stt_model,
-            file=(filename, audio_bytes),
-            language=language,
-            response_format="verbose_json",
-        )
-
+        return {
+            "model": self._stt_model,
+            "file": (filename, audio),
+            "language": language,
+            "response_format": "verbose_json",
+        }
+
+    def _transcription_result(self, response: Any, language: Optional[str]) -> TranscriptionResult:
         text = getattr(response, "text", "").strip()
         response_language = getattr(response, "language", None)
         segments = getattr(response, "segments", None)
@@ -105,18 +136,14 @@ class OpenAIService:
             confidence=confidence,
         )
 
-    def generate_response(
+    def _prompts(
         self,
         *,
         transcript: str,
         language: str,
-        context: Optional[str] = None,
-        model: Optional[str] = None,
-    ) -> LLMResult:
-        """Ask the GPT model to produce a concise, empathetic response."""
-
-        target_model = model or self._llm_model
-
+        context: Optional[str],
+        target_model: str,
+    ) -> tuple[str, str]:
         logger.debug(
             "Generating response | model=%s language=%s transcript_snippet=%s",
             target_model,
@@ -131,53 +158,203 @@ class OpenAIService:
         )
 
         user_prompt = transcript if context is None else f"{context}\n\nFarmer: {transcript}"
+        return system_prompt, user_prompt
 
-        response = self._client.responses.create(
-            model=target_model,
-            input=[
-                {
-                    "role": "system",
-                    "content": [
-                        {"type": "input_text", "text": system_prompt},
-                    ],
-                },
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "input_text", "text": user_prompt},
-                    ],
-                },
-            ],
+    @staticmethod
+    def _reply_key(*, transcript: str, language: str, context: Optional[str], target_model: str) -> tuple:
+        """Single-flight key of a reply; transcripts are folded like the reply cache's keys."""
+
+        return (target_model, language, normalize_transcript(transcript), context)
+
+    def _speech_request(
+        self,
+        *,
+        text: str,
+        language: str,
+        voice: Optional[str],
+        audio_format: Optional[str],
+        model: Optional[str],
+    ) -> dict[str, Any]:
+        target_voice = voice or self._tts_voice
+        target_format = audio_format or self._tts_format
+        target_model = model or self._tts_model
+
+        logger.debug("Synthesising speech using model=%s voice=%s language=%s", target_model, target_voice, language)
+
+        return {
+            "model": target_model,
+            "voice": target_voice,
+            "input": text,
+            "response_format": target_format,
+        }
+
+    def _stored_speech(self, request: dict[str, Any]) -> tuple[Optional[str], Optional[SpeechResult]]:
+        """Look the request up in the audio store; return its key and any stored clip."""
+
+        if self._audio_store is None:
+            return None, None
+
+        key = AudioStore.key(
+            text=request["input"],
+            voice=request["voice"],
+            model=request["model"],
+            audio_format=request["response_format"],
         )
+        audio_bytes = self._audio_store.get(key)
+        if audio_bytes is None:
+            return key, None
 
-        text = _extract_text(response)
-        if text.strip():
-            return LLMResult(text=text, model=target_model)
+        logger.debug("Serving speech from audio store | key=%s bytes=%s", key[:12], len(audio_bytes))
+        return key, SpeechResult(
+            audio_bytes=audio_bytes,
+            model=request["model"],
+            voice=request["voice"],
+            format=request["response_format"],
+        )
 
-        logger.warning("Responses API returned empty text; falling back to chat.completions")
+    @staticmethod
+    def _speech_key(request: dict[str, Any]) -> tuple:
+        """Single-flight key of a speech request, after voice, format and model defaults are applied."""
 
-        chat_response = self._client.chat.completions.create(
-            model=target_model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+        return (request["model"], request["voice"], request["response_format"], request["input"])
+
+    def _store_speech(self, key: Optional[str], result: SpeechResult, *, pin: bool = False) -> None:
+        if self._audio_store is not None and key is not None:
+            self._audio_store.put(key, result.audio_bytes, pin=pin)
+
+    def _speech_result(self, speech: Any, request: dict[str, Any]) -> SpeechResult:
+        audio_bytes = _speech_bytes(speech)
+
+        logger.debug(
+            "Synthesised speech bytes | model=%s voice=%s format=%s bytes=%s",
+            request["model"],
+            request["voice"],
+            request["response_format"],
+            len(audio_bytes),
         )
 
-        fallback_text = ""
-        choices = getattr(chat_response, "choices", None)
-        if choices:
-            first_choice = choices[0]
-            message = getattr(first_choice, "message", None)
-            if message is None and hasattr(first_choice, "delta"):
-                message = getattr(first_choice, "delta")
-            if message is not None:
-                fallback_text = getattr(message, "content", "") or ""
+        return SpeechResult(
+            audio_bytes=audio_bytes,
+            model=request["model"],
+            voice=request["voice"],
+            format=request["response_format"],
+        )
 
-        if not fallback_text:
-            logger.warning("Chat completions fallback also returned no content")
 
-        return LLMResult(text=fallback_text.strip(), model=target_model)
+class OpenAIService(_OpenAIServiceBase):
+    """Convenience service that aggregates the OpenAI workflows we need."""
+
+    def __init__(
+        self,
+        api_key: str,
+        stt_model: str,
+        llm_model: str,
+        tts_model: str,
+        tts_voice: str,
+        tts_format: str = "mp3",
+        audio_store: Optional[AudioStore] = None,
+        resilience: Optional[Resilience] = None,
+        base_url: Optional[str] = None,
+        http_client: Optional[httpx.Client] = None,
+        reply_fallback: Optional[ReplyFallback] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ) -> None:
+        super().__init__(
+            stt_model,
+            llm_model,
+            tts_model,
+            tts_voice,
+            tts_format,
+            audio_store,
+            resilience,
+            reply_fallback,
+            single_flight,
+        )
+        # Retries are driven by ``Resilience`` so they share the request budget.
+        self._client = OpenAI(api_key=api_key, base_url=base_url, max_retries=0, http_client=http_client)
+
+    @property
+    def client(self) -> OpenAI:
+        return self._client
+
+    def transcribe_audio(
+        self,
+        *,
+        audio_bytes: Optional[bytes] = None,
+        audio_file: Optional[BinaryIO] = None,
+        filename: str,
+        language: Optional[str] = None,
+        mime_type: Optional[str] = None,
+    ) -> TranscriptionResult:
+        """Send audio to Whisper for transcription.
+
+        Pass either ``audio_bytes`` or a seekable ``audio_file``; the file is
+        streamed into the request without being read into memory.
+        """
+
+        request = self._transcription_request(
+            audio_bytes=audio_bytes,
+            audio_file=audio_file,
+            filename=filename,
+            language=language,
+            mime_type=mime_type,
+        )
+        # Concurrent hedges cannot share one file position, so only byte payloads are hedged.
+        response = self._resilience.call(
+            "transcribe",
+            lambda timeout: self._client.audio.transcriptions.create(**request, timeout=timeout),
+            hedge=audio_file is None,
+        )
+        return self._transcription_result(response, language)
+
+    def generate_response(
+        self,
+        *,
+        transcript: str,
+        language: str,
+        context: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> LLMResult:
+        """Ask the GPT model to produce a concise, empathetic response."""
+
+        target_model = model or self._llm_model
+        system_prompt, user_prompt = self._prompts(
+            transcript=transcript,
+            language=language,
+            context=context,
+            target_model=target_model,
+        )
+
+        def _responses() -> str:
+            response = self._resilience.call(
+                "generate_response",
+                lambda timeout: self._client.responses.create(
+                    model=target_model,
+                    input=_responses_input(system_prompt, user_prompt),
+                    timeout=timeout,
+                ),
+            )
+            return _extract_text(response)
+
+        text = self._single_flight.call(
+            "generate_response",
+            self._reply_key(transcript=transcript, language=language, context=context, target_model=target_model),
+            lambda: self._reply_fallback.resolve(
+                target_model, _responses, lambda: self._chat_reply(target_model, system_prompt, user_prompt)
+            ),
+        )
+        return LLMResult(text=text, model=target_model)
+
+    def _chat_reply(self, model: str, system_prompt: str, user_prompt: str) -> str:
+        chat_response = self._resilience.call(
+            "generate_response",
+            lambda timeout: self._client.chat.completions.create(
+                model=model,
+                messages=_chat_messages(system_prompt, user_prompt),
+                timeout=timeout,
+            ),
+        )
+        return _chat_text(chat_response)
 
     def synthesize_speech(
         self,
@@ -190,42 +367,417 @@ class OpenAIService:
     ) -> SpeechResult:
         """Convert assistant text into audio using the OpenAI TTS API."""
 
-        target_voice = voice or self._tts_voice
-        target_format = audio_format or self._tts_format
-        target_model = model or self._tts_model
+        request = self._speech_request(
+            text=text,
+            language=language,
+            voice=voice,
+            audio_format=audio_format,
+            model=model,
+        )
+        key, stored = self._stored_speech(request)
+        if stored is not None:
+            return stored
+
+        def _synthesize() -> SpeechResult:
+            speech = self._resilience.call(
+                "synthesize", lambda timeout: self._client.audio.speech.create(**request, timeout=timeout)
+            )
+            result = self._speech_result(speech, request)
+            self._store_speech(key, result)
+            return result
+
+        return self._single_flight.call("synthesize", self._speech_key(request), _synthesize)
+
+    def embed_texts(self, texts: list[str], *, model: str, dimensions: Optional[int] = None) -> list[list[float]]:
+        """Embed texts with the embeddings endpoint; vectors come back in input order."""
+
+        response = self._resilience.call(
+            "embed",
+            lambda timeout: self._client.embeddings.create(
+                model=model, input=texts, timeout=timeout, **_embedding_options(dimensions)
+            ),
+        )
+        return _embeddings(response)
 
-        logger.debug("Synthesising speech using model=%s voice=%s language=%s", target_model, target_voice, language)
 
-        speech = self._client.audio.speech.create(
-            model=target_model,
-            voice=target_voice,
-            input=text,
-            response_format=target_format,
-        )
+class AsyncOpenAIService(_OpenAIServiceBase):
+    """Asyncio variant of :class:`OpenAIService` built on ``AsyncOpenAI``.
 
-        if hasattr(speech, "content") and isinstance(speech.content, (bytes, bytearray)):
-            audio_bytes = bytes(speech.content)
-        elif hasattr(speech, "data") and isinstance(speech.data, (bytes, bytearray)):
-            audio_bytes = bytes(speech.data)
-        elif hasattr(speech, "read"):
-            audio_bytes = speech.read()
-        else:  # pragma: no cover - fallback for SDK changes
-            audio_bytes = bytes(speech)  # type: ignore[arg-type]
+    Every call awaits the network instead of parking a worker thread, so the
+    number of in-flight voice requests is bounded by sockets, not the executor.
+    """
 
-        logger.debug(
-            "Synthesised speech bytes | model=%s voice=%s format=%s bytes=%s",
-            target_model,
-            target_voice,
-            target_format,
-            len(audio_bytes),
+    def __init__(
+        self,
+        api_key: str,
+        stt_model: str,
+        llm_model: str,
+        tts_model: str,
+        tts_voice: str,
+        tts_format: str = "mp3",
+        audio_store: Optional[AudioStore] = None,
+        resilience: Optional[Resilience] = None,
+        base_url: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        reply_fallback: Optional[ReplyFallback] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ) -> None:
+        super().__init__(
+            stt_model,
+            llm_model,
+            tts_model,
+            tts_voice,
+            tts_format,
+            audio_store,
+            resilience,
+            reply_fallback,
+            single_flight,
         )
+        self._client = AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0, http_client=http_client)
 
-        return SpeechResult(
+    @property
+    def client(self) -> AsyncOpenAI:
+        return self._client
+
+    async def transcribe_audio(
+        self,
+        *,
+        audio_bytes: Optional[bytes] = None,
+        audio_file: Optional[BinaryIO] = None,
+        filename: str,
+        language: Optional[str] = None,
+        mime_type: Optional[str] = None,
+    ) -> TranscriptionResult:
+        """Send audio to Whisper for transcription.
+
+        Pass either ``audio_bytes`` or a seekable ``audio_file``; the file is
+        streamed into the request without being read into memory.
+        """
+
+        request = self._transcription_request(
             audio_bytes=audio_bytes,
-            model=target_model,
-            voice=target_voice,
-            format=target_format,
+            audio_file=audio_file,
+            filename=filename,
+            language=language,
+            mime_type=mime_type,
+        )
+        # Concurrent hedges cannot share one file position, so only byte payloads are hedged.
+        response = await self._resilience.acall(
+            "transcribe",
+            lambda timeout: self._client.audio.transcriptions.create(**request, timeout=timeout),
+            hedge=audio_file is None,
+        )
+        return self._transcription_result(response, language)
+
+    async def generate_response(
+        self,
+        *,
+        transcript: str,
+        language: str,
+        context: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> LLMResult:
+        """Ask the GPT model to produce a concise, empathetic response."""
+
+        target_model = model or self._llm_model
+        system_prompt, user_prompt = self._prompts(
+            transcript=transcript,
+            language=language,
+            context=context,
+            target_model=target_model,
+        )
+
+        async def _responses() -> str:
+            response = await self._resilience.acall(
+                "generate_response",
+                lambda timeout: self._client.responses.create(
+                    model=target_model,
+                    input=_responses_input(system_prompt, user_prompt),
+                    timeout=timeout,
+                ),
+            )
+            return _extract_text(response)
+
+        text = await self._single_flight.acall(
+            "generate_response",
+            self._reply_key(transcript=transcript, language=language, context=context, target_model=target_model),
+            lambda: self._reply_fallback.aresolve(
+                target_model, _responses, lambda: self._chat_reply(target_model, system_prompt, user_prompt)
+            ),
+        )
+        return LLMResult(text=text, model=target_model)
+
+    async def _chat_reply(self, model: str, system_prompt: str, user_prompt: str) -> str:
+        chat_response = await self._resilience.acall(
+            "generate_response",
+            lambda timeout: self._client.chat.completions.create(
+                model=model,
+                messages=_chat_messages(system_prompt, user_prompt),
+                timeout=timeout,
+            ),
+        )
+        return _chat_text(chat_response)
+
+    async def stream_response(
+        self,
+        *,
+        transcript: str,
+        language: str,
+        context: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Yield reply text deltas from the Responses API as they are generated.
+
+        When the stream produces no text, the ``LLM_EMPTY_REPLY_FALLBACK``
+        strategy applies and a single non-streamed chat.completions reply is
+        yielded instead. With ``race`` the chat call starts alongside the
+        stream and is cancelled by the first delta, since a stream's first
+        token normally beats a whole chat reply.
+        """
+
+        target_model = model or self._llm_model
+        system_prompt, user_prompt = self._prompts(
+            transcript=transcript,
+            language=language,
+            context=context,
+            target_model=target_model,
+        )
+        fallback = self._reply_fallback
+
+        if fallback.prefers_chat(target_model):
+            text = await self._chat_reply(target_model, system_prompt, user_prompt)
+            fallback.record(target_model, CHAT_REMEMBERED if text else EMPTY)
+            if text:
+                yield text
+            return
+
+        raced: Optional[asyncio.Future[str]] = None
+        if fallback.strategy == "race":
+            raced = asyncio.ensure_future(self._chat_reply(target_model, system_prompt, user_prompt))
+
+        produced = False
+        try:
+            try:
+                async for delta in self._response_deltas(target_model, system_prompt, user_prompt):
+                    if raced is not None and not produced:
+                        raced.cancel()
+                    produced = True
+                    yield delta
+            except Exception:
+                if produced or raced is None:
+                    raise
+                logger.warning("Responses stream failed; using the raced chat.completions reply", exc_info=True)
+                text = await raced
+                fallback.record(target_model, CHAT_RACED if text else EMPTY)
+                if text:
+                    yield text
+                return
+
+            if produced:
+                fallback.record(target_model, RESPONSES)
+                return
+
+            if raced is not None:
+                text, path = await raced, CHAT_RACED
+            elif fallback.strategy == "none":
+                text, path = "", RESPONSES
+            else:
+                logger.warning("Responses stream returned empty text; falling back to chat.completions")
+                text, path = await self._chat_reply(target_model, system_prompt, user_prompt), CHAT_FALLBACK
+            fallback.record(target_model, path if text else EMPTY)
+            if text:
+                yield text
+        finally:
+            if raced is not None:
+                raced.cancel()
+
+    async def _response_deltas(self, model: str, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        # Only opening the stream is retried; a stream that fails midway cannot be replayed.
+        stream = await self._resilience.acall(
+            "generate_response",
+            lambda timeout: self._client.responses.create(
+                model=model,
+                input=_responses_input(system_prompt, user_prompt),
+                stream=True,
+                timeout=timeout,
+            ),
+            hedge=False,
+        )
+
+        async for event in stream:
+            if getattr(event, "type", None) != "response.output_text.delta":
+                continue
+            delta = getattr(event, "delta", "") or ""
+            if delta:
+                yield delta
+
+    async def synthesize_speech(
+        self,
+        *,
+        text: str,
+        language: str,
+        voice: Optional[str] = None,
+        audio_format: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> SpeechResult:
+        """Convert assistant text into audio using the OpenAI TTS API."""
+
+        request = self._speech_request(
+            text=text,
+            language=language,
+            voice=voice,
+            audio_format=audio_format,
+            model=model,
+        )
+        key, stored = await self._astored_speech(request)
+        if stored is not None:
+            return stored
+
+        async def _synthesize() -> SpeechResult:
+            speech = await self._resilience.acall(
+                "synthesize", lambda timeout: self._client.audio.speech.create(**request, timeout=timeout)
+            )
+            result = self._speech_result(speech, request)
+            await self._astore_speech(key, result)
+            return result
+
+        return await self._single_flight.acall("synthesize", self._speech_key(request), _synthesize)
+
+    async def embed_texts(
+        self, texts: list[str], *, model: str, dimensions: Optional[int] = None
+    ) -> list[list[float]]:
+        """Embed texts with the embeddings endpoint; vectors come back in input order."""
+
+        response = await self._resilience.acall(
+            "embed",
+            lambda timeout: self._client.embeddings.create(
+                model=model, input=texts, timeout=timeout, **_embedding_options(dimensions)
+            ),
         )
+        return _embeddings(response)
+
+    async def warm_speech(self, *, text: str, language: str) -> SpeechResult:
+        """Make sure a fixed phrase is stored and pinned in memory.
+
+        Synthesises it once if the store does not have it yet; afterwards the
+        phrase is always served locally.
+        """
+
+        request = self._speech_request(text=text, language=language, voice=None, audio_format=None, model=None)
+        key, stored = await self._astored_speech(request)
+        if stored is not None:
+            if self._audio_store is not None and key is not None:
+                await asyncio.to_thread(self._audio_store.pin, key)
+            return stored
+
+        speech = await self._resilience.acall(
+            "synthesize", lambda timeout: self._client.audio.speech.create(**request, timeout=timeout)
+        )
+        result = self._speech_result(speech, request)
+        await self._astore_speech(key, result, pin=True)
+        return result
+
+    # The clip store reads and writes files, so it is used from a worker thread here.
+
+    async def _astored_speech(self, request: dict[str, Any]) -> tuple[Optional[str], Optional[SpeechResult]]:
+        if self._audio_store is None:
+            return None, None
+        return await asyncio.to_thread(self._stored_speech, request)
+
+    async def _astore_speech(self, key: Optional[str], result: SpeechResult, *, pin: bool = False) -> None:
+        if self._audio_store is not None and key is not None:
+            await asyncio.to_thread(self._store_speech, key, result, pin=pin)
+
+    async def warm_connections(self, count: int, *, timeout: float = 5.0) -> int:
+        """Open up to ``count`` pooled connections before the first real request.
+
+        Sends ``count`` concurrent ``GET /models`` requests, which are free and
+        force one connection (TCP + TLS handshake) each; they stay in the pool
+        for ``OPENAI_KEEPALIVE_EXPIRY_SECONDS``. Returns how many succeeded.
+        """
+
+        client = self._client.with_options(timeout=timeout)
+
+        async def _ping() -> bool:
+            try:
+                await client.models.list()
+            except OpenAIError as exc:
+                logger.warning("Connection warmup request failed: %s", exc)
+                return False
+            return True
+
+        results = await asyncio.gather(*(_ping() for _ in range(count)))
+        return sum(results)
+
+
+def _embedding_options(dimensions: Optional[int]) -> dict[str, Any]:
+    # text-embedding-3 models can return shortened vectors; older models reject the parameter.
+    return {"dimensions": dimensions} if dimensions else {}
+
+
+def _embeddings(response: Any) -> list[list[float]]:
+    return [list(item.embedding) for item in sorted(response.data, key=lambda item: item.index)]
+
+
+def _responses_input(system_prompt: str, user_prompt: str) -> list[dict[str, Any]]:
+    """Build the Responses API ``input`` payload."""
+
+    return [
+        {
+            "role": "system",
+            "content": [
+                {"type": "input_text", "text": system_prompt},
+            ],
+        },
+        {
+            "role": "user",
+            "content": [
+                {"type": "input_text", "text": user_prompt},
+            ],
+        },
+    ]
+
+
+def _chat_messages(system_prompt: str, user_prompt: str) -> list[dict[str, str]]:
+    """Build the chat.completions ``messages`` payload."""
+
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def _chat_text(chat_response: Any) -> str:
+    """Pull the first choice's text out of a chat.completions response."""
+
+    fallback_text = ""
+    choices = getattr(chat_response, "choices", None)
+    if choices:
+        first_choice = choices[0]
+        message = getattr(first_choice, "message", None)
+        if message is None and hasattr(first_choice, "delta"):
+            message = getattr(first_choice, "delta")
+        if message is not None:
+            fallback_text = getattr(message, "content", "") or ""
+
+    if not fallback_text:
+        logger.warning("Chat completions fallback also returned no content")
+
+    return fallback_text.strip()
+
+
+def _speech_bytes(speech: Any) -> bytes:
+    """Normalise the various SDK speech payload shapes into raw bytes."""
+
+    if hasattr(speech, "content") and isinstance(speech.content, (bytes, bytearray)):
+        audio_bytes = bytes(speech.content)
+    elif hasattr(speech, "data") and isinstance(speech.data, (bytes, bytearray)):
+        audio_bytes = bytes(speech.data)
+    elif hasattr(speech, "read"):
+        audio_bytes = speech.read()
+    else:  # pragma: no cover - fallback for SDK changes
+        audio_bytes = bytes(speech)  # type: ignore[arg-type]
+    return audio_bytes
 
 
 def _estimate_confidence(segments: Optional[Iterable[Any]]) -> Optional[float]:
@@ -253,28 +805,103 @@ def _estimate_confidence(segments: Optional[Iterable[Any]]) -> Optional[float]:
     return min(1.0, max(0.0, avg_confidence))
 
 
-def _extract_text(response: Any) -> str:
-    """Extract textual content from the Responses API output."""
+# Where each response class keeps its ``output`` list: the attribute itself or
+# one of its serialisers. Filled on first sight of a class.
+_OUTPUT_SOURCES: dict[type, str] = {}
+_OUTPUT_SERIALISERS = ("model_dump", "model_dump_json", "dict", "to_dict", "model_dump_recursive")
 
-    if response is None:
-        return ""
 
-    # v1.0+ exposes a convenience property.
-    text = getattr(response, "output_text", None)
-    if isinstance(text, str) and text.strip():
-        return text.strip()
+def _field(value: Any, name: str) -> Any:
+    """Read ``name`` from a dict or an SDK object."""
+
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def _read_output(response: Any, source: str) -> Optional[list[Any]]:
+    if source == "output":
+        output = getattr(response, "output", None)
+    else:
+        serializer = getattr(response, source, None)
+        if not callable(serializer):
+            return None
+        try:
+            dumped = serializer()
+            if isinstance(dumped, str):
+                dumped = json.loads(dumped)
+        except Exception:  # pragma: no cover - defensive
+            return None
+        output = dumped.get("output") if isinstance(dumped, dict) else None
+    return list(output) if isinstance(output, (list, tuple)) and output else None
+
+
+def _response_output(response: Any) -> Optional[list[Any]]:
+    """The Responses API ``output`` list, read the way that worked for this class before."""
+
+    cls = type(response)
+    known = _OUTPUT_SOURCES.get(cls)
+    if known is not None:
+        output = _read_output(response, known)
+        if output is not None:
+            return output
+
+    for source in ("output", *_OUTPUT_SERIALISERS):
+        if source == known:
+            continue
+        output = _read_output(response, source)
+        if output is not None:
+            _OUTPUT_SOURCES[cls] = source
+            return output
+    return None
+
+
+def _output_text(output: list[Any]) -> Optional[str]:
+    """Concatenate ``output_text`` parts of message items, like the SDK's ``output_text``.
+
+    Returns None when no item matches the message schema, so the caller can
+    fall back to walking the payload.
+    """
+
+    parts: list[str] = []
+    matched = False
+    for item in output:
+        if _field(item, "type") != "message":
+            continue
+        content = _field(item, "content")
+        if not isinstance(content, (list, tuple)):
+            continue
+        matched = True
+        for part in content:
+            if _field(part, "type") != "output_text":
+                continue
+            text = _field(part, "text")
+            if text is not None and not isinstance(text, str):
+                # Older payloads wrap the string as {"value": ...}.
+                text = _field(text, "value")
+            if isinstance(text, str):
+                parts.append(text)
+    return "".join(parts).strip() if matched else None
+
+
+# Dict keys that tag a block's kind or identity rather than hold reply text.
+_DISCRIMINATOR_KEYS = frozenset({"type", "kind", "role", "id", "object", "status"})
+
+
+def _walk_text(value: object) -> str:
+    """Last resort for unknown shapes: collect every string reachable from ``value``."""
 
-    # Fallback to inspect the output blocks or recursively walk the response.
     chunks: list[str] = []
+    visited: set[int] = set()
 
-    def _collect_text(value: object, *, _visited: set[int]) -> None:
+    def _collect_text(value: object) -> None:
         if value is None:
             return
 
         value_id = id(value)
-        if value_id in _visited:
+        if value_id in visited:
             return
-        _visited.add(value_id)
+        visited.add(value_id)
 
         if isinstance(value, str):
             stripped = value.strip()
@@ -284,15 +911,13 @@ def _extract_text(response: Any) -> str:
 
         if isinstance(value, dict):
             for key, nested in value.items():
-                if key in {"text", "output_text", "value"}:
-                    _collect_text(nested, _visited=_visited)
-                else:
-                    _collect_text(nested, _visited=_visited)
+                if key not in _DISCRIMINATOR_KEYS:
+                    _collect_text(nested)
             return
 
         if isinstance(value, (list, tuple, set)):
             for item in value:
-                _collect_text(item, _visited=_visited)
+                _collect_text(item)
             return
 
         # Handle SDK-specific objects where attributes expose nested content.
@@ -302,46 +927,31 @@ def _extract_text(response: Any) -> str:
                     nested_value = getattr(value, attr)
                 except Exception:  # pragma: no cover - defensive
                     continue
-                _collect_text(nested_value, _visited=_visited)
+                _collect_text(nested_value)
 
-    # Prefer the direct output list if available.
-    output = getattr(response, "output", None)
-    if output:
-        _collect_text(output, _visited=set())
-    else:
-        # Fall back to model_dump / dict serialisations.
-        serialisers = (
-            "model_dump",
-            "model_dump_json",
-            "dict",
-            "to_dict",
-            "model_dump_recursive",
-        )
-        for name in serialisers:
-            serializer = getattr(response, name, None)
-            if callable(serializer):
-                try:
-                    dumped = serializer()
-                    if isinstance(dumped, str):
-                        try:
-                            import json
-
-                            dumped = json.loads(dumped)
-                        except Exception:  # pragma: no cover - defensive
-                            chunks.append(dumped.strip())
-                            break
-                    _collect_text(dumped, _visited=set())
-                    break
-                except Exception:  # pragma: no cover - defensive
-                    continue
+    _collect_text(value)
+    return "\n".join(chunks).strip()
 
-        if not chunks:
-            _collect_text(response, _visited=set())
 
-    if chunks:
-        return "\n".join(chunk for chunk in chunks if chunk).strip()
+def _extract_text(response: Any) -> str:
+    """Extract textual content from the Responses API output."""
 
-    return ""
+    if response is None:
+        return ""
+
+    # v1.0+ exposes a convenience property.
+    text = getattr(response, "output_text", None)
+    if isinstance(text, str) and text.strip():
+        return text.strip()
+
+    # Single pass over the known message / output_text schema.
+    output = _response_output(response)
+    if output is not None:
+        text = _output_text(output)
+        if text is not None:
+            return text
+
+    return _walk_text(output if output is not None else response)
 
 
 @lru_cache(maxsize=1)
@@ -356,15 +966,44 @@ def get_openai_service() -> OpenAIService:
         tts_model=settings.tts_model,
         tts_voice=settings.tts_voice,
         tts_format=settings.tts_format,
+        audio_store=get_audio_store(),
+        resilience=build_resilience(settings),
+        base_url=settings.openai_base_url,
+        http_client=build_http_client(settings),
+        reply_fallback=build_reply_fallback(settings),
+        single_flight=build_single_flight(settings),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_openai_service() -> AsyncOpenAIService:
+    """Return a cached AsyncOpenAIService configured from settings."""
+
+    settings = get_settings()
+    return AsyncOpenAIService(
+        api_key=settings.openai_api_key,
+        stt_model=settings.stt_model,
+        llm_model=settings.llm_model,
+        tts_model=settings.tts_model,
+        tts_voice=settings.tts_voice,
+        tts_format=settings.tts_format,
+        audio_store=get_audio_store(),
+        resilience=build_resilience(settings),
+        base_url=settings.openai_base_url,
+        http_client=build_async_http_client(settings),
+        reply_fallback=build_reply_fallback(settings),
+        single_flight=build_single_flight(settings),
     )
 
 
 __all__ = [
     "OpenAIService",
+    "AsyncOpenAIService",
     "TranscriptionResult",
     "LLMResult",
     "SpeechResult",
     "get_openai_service",
+    "get_async_openai_service",
     "OpenAIError",
 ]
 
@@ -0,0 +1,194 @@
+"""What to do when the Responses API returns an empty reply.
+
+Some models intermittently return no ``output_text`` from ``responses.create``.
+``LLM_EMPTY_REPLY_FALLBACK`` picks how a reply is still produced:
+
+* ``sequential`` (default): call chat.completions after the empty response,
+  which doubles LLM latency for those requests.
+* ``race``: call both APIs at once and take the first non-empty reply.
+* ``remember``: after a model's Responses reply comes back empty and chat
+  answers, send that model straight to chat.completions for
+  ``LLM_FALLBACK_MEMORY_SECONDS`` before trying the Responses API again.
+* ``none``: return the empty reply.
+
+``voice_llm_reply_path_total{model,path}`` counts which path produced each reply.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import logging
+import threading
+import time
+from typing import Awaitable, Callable, Optional, Sequence
+
+from ..config import Settings
+from ..metrics import LLM_REPLY_PATHS
+
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("sequential", "race", "remember", "none")
+
+# Values of the ``path`` label.
+RESPONSES = "responses"
+CHAT_FALLBACK = "chat_fallback"
+CHAT_RACED = "chat_raced"
+CHAT_REMEMBERED = "chat_remembered"
+EMPTY = "empty"
+
+
+class ReplyFallback:
+    """Applies the empty-reply strategy to sync and async reply calls.
+
+    Calls are passed as zero-argument callables returning the reply text, so
+    the services keep their own request building and resilience wrapping.
+    """
+
+    def __init__(self, strategy: str = "sequential", memory_seconds: float = 600.0) -> None:
+        strategy = strategy.lower()
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown LLM_EMPTY_REPLY_FALLBACK: {strategy!r}")
+        self.strategy = strategy
+        self.memory_seconds = memory_seconds
+        self._chat_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def prefers_chat(self, model: str) -> bool:
+        """Whether ``model`` is currently remembered as needing chat.completions."""
+
+        if self.strategy != "remember":
+            return False
+        with self._lock:
+            until = self._chat_until.get(model)
+            if until is None:
+                return False
+            if until <= time.monotonic():
+                del self._chat_until[model]
+                return False
+            return True
+
+    def record(self, model: str, path: str) -> None:
+        """Count the path that produced ``model``'s reply and update the memory."""
+
+        LLM_REPLY_PATHS.inc(model=model, path=path)
+        if self.strategy != "remember":
+            return
+        with self._lock:
+            if path == CHAT_FALLBACK:
+                logger.info(
+                    "Sending %s straight to chat.completions for %.0fs after an empty Responses reply",
+                    model,
+                    self.memory_seconds,
+                )
+                self._chat_until[model] = time.monotonic() + self.memory_seconds
+            elif path == EMPTY:
+                self._chat_until.pop(model, None)
+
+    def _finish(self, model: str, text: str, path: str) -> str:
+        self.record(model, path if text else EMPTY)
+        return text
+
+    # -- sync -----------------------------------------------------------
+
+    def resolve(self, model: str, responses: Callable[[], str], chat: Callable[[], str]) -> str:
+        """Return ``model``'s reply, calling chat.completions as the strategy dictates."""
+
+        if self.prefers_chat(model):
+            return self._finish(model, chat(), CHAT_REMEMBERED)
+        if self.strategy == "race":
+            text, path = self._race(((RESPONSES, responses), (CHAT_RACED, chat)))
+            return self._finish(model, text, path)
+
+        text = responses()
+        if text or self.strategy == "none":
+            return self._finish(model, text, RESPONSES)
+        logger.warning("Responses API returned empty text; falling back to chat.completions")
+        return self._finish(model, chat(), CHAT_FALLBACK)
+
+    def _race(self, calls: Sequence[tuple[str, Callable[[], str]]]) -> tuple[str, str]:
+        executor = self._thread_pool()
+        # Each call runs in a copy of this context so the request budget still applies.
+        futures = {executor.submit(contextvars.copy_context().run, fn): path for path, fn in calls}
+        errors: dict[str, BaseException] = {}
+        for future in concurrent.futures.as_completed(futures):
+            path = futures[future]
+            try:
+                text = future.result()
+            except Exception as exc:
+                errors[path] = exc
+                continue
+            if text:
+                # The slower call cannot be interrupted; it finishes in the pool and is dropped.
+                return text, path
+        if len(errors) == len(calls):
+            raise errors[calls[0][0]]
+        return "", EMPTY
+
+    def _thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="llm-race")
+            return self._executor
+
+    # -- async ----------------------------------------------------------
+
+    async def aresolve(
+        self, model: str, responses: Callable[[], Awaitable[str]], chat: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Async :meth:`resolve`; the losing call of a race is cancelled."""
+
+        if self.prefers_chat(model):
+            return self._finish(model, await chat(), CHAT_REMEMBERED)
+        if self.strategy == "race":
+            text, path = await self._arace(((RESPONSES, responses), (CHAT_RACED, chat)))
+            return self._finish(model, text, path)
+
+        text = await responses()
+        if text or self.strategy == "none":
+            return self._finish(model, text, RESPONSES)
+        logger.warning("Responses API returned empty text; falling back to chat.completions")
+        return self._finish(model, await chat(), CHAT_FALLBACK)
+
+    async def _arace(self, calls: Sequence[tuple[str, Callable[[], Awaitable[str]]]]) -> tuple[str, str]:
+        tasks = {asyncio.ensure_future(fn()): path for path, fn in calls}
+        pending = set(tasks)
+        errors: dict[str, BaseException] = {}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Iterate in call order so the Responses reply wins a tie.
+                for task, path in tasks.items():
+                    if task not in done:
+                        continue
+                    if task.exception() is not None:
+                        errors[path] = task.exception()  # type: ignore[assignment]
+                    elif task.result():
+                        return task.result(), path
+            if len(errors) == len(calls):
+                raise errors[calls[0][0]]
+            return "", EMPTY
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def build_reply_fallback(settings: Settings) -> ReplyFallback:
+    """Return a :class:`ReplyFallback` configured from settings."""
+
+    return ReplyFallback(settings.llm_empty_reply_fallback, settings.llm_fallback_memory_seconds)
+
+
+__all__ = [
+    "CHAT_FALLBACK",
+    "CHAT_RACED",
+    "CHAT_REMEMBERED",
+    "EMPTY",
+    "RESPONSES",
+    "STRATEGIES",
+    "ReplyFallback",
+    "build_reply_fallback",
+]
@@ -0,0 +1,315 @@
+"""Deadlines, retries and hedged requests for OpenAI calls.
+
+Every voice request gets one time budget (``OPENAI_REQUEST_BUDGET_SECONDS``).
+Each upstream call is given ``min(operation cap, budget remaining)`` as its
+timeout, retryable failures are retried with full-jitter backoff while budget
+remains, and operations listed in ``OPENAI_HEDGE_OPERATIONS`` fire a second,
+identical request once the first has been outstanding longer than the
+operation's recent p95 latency; whichever answers first wins.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterator, Mapping, Optional, TypeVar
+
+from openai import APIConnectionError, APIStatusError, OpenAIError
+
+from ..config import Settings, get_settings
+from ..metrics import UPSTREAM_EVENTS
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 408 request timeout, 409 conflict (lock contention), 429 rate limit, 5xx.
+RETRYABLE_STATUSES = frozenset({408, 409, 429})
+
+_DEADLINE: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("openai_deadline", default=None)
+
+
+class DeadlineExceeded(OpenAIError):
+    """The request's time budget ran out before an OpenAI call could finish."""
+
+
+@contextmanager
+def request_budget(seconds: Optional[float] = None) -> Iterator[None]:
+    """Bound every OpenAI call made inside the block by one shared deadline.
+
+    Nested budgets never extend an outer one. Defaults to
+    ``OPENAI_REQUEST_BUDGET_SECONDS``.
+    """
+
+    if seconds is None:
+        seconds = get_settings().openai_request_budget_seconds
+    deadline = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    token = _DEADLINE.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        try:
+            _DEADLINE.reset(token)
+        except ValueError:
+            # An async generator finalised from another task; its context is gone anyway.
+            pass
+
+
+def remaining_budget() -> Optional[float]:
+    """Seconds left in the current request budget, or ``None`` outside one."""
+
+    deadline = _DEADLINE.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether retrying the same request could plausibly succeed."""
+
+    if isinstance(exc, DeadlineExceeded):
+        return False
+    if isinstance(exc, APIConnectionError):  # includes APITimeoutError
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code in RETRYABLE_STATUSES or exc.status_code >= 500
+    return False
+
+
+@dataclass(frozen=True)
+class ResiliencePolicy:
+    """Timeouts, retry and hedging knobs for upstream calls."""
+
+    # Per-operation timeout caps (seconds) keyed by graph stage name.
+    operation_timeouts: Mapping[str, float] = field(
+        default_factory=lambda: {"transcribe": 15.0, "generate_response": 20.0, "synthesize": 15.0}
+    )
+    default_timeout: float = 20.0
+    max_retries: int = 2
+    backoff_base_seconds: float = 0.25
+    backoff_max_seconds: float = 2.0
+    hedge_operations: frozenset[str] = frozenset()
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_min_delay_seconds: float = 0.05
+    latency_window: int = 200
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ResiliencePolicy":
+        return cls(
+            operation_timeouts={
+                "transcribe": settings.openai_stt_timeout_seconds,
+                "generate_response": settings.openai_llm_timeout_seconds,
+                "synthesize": settings.openai_tts_timeout_seconds,
+            },
+            max_retries=settings.openai_max_retries,
+            backoff_base_seconds=settings.openai_retry_base_delay_seconds,
+            backoff_max_seconds=settings.openai_retry_max_delay_seconds,
+            hedge_operations=frozenset(settings.openai_hedge_operations),
+            hedge_quantile=settings.openai_hedge_quantile,
+            hedge_min_samples=settings.openai_hedge_min_samples,
+        )
+
+
+class Resilience:
+    """Applies a :class:`ResiliencePolicy` to sync and async upstream calls.
+
+    Calls are passed as ``fn(timeout)`` so the timeout can be forwarded to the
+    SDK's per-request ``timeout`` option; the SDK's own retries should be
+    disabled (``max_retries=0``) so attempts are not multiplied.
+    """
+
+    def __init__(self, policy: Optional[ResiliencePolicy] = None) -> None:
+        self.policy = policy or ResiliencePolicy()
+        self._latencies: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    # -- policy ---------------------------------------------------------
+
+    def timeout_for(self, operation: str) -> float:
+        """Timeout for the next attempt: the operation cap, clipped to the request budget."""
+
+        cap = self.policy.operation_timeouts.get(operation, self.policy.default_timeout)
+        remaining = remaining_budget()
+        if remaining is None:
+            return cap
+        if remaining <= 0:
+            UPSTREAM_EVENTS.inc(operation=operation, event="deadline")
+            raise DeadlineExceeded(f"Request budget exhausted before {operation}")
+        return min(cap, remaining)
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number ``attempt + 1``."""
+
+        ceiling = min(self.policy.backoff_max_seconds, self.policy.backoff_base_seconds * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    def record(self, operation: str, seconds: float) -> None:
+        """Add a successful call's latency to the operation's rolling window."""
+
+        with self._lock:
+            window = self._latencies.setdefault(operation, deque(maxlen=self.policy.latency_window))
+            window.append(seconds)
+
+    def hedge_delay(self, operation: str) -> Optional[float]:
+        """How long to wait before hedging, or ``None`` when hedging does not apply yet."""
+
+        if operation not in self.policy.hedge_operations:
+            return None
+        with self._lock:
+            samples = sorted(self._latencies.get(operation, ()))
+        if len(samples) < self.policy.hedge_min_samples:
+            return None
+        index = min(len(samples) - 1, int(self.policy.hedge_quantile * len(samples)))
+        return max(self.policy.hedge_min_delay_seconds, samples[index])
+
+    def _retry_delay(self, operation: str, attempt: int, exc: BaseException) -> Optional[float]:
+        """Backoff before the next attempt, or ``None`` if the error should propagate."""
+
+        if attempt >= self.policy.max_retries or not is_retryable(exc):
+            return None
+        delay = self.backoff(attempt)
+        remaining = remaining_budget()
+        if remaining is not None and delay >= remaining:
+            return None
+        UPSTREAM_EVENTS.inc(operation=operation, event="retry")
+        logger.warning(
+            "Retrying OpenAI %s after %s | attempt=%s delay_s=%.3f", operation, type(exc).__name__, attempt + 1, delay
+        )
+        return delay
+
+    # -- sync -----------------------------------------------------------
+
+    def call(self, operation: str, fn: Callable[[float], T], *, hedge: bool = True) -> T:
+        """Run ``fn(timeout)`` with retries (and hedging when enabled) on this thread."""
+
+        attempt = 0
+        while True:
+            timeout = self.timeout_for(operation)
+            try:
+                return self._attempt(operation, fn, timeout, hedge)
+            except Exception as exc:
+                delay = self._retry_delay(operation, attempt, exc)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _timed(self, operation: str, fn: Callable[[float], T], timeout: float) -> T:
+        start = time.perf_counter()
+        result = fn(timeout)
+        self.record(operation, time.perf_counter() - start)
+        return result
+
+    def _attempt(self, operation: str, fn: Callable[[float], T], timeout: float, hedge: bool) -> T:
+        delay = self.hedge_delay(operation) if hedge else None
+        if delay is None or delay >= timeout:
+            return self._timed(operation, fn, timeout)
+
+        executor = self._thread_pool()
+        primary = executor.submit(self._timed, operation, fn, timeout)
+        try:
+            return primary.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            pass
+
+        UPSTREAM_EVENTS.inc(operation=operation, event="hedge")
+        backup = executor.submit(self._timed, operation, fn, timeout - delay)
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        UPSTREAM_EVENTS.inc(operation=operation, event="hedge_won")
+                    # The slower request cannot be interrupted; it finishes in the pool and is dropped.
+                    return future.result()
+                error = error or future.exception()
+        assert error is not None
+        raise error
+
+    def _thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="openai-hedge")
+            return self._executor
+
+    # -- async ----------------------------------------------------------
+
+    async def acall(self, operation: str, fn: Callable[[float], Awaitable[T]], *, hedge: bool = True) -> T:
+        """Await ``fn(timeout)`` with retries, hedging when enabled; losing requests are cancelled."""
+
+        attempt = 0
+        while True:
+            timeout = self.timeout_for(operation)
+            try:
+                return await self._aattempt(operation, fn, timeout, hedge)
+            except Exception as exc:
+                delay = self._retry_delay(operation, attempt, exc)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _atimed(self, operation: str, fn: Callable[[float], Awaitable[T]], timeout: float) -> T:
+        start = time.perf_counter()
+        result = await fn(timeout)
+        self.record(operation, time.perf_counter() - start)
+        return result
+
+    async def _aattempt(self, operation: str, fn: Callable[[float], Awaitable[T]], timeout: float, hedge: bool) -> T:
+        delay = self.hedge_delay(operation) if hedge else None
+        if delay is None or delay >= timeout:
+            return await self._atimed(operation, fn, timeout)
+
+        primary = asyncio.ensure_future(self._atimed(operation, fn, timeout))
+        pending: set[asyncio.Future[T]] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            UPSTREAM_EVENTS.inc(operation=operation, event="hedge")
+            backup = asyncio.ensure_future(self._atimed(operation, fn, timeout - delay))
+            pending.add(backup)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            UPSTREAM_EVENTS.inc(operation=operation, event="hedge_won")
+                        return task.result()
+                    error = error or task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def build_resilience(settings: Settings) -> Resilience:
+    """Return a :class:`Resilience` configured from settings."""
+
+    return Resilience(ResiliencePolicy.from_settings(settings))
+
+
+__all__ = [
+    "DeadlineExceeded",
+    "Resilience",
+    "ResiliencePolicy",
+    "build_resilience",
+    "is_retryable",
+    "remaining_budget",
+    "request_budget",
+]
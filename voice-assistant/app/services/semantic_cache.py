@@ -0,0 +1,416 @@
+"""Near-duplicate reply cache: reuse an LLM reply for a differently worded question.
+
+Whisper rarely transcribes the same question the same way twice ("ٹماٹر کا
+ریٹ کیا ہے" / "ٹماٹروں کا ریٹ کیا ہے جی"), so the exact-match reply cache misses
+most repeats. Here each question is embedded, and a new one reuses the reply of
+its nearest cached neighbour when their cosine similarity clears
+``SEMANTIC_CACHE_THRESHOLD``.
+
+- Embeddings come from a local hashing embedder (character n-grams, no model
+  download) or the OpenAI embeddings endpoint.
+- Vectors live in a NumPy matrix per language and model. Search is one
+  matrix-vector product; above ``SEMANTIC_CACHE_APPROXIMATE_THRESHOLD`` entries
+  it only scans the clusters nearest the query (an IVF index).
+- Numbers, crops and cities must match exactly, so "wheat in Multan" never gets
+  the reply for "cotton in Lahore" however close the vectors are.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Protocol
+
+import numpy as np
+
+from ..config import get_settings
+from ..metrics import CACHE_LOOKUPS
+from .grounding import CITY_ALIASES, COMMODITY_ALIASES, PhraseIndex, tokens
+from .intents import FILLER_WORDS
+from .openai_client import OpenAIError, get_async_openai_service, get_openai_service
+
+
+logger = logging.getLogger(__name__)
+
+Vector = np.ndarray
+
+# Slots are allocated in chunks that double up to the entry cap.
+INITIAL_CAPACITY = 1024
+# k-means for the approximate index: sample size per cluster and iterations.
+TRAIN_POINTS_PER_CLUSTER = 32
+KMEANS_ITERATIONS = 8
+# Rows scored per chunk when assigning vectors to clusters.
+ASSIGN_CHUNK = 65_536
+# Slots added since the clustered index was last regrouped are scanned on every
+# lookup; they are folded into the per-cluster lists at 1/16 of the entries.
+PENDING_MIN = 1024
+
+
+class Embedder(Protocol):
+    dimensions: int
+
+    def embed(self, text: str) -> Optional[Vector]: ...
+
+    async def aembed(self, text: str) -> Optional[Vector]: ...
+
+
+def _unit(vector: Vector) -> Optional[Vector]:
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return None
+    return (vector / norm).astype(np.float32, copy=False)
+
+
+class HashingEmbedder:
+    """Signed feature hashing of words and character trigrams.
+
+    Robust to the spelling, suffix and filler-word noise in transcripts, at a
+    few microseconds per question. It has no notion of synonyms or of Urdu vs
+    Roman Urdu spellings being the same words; the OpenAI embedder does.
+    """
+
+    def __init__(self, dimensions: int) -> None:
+        self.dimensions = dimensions
+
+    def embed(self, text: str) -> Optional[Vector]:
+        features: list[str] = []
+        for word in tokens(text):
+            if word in FILLER_WORDS:
+                continue
+            padded = f"<{word}>"
+            features.append(padded)
+            features.extend(padded[index : index + 3] for index in range(len(padded) - 2))
+        if not features:
+            return None
+        hashes = np.fromiter((zlib.crc32(feature.encode("utf-8")) for feature in features), np.uint32, len(features))
+        vector = np.zeros(self.dimensions, np.float32)
+        signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+        np.add.at(vector, hashes % self.dimensions, signs)
+        return _unit(vector)
+
+    async def aembed(self, text: str) -> Optional[Vector]:
+        return self.embed(text)
+
+
+class OpenAIEmbedder:
+    """Embeddings endpoint; failures are logged and treated as a cache miss."""
+
+    def __init__(self, model: str, dimensions: int) -> None:
+        self.model = model
+        self.dimensions = dimensions
+
+    def embed(self, text: str) -> Optional[Vector]:
+        try:
+            [embedding] = get_openai_service().embed_texts([text], model=self.model, dimensions=self.dimensions)
+        except OpenAIError as exc:
+            logger.warning("Embedding failed; skipping the semantic cache: %s", exc)
+            return None
+        return _unit(np.asarray(embedding, np.float32))
+
+    async def aembed(self, text: str) -> Optional[Vector]:
+        try:
+            [embedding] = await get_async_openai_service().embed_texts(
+                [text], model=self.model, dimensions=self.dimensions
+            )
+        except OpenAIError as exc:
+            logger.warning("Embedding failed; skipping the semantic cache: %s", exc)
+            return None
+        return _unit(np.asarray(embedding, np.float32))
+
+
+class VectorIndex:
+    """Unit vectors in a ring of slots, searched by inner product.
+
+    Once ``approximate_threshold`` vectors are stored, a spherical k-means is
+    trained on a sample and each lookup scores only the vectors in the
+    ``probes`` clusters nearest the query. Slots are kept grouped by cluster
+    (``_order`` / ``_offsets``), so a lookup never touches the other clusters.
+    When full, the oldest slot is overwritten.
+    """
+
+    def __init__(
+        self,
+        dimensions: int,
+        *,
+        max_entries: int,
+        approximate_threshold: int = 0,
+        clusters: int = 256,
+        probes: int = 8,
+        seed: int = 0,
+    ) -> None:
+        self._max_entries = max_entries
+        self._approximate_threshold = approximate_threshold
+        self._clusters = clusters
+        self._probes = min(probes, clusters)
+        self._rng = np.random.default_rng(seed)
+        capacity = min(INITIAL_CAPACITY, max_entries)
+        self._vectors = np.zeros((capacity, dimensions), np.float32)
+        self._assign = np.zeros(capacity, np.int32)
+        self._centroids: Optional[Vector] = None
+        self._order = np.zeros(0, np.int32)
+        self._offsets = np.zeros(1, np.int64)
+        self._pending = np.zeros(max(PENDING_MIN, max_entries // 16), np.int32)
+        self._pending_count = 0
+        self._size = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def approximate(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def nbytes(self) -> int:
+        centroids = 0 if self._centroids is None else self._centroids.nbytes
+        return self._vectors.nbytes + self._assign.nbytes + centroids + self._order.nbytes + self._pending.nbytes
+
+    def add(self, vector: Vector) -> int:
+        """Store a unit vector and return its slot."""
+
+        slot = self._next
+        if slot >= len(self._vectors):
+            self._grow()
+        self._vectors[slot] = vector
+        self._next = (slot + 1) % self._max_entries
+        self._size = min(self._size + 1, self._max_entries)
+        if self._centroids is not None:
+            self._assign[slot] = int(np.argmax(self._centroids @ vector))
+            self._pending[self._pending_count] = slot
+            self._pending_count += 1
+            if self._pending_count >= min(len(self._pending), max(PENDING_MIN, self._size // 16)):
+                self._regroup()
+        elif 0 < self._approximate_threshold <= self._size:
+            self.train()
+        return slot
+
+    def search(self, vector: Vector) -> Optional[tuple[int, float]]:
+        """Nearest stored vector as ``(slot, cosine similarity)``."""
+
+        if not self._size:
+            return None
+        if self._centroids is None:
+            scores = self._vectors[: self._size] @ vector
+            slot = int(np.argmax(scores))
+            return slot, float(scores[slot])
+        nearest = np.argpartition(-(self._centroids @ vector), self._probes - 1)[: self._probes]
+        groups = [self._order[self._offsets[cluster] : self._offsets[cluster + 1]] for cluster in nearest]
+        candidates = np.concatenate([*groups, self._pending[: self._pending_count]])
+        # Drops pending slots from other clusters and grouped slots overwritten since.
+        candidates = candidates[np.isin(self._assign[candidates], nearest)]
+        if not candidates.size:
+            return None
+        scores = self._vectors[candidates] @ vector
+        best = int(np.argmax(scores))
+        return int(candidates[best]), float(scores[best])
+
+    def _regroup(self) -> None:
+        assign = self._assign[: self._size]
+        self._order = np.argsort(assign, kind="stable").astype(np.int32)
+        counts = np.bincount(assign, minlength=len(self._centroids))  # type: ignore[arg-type]
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+        self._pending_count = 0
+
+    def _grow(self) -> None:
+        capacity = min(len(self._vectors) * 2, self._max_entries)
+        vectors = np.zeros((capacity, self._vectors.shape[1]), np.float32)
+        vectors[: len(self._vectors)] = self._vectors
+        assign = np.zeros(capacity, np.int32)
+        assign[: len(self._assign)] = self._assign
+        self._vectors, self._assign = vectors, assign
+
+    def train(self) -> None:
+        """Cluster the stored vectors and switch to approximate search (normally done at the threshold)."""
+
+        start = time.perf_counter()
+        stored = self._vectors[: self._size]
+        sample_size = min(self._size, TRAIN_POINTS_PER_CLUSTER * self._clusters)
+        sample = stored[self._rng.choice(self._size, sample_size, replace=False)]
+        clusters = min(self._clusters, sample_size)
+        centroids = sample[self._rng.choice(sample_size, clusters, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty clusters keep their previous centroid.
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids).astype(np.float32)
+        for offset in range(0, self._size, ASSIGN_CHUNK):
+            chunk = stored[offset : offset + ASSIGN_CHUNK]
+            self._assign[offset : offset + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+        self._centroids = centroids
+        self._probes = min(self._probes, clusters)
+        self._regroup()
+        logger.info(
+            "Semantic cache index switched to %s clusters | entries=%s train_ms=%.1f",
+            clusters,
+            self._size,
+            (time.perf_counter() - start) * 1000,
+        )
+
+
+@dataclass(frozen=True)
+class SemanticHit:
+    text: str
+    model: str
+    similarity: float
+
+
+@dataclass(frozen=True)
+class _Entry:
+    text: str
+    model: str
+    guard: tuple[frozenset[str], ...]
+    stored_at: float
+
+
+class _Shelf:
+    """Vectors and replies for one language and model."""
+
+    def __init__(self, index: VectorIndex) -> None:
+        self.index = index
+        self.entries: list[Optional[_Entry]] = []
+
+
+@lru_cache(maxsize=1)
+def _entities() -> PhraseIndex:
+    entities = PhraseIndex()
+    for key, aliases in (*COMMODITY_ALIASES.items(), *CITY_ALIASES.items()):
+        for alias in (key, *aliases):
+            entities.add(alias, key)
+    return entities
+
+
+def question_guard(transcript: str) -> tuple[frozenset[str], ...]:
+    """Numbers and crop/city names in a question; a reused reply must have the same ones."""
+
+    words = tokens(transcript)
+    numbers = frozenset(word for word in words if any(ch.isdigit() for ch in word))
+    return numbers, frozenset(_entities().find(words))
+
+
+class SemanticCache:
+    """Nearest-neighbour reply cache, partitioned by reply language and LLM model."""
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        *,
+        threshold: float,
+        max_entries: int,
+        ttl_seconds: float,
+        approximate_threshold: int = 0,
+        clusters: int = 256,
+        probes: int = 8,
+    ) -> None:
+        self.embedder = embedder
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._index_options = {
+            "max_entries": max_entries,
+            "approximate_threshold": approximate_threshold,
+            "clusters": clusters,
+            "probes": probes,
+        }
+        self._shelves: dict[tuple[str, str], _Shelf] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(shelf.index) for shelf in self._shelves.values())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the vector indexes (reply texts not included)."""
+
+        return sum(shelf.index.nbytes for shelf in self._shelves.values())
+
+    def lookup(self, vector: Vector, *, transcript: str, language: str, model: str) -> Optional[SemanticHit]:
+        hit = self._lookup(vector, transcript, language, model)
+        CACHE_LOOKUPS.inc(cache="semantic", result="hit" if hit is not None else "miss")
+        return hit
+
+    def _lookup(self, vector: Vector, transcript: str, language: str, model: str) -> Optional[SemanticHit]:
+        with self._lock:
+            shelf = self._shelves.get((language, model))
+            found = shelf.index.search(vector) if shelf is not None else None
+            if shelf is None or found is None:
+                return None
+            slot, similarity = found
+            entry = shelf.entries[slot]
+        if entry is None or similarity < self._threshold:
+            return None
+        if time.monotonic() - entry.stored_at > self._ttl_seconds or entry.guard != question_guard(transcript):
+            return None
+        return SemanticHit(entry.text, entry.model, similarity)
+
+    def store(self, vector: Vector, *, transcript: str, language: str, model: str, text: str) -> None:
+        if not text.strip():
+            return
+        entry = _Entry(text, model, question_guard(transcript), time.monotonic())
+        with self._lock:
+            shelf = self._shelves.get((language, model))
+            if shelf is None:
+                index = VectorIndex(self.embedder.dimensions, **self._index_options)  # type: ignore[arg-type]
+                shelf = self._shelves[(language, model)] = _Shelf(index)
+            slot = shelf.index.add(vector)
+            if slot == len(shelf.entries):
+                shelf.entries.append(entry)
+            else:
+                shelf.entries[slot] = entry
+
+
+def _build_embedder(name: str, model: str, dimensions: int) -> Embedder:
+    if name == "hashing":
+        return HashingEmbedder(dimensions)
+    if name == "openai":
+        return OpenAIEmbedder(model, dimensions)
+    raise ValueError(f"Unknown SEMANTIC_CACHE_EMBEDDER: {name!r}")
+
+
+@lru_cache(maxsize=1)
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Return the process-wide semantic cache, or ``None`` when it is disabled."""
+
+    settings = get_settings()
+    if not settings.semantic_cache_enabled:
+        return None
+    embedder = _build_embedder(
+        settings.semantic_cache_embedder.lower(),
+        settings.semantic_cache_embedding_model,
+        settings.semantic_cache_dimensions,
+    )
+    logger.info(
+        "Semantic cache enabled | embedder=%s dimensions=%s threshold=%s max_entries=%s (~%.0f MiB of vectors)",
+        settings.semantic_cache_embedder,
+        settings.semantic_cache_dimensions,
+        settings.semantic_cache_threshold,
+        settings.semantic_cache_max_entries,
+        settings.semantic_cache_max_entries * settings.semantic_cache_dimensions * 4 / (1 << 20),
+    )
+    return SemanticCache(
+        embedder,
+        threshold=settings.semantic_cache_threshold,
+        max_entries=settings.semantic_cache_max_entries,
+        ttl_seconds=settings.semantic_cache_ttl_seconds,
+        approximate_threshold=settings.semantic_cache_approximate_threshold,
+        clusters=settings.semantic_cache_clusters,
+        probes=settings.semantic_cache_probes,
+    )
+
+
+__all__ = [
+    "HashingEmbedder",
+    "OpenAIEmbedder",
+    "SemanticCache",
+    "SemanticHit",
+    "Vector",
+    "VectorIndex",
+    "get_semantic_cache",
+    "question_guard",
+]
@@ -0,0 +1,170 @@
+"""Bounded per-session conversation memory used as LLM context for follow-up questions.
+
+Each session keeps its last few turns verbatim (answers clipped) plus a short
+rolling summary of the questions that fell out of that window. Sessions are
+evicted least recently used first, and idle ones expire, so memory stays
+bounded by ``MEMORY_MAX_SESSIONS`` whatever the traffic.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+from ..config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+# Questions folded into the summary are clipped to this many characters first.
+SUMMARY_QUESTION_CHARS = 80
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap upper-end token estimate; Urdu script tokenises at roughly 2-3 characters per token."""
+
+    return (len(text) + 2) // 3
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+class _Session:
+    """One farmer's history: flat ``[q0, a0, q1, a1, ...]`` slots, the rolling summary and the last full reply."""
+
+    __slots__ = ("turns", "summary", "last_reply", "touched_at")
+
+    def __init__(self, now: float) -> None:
+        self.turns: list[str] = []
+        self.summary = ""
+        self.last_reply = ""
+        self.touched_at = now
+
+
+class SessionMemory:
+    """LRU map of session ID to a compact, size-capped conversation history."""
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int,
+        max_turns: int,
+        turn_chars: int,
+        summary_chars: int,
+        ttl_seconds: float,
+    ) -> None:
+        self._max_sessions = max_sessions
+        self._max_turns = max(1, max_turns)
+        self._turn_chars = turn_chars
+        self._summary_chars = summary_chars
+        self._ttl_seconds = ttl_seconds
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def record(self, session_id: str, question: str, answer: str) -> None:
+        """Append a turn; the oldest turn beyond ``max_turns`` is folded into the summary."""
+
+        reply = answer
+        question = _clip(question, self._turn_chars)
+        answer = _clip(answer, self._turn_chars)
+        now = time.monotonic()
+        with self._lock:
+            session = self._live(session_id, now)
+            if session is None:
+                session = self._sessions[session_id] = _Session(now)
+                while len(self._sessions) > self._max_sessions:
+                    self._sessions.popitem(last=False)
+            session.touched_at = now
+            session.turns += (question, answer)
+            session.last_reply = reply
+            if len(session.turns) > 2 * self._max_turns:
+                dropped = session.turns[0]
+                del session.turns[:2]
+                summary = f"{session.summary}; {_clip(dropped, SUMMARY_QUESTION_CHARS)}".lstrip("; ")
+                # Keep the most recent topics when the summary overflows.
+                if len(summary) > self._summary_chars:
+                    summary = "…" + summary[-(self._summary_chars - 1) :].lstrip()
+                session.summary = summary
+
+    def context(self, session_id: str, max_tokens: int) -> Optional[str]:
+        """Render the history as prompt context within ``max_tokens``, newest turns first to survive."""
+
+        with self._lock:
+            session = self._live(session_id, time.monotonic())
+            if session is None:
+                return None
+            turns = list(session.turns)
+            summary = session.summary
+
+        lines: list[str] = []
+        used = 0
+        for index in range(len(turns) - 2, -1, -2):
+            pair = [f"Farmer: {turns[index]}", f"Assistant: {turns[index + 1]}"]
+            cost = sum(estimate_tokens(line) + 1 for line in pair)
+            if used + cost > max_tokens:
+                break
+            lines[:0] = pair
+            used += cost
+        else:
+            if summary:
+                line = f"Earlier topics: {summary}"
+                if used + estimate_tokens(line) + 1 <= max_tokens:
+                    lines.insert(0, line)
+        if not lines:
+            return None
+        return "Conversation so far:\n" + "\n".join(lines)
+
+    def last_reply(self, session_id: str) -> Optional[str]:
+        """The session's previous reply, unclipped, for "say that again"."""
+
+        with self._lock:
+            session = self._live(session_id, time.monotonic())
+            return session.last_reply if session is not None and session.last_reply else None
+
+    def forget(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def _live(self, session_id: str, now: float) -> Optional[_Session]:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        if now - session.touched_at > self._ttl_seconds:
+            del self._sessions[session_id]
+            return None
+        self._sessions.move_to_end(session_id)
+        return session
+
+
+@lru_cache(maxsize=1)
+def get_session_memory() -> Optional[SessionMemory]:
+    """Return the process-wide session memory, or ``None`` when ``MEMORY_MAX_SESSIONS`` is 0."""
+
+    settings = get_settings()
+    if settings.memory_max_sessions <= 0:
+        return None
+    logger.info(
+        "Conversation memory enabled | max_sessions=%s turns=%s context_tokens=%s",
+        settings.memory_max_sessions,
+        settings.memory_turns,
+        settings.memory_context_tokens,
+    )
+    return SessionMemory(
+        max_sessions=settings.memory_max_sessions,
+        max_turns=settings.memory_turns,
+        turn_chars=settings.memory_turn_chars,
+        summary_chars=settings.memory_summary_chars,
+        ttl_seconds=settings.memory_ttl_seconds,
+    )
+
+
+__all__ = ["SessionMemory", "estimate_tokens", "get_session_memory"]
@@ -0,0 +1,163 @@
+"""Share one upstream call between identical requests that are in flight together.
+
+When an alert goes out, many farmers ask the same question within seconds.
+Their reply and speech calls are identical, so only the first (the leader)
+goes upstream. The others wait for it and get the same result, or the same
+exception. Calls are keyed on the operation and its normalised parameters.
+The key is dropped as soon as the leader finishes, so nothing is cached here.
+Repeats after that go to the reply cache and the TTS store.
+
+- Sync calls, made from the graph's worker threads, wait on a
+  ``threading.Event``.
+- Async calls share one task. Cancelling a waiter, for example on a client
+  disconnect, does not cancel the call for the others. The call is cancelled
+  only when its last waiter goes away.
+
+The leader's request budget applies to the shared call.
+``voice_openai_events_total{event="coalesced"}`` counts the calls that did
+not go upstream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional, TypeVar
+
+from ..config import Settings
+from ..metrics import UPSTREAM_EVENTS
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+OPERATIONS = ("generate_response", "synthesize")
+
+
+class _Call:
+    """A sync call in flight, and its outcome once the leader has it."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Flight:
+    """An async call in flight, and how many callers still wait for it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Deduplicates concurrent identical calls for the configured operations."""
+
+    def __init__(self, operations: Iterable[str] = OPERATIONS) -> None:
+        self.operations = frozenset(operations)
+        self._calls: dict[tuple[str, Hashable], _Call] = {}
+        self._flights: dict[tuple[str, Hashable], _Flight] = {}
+        self._lock = threading.Lock()
+
+    def enabled(self, operation: str) -> bool:
+        return operation in self.operations
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently shared, sync and async."""
+
+        with self._lock:
+            return len(self._calls) + len(self._flights)
+
+    # -- sync -----------------------------------------------------------
+
+    def call(self, operation: str, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return ``fn()``, or the result of an identical call already in flight."""
+
+        if operation not in self.operations:
+            return fn()
+
+        flight_key = (operation, key)
+        with self._lock:
+            call = self._calls.get(flight_key)
+            leader = call is None
+            if leader:
+                call = self._calls[flight_key] = _Call()
+        assert call is not None
+
+        if not leader:
+            UPSTREAM_EVENTS.inc(operation=operation, event="coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[flight_key]
+            call.done.set()
+        return call.result
+
+    # -- async ----------------------------------------------------------
+
+    async def acall(self, operation: str, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async :meth:`call`; waiters share one task on the running loop."""
+
+        if operation not in self.operations:
+            return await fn()
+
+        flight_key = (operation, key)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            if flight is not None and flight.task.get_loop() is not loop:
+                # Services are process-wide; a call from another event loop cannot be awaited here.
+                flight = None
+            if flight is None:
+                flight = _Flight(asyncio.ensure_future(fn()))
+                self._flights[flight_key] = flight
+                flight.task.add_done_callback(lambda task: self._land(flight_key, task))
+            else:
+                UPSTREAM_EVENTS.inc(operation=operation, event="coalesced")
+            flight.waiters += 1
+
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                logger.debug("Cancelling %s call with no callers left", operation)
+                flight.task.cancel()
+
+    def _land(self, flight_key: tuple[str, Hashable], task: asyncio.Future[Any]) -> None:
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            if flight is not None and flight.task is task:
+                del self._flights[flight_key]
+        if not task.cancelled():
+            # Mark the exception retrieved; every waiter has already seen it through the shield.
+            task.exception()
+
+
+def build_single_flight(settings: Settings) -> SingleFlight:
+    """Return a :class:`SingleFlight` configured from settings."""
+
+    return SingleFlight(settings.openai_single_flight_operations)
+
+
+__all__ = [
+    "OPERATIONS",
+    "SingleFlight",
+    "build_single_flight",
+]
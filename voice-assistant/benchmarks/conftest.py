@@ -0,0 +1,46 @@
+"""Fixtures for the hot-path microbenchmarks; payload builders live in ``payloads``."""
+
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from openai.types.audio import TranscriptionSegment
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from payloads import AUDIO_BYTES, REPLY_CHARS, DumpOnly, output_items, sdk_response, segment_dicts  # noqa: E402
+
+
+@pytest.fixture(params=REPLY_CHARS, ids=lambda chars: f"{chars}chars")
+def reply_chars(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+@pytest.fixture
+def responses_payloads(reply_chars: int) -> dict[str, Any]:
+    """The shapes ``_extract_text`` sees, keyed by which of its paths they take."""
+
+    sdk = sdk_response(reply_chars)
+    return {
+        "output_text": sdk,
+        "sdk_blocks": SimpleNamespace(output=sdk.output),
+        "dict_blocks": SimpleNamespace(output=output_items(reply_chars)),
+        "model_dump": DumpOnly({"output": output_items(reply_chars)}),
+    }
+
+
+@pytest.fixture(params=["objects", "dicts"])
+def segments(request: pytest.FixtureRequest) -> list[Any]:
+    dicts = segment_dicts()
+    if request.param == "dicts":
+        return dicts
+    return [TranscriptionSegment.model_validate(segment) for segment in dicts]
+
+
+@pytest.fixture(params=AUDIO_BYTES, ids=lambda size: f"{size >> 20}MiB")
+def tts_audio(request: pytest.FixtureRequest) -> bytes:
+    # Incompressible bytes, like encoded speech.
+    return os.urandom(request.param)
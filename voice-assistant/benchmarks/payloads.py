@@ -0,0 +1,88 @@
+"""Realistic payloads for the hot-path microbenchmarks.
+
+Sizes follow production traffic: replies of a few thousand characters split
+over several output blocks (behind a reasoning item, as gpt-5 models return
+them), Whisper ``verbose_json`` for 90-second clips, and multi-MB TTS audio.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from openai.types.responses import Response
+
+
+SENTENCE = "گندم کی بوائی کے لیے نومبر کا پہلا ہفتہ بہترین ہے، اور بیج کی مقدار پچاس کلو فی ایکڑ رکھیں۔ "
+REPLY_CHARS = (500, 4000)
+CLIP_SECONDS = 90
+# Whisper cuts segments at pauses; conversational Urdu averages about 4 s.
+SEGMENT_SECONDS = 4.0
+AUDIO_BYTES = (1 << 20, 4 << 20)
+
+
+def reply_text(chars: int) -> str:
+    return (SENTENCE * (chars // len(SENTENCE) + 1))[:chars]
+
+
+def output_items(chars: int, blocks: int = 4) -> list[dict[str, Any]]:
+    """Responses API ``output``: a reasoning item, then a message with ``blocks`` text parts."""
+
+    text = reply_text(chars)
+    step = len(text) // blocks + 1
+    return [
+        {"id": "rs_bench", "type": "reasoning", "summary": []},
+        {
+            "id": "msg_bench",
+            "type": "message",
+            "role": "assistant",
+            "status": "completed",
+            "content": [
+                {"type": "output_text", "text": text[i : i + step], "annotations": []}
+                for i in range(0, len(text), step)
+            ],
+        },
+    ]
+
+
+def sdk_response(chars: int) -> Response:
+    return Response.model_validate(
+        {
+            "id": "resp_bench",
+            "object": "response",
+            "created_at": 1_700_000_000,
+            "model": "gpt-5-mini",
+            "output": output_items(chars),
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+        }
+    )
+
+
+class DumpOnly:
+    """A response that exposes its payload only through ``model_dump``."""
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def model_dump(self) -> dict[str, Any]:
+        return self._payload
+
+
+def segment_dicts(seconds: int = CLIP_SECONDS) -> list[dict[str, Any]]:
+    count = int(seconds / SEGMENT_SECONDS)
+    return [
+        {
+            "id": index,
+            "seek": int(index * SEGMENT_SECONDS * 100),
+            "start": index * SEGMENT_SECONDS,
+            "end": (index + 1) * SEGMENT_SECONDS,
+            "text": SENTENCE,
+            "tokens": list(range(50_000, 50_060)),
+            "temperature": 0.0,
+            "avg_logprob": -0.2 - (index % 7) * 0.03,
+            "compression_ratio": 1.4,
+            "no_speech_prob": 0.01,
+        }
+        for index in range(count)
+    ]
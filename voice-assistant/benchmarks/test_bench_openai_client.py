@@ -0,0 +1,26 @@
+"""Microbenchmarks for the OpenAI response helpers on the request hot path."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from app.services.openai_client import _estimate_confidence, _extract_text
+
+from payloads import reply_text
+
+
+@pytest.mark.parametrize("shape", ["output_text", "sdk_blocks", "dict_blocks", "model_dump"])
+def test_extract_text(benchmark: Any, responses_payloads: dict[str, Any], reply_chars: int, shape: str) -> None:
+    response = responses_payloads[shape]
+
+    text = benchmark(_extract_text, response)
+
+    assert text == reply_text(reply_chars).strip()
+
+
+def test_estimate_confidence(benchmark: Any, segments: list[Any]) -> None:
+    confidence = benchmark(_estimate_confidence, segments)
+
+    assert confidence is not None and 0.0 < confidence <= 1.0
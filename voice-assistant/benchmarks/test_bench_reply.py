@@ -0,0 +1,46 @@
+"""Microbenchmarks for building the /v1/voice-interact JSON reply."""
+
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from app.config import get_settings
+from app.routes import _interaction_response
+
+from payloads import reply_text
+
+
+def _graph_result(audio: bytes) -> dict[str, Any]:
+    return {
+        "language": "ur",
+        "transcript": reply_text(200),
+        "response_text": reply_text(1500),
+        "confidence": 0.87,
+        "tts_audio": audio,
+        "stage_ms": {"normalize": 3.2, "transcribe": 612.0, "generate_response": 1450.5, "synthesize": 820.1},
+    }
+
+
+def test_base64_encode(benchmark: Any, tts_audio: bytes) -> None:
+    encoded = benchmark(lambda: base64.b64encode(tts_audio).decode("utf-8"))
+
+    assert len(encoded) == (len(tts_audio) + 2) // 3 * 4
+
+
+def test_json_reply(benchmark: Any, tts_audio: bytes) -> None:
+    """Base64, response model construction and JSON encoding, as in the JSON mode of the route."""
+
+    settings = get_settings()
+    result = _graph_result(tts_audio)
+
+    def _reply() -> str:
+        audio_base64 = base64.b64encode(result["tts_audio"]).decode("utf-8")
+        body = _interaction_response(
+            result, selected_language="ur", settings=settings, processing_ms=2900.0, audio_base64=audio_base64
+        )
+        return body.model_dump_json()
+
+    payload = benchmark(_reply)
+
+    assert len(payload) > len(tts_audio)
@@ -0,0 +1,102 @@
+"""Synthetic audio containers for benchmarks.
+
+Only the structure the probes and decoders look at is realistic; compressed
+payloads are filler bytes of the right size.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import struct
+import wave
+
+import numpy as np
+
+
+def speech_like_pcm(seconds: float, sample_rate: int, channels: int = 1, *, lead_silence: float = 0.0) -> np.ndarray:
+    """Return int16 samples: optional silence, then amplitude-modulated tones with pauses."""
+
+    total = int(seconds * sample_rate)
+    t = np.arange(total) / sample_rate
+    voice = np.sin(2 * np.pi * 180 * t) + 0.5 * np.sin(2 * np.pi * 720 * t)
+    envelope = (np.sin(2 * np.pi * 3 * t) > -0.2).astype(np.float32)
+    signal = voice * envelope * 6000
+    signal[: int(lead_silence * sample_rate)] = 0
+    signal += np.random.default_rng(0).normal(0, 30, total)
+    samples = signal.astype("<i2")
+    if channels > 1:
+        samples = np.repeat(samples[:, None], channels, axis=1)
+    return samples
+
+
+def wav_bytes(seconds: float, sample_rate: int = 16_000, channels: int = 1, *, lead_silence: float = 0.0) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(speech_like_pcm(seconds, sample_rate, channels, lead_silence=lead_silence).tobytes())
+    return buffer.getvalue()
+
+
+def flac_bytes(seconds: float, sample_rate: int = 48_000, payload: int = 1 << 20) -> bytes:
+    total = int(seconds * sample_rate)
+    packed = (sample_rate << 44) | (1 << 41) | (15 << 36) | total  # stereo, 16-bit
+    streaminfo = struct.pack(">HH", 4096, 4096) + b"\0" * 6 + packed.to_bytes(8, "big") + b"\0" * 16
+    return b"fLaC" + bytes([0x80]) + (34).to_bytes(3, "big") + streaminfo + os.urandom(payload)
+
+
+def _ogg_page(granule: int, body: bytes, sequence: int) -> bytes:
+    segments = [255] * (len(body) // 255) + [len(body) % 255]
+    return (
+        b"OggS"
+        + struct.pack("<BBqIII", 0, 0, granule, 1, sequence, 0)
+        + bytes([len(segments)])
+        + bytes(segments)
+        + body
+    )
+
+
+def ogg_opus_bytes(seconds: float, payload: int = 1 << 20) -> bytes:
+    head = b"OpusHead" + bytes([1, 1]) + struct.pack("<HIhB", 312, 48_000, 0, 0)
+    pages = [_ogg_page(0, head, 0), _ogg_page(0, b"OpusTags" + b"\0" * 8, 1)]
+    chunk = 4000
+    samples = int(seconds * 48_000) + 312
+    count = max(1, payload // chunk)
+    for index in range(count):
+        granule = samples * (index + 1) // count
+        pages.append(_ogg_page(granule, os.urandom(chunk), index + 2))
+    return b"".join(pages)
+
+
+def _ebml(element_id: int, data: bytes) -> bytes:
+    size = len(data) | (1 << 56)  # 8-byte size vint
+    return element_id.to_bytes((element_id.bit_length() + 7) // 8, "big") + size.to_bytes(8, "big") + data
+
+
+def webm_bytes(seconds: float, payload: int = 1 << 20, *, with_duration: bool = True) -> bytes:
+    header = _ebml(0x1A45DFA3, _ebml(0x4282, b"webm"))
+    info = _ebml(0x2AD7B1, (1_000_000).to_bytes(3, "big"))
+    if with_duration:
+        info += _ebml(0x4489, struct.pack(">d", seconds * 1000))
+    clusters = []
+    cluster_ms = 1000
+    per_cluster = max(1, payload // max(1, int(seconds * 1000) // cluster_ms))
+    for start in range(0, int(seconds * 1000), cluster_ms):
+        blocks = b"".join(
+            _ebml(0xA3, b"\x81" + struct.pack(">hB", rel, 0x80) + os.urandom(max(1, per_cluster // 50)))
+            for rel in range(0, min(cluster_ms, int(seconds * 1000) - start), 20)
+        )
+        clusters.append(_ebml(0x1F43B675, _ebml(0xE7, start.to_bytes(4, "big")) + blocks))
+    unknown_size = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+    return header + b"\x18\x53\x80\x67" + unknown_size + _ebml(0x1549A966, info) + b"".join(clusters)
+
+
+def mp3_cbr_bytes(seconds: float, bitrate_kbps: int = 128) -> bytes:
+    frame_len = 144 * bitrate_kbps * 1000 // 44_100
+    bitrate_index = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320).index(bitrate_kbps)
+    header = bytes([0xFF, 0xFB, (bitrate_index << 4), 0xC4])
+    frames = int(seconds * 44_100 / 1152)
+    frame = header + b"\0" * (frame_len - 4)
+    return b"ID3\x04\x00\x00\x00\x00\x00\x00" + frame * frames
@@ -0,0 +1,69 @@
+"""Microbenchmark the header-only duration probe used for MAX_AUDIO_SECONDS.
+
+For each container and clip size, reports the probe time per call and per MB
+of upload, plus the probed duration so wrong answers are visible. The probe
+reads a bounded head/tail window, so time per call should stay flat as clips
+grow and time per MB should fall.
+
+    python scripts/bench_audio_probe.py --sizes 1 8 32 --iterations 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import time
+from typing import Callable, Optional
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from audio_samples import flac_bytes, mp3_cbr_bytes, ogg_opus_bytes, wav_bytes, webm_bytes  # noqa: E402
+
+from app.audio.probe import probe_duration  # noqa: E402
+
+
+SECONDS = 60.0
+
+# Each builder takes a target size in MiB and returns a SECONDS-long clip of roughly that size.
+# A CBR MP3's size is fixed by its length, so that clip grows in duration instead.
+BUILDERS: dict[str, Callable[[int], bytes]] = {
+    "wav": lambda mib: wav_bytes(SECONDS, sample_rate=mib * (1 << 20) // int(SECONDS * 2)),
+    "flac": lambda mib: flac_bytes(SECONDS, payload=mib << 20),
+    "ogg-opus": lambda mib: ogg_opus_bytes(SECONDS, payload=mib << 20),
+    "webm": lambda mib: webm_bytes(SECONDS, payload=mib << 20),
+    "webm-nodur": lambda mib: webm_bytes(SECONDS, payload=mib << 20, with_duration=False),
+    "mp3-cbr": lambda mib: mp3_cbr_bytes(mib * (1 << 20) * 8 / 320_000, bitrate_kbps=320),
+}
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark header-only audio duration probes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 8, 32], help="Clip sizes in MiB.")
+    parser.add_argument("--iterations", type=int, default=2000, help="Probe calls per container and size.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+
+    print(f"{'container':<12}{'size_mib':>9}{'duration_s':>12}{'us/probe':>10}{'us/MB':>9}")
+    for name, build in BUILDERS.items():
+        for size_mib in args.sizes:
+            fileobj = io.BytesIO(build(size_mib))
+            megabytes = len(fileobj.getbuffer()) / 1e6
+            duration = probe_duration(fileobj)
+
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                probe_duration(fileobj)
+            per_probe_us = (time.perf_counter() - start) / args.iterations * 1e6
+
+            shown = f"{duration:.2f}" if duration is not None else "-"
+            print(f"{name:<12}{megabytes:>9.1f}{shown:>12}{per_probe_us:>10.1f}{per_probe_us / megabytes:>9.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
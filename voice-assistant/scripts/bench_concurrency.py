@@ -0,0 +1,138 @@
+"""Load test comparing the thread-pool and native async voice graph paths.
+
+The OpenAI services are replaced with stubs that sleep for a configurable
+latency, so the numbers isolate how many requests each execution model can keep
+in flight rather than network or model speed.
+
+    python scripts/bench_concurrency.py --concurrency 50 200 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Optional
+from unittest import mock
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from app.graph import voice_graph  # noqa: E402
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult  # noqa: E402
+
+
+DEFAULT_CONCURRENCY = (50, 200, 1000)
+
+
+class _SleepingService:
+    """Blocking stand-in for OpenAIService that holds its thread for each call."""
+
+    def __init__(self, stt_s: float, llm_s: float, tts_s: float) -> None:
+        self._stt_s = stt_s
+        self._llm_s = llm_s
+        self._tts_s = tts_s
+
+    def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        time.sleep(self._stt_s)
+        return TranscriptionResult(text="آج ٹماٹر کا ریٹ کیا ہے؟", model="whisper-1", language="ur", confidence=0.9)
+
+    def generate_response(self, **_: object) -> LLMResult:
+        time.sleep(self._llm_s)
+        return LLMResult(text="ٹماٹر کا ریٹ مستحکم ہے۔", model="gpt-5-mini")
+
+    def synthesize_speech(self, **_: object) -> SpeechResult:
+        time.sleep(self._tts_s)
+        return SpeechResult(audio_bytes=b"\0" * 32_000, model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+class _AsyncSleepingService(_SleepingService):
+    """Async stand-in for AsyncOpenAIService that yields the loop while waiting."""
+
+    async def transcribe_audio(self, **_: object) -> TranscriptionResult:  # type: ignore[override]
+        await asyncio.sleep(self._stt_s)
+        return TranscriptionResult(text="آج ٹماٹر کا ریٹ کیا ہے؟", model="whisper-1", language="ur", confidence=0.9)
+
+    async def generate_response(self, **_: object) -> LLMResult:  # type: ignore[override]
+        await asyncio.sleep(self._llm_s)
+        return LLMResult(text="ٹماٹر کا ریٹ مستحکم ہے۔", model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:  # type: ignore[override]
+        await asyncio.sleep(self._tts_s)
+        return SpeechResult(audio_bytes=b"\0" * 32_000, model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def _initial_state() -> voice_graph.VoiceGraphState:
+    return {
+        "audio_bytes": b"\0" * 64_000,
+        "audio_filename": "bench.wav",
+        "audio_mime_type": "audio/wav",
+        "language": "ur",
+    }
+
+
+async def _run_executor_path() -> voice_graph.VoiceGraphState:
+    """Previous behaviour: push the sync graph onto the default executor."""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, voice_graph.invoke_voice_graph, _initial_state())
+
+
+async def _run_async_path() -> voice_graph.VoiceGraphState:
+    return await voice_graph.run_voice_graph(_initial_state())
+
+
+async def _measure(mode: str, concurrency: int) -> tuple[float, float]:
+    runner = _run_executor_path if mode == "executor" else _run_async_path
+
+    start = time.perf_counter()
+    await asyncio.gather(*(runner() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return elapsed, concurrency / elapsed
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare executor vs async voice graph throughput.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_CONCURRENCY),
+        help="Concurrent request counts to test.",
+    )
+    parser.add_argument("--stt-latency", type=float, default=0.05, help="Simulated STT latency in seconds.")
+    parser.add_argument("--llm-latency", type=float, default=0.10, help="Simulated LLM latency in seconds.")
+    parser.add_argument("--tts-latency", type=float, default=0.05, help="Simulated TTS latency in seconds.")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=("executor", "async"),
+        default=["executor", "async"],
+        help="Execution paths to benchmark.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+
+    sync_service = _SleepingService(args.stt_latency, args.llm_latency, args.tts_latency)
+    async_service = _AsyncSleepingService(args.stt_latency, args.llm_latency, args.tts_latency)
+    serial_s = args.stt_latency + args.llm_latency + args.tts_latency
+
+    print(f"Per-request upstream latency: {serial_s * 1000:.0f} ms")
+    print(f"{'mode':<10}{'concurrency':>12}{'wall_s':>10}{'req/s':>12}")
+
+    with mock.patch.object(voice_graph, "get_openai_service", lambda: sync_service), mock.patch.object(
+        voice_graph, "get_async_openai_service", lambda: async_service
+    ):
+        for concurrency in args.concurrency:
+            for mode in args.modes:
+                elapsed, throughput = asyncio.run(_measure(mode, concurrency))
+                print(f"{mode:<10}{concurrency:>12}{elapsed:>10.2f}{throughput:>12.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,147 @@
+"""Cold-start vs warm-pool latency of the first burst of OpenAI calls.
+
+The local fake OpenAI API (``scripts/fake_openai_server.py``) runs over TLS
+by default, with a throwaway self-signed certificate made by the ``openssl``
+CLI, so a cold request pays a real TCP + TLS handshake. Each round builds a
+fresh ``AsyncOpenAIService`` with the configured pool, then fires ``--burst``
+concurrent TTS calls: ``cold`` straight away, ``warm`` after
+``warm_connections()``. ``--handshake-ms`` delays the first request on each
+new connection to emulate handshake round trips to a remote API; the default
+of 0 measures loopback only.
+
+    python scripts/bench_connection_pool.py --burst 4 --rounds 20 --handshake-ms 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from app.config import Settings  # noqa: E402
+from app.metrics import OPENAI_CONNECTIONS_OPENED  # noqa: E402
+from app.services.http_pool import build_async_http_client  # noqa: E402
+from app.services.openai_client import AsyncOpenAIService  # noqa: E402
+from fake_openai_server import MODELS, SPEECH, FakeOpenAIServer, FakeProfile, Latency  # noqa: E402
+
+
+def _self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-keyout", str(key), "-out", str(cert),
+            "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )  # fmt: skip
+    return cert, key
+
+
+async def _round(settings: Settings, base_url: str, burst: int, warm: bool) -> tuple[list[float], int]:
+    service = AsyncOpenAIService(
+        api_key="bench",
+        stt_model="whisper-1",
+        llm_model="gpt-5-mini",
+        tts_model="gpt-4o-mini-tts",
+        tts_voice="alloy",
+        base_url=base_url,
+        http_client=build_async_http_client(settings),
+    )
+    if warm:
+        await service.warm_connections(burst)
+    opened_before = OPENAI_CONNECTIONS_OPENED.value(client="async")
+
+    async def _one(index: int) -> float:
+        start = time.perf_counter()
+        await service.synthesize_speech(text=f"bench {index}", language="ur")
+        return (time.perf_counter() - start) * 1000
+
+    latencies = await asyncio.gather(*(_one(i) for i in range(burst)))
+    opened = int(OPENAI_CONNECTIONS_OPENED.value(client="async") - opened_before)
+    await service.client.close()
+    return list(latencies), opened
+
+
+def _quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _bench(args: argparse.Namespace, base_url: str) -> None:
+    settings = Settings(  # type: ignore[call-arg]
+        OPENAI_API_KEY="bench",
+        OPENAI_MAX_CONNECTIONS=args.max_connections,
+        OPENAI_MAX_KEEPALIVE_CONNECTIONS=args.max_connections,
+    )
+    print(f"{'mode':<6} {'p50_ms':>8} {'p95_ms':>8} {'max_ms':>8} {'new_conns/burst':>16}")
+    for mode in ("cold", "warm"):
+        latencies: list[float] = []
+        opened: list[int] = []
+        for _ in range(args.rounds):
+            round_latencies, round_opened = await _round(settings, base_url, args.burst, mode == "warm")
+            latencies.extend(round_latencies)
+            opened.append(round_opened)
+        print(
+            f"{mode:<6} {statistics.median(latencies):>8.1f} {_quantile(latencies, 0.95):>8.1f} "
+            f"{max(latencies):>8.1f} {statistics.mean(opened):>16.1f}"
+        )
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--burst", type=int, default=4, help="Concurrent first requests per round.")
+    parser.add_argument("--rounds", type=int, default=20, help="Fresh clients per mode.")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stub TTS service time.")
+    parser.add_argument("--handshake-ms", type=float, default=0.0, help="Extra delay on each new connection.")
+    parser.add_argument("--max-connections", type=int, default=100, help="OPENAI_MAX_CONNECTIONS for the pool.")
+    parser.add_argument("--no-tls", action="store_true", help="Serve plain HTTP (no handshake cost).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    profile = FakeProfile(
+        latency={SPEECH: Latency("fixed", (args.latency_ms / 1000,)), MODELS: Latency()},
+        connect_latency=Latency("fixed", (args.handshake_ms / 1000,)),
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert = key = None
+        if not args.no_tls:
+            if shutil.which("openssl") is None:
+                print("openssl not found; rerun with --no-tls")
+                return 1
+            cert, key = _self_signed_cert(Path(tmp))
+            # httpx trusts SSL_CERT_FILE, so the pool under test is built exactly as in production.
+            os.environ["SSL_CERT_FILE"] = str(cert)
+
+        server = FakeOpenAIServer(profile).start(
+            ssl_certfile=str(cert) if cert else None, ssl_keyfile=str(key) if key else None
+        )
+        base_url = server.base_url
+        print(
+            f"stub={base_url} burst={args.burst} rounds={args.rounds} "
+            f"latency_ms={args.latency_ms} handshake_ms={args.handshake_ms}"
+        )
+        try:
+            asyncio.run(_bench(args, base_url))
+        finally:
+            server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
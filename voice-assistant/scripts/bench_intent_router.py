@@ -0,0 +1,158 @@
+"""Replay a transcript log through the intent router and count the LLM calls it saves.
+
+The log is one transcript per line, or JSONL with a ``transcript`` field. Without ``--log`` a synthetic farmer log is generated
+(about a fifth small talk and a third price or weather questions), with a demo
+market snapshot dated today. Reports:
+
+- transcripts per routed intent;
+- LLM calls without and with the router. A call is saved when the reply is
+  templated (or repeated from the session) or answered from the market index;
+- router and index lookup latency per transcript.
+
+    python scripts/bench_intent_router.py --log transcripts.jsonl --snapshot .cache/market_snapshot.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from app.config import get_settings  # noqa: E402
+from app.services.grounding import MarketIndex  # noqa: E402
+from app.services.intents import MARKET, SMALL_TALK, IntentClassifier, IntentRouter  # noqa: E402
+
+
+SMALL_TALK_LINES = (
+    "السلام علیکم", "Assalam o alaikum", "السلام علیکم جی", "شکریہ", "بہت شکریہ جناب", "thank you",
+    "اللہ حافظ", "allah hafiz", "جی دوبارہ بتائیں", "kya kaha", "hello", "kya haal hai",
+)
+MARKET_LINES = (
+    "لاہور میں ٹماٹر کا ریٹ کیا ہے", "tamatar ka rate lahore", "ملتان میں گندم کا بھاؤ", "کپاس کی قیمت کیا ہے",
+    "ملتان میں موسم کیسا ہے", "lahore mausam", "آج پیاز کا ریٹ", "فیصل آباد میں آلو کی قیمت",
+)
+QUESTION_LINES = (
+    "کپاس پر سفید مکھی کا کیا علاج ہے", "گندم کو کتنی کھاد ڈالنی چاہیے", "ٹماٹر کے پتے پیلے کیوں ہو رہے ہیں",
+    "dhan ki paneeri kab lagani chahiye", "السلام علیکم، میری مکئی میں سنڈی لگ گئی ہے کیا کروں",
+    "آم کے درخت پر پھول کیوں گر رہے ہیں", "how much water does sugarcane need in summer",
+)
+
+
+def _synthetic_log(count: int, seed: int) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    log = []
+    for _ in range(count):
+        roll = rng.random()
+        lines = SMALL_TALK_LINES if roll < 0.2 else MARKET_LINES if roll < 0.55 else QUESTION_LINES
+        log.append({"transcript": rng.choice(lines)})
+    return log
+
+
+def _demo_snapshot() -> dict[str, Any]:
+    today = date.today().isoformat()
+    items = [
+        {"_id": name, "name": name, "unit": "40kg" if name == "Wheat" else "kg"}
+        for name in ("Tomato", "Wheat", "Onion", "Potato", "Cotton")
+    ]
+    prices = [
+        {"item": item, "city": city, "date": today, "price": price}
+        for item, city, price in (
+            ("Tomato", "Lahore", 220), ("Wheat", "Multan", 4000), ("Onion", "Lahore", 150),
+            ("Potato", "Faisalabad", 90), ("Cotton", "Multan", 8500), ("Cotton", "Sukkur", 8300),
+        )
+    ]
+    weather = [
+        {"city": "Multan", "condition": "Sunny", "category": "heat", "temperature": 36, "humidity": 40},
+        {"city": "Lahore", "condition": "Haze", "category": "heat", "temperature": 31, "humidity": 55},
+    ]
+    return {"items": items, "prices": prices, "weather": weather}
+
+
+def _read_log(path: Path) -> list[dict[str, str]]:
+    log = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        log.append(json.loads(line) if line.startswith("{") else {"transcript": line})
+    return log
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay transcripts through the intent router.")
+    parser.add_argument("--log", type=Path, help="Transcript log (text lines or JSONL); synthetic when omitted.")
+    parser.add_argument("--snapshot", type=Path, help="Market snapshot; the configured one (or a demo) by default.")
+    parser.add_argument("--classifier", type=Path, help="Labelled JSONL to train the fallback classifier on.")
+    parser.add_argument("--count", type=int, default=20_000, help="Synthetic log length.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    settings = get_settings()
+    log = _read_log(args.log) if args.log else _synthetic_log(args.count, args.seed)
+
+    snapshot_path = args.snapshot or Path(settings.grounding_snapshot_path)
+    if snapshot_path.exists():
+        snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    else:
+        print(f"{snapshot_path} not found; using a demo snapshot")
+        snapshot = _demo_snapshot()
+    index = MarketIndex.from_snapshot(snapshot, max_age_days=settings.grounding_max_age_days)
+    classifier = IntentClassifier.load(args.classifier) if args.classifier else None
+    router = IntentRouter(classifier, threshold=settings.intent_classifier_threshold)
+
+    intents: Counter[str] = Counter()
+    llm_before = llm_after = 0
+    route_us: list[float] = []
+    lookup_us: list[float] = []
+    for entry in log:
+        transcript = entry.get("transcript", "").strip()
+        if not transcript:
+            continue
+        llm_before += 1
+
+        start = time.perf_counter()
+        intent = router.route(transcript).intent
+        route_us.append((time.perf_counter() - start) * 1e6)
+        intents[intent or "llm"] += 1
+
+        # Small talk never reaches the LLM; a "say that again" with nothing to repeat gets a template too.
+        answered = intent in SMALL_TALK
+        if intent not in SMALL_TALK:
+            start = time.perf_counter()
+            result = index.lookup(transcript, answer=intent == MARKET)
+            lookup_us.append((time.perf_counter() - start) * 1e6)
+            answered = result is not None and "ur" in result.answers
+        if not answered:
+            llm_after += 1
+
+    route_us.sort()
+    print(f"transcripts: {llm_before}")
+    for intent, count in intents.most_common():
+        print(f"  {intent:<10}{count:>8}  {count / llm_before:6.1%}")
+    saved = llm_before - llm_after
+    print(f"LLM calls: {llm_before} -> {llm_after} ({saved} saved, {saved / llm_before:.1%})")
+    print(
+        f"router: p50 {statistics.median(route_us):.1f} us  p99 {route_us[int(len(route_us) * 0.99)]:.1f} us  "
+        f"max {route_us[-1]:.1f} us"
+    )
+    if lookup_us:
+        lookup_us.sort()
+        p99 = lookup_us[int(len(lookup_us) * 0.99)]
+        print(f"index lookup: p50 {statistics.median(lookup_us):.1f} us  p99 {p99:.1f} us")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
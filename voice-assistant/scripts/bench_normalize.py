@@ -0,0 +1,69 @@
+"""Measure what the pre-transcription normalisation stage saves and costs.
+
+For typical recorder settings and each target encoding, reports upload bytes
+before and after normalisation, the percentage saved, and the CPU time spent
+normalising one clip.
+
+    python scripts/bench_normalize.py --seconds 10 30 --clips 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from typing import Optional
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from audio_samples import wav_bytes  # noqa: E402
+
+from app.audio.normalize import ENCODINGS, normalize_audio  # noqa: E402
+
+
+# (label, sample_rate, channels) as produced by common recorders.
+SOURCES = (
+    ("48k-stereo", 48_000, 2),
+    ("44k-stereo", 44_100, 2),
+    ("48k-mono", 48_000, 1),
+    ("16k-mono", 16_000, 1),
+)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark upload normalisation before STT.")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[10.0, 30.0], help="Clip lengths to test.")
+    parser.add_argument("--clips", type=int, default=20, help="Normalisations timed per source and encoding.")
+    parser.add_argument("--encodings", nargs="+", default=list(ENCODINGS), choices=ENCODINGS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+
+    print(f"{'source':<12}{'secs':>6}  {'encoding':<8}{'bytes_in':>11}{'bytes_out':>11}{'saved':>8}{'cpu_ms':>9}")
+    for seconds in args.seconds:
+        for label, rate, channels in SOURCES:
+            source = wav_bytes(seconds, sample_rate=rate, channels=channels)
+            for encoding in args.encodings:
+                result = normalize_audio(source, filename="clip.wav", mime_type="audio/wav", encoding=encoding)
+
+                samples = []
+                for _ in range(args.clips):
+                    start = time.process_time()
+                    normalize_audio(source, filename="clip.wav", mime_type="audio/wav", encoding=encoding)
+                    samples.append(time.process_time() - start)
+
+                out = len(result.audio_bytes)
+                saved = 1 - out / len(source)
+                cpu_ms = statistics.median(samples) * 1000
+                print(
+                    f"{label:<12}{seconds:>6.0f}  {encoding:<8}{len(source):>11}{out:>11}{saved:>8.1%}{cpu_ms:>9.2f}"
+                )
+
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+"""Compare JSON/base64, raw audio and multipart reply modes of /v1/voice-interact.
+
+Reports bytes on the wire (body + response headers) and server CPU time per
+request for several reply clip sizes. The OpenAI services are stubbed, so the
+CPU figures cover request parsing, the graph bookkeeping and response
+encoding only. Server CPU is measured around the ASGI call while the client
+thread is blocked waiting on it.
+
+    python scripts/bench_response_modes.py --sizes 64 512 2048 --requests 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from typing import Any, Optional
+from unittest import mock
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import create_app  # noqa: E402
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult  # noqa: E402
+
+
+MODES = {
+    "json": "application/json",
+    "audio": "audio/*",
+    "multipart": "multipart/mixed",
+}
+
+
+class _StubService:
+    def __init__(self, audio_bytes: bytes) -> None:
+        self._audio_bytes = audio_bytes
+
+    async def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        return TranscriptionResult(text="آج ٹماٹر کا ریٹ کیا ہے؟", model="whisper-1", language="ur", confidence=0.9)
+
+    async def generate_response(self, **_: object) -> LLMResult:
+        return LLMResult(text="آج لاہور میں ٹماٹر کا ریٹ مستحکم ہے۔ " * 4, model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=self._audio_bytes, model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+class _CpuMeter:
+    """ASGI wrapper recording process CPU time spent inside the app per request."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        self.samples: list[float] = []
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.process_time()
+        await self.app(scope, receive, send)
+        self.samples.append(time.process_time() - start)
+
+
+def _wire_bytes(response: Any) -> int:
+    header_bytes = sum(len(name) + len(value) + 4 for name, value in response.headers.raw)
+    return len(response.content) + header_bytes
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark /v1/voice-interact reply encodings.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 512, 2048], help="Reply clip sizes in KiB.")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per mode and size.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    upload = os.urandom(64 * 1024)
+
+    print(f"{'clip_kib':>8}  {'mode':<10}{'wire_bytes':>12}{'vs_json':>9}{'cpu_ms/req':>12}")
+    for size_kib in args.sizes:
+        service = _StubService(os.urandom(size_kib * 1024))
+        meter = _CpuMeter(create_app())
+        baseline: Optional[tuple[int, float]] = None
+
+        with mock.patch("app.graph.voice_graph.get_async_openai_service", lambda: service):
+            client = TestClient(meter)
+            for mode, accept in MODES.items():
+                # Warm-up request so imports and first-call costs are excluded.
+                client.post("/v1/voice-interact", files={"audio": ("q.wav", upload, "audio/wav")}, headers={"Accept": accept})
+                meter.samples.clear()
+
+                wire = 0
+                for _ in range(args.requests):
+                    response = client.post(
+                        "/v1/voice-interact",
+                        files={"audio": ("q.wav", upload, "audio/wav")},
+                        headers={"Accept": accept},
+                    )
+                    response.raise_for_status()
+                    wire = _wire_bytes(response)
+
+                cpu_ms = statistics.median(meter.samples) * 1000
+                if baseline is None:
+                    baseline = (wire, cpu_ms)
+                ratio = wire / baseline[0]
+                print(f"{size_kib:>8}  {mode:<10}{wire:>12}{ratio:>9.2f}{cpu_ms:>12.3f}")
+
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
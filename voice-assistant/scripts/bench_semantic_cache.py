@@ -0,0 +1,202 @@
+"""Hit rate, lookup latency and memory of the near-duplicate reply cache.
+
+1. Hit rate: farmer questions are asked again in Whisper-style variants
+   (fillers, suffixes, پر/پہ, word order, punctuation). Exact-match and
+   semantic hit rates are reported at several thresholds, with false hits
+   (the reply of a different question).
+2. Latency and memory of the vector index at ``--sizes`` entries, brute force
+   against the clustered (IVF) index. Vectors are clustered by topic like real
+   question embeddings. Recall is the share of queries whose approximate
+   neighbour is the exact one.
+
+    python scripts/bench_semantic_cache.py --sizes 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Optional
+
+import numpy as np
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from app.config import get_settings  # noqa: E402
+from app.services.cache import normalize_transcript  # noqa: E402
+from app.services.semantic_cache import HashingEmbedder, SemanticCache, VectorIndex  # noqa: E402
+
+
+CROPS = ("کپاس", "گندم", "ٹماٹر", "چاول", "مکئی", "آلو", "پیاز", "گنا", "آم", "مرچ")
+QUESTIONS = (
+    "{crop} پر سفید مکھی کا کیا علاج ہے",
+    "{crop} کو کتنی کھاد ڈالنی چاہیے",
+    "{crop} کے پتے پیلے کیوں ہو رہے ہیں",
+    "{crop} کو پانی کب دینا چاہیے",
+    "{crop} کی بوائی کا صحیح وقت کیا ہے",
+    "{crop} پر سنڈی کا حملہ ہو تو کیا کریں",
+    "{crop} کی اچھی پیداوار کے لیے کون سا بیج بہتر ہے",
+    "{crop} میں جڑی بوٹیوں کو کیسے ختم کریں",
+)
+FILLERS = ("جی", "بھائی", "جناب", "صاحب جی")
+
+
+def _variant(question: str, rng: random.Random) -> str:
+    words = question.split()
+    if rng.random() < 0.4:
+        words.insert(0, rng.choice(FILLERS))
+    if rng.random() < 0.3:
+        words.append(rng.choice(FILLERS))
+    if rng.random() < 0.3:
+        words = ["پہ" if word == "پر" else word for word in words]
+    if rng.random() < 0.3 and "کیا" in words:
+        index = words.index("کیا")
+        if index + 1 < len(words):
+            words[index], words[index + 1] = words[index + 1], words[index]
+    if rng.random() < 0.2:
+        words = [word + "وں" if word in CROPS and rng.random() < 0.5 else word for word in words]
+    return " ".join(words) + rng.choice(("", "؟", "۔", " ?"))
+
+
+def hit_rates(asks: int, thresholds: list[float], seed: int) -> None:
+    rng = random.Random(seed)
+    bases = [template.format(crop=crop) for template in QUESTIONS for crop in CROPS]
+    stream = [(base_id, _variant(bases[base_id], rng)) for base_id in (rng.randrange(len(bases)) for _ in range(asks))]
+    embedder = HashingEmbedder(get_settings().semantic_cache_dimensions)
+    vectors = [embedder.embed(text) for _, text in stream]
+
+    exact: set[str] = set()
+    exact_hits = 0
+    for _, text in stream:
+        key = normalize_transcript(text)
+        exact_hits += key in exact
+        exact.add(key)
+    print(f"{len(bases)} distinct questions, {asks} asks")
+    print(f"  exact-match cache: hit rate {exact_hits / asks:.1%}")
+
+    for threshold in thresholds:
+        cache = SemanticCache(embedder, threshold=threshold, max_entries=asks, ttl_seconds=3600)
+        answers: dict[str, int] = {}
+        hits = false_hits = 0
+        for (base_id, text), vector in zip(stream, vectors):
+            hit = cache.lookup(vector, transcript=text, language="ur", model="m")
+            if hit is not None:
+                hits += 1
+                false_hits += answers[hit.text] != base_id
+                continue
+            reply = f"reply-{base_id}-{len(answers)}"
+            answers[reply] = base_id
+            cache.store(vector, transcript=text, language="ur", model="m", text=reply)
+        print(
+            f"  semantic @ {threshold:.2f}: hit rate {hits / asks:.1%}  false hits {false_hits} "
+            f"({false_hits / max(hits, 1):.2%} of hits)"
+        )
+
+    start = time.perf_counter()
+    for _, text in stream[:2000]:
+        embedder.embed(text)
+    print(f"  hashing embedder: {(time.perf_counter() - start) / min(asks, 2000) * 1e6:.1f} us/question")
+
+
+def _clustered(rng: np.random.Generator, count: int, dimensions: int, topics: int) -> np.ndarray:
+    centers = rng.standard_normal((topics, dimensions)).astype(np.float32)
+    rows = centers[rng.integers(0, topics, count)] + 0.8 * rng.standard_normal((count, dimensions)).astype(np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def _timed_search(index: VectorIndex, queries: np.ndarray) -> tuple[list[float], list[Optional[int]]]:
+    samples, found = [], []
+    for query in queries:
+        start = time.perf_counter()
+        hit = index.search(query)
+        samples.append((time.perf_counter() - start) * 1e6)
+        found.append(hit[0] if hit else None)
+    return sorted(samples), found
+
+
+def index_latency(size: int, queries: int, seed: int, clusters: int, probes: int) -> None:
+    dimensions = get_settings().semantic_cache_dimensions
+    rng = np.random.default_rng(seed)
+    rows = _clustered(rng, size, dimensions, topics=max(size // 50, 10))
+    index = VectorIndex(
+        dimensions,
+        max_entries=size,
+        clusters=clusters,
+        probes=probes,
+    )
+    for row in rows:
+        index.add(row)
+    picks = rng.integers(0, size, queries)
+    noisy = rows[picks] + 0.05 * rng.standard_normal((queries, dimensions)).astype(np.float32)
+    noisy /= np.linalg.norm(noisy, axis=1, keepdims=True)
+
+    exact_us, exact_found = _timed_search(index, noisy)
+    start = time.perf_counter()
+    index.train()
+    train_s = time.perf_counter() - start
+    approx_us, approx_found = _timed_search(index, noisy)
+    recall = np.mean([a == e for a, e in zip(approx_found, exact_found)])
+    print(
+        f"{size:>9}  {index.nbytes / (1 << 20):>8.1f}  {statistics.median(exact_us):>9.0f}"
+        f"  {exact_us[int(queries * 0.99)]:>9.0f}  {statistics.median(approx_us):>9.0f}"
+        f"  {approx_us[int(queries * 0.99)]:>9.0f}  {recall:>6.1%}  {train_s:>7.2f}"
+    )
+
+
+def cache_memory(entries: int) -> None:
+    embedder = HashingEmbedder(get_settings().semantic_cache_dimensions)
+    questions = [template.format(crop=crop) for template in QUESTIONS for crop in CROPS]
+    reply = "کپاس پر سفید مکھی کے لیے صبح کے وقت تجویز کردہ سپرے کریں اور کھیت کی صفائی رکھیں۔ " * 3
+    vectors = [embedder.embed(f"{question} {index}") for index, question in enumerate(questions)]
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    cache = SemanticCache(embedder, threshold=0.85, max_entries=entries, ttl_seconds=3600)
+    for index in range(entries):
+        question = questions[index % len(questions)]
+        cache.store(vectors[index % len(vectors)], transcript=question, language="ur", model="m", text=reply[:] + "")
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    print(
+        f"cache with {entries} entries: {used / (1 << 20):.1f} MiB traced ({used / entries:.0f} B/entry, "
+        f"of which {cache.nbytes / entries:.0f} B vectors; reply texts are shared here)"
+    )
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the semantic reply cache.")
+    parser.add_argument("--asks", type=int, default=5000, help="Questions in the hit-rate stream.")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.8, 0.85, 0.9, 0.95])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=300, help="Timed lookups per size.")
+    parser.add_argument("--clusters", type=int, help="Override SEMANTIC_CACHE_CLUSTERS.")
+    parser.add_argument("--probes", type=int, help="Override SEMANTIC_CACHE_PROBES.")
+    parser.add_argument("--seed", type=int, default=3)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    hit_rates(args.asks, args.thresholds, args.seed)
+
+    settings = get_settings()
+    clusters = args.clusters or settings.semantic_cache_clusters
+    probes = args.probes or settings.semantic_cache_probes
+    print(
+        f"\nvector index: {settings.semantic_cache_dimensions} dims, {clusters} clusters, "
+        f"{probes} probes (latencies in us)"
+    )
+    print(f"{'entries':>9}  {'MiB':>8}  {'exact p50':>9}  {'exact p99':>9}  {'ivf p50':>9}  {'ivf p99':>9}  recall  train_s")
+    for size in args.sizes:
+        index_latency(size, args.queries, args.seed, clusters, probes)
+
+    print()
+    cache_memory(min(args.sizes))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
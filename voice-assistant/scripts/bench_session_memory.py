@@ -0,0 +1,125 @@
+"""Memory, latency and prompt growth of the per-session conversation memory.
+
+Fills a ``SessionMemory`` with ``--sessions`` farmer conversations of
+``--turns`` turns each (Urdu questions and answers of realistic length) using
+the configured ``MEMORY_*`` limits, then reports:
+
+- traced heap per session once every history window is full;
+- ``record`` and ``context`` latency;
+- how the injected context grows with conversation length (it should
+  plateau at the ``MEMORY_CONTEXT_TOKENS`` budget);
+- that memory stays flat when 20% more sessions than the cap arrive.
+
+    python scripts/bench_session_memory.py --sessions 100000 --turns 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Optional
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+from app.config import get_settings  # noqa: E402
+from app.services.session_memory import SessionMemory, estimate_tokens  # noqa: E402
+
+
+CROPS = ("ٹماٹر", "گندم", "کپاس", "چاول", "مکئی", "آلو", "پیاز", "گنا")
+CITIES = ("لاہور", "ملتان", "فیصل آباد", "سکھر", "حیدرآباد", "ساہیوال")
+
+
+def _question(session: int, turn: int) -> str:
+    crop = CROPS[(session + turn) % len(CROPS)]
+    return f"{CITIES[session % len(CITIES)]} میں آج {crop} کا ریٹ کیا ہے اور اس ہفتے کیا کرنا چاہیے؟ ({turn})"
+
+
+def _answer(session: int, turn: int) -> str:
+    crop = CROPS[(session + turn) % len(CROPS)]
+    advice = "کھیت میں پانی ہلکا رکھیں، سنڈی کے لیے پتوں کا معائنہ کریں اور کھاد صبح کے وقت ڈالیں۔ "
+    return f"{crop} کا آج کا ریٹ تقریباً {180 + turn * 5} روپے فی کلو ہے۔ " + advice * 4
+
+
+def _memory(sessions: int) -> SessionMemory:
+    settings = get_settings()
+    return SessionMemory(
+        max_sessions=sessions,
+        max_turns=settings.memory_turns,
+        turn_chars=settings.memory_turn_chars,
+        summary_chars=settings.memory_summary_chars,
+        ttl_seconds=settings.memory_ttl_seconds,
+    )
+
+
+def _fill(memory: SessionMemory, sessions: range, turns: int) -> None:
+    for turn in range(turns):
+        for session in sessions:
+            memory.record(f"farmer-{session}", _question(session, turn), _answer(session, turn))
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the conversation memory store.")
+    parser.add_argument("--sessions", type=int, default=100_000, help="Concurrent sessions (also the cap).")
+    parser.add_argument("--turns", type=int, default=8, help="Turns recorded per session.")
+    parser.add_argument("--lookups", type=int, default=20_000, help="Timed context() calls.")
+    parser.add_argument("--growth-turns", type=int, default=12, help="Conversation length for the growth table.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    settings = get_settings()
+    budget = settings.memory_context_tokens
+    print(
+        f"MEMORY_TURNS={settings.memory_turns} MEMORY_TURN_CHARS={settings.memory_turn_chars} "
+        f"MEMORY_SUMMARY_CHARS={settings.memory_summary_chars} MEMORY_CONTEXT_TOKENS={budget}"
+    )
+
+    # Latency, without tracemalloc's overhead.
+    memory = _memory(args.sessions)
+    start = time.perf_counter()
+    _fill(memory, range(args.sessions), args.turns)
+    record_us = (time.perf_counter() - start) / (args.sessions * args.turns) * 1e6
+    ids = [f"farmer-{random.randrange(args.sessions)}" for _ in range(args.lookups)]
+    samples = []
+    for session_id in ids:
+        start = time.perf_counter()
+        memory.context(session_id, budget)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    print(
+        f"record: {record_us:.2f} us/op   context: p50 {statistics.median(samples):.2f} us  "
+        f"p99 {samples[int(len(samples) * 0.99)]:.2f} us"
+    )
+    del memory
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    memory = _memory(args.sessions)
+    _fill(memory, range(args.sessions), args.turns)
+    full = tracemalloc.get_traced_memory()[0] - baseline
+    # 20% more farmers than the cap: the least recently used are evicted.
+    _fill(memory, range(args.sessions, args.sessions + args.sessions // 5), args.turns)
+    overflow = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    print(
+        f"sessions: {len(memory)}   heap: {full / (1 << 20):.1f} MiB ({full / args.sessions:.0f} B/session)   "
+        f"after +20% sessions: {overflow / (1 << 20):.1f} MiB"
+    )
+
+    growth = _memory(1)
+    print(f"\n{'turns':>5}{'context_chars':>15}{'context_tokens':>16}{'prompt_tokens':>15}")
+    for turn in range(args.growth_turns + 1):
+        context = growth.context("farmer-0", budget) or ""
+        prompt = f"{context}\n\nFarmer: {_question(0, turn)}" if context else _question(0, turn)
+        print(f"{turn:>5}{len(context):>15}{estimate_tokens(context):>16}{estimate_tokens(prompt):>15}")
+        growth.record("farmer-0", _question(0, turn), _answer(0, turn))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+"""Peak memory per /v1/voice-interact request: streamed upload vs buffered bytes.
+
+The app runs under uvicorn in a child process so the upload arrives over a real
+socket in chunks. It uses the real ``AsyncOpenAIService.transcribe_audio``
+against an in-process httpx transport that drains the multipart body chunk by
+chunk, as a socket would; the LLM and TTS calls are stubbed. ``stream`` is the
+current route, which hands the spooled upload to STT as a file. ``buffered``
+reproduces the old behaviour by reading the upload into ``audio_bytes``
+first. Peak is the server's traced Python heap growth inside each request
+(tracemalloc); the client's own buffers are not counted.
+
+    python scripts/bench_upload_memory.py --sizes 1 4 16 --requests 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Optional
+from unittest import mock
+
+os.environ.setdefault("OPENAI_API_KEY", "bench-not-used")
+
+import httpx  # noqa: E402
+from openai import AsyncOpenAI  # noqa: E402
+
+from app.graph.voice_graph import run_voice_graph  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.services.openai_client import AsyncOpenAIService, LLMResult, SpeechResult  # noqa: E402
+
+
+PEAKS_PATH = "/bench/peaks"
+
+
+class _DrainTransport(httpx.AsyncBaseTransport):
+    """Consume the request body chunk by chunk like a socket (``MockTransport`` reads it whole)."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async for _ in request.stream:  # type: ignore[union-attr]
+            pass
+        return httpx.Response(200, json={"text": "آج ٹماٹر کا ریٹ کیا ہے؟", "language": "urdu", "segments": []})
+
+
+class _BenchService(AsyncOpenAIService):
+    """Real transcription request building; canned LLM and TTS results."""
+
+    def __init__(self) -> None:
+        client = AsyncOpenAI(api_key="bench", http_client=httpx.AsyncClient(transport=_DrainTransport()))
+        self._client = client
+        self._stt_model = "whisper-1"
+        self._llm_model = "gpt-5-mini"
+
+    async def generate_response(self, **_: object) -> LLMResult:
+        return LLMResult(text="آج لاہور میں ٹماٹر کا ریٹ مستحکم ہے۔", model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"\0" * 4096, model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+async def _buffered_graph(state: dict[str, Any]) -> dict[str, Any]:
+    state = dict(state)
+    state["audio_bytes"] = state.pop("audio_file").read()
+    return await run_voice_graph(state)
+
+
+class _PeakMeter:
+    """ASGI wrapper recording peak traced heap growth per request; GET PEAKS_PATH drains them."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        self.samples: list[int] = []
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["path"] == PEAKS_PATH:
+            body = json.dumps(self.samples).encode()
+            self.samples = []
+            await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+            await send({"type": "http.response.body", "body": body})
+            return
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        await self.app(scope, receive, send)
+        self.samples.append(tracemalloc.get_traced_memory()[1] - baseline)
+
+
+def serve(mode: str, port: int) -> None:
+    import uvicorn
+
+    service = _BenchService()
+    logging.disable(logging.INFO)
+    with mock.patch("app.graph.voice_graph.get_async_openai_service", lambda: service):
+        if mode == "buffered":
+            mock.patch("app.routes.run_voice_graph", _buffered_graph).start()
+        tracemalloc.start()
+        uvicorn.run(_PeakMeter(create_app()), host="127.0.0.1", port=port, log_level="warning")
+
+
+def _start_server(mode: str, port: int) -> subprocess.Popen:
+    process = subprocess.Popen([sys.executable, __file__, "--serve", mode, "--port", str(port)])
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/health").raise_for_status()
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("Benchmark server did not start")
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark peak memory of voice uploads.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 4, 16], help="Upload sizes in MiB.")
+    parser.add_argument("--requests", type=int, default=5, help="Requests per mode and size.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--serve", choices=("stream", "buffered"), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.serve:
+        serve(args.serve, args.port)
+        return 0
+
+    # A WebM/Opus upload, as browsers send: passed through unnormalised.
+    uploads = {size: b"\x1a\x45\xdf\xa3" + os.urandom((size << 20) - 4) for size in args.sizes}
+    results: dict[tuple[int, str], float] = {}
+    for mode in ("stream", "buffered"):
+        server = _start_server(mode, args.port)
+        try:
+            with httpx.Client(base_url=f"http://127.0.0.1:{args.port}", timeout=60) as client:
+                for size, upload in uploads.items():
+                    for _ in range(args.requests):
+                        response = client.post(
+                            "/v1/voice-interact", files={"audio": ("q.webm", upload, "audio/webm")}
+                        )
+                        response.raise_for_status()
+                    results[(size, mode)] = statistics.median(client.get(PEAKS_PATH).json())
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"{'upload_mib':>10}  {'mode':<9}{'peak_mib':>10}{'peak/upload':>13}")
+    for size, upload in uploads.items():
+        for mode in ("stream", "buffered"):
+            peak = results[(size, mode)]
+            print(f"{size:>10}  {mode:<9}{peak / (1 << 20):>10.2f}{peak / len(upload):>13.2f}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
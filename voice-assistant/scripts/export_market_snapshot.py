@@ -0,0 +1,44 @@
+"""Export the backend's market items, prices and weather to a local snapshot file.
+
+The voice service builds its price and weather index from this file
+(``GROUNDING_SNAPSHOT_PATH``). Run it from cron, or let the service pull
+snapshots itself by setting ``GROUNDING_BACKEND_URL``.
+
+    python scripts/export_market_snapshot.py --backend-url http://localhost:5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+from typing import Optional
+
+os.environ.setdefault("OPENAI_API_KEY", "export-not-used")
+
+from app.config import get_settings  # noqa: E402
+from app.services.grounding import MarketIndex, fetch_snapshot, write_snapshot  # noqa: E402
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export a market price and weather snapshot from the backend.")
+    parser.add_argument("--backend-url", default="http://localhost:5000", help="Backend base URL.")
+    parser.add_argument("--out", type=Path, default=Path(get_settings().grounding_snapshot_path))
+    parser.add_argument("--timeout", type=float, default=10.0)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    snapshot = fetch_snapshot(args.backend_url, timeout=args.timeout)
+    write_snapshot(args.out, snapshot)
+    index = MarketIndex.from_snapshot(snapshot)
+    print(
+        f"Wrote {args.out}: {len(snapshot['items'])} items, {len(snapshot['prices'])} price rows, "
+        f"{len(index.prices)} latest prices, {len(index.weather)} weather cities"
+    )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,397 @@
+"""Local stand-in for the OpenAI API with configurable latency, payloads and faults.
+
+Implements the endpoints the voice loop calls — ``audio/transcriptions``
+(verbose_json), ``responses`` (plain and ``stream=True``),
+``chat/completions`` and ``audio/speech`` — plus ``GET /models`` for the
+connection warmup, on a real socket so the SDK's HTTP stack is exercised.
+``GET /_fake/calls`` returns the number of calls per endpoint so far.
+Latencies are drawn per request from a distribution (``fixed:0.2``,
+``uniform:0.1,0.4``, ``normal:0.3,0.05``, ``lognormal:0.3,0.4`` with the
+median and sigma, or a bare number of seconds). Payload sizes follow the
+transcript length, the reply length and bytes of speech per reply character.
+Tests queue one-off delays or error statuses with
+:meth:`FakeOpenAIServer.script`.
+
+    python scripts/fake_openai_server.py --port 8100 --llm-latency lognormal:0.8,0.4
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1 uvicorn app.main:app
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, replace
+from typing import AsyncIterator, Iterator, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+
+TRANSCRIPTIONS = "/v1/audio/transcriptions"
+RESPONSES = "/v1/responses"
+CHAT_COMPLETIONS = "/v1/chat/completions"
+SPEECH = "/v1/audio/speech"
+MODELS = "/v1/models"
+CALLS = "/_fake/calls"
+
+DEFAULT_TRANSCRIPT = "گندم کا ریٹ کیا ہے؟"
+DEFAULT_REPLY = "گندم کی قیمت 4000 روپے فی من ہے۔"
+
+
+@dataclass(frozen=True)
+class Latency:
+    """A latency distribution in seconds."""
+
+    kind: str = "fixed"
+    params: tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """Parse ``kind:a,b`` (or a bare number of seconds)."""
+
+        kind, _, values = spec.partition(":")
+        if not values:
+            return cls("fixed", (float(kind),))
+        params = tuple(float(value) for value in values.split(","))
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+        if expected.get(kind) != len(params):
+            raise ValueError(f"Unsupported latency spec {spec!r}")
+        return cls(kind, params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(*self.params))
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+        return self.params[0]
+
+
+@dataclass(frozen=True)
+class FakeProfile:
+    """Latencies and payload sizes served by :class:`FakeOpenAIServer`."""
+
+    latency: dict[str, Latency] = field(default_factory=dict)
+    # Extra delay on the first request of each new connection (emulated handshake round trips).
+    connect_latency: Latency = Latency()
+    transcript: str = DEFAULT_TRANSCRIPT
+    segments: int = 1
+    reply: str = DEFAULT_REPLY
+    # ~4 KB/s of 32 kbps mp3 at ~15 spoken characters per second.
+    speech_bytes_per_char: int = 270
+    stream_delta_chars: int = 12
+
+    @classmethod
+    def fixed(cls, seconds: float, **overrides: object) -> "FakeProfile":
+        """Every endpoint answers after ``seconds``."""
+
+        latency = Latency("fixed", (seconds,))
+        paths = (TRANSCRIPTIONS, RESPONSES, CHAT_COMPLETIONS, SPEECH, MODELS)
+        return replace(cls(), latency={path: latency for path in paths}, **overrides)  # type: ignore[arg-type]
+
+
+@dataclass(frozen=True)
+class Fault:
+    """One scripted reply: wait ``delay`` seconds, then answer with ``status``."""
+
+    delay: float = 0.0
+    status: int = 200
+
+
+def _reply_text(chars: int) -> str:
+    """The default reply repeated (and cut) to ``chars`` characters."""
+
+    if chars <= len(DEFAULT_REPLY):
+        return DEFAULT_REPLY
+    return " ".join([DEFAULT_REPLY] * math.ceil(chars / (len(DEFAULT_REPLY) + 1)))[:chars]
+
+
+def _error_response(status: int) -> Response:
+    return JSONResponse(
+        {"error": {"message": f"injected {status}", "type": "server_error", "code": None}}, status_code=status
+    )
+
+
+class FakeOpenAIServer:
+    """Run the fake API on ``127.0.0.1`` in a background thread."""
+
+    def __init__(self, profile: Optional[FakeProfile] = None, *, seed: int = 0) -> None:
+        self.profile = profile or FakeProfile()
+        self.calls: dict[str, int] = defaultdict(int)
+        self._scripts: dict[str, deque[Fault]] = defaultdict(deque)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._connections: set[tuple[str, int]] = set()
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self.base_url = ""
+
+    @property
+    def reply_text(self) -> str:
+        return self.profile.reply
+
+    def script(self, path: str, *faults: Fault) -> None:
+        """Queue behaviours for the next calls to ``path``; later calls follow the profile."""
+
+        with self._lock:
+            self._scripts[path].extend(faults)
+
+    def _next(self, path: str, request: Request) -> Fault:
+        with self._lock:
+            self.calls[path] += 1
+            queue = self._scripts[path]
+            fault = queue.popleft() if queue else Fault(delay=self.profile.latency.get(path, Latency()).sample(self._rng))
+            peer = (request.client.host, request.client.port) if request.client else ("", 0)
+            if peer not in self._connections:
+                self._connections.add(peer)
+                fault = replace(fault, delay=fault.delay + self.profile.connect_latency.sample(self._rng))
+        return fault
+
+    def app(self) -> FastAPI:
+        app = FastAPI()
+
+        async def _wait(path: str, request: Request) -> Optional[Response]:
+            """Sleep for the sampled or scripted delay; return the injected error response, if any."""
+
+            fault = self._next(path, request)
+            await asyncio.sleep(fault.delay)
+            return _error_response(fault.status) if fault.status != 200 else None
+
+        @app.post(TRANSCRIPTIONS)
+        async def transcriptions(request: Request) -> Response:
+            await request.body()
+            error = await _wait(TRANSCRIPTIONS, request)
+            if error is not None:
+                return error
+            profile = self.profile
+            step = 30.0 / max(1, profile.segments)
+            segments = [
+                {
+                    "id": index,
+                    "seek": 0,
+                    "start": index * step,
+                    "end": (index + 1) * step,
+                    "text": profile.transcript,
+                    "tokens": [50364 + index] * 12,
+                    "temperature": 0.0,
+                    "avg_logprob": -0.1 - 0.01 * (index % 10),
+                    "compression_ratio": 1.2,
+                    "no_speech_prob": 0.01,
+                }
+                for index in range(profile.segments)
+            ]
+            return JSONResponse(
+                {
+                    "task": "transcribe",
+                    "text": " ".join([profile.transcript] * profile.segments),
+                    "language": "urdu",
+                    "duration": profile.segments * step,
+                    "segments": segments,
+                }
+            )
+
+        @app.post(RESPONSES)
+        async def responses(request: Request) -> Response:
+            body = await request.json()
+            model = body.get("model", "gpt-5-mini")
+            if body.get("stream"):
+                fault = self._next(RESPONSES, request)
+                if fault.status != 200:
+                    return _error_response(fault.status)
+                return StreamingResponse(self._stream(model, fault.delay), media_type="text/event-stream")
+            return await _wait(RESPONSES, request) or JSONResponse(_response_object(self.profile.reply, model))
+
+        @app.post(CHAT_COMPLETIONS)
+        async def chat_completions(request: Request) -> Response:
+            body = await request.json()
+            return await _wait(CHAT_COMPLETIONS, request) or JSONResponse(
+                {
+                    "id": "chatcmpl_fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "gpt-5-mini"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {"role": "assistant", "content": self.profile.reply},
+                        }
+                    ],
+                }
+            )
+
+        @app.post(SPEECH)
+        async def speech(request: Request) -> Response:
+            body = await request.json()
+            size = max(2048, len(body.get("input", "")) * self.profile.speech_bytes_per_char)
+            return await _wait(SPEECH, request) or Response(b"ID3" + b"\x00" * size, media_type="audio/mpeg")
+
+        @app.get(MODELS)
+        async def models(request: Request) -> Response:
+            return await _wait(MODELS, request) or JSONResponse(
+                {"object": "list", "data": [{"id": "gpt-5-mini", "object": "model", "created": 0, "owned_by": "openai"}]}
+            )
+
+        @app.get(CALLS)
+        async def calls() -> Response:
+            with self._lock:
+                return JSONResponse(dict(self.calls))
+
+        return app
+
+    async def _stream(self, model: str, total_delay: float) -> AsyncIterator[bytes]:
+        """Spread the sampled latency over ``response.output_text.delta`` events."""
+
+        text = self.profile.reply
+        step = max(1, self.profile.stream_delta_chars)
+        deltas = [text[start : start + step] for start in range(0, len(text), step)]
+        for sequence, delta in enumerate(deltas):
+            await asyncio.sleep(total_delay / len(deltas))
+            yield _sse(
+                "response.output_text.delta",
+                {
+                    "type": "response.output_text.delta",
+                    "item_id": "msg_fake",
+                    "output_index": 0,
+                    "content_index": 0,
+                    "delta": delta,
+                    "logprobs": [],
+                    "sequence_number": sequence,
+                },
+            )
+        yield _sse(
+            "response.completed",
+            {"type": "response.completed", "response": _response_object(text, model), "sequence_number": len(deltas)},
+        )
+
+    def start(
+        self, *, port: int = 0, ssl_certfile: Optional[str] = None, ssl_keyfile: Optional[str] = None
+    ) -> "FakeOpenAIServer":
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Inherited by accepted sockets, so responses are not held back by Nagle's algorithm.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.bind(("127.0.0.1", port))
+        scheme = "https" if ssl_certfile else "http"
+        self.base_url = f"{scheme}://127.0.0.1:{sock.getsockname()[1]}/v1"
+
+        config = uvicorn.Config(
+            self.app(),
+            log_level="warning",
+            lifespan="off",
+            timeout_graceful_shutdown=0.1,
+            ssl_certfile=ssl_certfile,
+            ssl_keyfile=ssl_keyfile,
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, kwargs={"sockets": [sock]}, daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:  # pragma: no cover - environment problem
+                raise RuntimeError("fake OpenAI server did not start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+
+def _response_object(text: str, model: str) -> dict[str, object]:
+    return {
+        "id": "resp_fake",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": model,
+        "status": "completed",
+        "output": [
+            {
+                "type": "message",
+                "id": "msg_fake",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+    }
+
+
+def _sse(event: str, payload: dict[str, object]) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8")
+
+
+def serve(profile: Optional[FakeProfile] = None, **kwargs: object) -> Iterator[FakeOpenAIServer]:
+    """Generator for use as a pytest fixture body."""
+
+    with FakeOpenAIServer(profile, **kwargs) as server:  # type: ignore[arg-type]
+        yield server
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--stt-latency", type=Latency.parse, default=Latency.parse("lognormal:0.6,0.3"))
+    parser.add_argument("--llm-latency", type=Latency.parse, default=Latency.parse("lognormal:1.0,0.4"))
+    parser.add_argument("--tts-latency", type=Latency.parse, default=Latency.parse("lognormal:0.5,0.3"))
+    parser.add_argument("--connect-latency", type=Latency.parse, default=Latency(), help="Per new connection.")
+    parser.add_argument("--reply-chars", type=int, default=len(DEFAULT_REPLY), help="Length of generated replies.")
+    parser.add_argument("--segments", type=int, default=4, help="verbose_json segments per transcription.")
+    parser.add_argument("--speech-bytes-per-char", type=int, default=270)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ssl-certfile")
+    parser.add_argument("--ssl-keyfile")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    profile = FakeProfile(
+        latency={
+            TRANSCRIPTIONS: args.stt_latency,
+            RESPONSES: args.llm_latency,
+            CHAT_COMPLETIONS: args.llm_latency,
+            SPEECH: args.tts_latency,
+        },
+        connect_latency=args.connect_latency,
+        reply=_reply_text(args.reply_chars),
+        segments=args.segments,
+        speech_bytes_per_char=args.speech_bytes_per_char,
+    )
+    server = FakeOpenAIServer(profile, seed=args.seed).start(
+        port=args.port, ssl_certfile=args.ssl_certfile, ssl_keyfile=args.ssl_keyfile
+    )
+    print(f"Fake OpenAI API listening on {server.base_url}", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import argparse
-import base64
 import io
 import json
 import os
 import wave
 from pathlib import Path
 from typing import Optional
+from urllib.parse import unquote
 
 import numpy as np
 import requests
@@ -55,18 +55,31 @@ def call_assistant(
     url: str,
     language: str,
     timeout: float,
-) -> dict:
-    """Send the recorded clip to the FastAPI service."""
+) -> tuple[dict, Optional[bytes]]:
+    """Send the recorded clip to the FastAPI service.
+
+    Asks for the binary reply mode (``Accept: audio/*``) so the audio arrives
+    as the raw body instead of base64 inside JSON; text fields come back in
+    ``X-*`` headers.
+    """
 
     files = {"audio": ("question.wav", audio_bytes, "audio/wav")}
     response = requests.post(
         f"{url.rstrip('/')}/v1/voice-interact",
         params={"language": language},
         files=files,
+        headers={"Accept": "audio/*"},
         timeout=timeout,
     )
     response.raise_for_status()
-    return response.json()
+
+    payload = {
+        "language": response.headers.get("X-Language", language),
+        "transcript": unquote(response.headers.get("X-Transcript", "")),
+        "response_text": unquote(response.headers.get("X-Response-Text", "")),
+        "metadata": json.loads(response.headers.get("X-Voice-Metadata", "{}")),
+    }
+    return payload, response.content or None
 
 
 def _play_wav_bytes(wav_bytes: bytes) -> None:
@@ -92,14 +105,13 @@ def _save_audio_file(audio_bytes: bytes, path: Path) -> None:
         os.startfile(path)
 
 
-def play_response(audio_b64: Optional[str], metadata: Optional[dict], save_dir: Optional[Path] = None) -> None:
-    """Decode and play or store the assistant's audio reply."""
+def play_response(audio_bytes: Optional[bytes], metadata: Optional[dict], save_dir: Optional[Path] = None) -> None:
+    """Play or store the assistant's audio reply."""
 
-    if not audio_b64:
+    if not audio_bytes:
         print("No audio was returned by the assistant.")
         return
 
-    audio_bytes = base64.b64decode(audio_b64)
     metadata = metadata or {}
     fmt = metadata.get("tts_format") or metadata.get("format") or "mp3"
 
@@ -159,7 +171,7 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     try:
         wav_bytes = build_wav_bytes(audio_data, args.sample_rate)
-        payload = call_assistant(
+        payload, reply_audio = call_assistant(
             audio_bytes=wav_bytes,
             url=args.url,
             language=args.language,
@@ -182,7 +194,7 @@ def main(argv: Optional[list[str]] = None) -> int:
     print("Metadata:", json.dumps(metadata, ensure_ascii=False, indent=2))
     print("-------------------------\n")
 
-    play_response(payload.get("audio_base64"), metadata, args.save_dir)
+    play_response(reply_audio, metadata, args.save_dir)
     return 0
 
 
@@ -0,0 +1,108 @@
+"""CLI helper that streams the microphone to /v1/voice-session over a WebSocket.
+
+Unlike ``live_client.py`` there is no fixed recording window: speak, pause, and
+the server answers on the same connection. Keep talking for follow-up turns and
+press Ctrl+C to end the session.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from typing import Optional
+
+import sounddevice as sd
+import websockets
+
+from live_client import DEFAULT_SAMPLE_RATE, play_response
+
+
+FRAME_MS = 20
+
+
+async def _stream_microphone(ws: websockets.WebSocketClientProtocol, sample_rate: int) -> None:
+    """Forward 20 ms PCM frames from the default microphone to the socket."""
+
+    loop = asyncio.get_running_loop()
+    frames: asyncio.Queue[bytes] = asyncio.Queue()
+
+    def _callback(indata, _frames, _time, status) -> None:  # pragma: no cover - audio driver callback
+        if status:
+            print(f"[mic] {status}")
+        loop.call_soon_threadsafe(frames.put_nowait, bytes(indata))
+
+    with sd.RawInputStream(
+        samplerate=sample_rate,
+        channels=1,
+        dtype="int16",
+        blocksize=sample_rate * FRAME_MS // 1000,
+        callback=_callback,
+    ):
+        while True:
+            await ws.send(await frames.get())
+
+
+async def _print_replies(ws: websockets.WebSocketClientProtocol, save_dir: Optional[Path]) -> None:
+    """Print transcripts/replies and play audio chunks as they arrive."""
+
+    audio_format = "mp3"
+    async for message in ws:
+        if isinstance(message, bytes):
+            await asyncio.to_thread(play_response, message, {"tts_format": audio_format}, save_dir)
+            continue
+
+        event = json.loads(message)
+        kind = event.get("type")
+        if kind == "speech_end":
+            print(f"\n[turn {event['turn']}] heard {event['audio_ms']:.0f} ms of audio, thinking...")
+        elif kind == "transcript":
+            print("Transcript:", event.get("transcript") or "<empty>")
+        elif kind == "text":
+            print("Assistant:", event.get("text"))
+        elif kind == "audio":
+            audio_format = event.get("format", audio_format)
+        elif kind == "done":
+            metadata = event.get("metadata", {})
+            print(f"[turn {event['turn']}] first audio after {metadata.get('time_to_first_audio_ms') or 0:.0f} ms")
+        elif kind == "error":
+            print("Error:", event.get("detail"))
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Hold a live voice session with the assistant.")
+    parser.add_argument("--url", default="ws://localhost:8001", help="WebSocket base URL of the voice assistant.")
+    parser.add_argument("--language", default="ur", help="Language code for the session.")
+    parser.add_argument("--sample-rate", type=int, default=DEFAULT_SAMPLE_RATE, help="Microphone sample rate.")
+    parser.add_argument(
+        "--save-dir",
+        type=Path,
+        help="Optional directory to save assistant audio responses when direct playback is not possible.",
+    )
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> int:
+    url = f"{args.url.rstrip('/')}/v1/voice-session?language={args.language}&sample_rate={args.sample_rate}"
+    async with websockets.connect(url, max_size=None) as ws:
+        ready = json.loads(await ws.recv())
+        print(f"Session ready ({ready.get('sample_rate')} Hz). Speak whenever you like; Ctrl+C to quit.")
+        await asyncio.gather(_stream_microphone(ws, args.sample_rate), _print_replies(ws, args.save_dir))
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    try:
+        return asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        print("\nSession ended.")
+        return 0
+    except Exception as exc:
+        print(f"Voice session failed: {exc}")
+        return 1
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
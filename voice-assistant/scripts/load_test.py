@@ -0,0 +1,288 @@
+"""End-to-end load test of /v1/voice-interact against the local fake OpenAI API.
+
+Starts ``scripts/fake_openai_server.py`` and the service (``uvicorn
+app.main:app`` with ``OPENAI_BASE_URL`` pointed at the fake) as child
+processes, so the whole stack runs for real: upload handling, normalisation,
+the LangGraph workflow, the OpenAI SDK and its connection pool. For each
+concurrency level it sends ``--requests`` uploads and reports throughput,
+p50/p95/p99 latency, errors, the service's peak resident memory, and the
+upstream LLM and TTS calls per request. The fake transcribes every upload to
+the same question, so the workload is all duplicates: with the caches off,
+identical calls that overlap share one upstream call
+(``OPENAI_SINGLE_FLIGHT_OPERATIONS``). ``--no-single-flight`` turns that off
+for comparison.
+
+Save a run with ``--save`` and gate later changes with ``--baseline``: the
+exit status is 1 when any level's p95 grows, or its throughput drops, by
+more than ``--tolerance``.
+
+    python scripts/load_test.py --concurrency 1 8 32 --requests 200 --save load-baseline.json
+    python scripts/load_test.py --concurrency 1 8 32 --requests 200 --baseline load-baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from audio_samples import wav_bytes
+from fake_openai_server import CALLS, CHAT_COMPLETIONS, RESPONSES, SPEECH
+
+
+SCRIPTS = Path(__file__).resolve().parent
+ROOT = SCRIPTS.parent
+DEFAULT_CONCURRENCY = (1, 8, 32)
+
+
+@dataclass
+class LevelResult:
+    concurrency: int
+    requests: int
+    errors: int
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_rss_mib: Optional[float]
+    llm_calls_per_request: float
+    tts_calls_per_request: float
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{process.args} exited with {process.returncode}")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise RuntimeError(f"{url} did not come up")
+
+
+def _rss_mib(pid: int) -> Optional[float]:
+    """Resident set size of ``pid`` from /proc (Linux only)."""
+
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+class _RssSampler:
+    """Track the peak RSS of a process while a level runs."""
+
+    def __init__(self, pid: int, interval: float = 0.05) -> None:
+        self.pid = pid
+        self.interval = interval
+        self.peak: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            rss = _rss_mib(self.pid)
+            if rss is not None:
+                self.peak = rss if self.peak is None else max(self.peak, rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "_RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def _quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _run_level(url: str, audio: bytes, concurrency: int, requests: int) -> tuple[list[float], int, float]:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=120.0) as client:
+
+        async def _worker() -> None:
+            nonlocal errors
+            for _ in remaining:
+                start = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/v1/voice-interact", files={"audio": ("load.wav", audio, "audio/wav")}
+                    )
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append((time.perf_counter() - start) * 1000)
+                else:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+
+def _upstream_calls(fake_url: str) -> dict[str, int]:
+    return httpx.get(fake_url.removesuffix("/v1") + CALLS, timeout=5.0).json()
+
+
+def _compare(results: list[LevelResult], baseline: list[dict[str, float]], tolerance: float) -> list[str]:
+    """Describe every level that regressed beyond ``tolerance`` against the baseline."""
+
+    previous = {int(level["concurrency"]): level for level in baseline}
+    problems = []
+    for result in results:
+        base = previous.get(result.concurrency)
+        if base is None:
+            continue
+        if result.p95_ms > base["p95_ms"] * (1 + tolerance):
+            problems.append(f"c={result.concurrency}: p95 {base['p95_ms']:.0f} -> {result.p95_ms:.0f} ms")
+        if result.throughput_rps < base["throughput_rps"] * (1 - tolerance):
+            problems.append(
+                f"c={result.concurrency}: throughput {base['throughput_rps']:.1f} -> {result.throughput_rps:.1f} req/s"
+            )
+        if result.errors > base.get("errors", 0):
+            problems.append(f"c={result.concurrency}: errors {base.get('errors', 0):.0f} -> {result.errors}")
+    return problems
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--requests", type=int, default=100, help="Requests per concurrency level.")
+    parser.add_argument("--audio-seconds", type=float, default=4.0, help="Length of the uploaded WAV clip.")
+    parser.add_argument("--stt-latency", default="lognormal:0.3,0.3", help="Fake transcription latency.")
+    parser.add_argument("--llm-latency", default="lognormal:0.5,0.4", help="Fake reply latency.")
+    parser.add_argument("--tts-latency", default="lognormal:0.3,0.3", help="Fake speech latency.")
+    parser.add_argument("--reply-chars", type=int, default=300, help="Length of the fake replies.")
+    parser.add_argument("--cache", action="store_true", help="Keep the reply cache and TTS store enabled.")
+    parser.add_argument(
+        "--no-single-flight", action="store_true", help="Send every identical in-flight call upstream."
+    )
+    parser.add_argument("--save", type=Path, help="Write results as JSON.")
+    parser.add_argument("--baseline", type=Path, help="Fail if results regress against this JSON.")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative regression.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    fake_port, app_port = _free_port(), _free_port()
+    fake_url = f"http://127.0.0.1:{fake_port}/v1"
+    app_url = f"http://127.0.0.1:{app_port}"
+
+    fake = subprocess.Popen(
+        [
+            sys.executable, str(SCRIPTS / "fake_openai_server.py"), "--port", str(fake_port),
+            "--stt-latency", args.stt_latency, "--llm-latency", args.llm_latency,
+            "--tts-latency", args.tts_latency, "--reply-chars", str(args.reply_chars),
+        ],
+        stdout=subprocess.DEVNULL,
+    )  # fmt: skip
+    env = {
+        **os.environ,
+        "OPENAI_API_KEY": "load-test",
+        "OPENAI_BASE_URL": fake_url,
+        "PYTHONPATH": str(ROOT),
+    }
+    if not args.cache:
+        # Identical fake answers would otherwise be served from the caches after the first request.
+        env.update({"RESPONSE_CACHE_BACKEND": "none", "TTS_STORE_DIR": ""})
+    if args.no_single_flight:
+        env["OPENAI_SINGLE_FLIGHT_OPERATIONS"] = "[]"
+    service = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(app_port), "--log-level", "warning"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+    results: list[LevelResult] = []
+    try:
+        _wait_for(f"{fake_url}/models", fake)
+        _wait_for(f"{app_url}/health", service)
+        audio = wav_bytes(args.audio_seconds)
+        print(
+            f"upload={len(audio)} B stt={args.stt_latency} llm={args.llm_latency} tts={args.tts_latency} "
+            f"cache={'on' if args.cache else 'off'} single_flight={'off' if args.no_single_flight else 'on'}"
+        )
+        print(
+            f"{'conc':>5} {'reqs':>5} {'errs':>5} {'req/s':>8} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'rss_MiB':>8}"
+            f" {'llm/req':>8} {'tts/req':>8}"
+        )
+        for concurrency in args.concurrency:
+            before = _upstream_calls(fake_url)
+            with _RssSampler(service.pid) as sampler:
+                latencies, errors, elapsed = asyncio.run(_run_level(app_url, audio, concurrency, args.requests))
+            after = _upstream_calls(fake_url)
+            result = LevelResult(
+                concurrency=concurrency,
+                requests=args.requests,
+                errors=errors,
+                throughput_rps=len(latencies) / elapsed,
+                p50_ms=statistics.median(latencies) if latencies else float("nan"),
+                p95_ms=_quantile(latencies, 0.95) if latencies else float("nan"),
+                p99_ms=_quantile(latencies, 0.99) if latencies else float("nan"),
+                peak_rss_mib=sampler.peak,
+                llm_calls_per_request=sum(
+                    after.get(path, 0) - before.get(path, 0) for path in (RESPONSES, CHAT_COMPLETIONS)
+                ) / args.requests,
+                tts_calls_per_request=(after.get(SPEECH, 0) - before.get(SPEECH, 0)) / args.requests,
+            )
+            results.append(result)
+            rss = f"{result.peak_rss_mib:.1f}" if result.peak_rss_mib is not None else "n/a"
+            print(
+                f"{concurrency:>5} {result.requests:>5} {errors:>5} {result.throughput_rps:>8.1f} "
+                f"{result.p50_ms:>8.1f} {result.p95_ms:>8.1f} {result.p99_ms:>8.1f} {rss:>8}"
+                f" {result.llm_calls_per_request:>8.2f} {result.tts_calls_per_request:>8.2f}"
+            )
+    finally:
+        for process in (service, fake):
+            process.terminate()
+            process.wait(timeout=10)
+
+    if args.save:
+        args.save.write_text(json.dumps([asdict(result) for result in results], indent=2))
+    if args.baseline:
+        problems = _compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,54 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from app.config import get_settings
+from app.services.audio_store import get_audio_store
+from app.services.cache import get_response_cache
+from app.services.grounding import get_market_data
+from app.services.jobs import get_job_queue
+from app.services.openai_client import get_async_openai_service, get_openai_service
+from app.services.semantic_cache import get_semantic_cache
+from app.services.session_memory import get_session_memory
+
+# Process-wide singletons that hold state; the OpenAI services are listed because they capture the audio store.
+SINGLETONS = (
+    get_response_cache,
+    get_semantic_cache,
+    get_audio_store,
+    get_session_memory,
+    get_market_data,
+    get_openai_service,
+    get_async_openai_service,
+)
+
+
+def _reset_singletons() -> None:
+    for getter in SINGLETONS:
+        getter.cache_clear()
+    if get_job_queue.cache_info().currsize:
+        get_job_queue().close()
+    get_job_queue.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_singletons(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[None]:
+    """Give every test empty caches, stores and queues, with anything on disk under ``tmp_path``.
+
+    Cached replies, stored clips, session turns and jobs then never leak
+    between tests, and test runs never write into the repo's ``.cache``.
+    """
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "response_cache_dir", str(tmp_path / "responses"))
+    monkeypatch.setattr(settings, "tts_store_dir", str(tmp_path / "tts"))
+    monkeypatch.setattr(settings, "job_store_path", str(tmp_path / "jobs.sqlite3"))
+    monkeypatch.setattr(settings, "grounding_snapshot_path", str(tmp_path / "market_snapshot.json"))
+    _reset_singletons()
+    yield
+    _reset_singletons()
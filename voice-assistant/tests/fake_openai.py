@@ -0,0 +1,39 @@
+"""Test access to the local fake OpenAI API.
+
+The server lives in ``scripts/fake_openai_server.py`` so the load harness can
+run it standalone; this module puts ``scripts`` on the path and re-exports it.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from fake_openai_server import (  # noqa: E402
+    CHAT_COMPLETIONS,
+    MODELS,
+    RESPONSES,
+    SPEECH,
+    TRANSCRIPTIONS,
+    FakeOpenAIServer,
+    FakeProfile,
+    Fault,
+    Latency,
+    serve,
+)
+
+
+__all__ = [
+    "CHAT_COMPLETIONS",
+    "FakeOpenAIServer",
+    "FakeProfile",
+    "Fault",
+    "Latency",
+    "MODELS",
+    "RESPONSES",
+    "SPEECH",
+    "TRANSCRIPTIONS",
+    "serve",
+]
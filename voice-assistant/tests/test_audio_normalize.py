@@ -0,0 +1,103 @@
+"""Tests for the pre-transcription audio normalisation stage."""
+
+from __future__ import annotations
+
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from app.audio.normalize import decode_wav, normalize_audio
+from app.graph.voice_graph import run_voice_graph
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+
+
+def _wav(seconds: float, rate: int, channels: int) -> bytes:
+    t = np.arange(int(seconds * rate)) / rate
+    tone = (np.sin(2 * np.pi * 440 * t) * 12_000).astype("<i2")
+    frames = np.repeat(tone[:, None], channels, axis=1)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(frames.tobytes())
+    return buffer.getvalue()
+
+
+def test_normalize_downmixes_and_resamples_stereo_wav() -> None:
+    source = _wav(2.0, 48_000, 2)
+
+    result = normalize_audio(source, filename="clip.WAV", mime_type="audio/x-wav")
+
+    assert result.changed
+    assert result.filename == "clip.wav"
+    assert result.mime_type == "audio/wav"
+    with wave.open(io.BytesIO(result.audio_bytes)) as wf:
+        assert (wf.getnchannels(), wf.getframerate(), wf.getsampwidth()) == (1, 16_000, 2)
+        assert wf.getnframes() == 32_000
+    assert len(result.audio_bytes) < len(source) / 5
+
+    # The tone survives resampling at roughly its original level.
+    samples, _ = decode_wav(result.audio_bytes)
+    assert np.sqrt(np.mean(samples[1000:-1000] ** 2)) == pytest.approx(12_000 / 32768 / np.sqrt(2), rel=0.05)
+
+
+def test_normalize_mulaw_halves_pcm16() -> None:
+    source = _wav(1.0, 44_100, 1)
+
+    pcm16 = normalize_audio(source, filename="a.wav", mime_type="audio/wav")
+    mulaw = normalize_audio(source, filename="a.wav", mime_type="audio/wav", encoding="mulaw")
+
+    assert mulaw.changed
+    assert len(mulaw.audio_bytes) < len(pcm16.audio_bytes) * 0.55
+    assert mulaw.audio_bytes[20:22] == b"\x07\x00"  # WAVE_FORMAT_MULAW
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [_wav(1.0, 16_000, 1), b"\x1a\x45\xdf\xa3webm-bytes", b"not audio"],
+    ids=["already-16k-mono", "webm", "garbage"],
+)
+def test_normalize_passes_through_when_nothing_to_gain(payload: bytes) -> None:
+    result = normalize_audio(payload, filename="a.webm", mime_type="audio/webm")
+
+    assert not result.changed
+    assert result.audio_bytes is payload
+    assert result.filename == "a.webm"
+
+
+class _RecordingService:
+    def __init__(self) -> None:
+        self.uploads: list[dict[str, object]] = []
+
+    async def transcribe_audio(self, **kwargs: object) -> TranscriptionResult:
+        self.uploads.append(kwargs)
+        return TranscriptionResult(text="ٹماٹر کا ریٹ؟", model="whisper-1", language="ur", confidence=0.9)
+
+    async def generate_response(self, **_: object) -> LLMResult:
+        return LLMResult(text="ٹماٹر 220 روپے فی کلو ہے۔", model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"fake", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+@pytest.mark.asyncio
+async def test_graph_transcribes_normalized_audio(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _RecordingService()
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+
+    await run_voice_graph(
+        {
+            "audio_bytes": _wav(1.0, 48_000, 2),
+            "audio_filename": "browser.wav",
+            "audio_mime_type": "audio/wav",
+            "language": "ur",
+        }
+    )
+
+    (upload,) = service.uploads
+    with wave.open(io.BytesIO(upload["audio_bytes"])) as wf:
+        assert (wf.getnchannels(), wf.getframerate()) == (1, 16_000)
+    assert upload["mime_type"] == "audio/wav"
@@ -0,0 +1,118 @@
+"""Tests for header-only duration probes and upload size limits."""
+
+from __future__ import annotations
+
+import io
+import struct
+import wave
+
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from app.audio.probe import probe_duration
+from app.main import create_app
+from app.middleware import UploadSizeLimitMiddleware
+
+
+def _wav(seconds: float, rate: int = 16_000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(b"\0\0" * int(seconds * rate))
+    return buffer.getvalue()
+
+
+def _flac(seconds: float, rate: int = 44_100) -> bytes:
+    packed = (rate << 44) | (1 << 41) | (15 << 36) | int(seconds * rate)
+    info = b"\0" * 10 + packed.to_bytes(8, "big") + b"\0" * 16
+    return b"fLaC" + b"\x80\x00\x00\x22" + info + b"\0" * 100
+
+
+def _ogg_page(granule: int, body: bytes) -> bytes:
+    return b"OggS" + struct.pack("<BBqIII", 0, 0, granule, 1, 0, 0) + bytes([1, len(body)]) + body
+
+
+def _ogg_vorbis(seconds: float, rate: int = 22_050) -> bytes:
+    ident = b"\x01vorbis" + struct.pack("<IBI", 0, 1, rate) + b"\0" * 13
+    return _ogg_page(0, ident) + _ogg_page(int(seconds * rate), b"\0" * 200)
+
+
+def _webm(seconds: float) -> bytes:
+    def element(element_id: bytes, data: bytes) -> bytes:
+        return element_id + bytes([0x80 | len(data)]) + data
+
+    info = element(b"\x2a\xd7\xb1", (1_000_000).to_bytes(3, "big")) + element(b"\x44\x89", struct.pack(">d", seconds * 1000))
+    segment = element(b"\x15\x49\xa9\x66", info)
+    return element(b"\x1a\x45\xdf\xa3", b"") + b"\x18\x53\x80\x67\x01\xff\xff\xff\xff\xff\xff\xff" + segment
+
+
+def _mp3_xing(frames: int) -> bytes:
+    header = bytes([0xFF, 0xFB, 0x90, 0x44])  # MPEG1 Layer III, 128 kbps, 44.1 kHz, joint stereo
+    side_info = b"\0" * 32
+    xing = b"Xing" + struct.pack(">II", 1, frames)
+    return header + side_info + xing + b"\0" * 400
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        (_wav(2.5), 2.5),
+        (_flac(61.0), 61.0),
+        (_ogg_vorbis(12.0), 12.0),
+        (_webm(95.5), 95.5),
+        (_mp3_xing(1000), 1000 * 1152 / 44_100),
+    ],
+    ids=["wav", "flac", "ogg", "webm", "mp3"],
+)
+def test_probe_duration(payload: bytes, expected: float) -> None:
+    fileobj = io.BytesIO(payload)
+    fileobj.seek(3)
+
+    assert probe_duration(fileobj) == pytest.approx(expected, rel=1e-3)
+    assert fileobj.tell() == 3
+
+
+def test_probe_duration_unknown_format_returns_none() -> None:
+    assert probe_duration(io.BytesIO(b"not audio at all")) is None
+
+
+def test_voice_interact_rejects_clip_longer_than_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail() -> None:
+        raise AssertionError("over-limit clips must not reach OpenAI")
+
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", _fail)
+    client = TestClient(create_app())
+
+    response = client.post("/v1/voice-interact", files={"audio": ("long.wav", _wav(91.0, rate=8_000), "audio/wav")})
+
+    assert response.status_code == 413
+    assert "91 seconds" in response.json()["detail"]
+
+
+def test_upload_limit_middleware_rejects_declared_and_streamed_bodies() -> None:
+    app = FastAPI()
+
+    @app.post("/v1/voice-interact")
+    async def _upload(audio: UploadFile = File(...)) -> dict[str, int]:
+        return {"bytes": len(await audio.read())}
+
+    app.add_middleware(UploadSizeLimitMiddleware, max_bytes=1_000)
+    client = TestClient(app)
+
+    assert client.post("/v1/voice-interact", files={"audio": ("a.wav", b"\0" * 100, "audio/wav")}).status_code == 200
+    assert client.post("/v1/voice-interact", files={"audio": ("a.wav", b"\0" * 5_000, "audio/wav")}).status_code == 413
+
+    def _chunks():
+        # No Content-Length: the limit has to be enforced while the body streams in.
+        yield b'--b\r\nContent-Disposition: form-data; name="audio"; filename="a.wav"\r\nContent-Type: audio/wav\r\n\r\n'
+        for _ in range(10):
+            yield b"\0" * 500
+        yield b"\r\n--b--\r\n"
+
+    streamed = client.post(
+        "/v1/voice-interact", content=_chunks(), headers={"Content-Type": "multipart/form-data; boundary=b"}
+    )
+    assert streamed.status_code == 413
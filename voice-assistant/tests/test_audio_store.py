@@ -0,0 +1,117 @@
+"""Tests for the content-addressed TTS clip store."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from app.services.audio_store import AudioStore
+from app.services.openai_client import AsyncOpenAIService, OpenAIService
+
+
+class _Speech:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+
+class _CountingSpeech:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create(self, *, input: str, **_: object) -> _Speech:
+        self.calls += 1
+        return _Speech(f"audio:{input}".encode("utf-8"))
+
+
+class _AsyncCountingSpeech(_CountingSpeech):
+    async def create(self, **kwargs: object) -> _Speech:  # type: ignore[override]
+        return super().create(**kwargs)
+
+
+def _service(cls: type, speech: object, store: AudioStore):
+    service = cls.__new__(cls)
+    service._client = type("Client", (), {"audio": type("Audio", (), {"speech": speech})()})()
+    service._stt_model = "whisper-1"
+    service._llm_model = "gpt-5-mini"
+    service._tts_model = "gpt-4o-mini-tts"
+    service._tts_voice = "alloy"
+    service._tts_format = "mp3"
+    service._audio_store = store
+    return service
+
+
+def test_store_key_depends_on_every_parameter() -> None:
+    base = {"text": "سلام", "voice": "alloy", "model": "tts", "audio_format": "mp3"}
+    keys = {AudioStore.key(**base)}
+    for name, value in (("text", "سلام!"), ("voice", "nova"), ("model", "tts-2"), ("audio_format", "wav")):
+        keys.add(AudioStore.key(**{**base, name: value}))
+
+    assert len(keys) == 5
+
+
+def test_store_evicts_lru_but_keeps_pinned(tmp_path: Path) -> None:
+    store = AudioStore(tmp_path, max_bytes=8)
+    store.put("aa01", b"1234", pin=True)
+    store.put("bb02", b"5678")
+    store.put("cc03", b"90ab")
+
+    assert store.get("bb02") is None
+    assert store.get("aa01") == b"1234"
+    assert store.get("cc03") == b"90ab"
+    assert not list(tmp_path.rglob("*.tmp"))
+    assert AudioStore(tmp_path, max_bytes=8).get("cc03") == b"90ab"
+
+
+def test_sync_service_synthesises_each_phrase_once(tmp_path: Path) -> None:
+    speech = _CountingSpeech()
+    service = _service(OpenAIService, speech, AudioStore(tmp_path, max_bytes=1024))
+
+    first = service.synthesize_speech(text="دوبارہ بولیں", language="ur")
+    second = service.synthesize_speech(text="دوبارہ بولیں", language="ur")
+
+    assert first.audio_bytes == second.audio_bytes
+    assert speech.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_warm_speech_pins_phrase_for_offline_fallback(tmp_path: Path) -> None:
+    speech = _AsyncCountingSpeech()
+    store = AudioStore(tmp_path, max_bytes=1024)
+    service = _service(AsyncOpenAIService, speech, store)
+
+    await service.warm_speech(text="معذرت", language="ur")
+    for path in tmp_path.rglob("*"):
+        if path.is_file():
+            path.unlink()  # even with the disk copy gone the pinned clip is served
+    result = await service.synthesize_speech(text="معذرت", language="ur")
+
+    assert result.audio_bytes == "audio:معذرت".encode("utf-8")
+    assert speech.calls == 1
+
+
+class _ThreadRecordingStore(AudioStore):
+    def __init__(self, directory: Path) -> None:
+        super().__init__(directory, max_bytes=1024)
+        self.threads: set[int] = set()
+
+    def get(self, key: str) -> Optional[bytes]:
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def put(self, key: str, audio: bytes, *, pin: bool = False) -> None:
+        self.threads.add(threading.get_ident())
+        super().put(key, audio, pin=pin)
+
+
+@pytest.mark.asyncio
+async def test_async_service_keeps_store_io_off_the_event_loop(tmp_path: Path) -> None:
+    store = _ThreadRecordingStore(tmp_path)
+    service = _service(AsyncOpenAIService, _AsyncCountingSpeech(), store)
+
+    await service.synthesize_speech(text="سلام", language="ur")
+    await service.synthesize_speech(text="سلام", language="ur")
+
+    assert store.threads and threading.get_ident() not in store.threads
@@ -0,0 +1,132 @@
+"""Tests for the /v1/voice-interact/batch NDJSON endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import BinaryIO
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import get_settings
+from app.audio.upload import spool_copy
+from app.main import create_app
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+
+
+class _AsyncService:
+    def __init__(self) -> None:
+        self.transcribed: list[bytes] = []
+        self.active = 0
+        self.peak = 0
+
+    async def transcribe_audio(self, *, audio_bytes: bytes, **_: object) -> TranscriptionResult:
+        if audio_bytes.endswith(b"corrupt"):
+            raise ValueError("could not decode clip")
+        self.transcribed.append(audio_bytes)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        # Longer clips take longer, so completion order differs from upload order.
+        await asyncio.sleep(0.05 * len(audio_bytes) / 1000)
+        self.active -= 1
+        return TranscriptionResult(text=f"clip of {len(audio_bytes)} bytes", model="whisper-1", language="ur")
+
+    async def generate_response(self, *, transcript: str, **_: object) -> LLMResult:
+        return LLMResult(text=f"reply to {transcript}", model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"ID3", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> _AsyncService:
+    stub = _AsyncService()
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: stub)
+    return stub
+
+
+@pytest.fixture
+def client(service: _AsyncService) -> TestClient:
+    return TestClient(create_app())
+
+
+def _clip(name: str, size: int, mime: str = "audio/wav") -> tuple[str, tuple[str, bytes, str]]:
+    return ("audio", (name, b"RIFF" + bytes([size % 251]) * (size - 4), mime))
+
+
+def _lines(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch_streams_one_line_per_clip_and_dedupes(client: TestClient, service: _AsyncService) -> None:
+    files = [
+        _clip("long.wav", 4000),
+        _clip("short.wav", 1000),
+        _clip("copy-of-long.wav", 4000),
+        _clip("notes.txt", 1000, mime="text/plain"),
+    ]
+
+    response = client.post("/v1/voice-interact/batch", files=files)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = _lines(response)
+    assert [line["index"] for line in lines] == [3, 1, 0, 2]
+    assert lines[0]["status_code"] == 415 and lines[0]["result"] is None
+    assert lines[1]["result"]["transcript"] == "clip of 1000 bytes"
+    assert lines[3]["duplicate_of"] == 0
+    assert lines[3]["filename"] == "copy-of-long.wav"
+    assert lines[3]["result"] == lines[2]["result"]
+    assert sorted(len(clip) for clip in service.transcribed) == [1000, 4000]
+
+
+def test_batch_reports_a_failing_clip_and_finishes_the_rest(client: TestClient, service: _AsyncService) -> None:
+    files = [
+        _clip("first.wav", 3000),
+        ("audio", ("broken.wav", b"RIFF" + b"\x00" * 1000 + b"corrupt", "audio/wav")),
+        _clip("last.wav", 2000),
+    ]
+
+    response = client.post("/v1/voice-interact/batch", files=files)
+
+    lines = {line["index"]: line for line in _lines(response)}
+    assert sorted(lines) == [0, 1, 2]
+    assert lines[1]["status_code"] == 500 and lines[1]["result"] is None
+    assert lines[0]["result"]["transcript"] == "clip of 3000 bytes"
+    assert lines[2]["result"]["transcript"] == "clip of 2000 bytes"
+
+
+def test_batch_keeps_clips_on_disk_and_cleans_them_up(
+    monkeypatch: pytest.MonkeyPatch, client: TestClient, service: _AsyncService
+) -> None:
+    spools: list[BinaryIO] = []
+
+    def _spool(fileobj: BinaryIO) -> tuple[str, BinaryIO]:
+        digest, spool = spool_copy(fileobj)
+        spools.append(spool)
+        return digest, spool
+
+    monkeypatch.setattr("app.routes.spool_copy", _spool)
+
+    response = client.post("/v1/voice-interact/batch", files=[_clip("a.wav", 2000), _clip("b.wav", 2000)])
+
+    assert len(_lines(response)) == 2 and len(service.transcribed) == 1
+    assert len(spools) == 2 and all(spool.closed for spool in spools)
+
+
+def test_batch_bounds_concurrency(monkeypatch: pytest.MonkeyPatch, client: TestClient, service: _AsyncService) -> None:
+    monkeypatch.setattr(get_settings(), "batch_concurrency", 2)
+
+    response = client.post("/v1/voice-interact/batch", files=[_clip(f"{i}.wav", 1000 + i) for i in range(6)])
+
+    assert len(_lines(response)) == 6
+    assert service.peak == 2
+
+
+def test_batch_rejects_too_many_clips(monkeypatch: pytest.MonkeyPatch, client: TestClient) -> None:
+    monkeypatch.setattr(get_settings(), "batch_max_clips", 2)
+
+    response = client.post("/v1/voice-interact/batch", files=[_clip(f"{i}.wav", 1000 + i) for i in range(3)])
+
+    assert response.status_code == 413
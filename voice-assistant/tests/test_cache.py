@@ -0,0 +1,165 @@
+"""Tests for the reply/audio response cache."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from app.graph.voice_graph import invoke_voice_graph, run_voice_graph
+from app.services import cache as cache_module
+from app.services.cache import DiskCacheBackend, MemoryCacheBackend, ResponseCache, normalize_transcript
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+
+
+class _CountingService:
+    def __init__(self, transcript: str) -> None:
+        self._transcript = transcript
+        self.llm_calls = 0
+        self.tts_calls = 0
+
+    def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        return TranscriptionResult(text=self._transcript, model="whisper-1", language="ur", confidence=0.9)
+
+    def generate_response(self, **_: object) -> LLMResult:
+        self.llm_calls += 1
+        return LLMResult(text=f"جواب {self.llm_calls}", model="gpt-5-mini")
+
+    def synthesize_speech(self, *, text: str, **_: object) -> SpeechResult:
+        self.tts_calls += 1
+        return SpeechResult(audio_bytes=text.encode("utf-8"), model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def test_normalize_transcript_folds_punctuation_case_and_letter_variants() -> None:
+    assert normalize_transcript("  Tomato   RATE today?? ") == "tomato rate today"
+    assert normalize_transcript("آج ٹماٹر کا ريٹ كيا ہے؟") == normalize_transcript("آج ٹماٹر کا ریٹ کیا ہے")
+
+
+def test_memory_backend_evicts_least_recently_used_by_bytes() -> None:
+    backend = MemoryCacheBackend(max_bytes=10)
+    backend.set("a", b"1234", ttl_seconds=60)
+    backend.set("b", b"5678", ttl_seconds=60)
+    assert backend.get("a") == b"1234"  # refresh "a"
+
+    backend.set("c", b"90ab", ttl_seconds=60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1234"
+    assert backend.size_bytes == 8
+
+
+def test_memory_backend_expires_entries() -> None:
+    backend = MemoryCacheBackend(max_bytes=100)
+    backend.set("a", b"x", ttl_seconds=0)
+
+    assert backend.get("a") is None
+    assert backend.size_bytes == 0
+
+
+def test_disk_backend_persists_and_evicts(tmp_path: Path) -> None:
+    backend = DiskCacheBackend(tmp_path, max_bytes=10)
+    backend.set("a", b"1234", ttl_seconds=60)
+    backend.set("b", b"5678", ttl_seconds=60)
+
+    reopened = DiskCacheBackend(tmp_path, max_bytes=10)
+    assert reopened.get("a") == b"1234"
+    assert reopened.size_bytes == 8
+
+    reopened.set("c", b"90ab", ttl_seconds=60)
+    assert reopened.get("b") is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_disk_backend_treats_truncated_entries_as_misses(tmp_path: Path) -> None:
+    backend = DiskCacheBackend(tmp_path, max_bytes=1024)
+    backend.set("a", b"1234", ttl_seconds=60)
+    (tmp_path / "a.bin").write_bytes(b"\x00\x01")
+    (tmp_path / "b.bin").write_bytes(b"")
+    cache = ResponseCache(DiskCacheBackend(tmp_path, max_bytes=1024), ttl_seconds=60)
+
+    assert cache.get_audio("a") is None
+    assert cache.get_reply("b") is None
+    assert not list(tmp_path.glob("*.bin"))
+    assert cache.stats()["size_bytes"] == 0
+
+
+def test_disk_write_failures_do_not_fail_the_request(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = ResponseCache(DiskCacheBackend(tmp_path, max_bytes=1024), ttl_seconds=60)
+
+    def _full(*_: object) -> None:
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(cache.backend, "set", _full)
+
+    cache.set_reply("a", "جواب", "gpt-5-mini")
+    cache.set_audio("b", b"ID3")
+    assert cache.get_reply("a") is None
+
+
+def test_graph_serves_repeat_question_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _CountingService("آج ٹماٹر کا ریٹ کیا ہے؟")
+    response_cache = ResponseCache(MemoryCacheBackend(1024 * 1024), ttl_seconds=60)
+    monkeypatch.setattr("app.graph.voice_graph.get_openai_service", lambda: service)
+    monkeypatch.setattr("app.graph.voice_graph.get_response_cache", lambda: response_cache)
+
+    first = invoke_voice_graph({"audio_bytes": b"1", "language": "ur"})
+    service._transcript = "آج ٹماٹر کا ریٹ کیا ہے"  # Whisper drops the question mark
+    second = invoke_voice_graph({"audio_bytes": b"2", "language": "ur"})
+
+    assert first["reply_cached"] is False and first["audio_cached"] is False
+    assert second["reply_cached"] is True and second["audio_cached"] is True
+    assert second["response_text"] == first["response_text"]
+    assert second["tts_audio"] == first["tts_audio"]
+    assert (service.llm_calls, service.tts_calls) == (1, 1)
+    assert response_cache.stats()["hits"] == {"reply": 1, "audio": 1}
+    assert response_cache.stats()["misses"] == {"reply": 1, "audio": 1}
+
+
+class _AsyncCountingService(_CountingService):
+    async def transcribe_audio(self, **kwargs: object) -> TranscriptionResult:  # type: ignore[override]
+        return super().transcribe_audio(**kwargs)
+
+    async def generate_response(self, **kwargs: object) -> LLMResult:  # type: ignore[override]
+        return super().generate_response(**kwargs)
+
+    async def synthesize_speech(self, **kwargs: object) -> SpeechResult:  # type: ignore[override]
+        return super().synthesize_speech(**kwargs)
+
+
+class _ThreadRecordingDiskBackend(DiskCacheBackend):
+    threads: set[int]
+
+    def get(self, key: str) -> Optional[bytes]:
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.threads.add(threading.get_ident())
+        super().set(key, value, ttl_seconds)
+
+
+async def test_async_graph_reads_the_disk_cache_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    service = _AsyncCountingService("آج ٹماٹر کا ریٹ کیا ہے؟")
+    backend = _ThreadRecordingDiskBackend(tmp_path, max_bytes=1024 * 1024)
+    backend.threads = set()
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+    monkeypatch.setattr("app.graph.voice_graph.get_response_cache", lambda: ResponseCache(backend, ttl_seconds=60))
+
+    await run_voice_graph({"audio_bytes": b"1", "language": "ur"})
+    second = await run_voice_graph({"audio_bytes": b"2", "language": "ur"})
+
+    assert second["reply_cached"] is True and second["audio_cached"] is True
+    assert backend.threads and threading.get_ident() not in backend.threads
+
+
+def test_get_response_cache_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Settings:
+        response_cache_backend = "none"
+
+    monkeypatch.setattr(cache_module, "get_settings", lambda: _Settings())
+
+    assert cache_module.get_response_cache() is None
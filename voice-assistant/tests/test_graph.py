@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import time
 
 import pytest
 
-from app.graph.voice_graph import invoke_voice_graph
+from app.graph.voice_graph import invoke_voice_graph, reply_variants, run_voice_graph
 from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
 
 
@@ -34,6 +35,20 @@ class _DummyOpenAIService:
         )
 
 
+class _DummyAsyncOpenAIService:
+    def __init__(self) -> None:
+        self._sync = _DummyOpenAIService()
+
+    async def transcribe_audio(self, **kwargs: object) -> TranscriptionResult:
+        return self._sync.transcribe_audio(**kwargs)
+
+    async def generate_response(self, **kwargs: object) -> LLMResult:
+        return self._sync.generate_response(**kwargs)
+
+    async def synthesize_speech(self, **kwargs: object) -> SpeechResult:
+        return self._sync.synthesize_speech(**kwargs)
+
+
 @pytest.mark.asyncio
 async def test_invoke_voice_graph(monkeypatch: pytest.MonkeyPatch) -> None:
     """The pipeline should surface transcript, response, and audio metadata."""
@@ -58,3 +73,87 @@ async def test_invoke_voice_graph(monkeypatch: pytest.MonkeyPatch) -> None:
     assert result["llm_model"] == "gpt-5-mini"
     assert result["tts_format"] == "mp3"
 
+
+@pytest.mark.asyncio
+async def test_run_voice_graph_uses_async_service(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The API path should await the async service rather than the blocking one."""
+
+    def _fail() -> None:
+        raise AssertionError("sync service must not be used by run_voice_graph")
+
+    monkeypatch.setattr("app.graph.voice_graph.get_openai_service", _fail)
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: _DummyAsyncOpenAIService())
+
+    result = await run_voice_graph(
+        {
+            "audio_bytes": b"binary-data",
+            "audio_filename": "query.wav",
+            "audio_mime_type": "audio/wav",
+            "language": "ur",
+        }
+    )
+
+    assert result["transcript"].startswith("آج")
+    assert result["tts_audio"] == b"fake-binary"
+    assert result["audio_filename"] == "query.wav"
+
+
+class _SlowAsyncOpenAIService(_DummyAsyncOpenAIService):
+    async def generate_response(self, *, language: str, **_: object) -> LLMResult:
+        await asyncio.sleep(0.2)
+        return LLMResult(text=f"reply in {language}", model="gpt-5-mini")
+
+    async def synthesize_speech(self, *, text: str, **_: object) -> SpeechResult:
+        await asyncio.sleep(0.2)
+        return SpeechResult(audio_bytes=text.encode(), model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+@pytest.mark.asyncio
+async def test_run_voice_graph_fans_out_target_languages(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each target language gets its own concurrent LLM + TTS branch."""
+
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: _SlowAsyncOpenAIService())
+
+    start = time.perf_counter()
+    result = await run_voice_graph(
+        {
+            "audio_bytes": b"binary-data",
+            "audio_filename": "query.wav",
+            "audio_mime_type": "audio/wav",
+            "language": "ur",
+            "target_languages": ["pa", "ur", "en"],
+        }
+    )
+    elapsed = time.perf_counter() - start
+
+    # Three sequential branches would take 1.2 s; concurrent ones take about one branch (0.4 s).
+    assert elapsed < 0.8
+    assert [variant["language"] for variant in reply_variants(result)] == ["pa", "ur", "en"]
+    assert [variant["tts_audio"] for variant in reply_variants(result)] == [
+        b"reply in pa",
+        b"reply in ur",
+        b"reply in en",
+    ]
+    assert (result["language"], result["response_text"]) == ("pa", "reply in pa")
+    assert result["stage_ms"]["generate_response"] >= 200
+
+
+def test_invoke_voice_graph_fans_out_on_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _SlowService(_DummyOpenAIService):
+        def generate_response(self, *, language: str, **_: object) -> LLMResult:
+            time.sleep(0.2)
+            return LLMResult(text=f"reply in {language}", model="gpt-5-mini")
+
+    monkeypatch.setattr("app.graph.voice_graph.get_openai_service", lambda: _SlowService())
+
+    start = time.perf_counter()
+    result = invoke_voice_graph(
+        {"audio_bytes": b"binary-data", "language": "ur", "target_languages": ["ur", "en", "pa"]}
+    )
+
+    assert time.perf_counter() - start < 0.5
+    assert sorted(variant["response_text"] for variant in result["variants"]) == [
+        "reply in en",
+        "reply in pa",
+        "reply in ur",
+    ]
@@ -0,0 +1,208 @@
+"""Tests for the market price / weather index and its graph tool node."""
+
+from __future__ import annotations
+
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from app.graph.voice_graph import invoke_voice_graph, run_voice_graph
+from app.services.grounding import MARKET_PRICE, WEATHER, MarketData, MarketIndex, write_snapshot
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+
+TODAY = date.today()
+
+
+def _snapshot(tomato_price: float = 220, tomato_age_days: int = 0) -> dict[str, Any]:
+    return {
+        "items": [
+            {"_id": "i1", "name": "Tomato", "unit": "kg"},
+            {"_id": "i2", "name": "Wheat", "unit": "40kg", "aliases": ["kanak"]},
+            {"_id": "i3", "name": "Garlic", "unit": "kg", "enabled": False},
+        ],
+        "prices": [
+            {"item": "i1", "city": "Lahore", "date": f"{TODAY - timedelta(days=5)}T00:00:00.000Z", "price": 180},
+            {"item": "i1", "city": "Lahore", "date": f"{TODAY - timedelta(days=tomato_age_days)}", "price": tomato_price},
+            {"item": "i1", "city": "Faisalabad", "date": str(TODAY), "price": 210},
+            {"item": "i2", "city": "Multan", "date": str(TODAY), "price": 4000.5},
+            {"item": "i3", "city": "Lahore", "date": str(TODAY), "price": 600},
+        ],
+        "weather": [
+            {"city": "Multan", "condition": "Scorching sunshine", "category": "heat", "temperature": 37,
+             "humidity": 42, "precipitationChance": 9},
+            {"city": "Lahore", "condition": "Warm with haze", "category": "heat", "temperature": 31,
+             "humidity": 55, "precipitationChance": 18},
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "question",
+    ["لاہور میں ٹماٹر کا ریٹ کیا ہے؟", "Tamatar ka rate Lahore mein kya hai", "ٹماٹروں کا بھاؤ لاہور"],
+)
+def test_price_for_one_commodity_and_city_is_answered(question: str) -> None:
+    result = MarketIndex.from_snapshot(_snapshot()).lookup(question)
+
+    assert result is not None and result.tool == MARKET_PRICE
+    assert result.answers["ur"] == f"لاہور میں ٹماٹر کا ریٹ 220 روپے فی کلو ہے ({TODAY} کا ریٹ)۔"
+    assert result.answers["en"] == f"Tomato in Lahore is 220 PKR per kg (as of {TODAY})."
+
+
+def test_broad_or_stale_price_questions_only_ground_the_llm() -> None:
+    index = MarketIndex.from_snapshot(_snapshot(tomato_age_days=10))
+
+    broad = index.lookup("ٹماٹر کی قیمت کیا ہے")
+    stale = index.lookup("لاہور میں ٹماٹر کی قیمت")
+
+    assert broad is not None and broad.answers == {}
+    assert broad.facts.splitlines() == [
+        f"Market price: Tomato in Faisalabad, 210 PKR/kg on {TODAY}",
+        f"Market price: Tomato in Lahore, 180 PKR/kg on {TODAY - timedelta(days=5)}",
+    ]
+    assert stale is not None and stale.answers == {} and "Lahore" in stale.facts
+
+
+def test_multi_word_cities_snapshot_aliases_and_disabled_items() -> None:
+    index = MarketIndex.from_snapshot(_snapshot())
+
+    assert "210" in index.lookup("فیصل آباد میں ٹماٹر کا ریٹ").answers["ur"]  # type: ignore[union-attr]
+    assert "4000.5 روپے فی من" in index.lookup("ملتان kanak rate").answers["ur"]  # type: ignore[union-attr]
+    assert index.lookup("لاہور میں لہسن کا ریٹ") is None
+    assert index.lookup("گندم کے پتے پیلے ہو رہے ہیں") is None
+
+
+def test_weather_for_a_city() -> None:
+    index = MarketIndex.from_snapshot(_snapshot())
+
+    result = index.lookup("ملتان میں موسم کیسا رہے گا؟")
+
+    assert result is not None and result.tool == WEATHER
+    assert result.answers["ur"] == "ملتان میں موسم گرم ہے: درجہ حرارت 37 ڈگری، نمی 42 فیصد اور بارش کا امکان 9 فیصد ہے۔"
+    assert len(index.lookup("aaj mausam kaisa hai").facts.splitlines()) == 2  # type: ignore[union-attr]
+    assert index.lookup("کراچی میں بارش ہوگی؟") is None
+    assert index.lookup("کراچی میں ٹماٹر کا ریٹ") is None
+
+
+def test_lookups_that_may_not_answer_only_return_figures() -> None:
+    index = MarketIndex.from_snapshot(_snapshot())
+
+    price = index.lookup("لاہور میں ٹماٹر کا ریٹ", answer=False)
+    weather = index.lookup("ملتان میں بارش", answer=False)
+
+    assert price is not None and price.tool == MARKET_PRICE and price.answers == {}
+    assert weather is not None and weather.answers == {}
+    assert weather.facts.startswith("Weather: Multan, Scorching sunshine")
+
+
+def test_market_data_reloads_a_changed_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot.json"
+    data = MarketData(path)
+    assert data.refresh() is False and data.lookup("lahore tomato rate") is None
+
+    write_snapshot(path, _snapshot())
+    assert data.refresh() is True
+    assert data.refresh() is False
+    write_snapshot(path, _snapshot(tomato_price=250))
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 5))
+    assert data.refresh() is True
+
+    assert "250" in data.lookup("lahore tomato rate").answers["en"]  # type: ignore[union-attr]
+
+
+class _Service:
+    def __init__(self) -> None:
+        self.contexts: list[tuple[str, Optional[str]]] = []
+        self.spoken: list[str] = []
+
+    def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        return TranscriptionResult(text="لاہور میں ٹماٹر کا ریٹ کیا ہے؟", model="whisper-1", language="ur")
+
+    def generate_response(self, *, language: str, context: Optional[str] = None, **_: object) -> LLMResult:
+        self.contexts.append((language, context))
+        return LLMResult(text=f"[{language}] 220", model="gpt-5-mini")
+
+    def synthesize_speech(self, *, text: str, **_: object) -> SpeechResult:
+        self.spoken.append(text)
+        return SpeechResult(audio_bytes=b"ID3", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+class _AsyncService:
+    def __init__(self) -> None:
+        self._sync = _Service()
+
+    async def transcribe_audio(self, **kwargs: Any) -> TranscriptionResult:
+        return self._sync.transcribe_audio(**kwargs)
+
+    async def generate_response(self, **kwargs: Any) -> LLMResult:
+        return self._sync.generate_response(**kwargs)
+
+    async def synthesize_speech(self, **kwargs: Any) -> SpeechResult:
+        return self._sync.synthesize_speech(**kwargs)
+
+
+@pytest.fixture
+def market(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> MarketData:
+    path = tmp_path / "snapshot.json"
+    write_snapshot(path, _snapshot())
+    data = MarketData(path)
+    data.refresh()
+    monkeypatch.setattr("app.graph.voice_graph.get_market_data", lambda: data)
+    return data
+
+
+def _state(**extra: Any) -> dict[str, Any]:
+    return {"audio_bytes": b"RIFF....", "audio_filename": "q.wav", "audio_mime_type": "audio/wav", **extra}
+
+
+def test_graph_answers_from_the_index_without_the_llm(monkeypatch: pytest.MonkeyPatch, market: MarketData) -> None:
+    service = _Service()
+    monkeypatch.setattr("app.graph.voice_graph.get_openai_service", lambda: service)
+
+    result = invoke_voice_graph(_state(language="ur"))
+
+    assert result["intent"] == "market" and result["tool_answered"] is True
+    assert result["response_text"].startswith("لاہور میں ٹماٹر کا ریٹ 220 روپے")
+    assert service.contexts == []
+    assert service.spoken == [result["response_text"]]
+    assert "lookup_tools" in result["stage_ms"] and "generate_response" not in result["stage_ms"]
+
+
+@pytest.mark.parametrize(
+    ("question", "facts"),
+    [
+        ("ملتان میں بارش کے بعد گندم میں کونسی کھاد ڈالیں", "Weather: Multan"),
+        ("لاہور میں ٹماٹر کا ریٹ کم ہے تو کیا سٹور کر لوں", "Market price: Tomato in Lahore"),
+    ],
+)
+def test_graph_sends_figures_for_a_mixed_question_to_the_llm(
+    monkeypatch: pytest.MonkeyPatch, market: MarketData, question: str, facts: str
+) -> None:
+    service = _Service()
+    service.transcribe_audio = lambda **_: TranscriptionResult(  # type: ignore[method-assign]
+        text=question, model="whisper-1", language="ur"
+    )
+    monkeypatch.setattr("app.graph.voice_graph.get_openai_service", lambda: service)
+
+    result = invoke_voice_graph(_state(language="ur"))
+
+    assert "intent" not in result and not result.get("tool_answered")
+    [(_, context)] = service.contexts
+    assert context is not None and context.startswith(f"Reference data:\n{facts}")
+
+
+@pytest.mark.asyncio
+async def test_fan_out_phrases_figures_only_for_untemplated_languages(
+    monkeypatch: pytest.MonkeyPatch, market: MarketData
+) -> None:
+    service = _AsyncService()
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+
+    result = await run_voice_graph(_state(language="ur", target_languages=["ur", "pa"]))
+
+    assert result["response_text"].startswith("لاہور میں ٹماٹر")
+    [(language, context)] = service._sync.contexts
+    assert language == "pa"
+    assert context == f"Answer only from these figures:\nMarket price: Tomato in Lahore, 220 PKR/kg on {TODAY}"
@@ -0,0 +1,85 @@
+"""Tests for the configured OpenAI connection pools, warmup and pool metrics."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Iterator
+
+import pytest
+
+from app.config import Settings
+from app.metrics import OPENAI_CONNECTIONS_OPENED, OPENAI_POOL_IN_FLIGHT, OPENAI_POOL_WAIT_SECONDS
+from app.services import http_pool
+from app.services.http_pool import build_async_http_client, http2_enabled, pool_limits
+from app.services.openai_client import AsyncOpenAIService
+from fake_openai import SPEECH, FakeOpenAIServer, FakeProfile, Fault, serve
+
+
+@pytest.fixture
+def fake_api() -> Iterator[FakeOpenAIServer]:
+    yield from serve()
+
+
+def _settings(**env: object) -> Settings:
+    return Settings(OPENAI_API_KEY="test", **env)  # type: ignore[arg-type]
+
+
+def _service(server: FakeOpenAIServer, settings: Settings) -> AsyncOpenAIService:
+    return AsyncOpenAIService(
+        api_key="test",
+        stt_model="whisper-1",
+        llm_model="gpt-5-mini",
+        tts_model="gpt-4o-mini-tts",
+        tts_voice="alloy",
+        base_url=server.base_url,
+        http_client=build_async_http_client(settings),
+    )
+
+
+def test_pool_limits_follow_settings() -> None:
+    limits = pool_limits(
+        _settings(OPENAI_MAX_CONNECTIONS=8, OPENAI_MAX_KEEPALIVE_CONNECTIONS=4, OPENAI_KEEPALIVE_EXPIRY_SECONDS=12)
+    )
+
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (8, 4, 12)
+
+
+def test_http2_falls_back_without_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_pool.importlib.util, "find_spec", lambda name: None)
+
+    assert http2_enabled(_settings(OPENAI_HTTP2=True)) is False
+    assert http2_enabled(_settings(OPENAI_HTTP2=False)) is False
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_connections_that_requests_reuse(fake_api: FakeOpenAIServer) -> None:
+    fake_api.profile = FakeProfile.fixed(0.05)
+    service = _service(fake_api, _settings())
+    opened = OPENAI_CONNECTIONS_OPENED.value(client="async")
+
+    assert await service.warm_connections(3) == 3
+    assert OPENAI_CONNECTIONS_OPENED.value(client="async") == opened + 3
+
+    await asyncio.gather(*(service.synthesize_speech(text=f"جملہ {i}", language="ur") for i in range(3)))
+
+    assert OPENAI_CONNECTIONS_OPENED.value(client="async") == opened + 3
+    assert OPENAI_POOL_IN_FLIGHT.value(client="async") == 0
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_records_wait(fake_api: FakeOpenAIServer) -> None:
+    fake_api.script(SPEECH, Fault(delay=0.3))
+    service = _service(fake_api, _settings(OPENAI_MAX_CONNECTIONS=1))
+    waits = OPENAI_POOL_WAIT_SECONDS.count(client="async")
+
+    await asyncio.gather(
+        service.synthesize_speech(text="پہلا", language="ur"),
+        service.synthesize_speech(text="دوسرا", language="ur"),
+    )
+
+    assert OPENAI_POOL_WAIT_SECONDS.count(client="async") == waits + 2
+    text = OPENAI_POOL_WAIT_SECONDS.render()
+    # One request queued behind the 0.3 s one, so it lands above the 0.25 s bucket.
+    above = [line for line in text if line.startswith('voice_openai_pool_wait_seconds_bucket{client="async",le="0.25"}')]
+    total = [line for line in text if line.startswith('voice_openai_pool_wait_seconds_count{client="async"}')]
+    assert int(total[0].split()[-1]) - int(above[0].split()[-1]) >= 1
@@ -0,0 +1,145 @@
+"""Tests for the intent router and its templated replies."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.graph.voice_graph import invoke_voice_graph
+from app.main import create_app
+from app.services.intents import GREETING, REPLIES, IntentClassifier, IntentRouter, language_code
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+from app.services.session_memory import SessionMemory
+
+
+@pytest.mark.parametrize(
+    ("transcript", "intent"),
+    [
+        ("السلام علیکم جی", "greeting"),
+        ("Assalam-o-Alaikum!", "greeting"),
+        ("kya haal hai bhai", "greeting"),
+        ("Thank you so much.", "thanks"),
+        ("بہت شکریہ، اللہ حافظ", "goodbye"),
+        ("جی دوبارہ بتائیں؟", "repeat"),
+        ("لاہور میں ٹماٹر کا ریٹ کیا ہے", "market"),
+        ("aaj mausam kaisa hai", "market"),
+        ("ملتان میں بارش کے بعد گندم میں کونسی کھاد ڈالیں", None),
+        ("tamatar ka rate gir gaya hai ab kya karun", None),
+        ("السلام علیکم، میری گندم کے پتے پیلے ہو رہے ہیں", None),
+        ("gandum hi lagaen ya kapas", None),
+        ("ٹھیک ہے", None),
+        ("", None),
+    ],
+)
+def test_keyword_routes(transcript: str, intent: Optional[str]) -> None:
+    assert IntentRouter().route(transcript).intent == intent
+
+
+def test_classifier_catches_phrasings_the_tables_miss() -> None:
+    examples = [
+        ("aap ki meherbani", "thanks"),
+        ("bari meherbani aap ki", "thanks"),
+        ("meherbani sahab", "thanks"),
+        ("kapas ki fasal par sundi", "other"),
+        ("gandum ko pani kab dein", "other"),
+        ("khad kitni dalni hai", "other"),
+    ]
+    classifier = IntentClassifier.train(examples)
+
+    route = IntentRouter(classifier, threshold=0.8).route("bohat meherbani ji")
+
+    assert (route.intent, route.source) == ("thanks", "classifier")
+    assert IntentRouter(classifier, threshold=0.8).route("kapas ko pani kab dein").intent is None
+    assert IntentRouter(classifier, threshold=0.999).route("bohat meherbani ji").intent is None
+
+
+def test_classifier_decides_questions_that_only_mention_a_price() -> None:
+    examples = [
+        ("gandum ka rate gir gaya", "market"),
+        ("kapas ka rate gir gaya", "market"),
+        ("barish ke baad khad", "other"),
+        ("barish ke baad spray kab karein", "other"),
+    ]
+    router = IntentRouter(IntentClassifier.train(examples), threshold=0.8)
+
+    route = router.route("tamatar ka rate gir gaya hai")
+
+    assert (route.intent, route.source) == ("market", "classifier")
+    assert router.route("barish ke baad gandum ko khad").intent is None
+
+
+def test_language_names_map_to_template_codes() -> None:
+    assert language_code("urdu") == "ur"
+    assert language_code("English") == "en"
+    assert language_code("pa") == "pa"
+
+
+class _Service:
+    def __init__(self, transcript: str) -> None:
+        self.transcript = transcript
+        self.spoken: list[str] = []
+
+    def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        return TranscriptionResult(text=self.transcript, model="whisper-1", language="urdu")
+
+    def generate_response(self, **_: object) -> LLMResult:
+        raise AssertionError("small talk should not reach the LLM")
+
+    def synthesize_speech(self, *, text: str, **_: object) -> SpeechResult:
+        self.spoken.append(text)
+        return SpeechResult(audio_bytes=b"ID3", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def test_greeting_is_answered_from_a_template(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _Service("السلام علیکم")
+    monkeypatch.setattr("app.graph.voice_graph.get_openai_service", lambda: service)
+
+    result = invoke_voice_graph({"audio_bytes": b"RIFF....", "audio_filename": "q.wav", "language": "ur"})
+
+    assert result["intent"] == GREETING and result["tool_answered"] is True
+    assert service.spoken == [REPLIES[GREETING]["ur"]]
+    assert "route_intent" in result["stage_ms"]
+    assert "lookup_tools" not in result["stage_ms"] and "generate_response" not in result["stage_ms"]
+
+
+class _AsyncService:
+    def __init__(self) -> None:
+        self.llm_calls = 0
+
+    async def transcribe_audio(self, *, filename: str, **_: object) -> TranscriptionResult:
+        text = "دوبارہ بتائیں" if filename == "repeat.wav" else "کپاس پر سنڈی کا کیا علاج ہے؟"
+        return TranscriptionResult(text=text, model="whisper-1", language="ur")
+
+    async def generate_response(self, **_: Any) -> LLMResult:
+        self.llm_calls += 1
+        return LLMResult(text="کپاس پر سنڈی کے لیے محکمہ زراعت کی تجویز کردہ سپرے کریں۔", model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"ID3", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def test_repeat_replays_the_sessions_last_reply(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _AsyncService()
+    memory = SessionMemory(max_sessions=10, max_turns=2, turn_chars=20, summary_chars=60, ttl_seconds=60)
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+    monkeypatch.setattr("app.graph.voice_graph.get_session_memory", lambda: memory)
+    client = TestClient(create_app())
+
+    def post(name: str, session: str) -> dict[str, Any]:
+        files = {"audio": (name, b"RIFF....", "audio/wav")}
+        response = client.post("/v1/voice-interact", files=files, headers={"X-Session-ID": session})
+        assert response.status_code == 200
+        return response.json()
+
+    answer = post("question.wav", "farmer-7")
+    repeated = post("repeat.wav", "farmer-7")
+    fresh = post("repeat.wav", "farmer-8")
+
+    assert service.llm_calls == 1
+    assert repeated["response_text"] == answer["response_text"]
+    assert repeated["metadata"]["intent"] == "repeat" and repeated["metadata"]["tool_answered"] is True
+    assert fresh["response_text"] == REPLIES["repeat"]["ur"]
+    # Only the real question is kept as conversation history.
+    assert memory.context("farmer-7", max_tokens=400).count("Farmer:") == 1  # type: ignore[union-attr]
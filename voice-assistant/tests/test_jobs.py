@@ -0,0 +1,183 @@
+"""Tests for background voice jobs on /v1/voice-interact/jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import get_settings
+from app.main import create_app
+from app.services.jobs import FAILED, QUEUED, SUCCEEDED, Job, JobQueue, MemoryJobStore, SqliteJobStore, get_job_queue
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+
+
+class _BlockingService:
+    """Sync service whose transcriptions wait until ``release`` is set."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.release.set()
+        self.transcribed: list[bytes] = []
+
+    def transcribe_audio(self, *, audio_bytes: bytes, **_: object) -> TranscriptionResult:
+        self.release.wait(5)
+        self.transcribed.append(audio_bytes)
+        return TranscriptionResult(text="کپاس پر سنڈی", model="whisper-1", language="ur")
+
+    def generate_response(self, *, language: str, **_: object) -> LLMResult:
+        return LLMResult(text=f"[{language}] سپرے کریں", model="gpt-5-mini")
+
+    def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"ID3", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> _BlockingService:
+    stub = _BlockingService()
+    monkeypatch.setattr("app.graph.voice_graph.get_openai_service", lambda: stub)
+    return stub
+
+
+@pytest.fixture
+def queue(monkeypatch: pytest.MonkeyPatch, service: _BlockingService):
+    job_queue = JobQueue(MemoryJobStore(), workers=1, max_queued=1, result_ttl_seconds=60)
+    monkeypatch.setattr("app.routes.get_job_queue", lambda: job_queue)
+    yield job_queue
+    service.release.set()
+    job_queue.close()
+
+
+@pytest.fixture
+def client(queue: JobQueue) -> TestClient:
+    return TestClient(create_app())
+
+
+def _submit(client: TestClient, payload: bytes = b"RIFF....", **params: str):
+    return client.post("/v1/voice-interact/jobs", params=params, files={"audio": ("q.wav", payload, "audio/wav")})
+
+
+def _wait_for_status(queue: JobQueue, job_id: str, status: str) -> None:
+    deadline = time.monotonic() + 2
+    while queue.get(job_id).status != status:  # type: ignore[union-attr]
+        assert time.monotonic() < deadline, f"job never became {status}"
+        time.sleep(0.01)
+
+
+def test_job_is_accepted_then_long_polled_to_completion(client: TestClient, service: _BlockingService) -> None:
+    service.release.clear()
+
+    submitted = _submit(client, languages="ur,en")
+
+    assert submitted.status_code == 202
+    job_id = submitted.json()["job_id"]
+    assert submitted.headers["location"] == f"/v1/voice-interact/jobs/{job_id}"
+    assert client.get(f"/v1/voice-interact/jobs/{job_id}").json()["result"] is None
+
+    threading.Timer(0.1, service.release.set).start()
+    body = client.get(f"/v1/voice-interact/jobs/{job_id}", params={"wait": 5}).json()
+
+    assert (body["status"], body["status_code"]) == ("succeeded", 200)
+    assert body["result"]["response_text"] == "[ur] سپرے کریں"
+    assert body["result"]["variants"][0]["language"] == "en"
+    assert body["result"]["audio_base64"] == "SUQz"
+
+
+def test_full_queue_answers_503_with_retry_after(
+    client: TestClient, queue: JobQueue, service: _BlockingService
+) -> None:
+    service.release.clear()
+    running = _submit(client).json()["job_id"]
+    _wait_for_status(queue, running, "running")
+    assert _submit(client).status_code == 202
+
+    rejected = _submit(client)
+
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "5"
+    assert queue.depth == 1
+
+
+def test_cancelled_jobs_never_run_or_keep_their_result(
+    client: TestClient, queue: JobQueue, service: _BlockingService
+) -> None:
+    service.release.clear()
+    running = _submit(client, b"RIFF-running").json()["job_id"]
+    _wait_for_status(queue, running, "running")
+    waiting = _submit(client, b"RIFF-waiting").json()["job_id"]
+
+    assert client.delete(f"/v1/voice-interact/jobs/{waiting}").json()["status"] == "cancelled"
+    assert queue.depth == 0
+    assert client.delete(f"/v1/voice-interact/jobs/{running}").json()["status"] == "cancelled"
+    service.release.set()
+    time.sleep(0.1)
+
+    assert service.transcribed == [b"RIFF-running"]
+    assert client.get(f"/v1/voice-interact/jobs/{running}").json()["result"] is None
+    assert client.delete(f"/v1/voice-interact/jobs/{running}").status_code == 200
+    assert client.get("/v1/voice-interact/jobs/unknown").status_code == 404
+
+
+def test_failed_task_records_status_and_detail(queue: JobQueue) -> None:
+    class _Rejected(Exception):
+        status_code = 504
+        detail = "too slow"
+
+    def _fail() -> str:
+        raise _Rejected()
+
+    job = queue.submit(_fail, language="ur")
+    _wait_for_status(queue, job.job_id, FAILED)
+
+    finished = queue.get(job.job_id)
+    assert (finished.status_code, finished.error) == (504, "too slow")  # type: ignore[union-attr]
+
+
+def test_sqlite_store_keeps_results_and_fails_interrupted_jobs(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    store = SqliteJobStore(path)
+    store.create(Job(job_id="done", status=QUEUED, language="ur", created_at=1.0))
+    store.create(Job(job_id="lost", status=QUEUED, language="pa", created_at=2.0))
+    assert store.transition("done", (QUEUED,), status=SUCCEEDED, result="{}", finished_at=3.0) is not None
+    assert store.transition("done", (QUEUED,), status=FAILED) is None
+    store.close()
+
+    reopened = SqliteJobStore(path)
+
+    assert reopened.get("done") == Job(
+        job_id="done", status=SUCCEEDED, language="ur", created_at=1.0, finished_at=3.0, result="{}"
+    )
+    lost = reopened.get("lost")
+    assert (lost.status, lost.status_code) == (FAILED, 503)  # type: ignore[union-attr]
+    assert reopened.purge(finished_before=4.0) == 1
+    assert reopened.get("done") is None
+
+
+def test_app_shutdown_stops_background_tasks_and_closes_the_queue(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    async def _forever() -> None:
+        await asyncio.Event().wait()
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "openai_warmup_connections", 0)
+    monkeypatch.setattr(settings, "job_store_backend", "sqlite")
+    monkeypatch.setattr(settings, "job_store_path", str(tmp_path / "jobs.sqlite3"))
+    monkeypatch.setattr("app.main.warm_fallback_speech", _forever)
+    monkeypatch.setattr("app.main.refresh_market_data_forever", _forever)
+    get_job_queue.cache_clear()
+    app = create_app()
+
+    with TestClient(app):
+        job_queue = get_job_queue()
+        tasks = (app.state.speech_warmup, app.state.market_refresh)
+
+    assert all(task.cancelled() for task in tasks)
+    assert get_job_queue.cache_info().currsize == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        job_queue.get("job-1")
@@ -0,0 +1,84 @@
+"""Tests for the in-process metrics registry and the /metrics endpoint."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.metrics import MetricsRegistry
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("demo_requests_total", "Requests.", ["endpoint"])
+    in_flight = registry.gauge("demo_in_flight", "In flight.")
+    latency = registry.histogram("demo_seconds", "Latency.", ["stage"], buckets=(0.1, 1.0))
+
+    requests.inc(endpoint="/a")
+    requests.inc(2, endpoint='/b"x')
+    in_flight.set(3)
+    latency.observe(0.05, stage="stt")
+    latency.observe(0.5, stage="stt")
+    latency.observe(5.0, stage="stt")
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE demo_requests_total counter" in lines
+    assert 'demo_requests_total{endpoint="/a"} 1' in lines
+    assert 'demo_requests_total{endpoint="/b\\"x"} 2' in lines
+    assert "demo_in_flight 3" in lines
+    assert 'demo_seconds_bucket{stage="stt",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{stage="stt",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{stage="stt",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{stage="stt"} 3' in lines
+    assert 'demo_seconds_sum{stage="stt"} 5.55' in lines
+
+
+def test_registry_rejects_wrong_labels() -> None:
+    counter = MetricsRegistry().counter("demo_total", "Demo.", ["cache"])
+
+    with pytest.raises(ValueError):
+        counter.inc(stage="stt")
+
+
+class _StubService:
+    async def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        return TranscriptionResult(text="گندم کی قیمت؟", model="whisper-1", language="ur", confidence=0.9)
+
+    async def generate_response(self, **_: object) -> LLMResult:
+        return LLMResult(text="گندم 4000 روپے فی من ہے۔", model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"fake-mp3", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def test_voice_interact_reports_stages_and_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: _StubService())
+    client = TestClient(create_app())
+    payload = b"\x1a\x45\xdf\xa3" + os.urandom(20_000)
+
+    response = client.post("/v1/voice-interact", files={"audio": ("q.webm", payload, "audio/webm")})
+
+    assert response.status_code == 200
+    stages = response.json()["metadata"]["stages_ms"]
+    assert {"normalize", "transcribe", "generate_response", "synthesize"} <= set(stages)
+    assert all(ms >= 0 for ms in stages.values())
+
+    client.post("/v1/voice-interact", files={"audio": ("q.webm", b"", "audio/webm")})
+    metrics = client.get("/metrics")
+
+    assert metrics.status_code == 200
+    assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = metrics.text
+    assert 'voice_stage_duration_seconds_count{stage="transcribe"}' in text
+    assert 'voice_stage_duration_seconds_count{stage="serialize"}' in text
+    assert 'voice_requests_total{endpoint="/v1/voice-interact",status="200"}' in text
+    assert 'voice_requests_total{endpoint="/v1/voice-interact",status="422"}' in text
+    assert 'voice_errors_total{type="http_422"}' in text
+    assert 'voice_upload_bytes_total{endpoint="/v1/voice-interact"}' in text
+    assert 'voice_reply_bytes_total{mode="json"}' in text
+    assert 'voice_requests_in_flight{endpoint="/v1/voice-interact"} 0' in text
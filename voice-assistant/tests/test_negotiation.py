@@ -0,0 +1,100 @@
+"""Tests for content negotiation on /v1/voice-interact."""
+
+from __future__ import annotations
+
+import json
+from urllib.parse import unquote
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.negotiation import preferred_response_mode
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+
+
+AUDIO = bytes(range(256)) * 64
+
+
+class _AsyncService:
+    async def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        return TranscriptionResult(text="آج ٹماٹر کا ریٹ کیا ہے؟", model="whisper-1", language="ur", confidence=0.9)
+
+    async def generate_response(self, **_: object) -> LLMResult:
+        return LLMResult(text="ٹماٹر کا ریٹ مستحکم ہے۔", model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=AUDIO, model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: _AsyncService())
+    return TestClient(create_app())
+
+
+def _post(client: TestClient, accept: str | None):
+    headers = {"Accept": accept} if accept else {}
+    return client.post(
+        "/v1/voice-interact",
+        files={"audio": ("q.wav", b"RIFF....", "audio/wav")},
+        headers=headers,
+    )
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, "json"),
+        ("application/json", "json"),
+        ("*/*", "json"),
+        ("audio/*", "audio"),
+        ("audio/mpeg", "audio"),
+        ("multipart/mixed", "multipart"),
+        ("application/json;q=0.5, audio/*", "audio"),
+        ("audio/*;q=0, application/json", "json"),
+        ("text/html", "json"),
+    ],
+)
+def test_preferred_response_mode(accept: str | None, expected: str) -> None:
+    assert preferred_response_mode(accept) == expected
+
+
+def test_json_mode_is_unchanged(client: TestClient) -> None:
+    response = _post(client, None)
+
+    assert response.status_code == 200
+    assert response.json()["audio_base64"]
+
+
+def test_audio_mode_returns_raw_body_and_header_metadata(client: TestClient) -> None:
+    response = _post(client, "audio/*")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/mpeg"
+    assert response.content == AUDIO
+    assert unquote(response.headers["X-Transcript"]) == "آج ٹماٹر کا ریٹ کیا ہے؟"
+    assert unquote(response.headers["X-Response-Text"]) == "ٹماٹر کا ریٹ مستحکم ہے۔"
+    assert json.loads(response.headers["X-Voice-Metadata"])["tts_format"] == "mp3"
+
+
+def test_multipart_mode_carries_json_and_binary_parts(client: TestClient) -> None:
+    response = _post(client, "multipart/mixed")
+
+    assert response.status_code == 200
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/mixed; boundary=")
+    boundary = content_type.split("boundary=")[1].encode("ascii")
+    assert int(response.headers["content-length"]) == len(response.content)
+
+    parts = response.content.split(b"--" + boundary)
+    json_headers, json_body = parts[1].split(b"\r\n\r\n", 1)
+    audio_headers, audio_body = parts[2].split(b"\r\n\r\n", 1)
+
+    assert b"application/json" in json_headers
+    payload = json.loads(json_body.rstrip(b"\r\n"))
+    assert "audio_base64" not in payload
+    assert payload["transcript"].startswith("آج")
+    assert b"audio/mpeg" in audio_headers
+    assert audio_body[:-2] == AUDIO
+    assert parts[3] == b"--\r\n"
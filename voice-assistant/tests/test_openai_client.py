@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from app.services.openai_client import _extract_text
+from types import SimpleNamespace
+
+from app.services.openai_client import _OUTPUT_SOURCES, _extract_text
 
 
 class _ResponseWithOutputText:
@@ -64,3 +66,29 @@ def test_extract_text_uses_model_dump_when_needed() -> None:
 
     assert _extract_text(response) == "بارش کا امکان کم ہے۔"
 
+
+def test_extract_text_reads_sdk_blocks_past_reasoning_items() -> None:
+    message = SimpleNamespace(
+        type="message",
+        content=[
+            SimpleNamespace(type="output_text", text="گندم کی بوائی "),
+            SimpleNamespace(type="refusal", refusal="ignored"),
+            SimpleNamespace(type="output_text", text="نومبر میں کریں۔"),
+        ],
+    )
+    response = SimpleNamespace(output=[SimpleNamespace(type="reasoning", summary=[]), message])
+
+    assert _extract_text(response) == "گندم کی بوائی نومبر میں کریں۔"
+
+
+def test_extract_text_remembers_output_source_per_class() -> None:
+    _extract_text(_ResponseWithModelDump("پہلا"))
+
+    assert _OUTPUT_SOURCES[_ResponseWithModelDump] == "model_dump"
+    assert _extract_text(_ResponseWithModelDump("دوسرا")) == "دوسرا"
+
+
+def test_extract_text_walks_unknown_shapes() -> None:
+    response = SimpleNamespace(output=[{"kind": "note", "body": {"value": "کھاد ڈالیں"}}])
+
+    assert _extract_text(response) == "کھاد ڈالیں"
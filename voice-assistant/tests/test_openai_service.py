@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from app.services.openai_client import LLMResult, OpenAIService
+import pytest
+
+from app.services.openai_client import AsyncOpenAIService, LLMResult, OpenAIService
 
 
 class _EmptyResponsesOutput:
@@ -47,14 +49,30 @@ class _StubChatCompletions:
         return self._response
 
 
+class _AsyncStubCreate:
+    def __init__(self, response: object) -> None:
+        self._response = response
+        self.last_kwargs: dict[str, object] | None = None
+
+    async def create(self, **kwargs: object) -> object:
+        self.last_kwargs = kwargs
+        return self._response
+
+
 class _StubClient:
     def __init__(self, responses_payload: object, chat_payload: object) -> None:
         self.responses = _StubResponses(responses_payload)
         self.chat = type("Chat", (), {"completions": _StubChatCompletions(chat_payload)})()
 
 
-def _build_service(stub_client: object) -> OpenAIService:
-    service = OpenAIService.__new__(OpenAIService)
+class _AsyncStubClient:
+    def __init__(self, responses_payload: object, chat_payload: object) -> None:
+        self.responses = _AsyncStubCreate(responses_payload)
+        self.chat = type("Chat", (), {"completions": _AsyncStubCreate(chat_payload)})()
+
+
+def _build_service(stub_client: object, service_cls: type = OpenAIService) -> OpenAIService:
+    service = service_cls.__new__(service_cls)
     service._client = stub_client  # type: ignore[attr-defined]
     service._stt_model = "whisper-1"  # type: ignore[attr-defined]
     service._llm_model = "gpt-5-mini"  # type: ignore[attr-defined]
@@ -76,3 +94,14 @@ def test_generate_response_falls_back_to_chat_completion() -> None:
     assert stub_client.chat.completions.last_kwargs is not None
     assert "max_tokens" not in stub_client.chat.completions.last_kwargs
 
+
+@pytest.mark.asyncio
+async def test_async_generate_response_falls_back_to_chat_completion() -> None:
+    stub_client = _AsyncStubClient(_EmptyResponsesOutput(), _ChatResponse("پانی کم دیں۔"))
+    service = _build_service(stub_client, AsyncOpenAIService)
+
+    result: LLMResult = await service.generate_response(transcript="پتے پیلے ہو رہے ہیں", language="ur")
+
+    assert result.text == "پانی کم دیں۔"
+    assert stub_client.responses.last_kwargs is not None
+    assert stub_client.chat.completions.last_kwargs is not None
@@ -0,0 +1,164 @@
+"""Tests for the empty Responses reply strategies."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+
+import pytest
+
+from app.metrics import LLM_REPLY_PATHS
+from app.services.openai_client import AsyncOpenAIService
+from app.services.reply_fallback import ReplyFallback
+
+
+def _paths(model: str) -> dict[str, float]:
+    paths = ("responses", "chat_fallback", "chat_raced", "chat_remembered", "empty")
+    return {path: LLM_REPLY_PATHS.value(model=model, path=path) for path in paths}
+
+
+def _delta(before: dict[str, float], after: dict[str, float]) -> dict[str, float]:
+    return {path: after[path] - before[path] for path in after if after[path] != before[path]}
+
+
+def test_unknown_strategy_is_rejected() -> None:
+    with pytest.raises(ValueError, match="LLM_EMPTY_REPLY_FALLBACK"):
+        ReplyFallback("parallel")
+
+
+def test_sequential_calls_chat_after_empty_reply() -> None:
+    calls: list[str] = []
+    fallback = ReplyFallback("sequential")
+    before = _paths("seq-model")
+
+    text = fallback.resolve("seq-model", lambda: calls.append("responses") or "", lambda: calls.append("chat") or "ok")
+
+    assert (text, calls) == ("ok", ["responses", "chat"])
+    assert _delta(before, _paths("seq-model")) == {"chat_fallback": 1}
+
+
+def test_none_returns_empty_without_chat() -> None:
+    fallback = ReplyFallback("none")
+
+    assert fallback.resolve("none-model", lambda: "", lambda: pytest.fail("chat called")) == ""
+
+
+def test_remember_sends_model_straight_to_chat_until_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    fallback = ReplyFallback("remember", memory_seconds=60)
+    before = _paths("flaky-model")
+
+    def responses() -> str:
+        calls.append("responses")
+        return ""
+
+    def chat() -> str:
+        calls.append("chat")
+        return "جواب"
+
+    fallback.resolve("flaky-model", responses, chat)
+    fallback.resolve("flaky-model", responses, chat)
+    assert calls == ["responses", "chat", "chat"]
+    assert fallback.prefers_chat("other-model") is False
+
+    later = time.monotonic() + 61
+    monkeypatch.setattr("app.services.reply_fallback.time.monotonic", lambda: later)
+    fallback.resolve("flaky-model", responses, chat)
+
+    assert calls[-2:] == ["responses", "chat"]
+    assert _delta(before, _paths("flaky-model")) == {"chat_fallback": 2, "chat_remembered": 1}
+
+
+def test_race_takes_first_non_empty_reply() -> None:
+    fallback = ReplyFallback("race")
+
+    def slow_responses() -> str:
+        time.sleep(0.3)
+        return "slow"
+
+    start = time.perf_counter()
+    text = fallback.resolve("race-model", slow_responses, lambda: "fast")
+
+    assert text == "fast"
+    assert time.perf_counter() - start < 0.25
+    # An empty winner does not count; the race waits for the other reply.
+    assert fallback.resolve("race-model", lambda: "", lambda: (time.sleep(0.05), "late")[1]) == "late"
+
+
+@pytest.mark.asyncio
+async def test_async_race_cancels_the_losing_call() -> None:
+    fallback = ReplyFallback("race")
+    cancelled = asyncio.Event()
+    before = _paths("arace-model")
+
+    async def slow_responses() -> str:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "slow"
+
+    async def chat() -> str:
+        await asyncio.sleep(0.01)
+        return "fast"
+
+    assert await fallback.aresolve("arace-model", slow_responses, chat) == "fast"
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert _delta(before, _paths("arace-model")) == {"chat_raced": 1}
+
+
+@pytest.mark.asyncio
+async def test_async_race_raises_when_both_calls_fail() -> None:
+    fallback = ReplyFallback("race")
+
+    async def fail(message: str) -> str:
+        raise RuntimeError(message)
+
+    with pytest.raises(RuntimeError, match="responses"):
+        await fallback.aresolve("fail-model", lambda: fail("responses"), lambda: fail("chat"))
+
+
+class _EmptyStream:
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._events()
+
+    async def _events(self) -> AsyncIterator[Any]:
+        yield SimpleNamespace(type="response.created")
+        yield SimpleNamespace(type="response.completed")
+
+
+class _Create:
+    def __init__(self, result: Any) -> None:
+        self.result = result
+        self.calls = 0
+
+    async def create(self, **_: Any) -> Any:
+        self.calls += 1
+        return self.result
+
+
+def _stream_service(fallback: ReplyFallback) -> AsyncOpenAIService:
+    service = AsyncOpenAIService.__new__(AsyncOpenAIService)
+    chat = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="پانی دیں۔"))])
+    service._client = SimpleNamespace(  # type: ignore[attr-defined]
+        responses=_Create(_EmptyStream()), chat=SimpleNamespace(completions=_Create(chat))
+    )
+    service._llm_model = "stream-model"  # type: ignore[attr-defined]
+    service._reply_fallback = fallback  # type: ignore[attr-defined]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_stream_remembers_model_after_empty_stream() -> None:
+    service = _stream_service(ReplyFallback("remember"))
+
+    async def reply() -> list[str]:
+        return [delta async for delta in service.stream_response(transcript="پتے پیلے ہیں", language="ur")]
+
+    assert await reply() == ["پانی دیں۔"]
+    assert await reply() == ["پانی دیں۔"]
+    assert service.client.responses.calls == 1
+    assert service.client.chat.completions.calls == 2
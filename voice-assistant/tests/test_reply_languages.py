@@ -0,0 +1,70 @@
+"""Tests for multi-language replies on /v1/voice-interact."""
+
+from __future__ import annotations
+
+import base64
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+
+
+class _AsyncService:
+    async def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        return TranscriptionResult(text="گندم کب بوئیں؟", model="whisper-1", language="ur", confidence=0.9)
+
+    async def generate_response(self, *, language: str, **_: object) -> LLMResult:
+        return LLMResult(text=f"[{language}] نومبر", model="gpt-5-mini")
+
+    async def synthesize_speech(self, *, text: str, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=text.encode(), model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: _AsyncService())
+    return TestClient(create_app())
+
+
+def _post(client: TestClient, languages: str, accept: str = "application/json"):
+    return client.post(
+        "/v1/voice-interact",
+        params={"languages": languages},
+        files={"audio": ("q.wav", b"RIFF....", "audio/wav")},
+        headers={"Accept": accept},
+    )
+
+
+def test_json_reply_carries_every_requested_language(client: TestClient) -> None:
+    response = _post(client, "pa, en,pa,ur")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["language"], body["response_text"]) == ("pa", "[pa] نومبر")
+    assert [(variant["language"], variant["response_text"]) for variant in body["variants"]] == [
+        ("en", "[en] نومبر"),
+        ("ur", "[ur] نومبر"),
+    ]
+    assert base64.b64decode(body["variants"][0]["audio_base64"]) == "[en] نومبر".encode()
+
+
+def test_multipart_reply_adds_a_part_per_extra_language(client: TestClient) -> None:
+    response = _post(client, "ur,en", accept="multipart/mixed")
+
+    assert response.status_code == 200
+    assert b"Content-Language: en\r\n" in response.content
+    assert "[en] نومبر".encode() in response.content
+    assert response.content.count(b"Content-Type: audio/mpeg") == 2
+
+
+def test_single_language_reply_has_no_variants(client: TestClient) -> None:
+    body = _post(client, "en").json()
+
+    assert (body["language"], body["variants"]) == ("en", None)
+
+
+@pytest.mark.parametrize("languages", ["ur,pa,en,sd", "ur,<script>"])
+def test_bad_language_lists_are_rejected(client: TestClient, languages: str) -> None:
+    assert _post(client, languages).status_code == 422
@@ -0,0 +1,149 @@
+"""Retry, deadline and hedging behaviour of the OpenAI services against a local fake API."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from openai import APITimeoutError, BadRequestError
+
+from app.main import create_app
+from app.metrics import UPSTREAM_EVENTS
+from app.services.openai_client import AsyncOpenAIService, OpenAIService
+from app.services.resilience import DeadlineExceeded, Resilience, ResiliencePolicy, request_budget
+from fake_openai import RESPONSES, SPEECH, TRANSCRIPTIONS, FakeOpenAIServer, Fault, serve
+
+
+@pytest.fixture
+def fake_api() -> Iterator[FakeOpenAIServer]:
+    yield from serve()
+
+
+def _policy(**overrides: object) -> ResiliencePolicy:
+    defaults: dict[str, object] = {
+        "operation_timeouts": {"transcribe": 0.5, "generate_response": 0.5, "synthesize": 0.5},
+        "backoff_base_seconds": 0.01,
+        "backoff_max_seconds": 0.02,
+    }
+    return ResiliencePolicy(**{**defaults, **overrides})  # type: ignore[arg-type]
+
+
+def _service(server: FakeOpenAIServer, service_cls: type = OpenAIService, **policy: object):
+    return service_cls(
+        api_key="test",
+        stt_model="whisper-1",
+        llm_model="gpt-5-mini",
+        tts_model="gpt-4o-mini-tts",
+        tts_voice="alloy",
+        resilience=Resilience(_policy(**policy)),
+        base_url=server.base_url,
+    )
+
+
+def test_retries_server_errors_then_succeeds(fake_api: FakeOpenAIServer) -> None:
+    fake_api.script(TRANSCRIPTIONS, Fault(status=503), Fault(status=429))
+    before = UPSTREAM_EVENTS.value(operation="transcribe", event="retry")
+
+    result = _service(fake_api).transcribe_audio(audio_bytes=b"RIFF" + b"\x00" * 64, filename="q.wav")
+
+    assert result.text == "گندم کا ریٹ کیا ہے؟"
+    assert fake_api.calls[TRANSCRIPTIONS] == 3
+    assert UPSTREAM_EVENTS.value(operation="transcribe", event="retry") == before + 2
+
+
+def test_slow_attempt_times_out_and_is_retried(fake_api: FakeOpenAIServer) -> None:
+    fake_api.script(RESPONSES, Fault(delay=2.0))
+
+    start = time.perf_counter()
+    result = _service(fake_api).generate_response(transcript="گندم کا ریٹ؟", language="ur")
+
+    assert result.text == fake_api.reply_text
+    assert fake_api.calls[RESPONSES] == 2
+    assert time.perf_counter() - start < 1.5
+
+
+def test_client_errors_are_not_retried(fake_api: FakeOpenAIServer) -> None:
+    fake_api.script(SPEECH, Fault(status=400))
+
+    with pytest.raises(BadRequestError):
+        _service(fake_api).synthesize_speech(text="سلام", language="ur")
+
+    assert fake_api.calls[SPEECH] == 1
+
+
+def test_request_budget_bounds_all_attempts(fake_api: FakeOpenAIServer) -> None:
+    fake_api.script(TRANSCRIPTIONS, *[Fault(delay=2.0)] * 5)
+    service = _service(fake_api, max_retries=5, operation_timeouts={"transcribe": 5.0})
+
+    start = time.perf_counter()
+    with pytest.raises((APITimeoutError, DeadlineExceeded)):
+        with request_budget(0.4):
+            service.transcribe_audio(audio_bytes=b"RIFF" + b"\x00" * 64, filename="q.wav")
+
+    assert time.perf_counter() - start < 1.0
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_beats_slow_primary(fake_api: FakeOpenAIServer) -> None:
+    service = _service(
+        fake_api, AsyncOpenAIService, hedge_operations=frozenset({"synthesize"}), hedge_min_samples=5, max_retries=0
+    )
+    for _ in range(5):
+        await service.synthesize_speech(text="سلام", language="ur")
+    fake_api.script(SPEECH, Fault(delay=2.0))
+    before = UPSTREAM_EVENTS.value(operation="synthesize", event="hedge_won")
+
+    start = time.perf_counter()
+    result = await service.synthesize_speech(text="سلام", language="ur")
+
+    assert result.audio_bytes.startswith(b"ID3")
+    # Without hedging the slow primary would hit the 0.5 s timeout and fail.
+    assert time.perf_counter() - start < 0.5
+    assert fake_api.calls[SPEECH] == 7
+    assert UPSTREAM_EVENTS.value(operation="synthesize", event="hedge_won") == before + 1
+
+
+def test_sync_hedge_beats_slow_primary(fake_api: FakeOpenAIServer) -> None:
+    service = _service(fake_api, hedge_operations=frozenset({"transcribe"}), hedge_min_samples=5, max_retries=0)
+    for _ in range(5):
+        service.transcribe_audio(audio_bytes=b"RIFF" + b"\x00" * 64, filename="q.wav")
+    fake_api.script(TRANSCRIPTIONS, Fault(delay=2.0))
+
+    start = time.perf_counter()
+    result = service.transcribe_audio(audio_bytes=b"RIFF" + b"\x00" * 64, filename="q.wav")
+
+    assert result.text
+    assert time.perf_counter() - start < 0.5
+    assert fake_api.calls[TRANSCRIPTIONS] == 7
+
+
+class _TimingOutService:
+    async def transcribe_audio(self, **_: object) -> object:
+        raise DeadlineExceeded("Request budget exhausted before transcribe")
+
+
+def test_voice_interact_maps_deadline_to_504(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: _TimingOutService())
+
+    response = TestClient(create_app()).post(
+        "/v1/voice-interact", files={"audio": ("q.webm", b"\x1a\x45\xdf\xa3" + b"\x00" * 2048, "audio/webm")}
+    )
+
+    assert response.status_code == 504
+
+
+def test_voice_interact_stream_reports_deadline_as_timeout_event(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: _TimingOutService())
+    monkeypatch.setattr("app.graph.voice_stream.get_async_openai_service", lambda: _TimingOutService())
+
+    response = TestClient(create_app()).post(
+        "/v1/voice-interact/stream", files={"audio": ("q.webm", b"\x1a\x45\xdf\xa3" + b"\x00" * 2048, "audio/webm")}
+    )
+
+    assert response.status_code == 200
+    event, data = response.text.strip().split("\n")
+    assert event == "event: error"
+    assert json.loads(data.removeprefix("data: "))["status_code"] == 504
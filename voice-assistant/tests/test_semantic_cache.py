@@ -0,0 +1,164 @@
+"""Tests for the near-duplicate reply cache and its vector index."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app.graph.voice_graph import invoke_voice_graph, run_voice_graph
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+from app.services.semantic_cache import HashingEmbedder, SemanticCache, VectorIndex
+
+EMBEDDER = HashingEmbedder(256)
+
+
+def _cache(**overrides: float) -> SemanticCache:
+    options = {"threshold": 0.85, "max_entries": 100, "ttl_seconds": 60}
+    options.update(overrides)
+    return SemanticCache(EMBEDDER, **options)  # type: ignore[arg-type]
+
+
+def _store(cache: SemanticCache, transcript: str, text: str, language: str = "ur") -> None:
+    cache.store(EMBEDDER.embed(transcript), transcript=transcript, language=language, model="gpt-5-mini", text=text)
+
+
+def _lookup(cache: SemanticCache, transcript: str, language: str = "ur"):
+    return cache.lookup(EMBEDDER.embed(transcript), transcript=transcript, language=language, model="gpt-5-mini")
+
+
+def test_rephrased_questions_reuse_the_reply() -> None:
+    cache = _cache()
+    _store(cache, "کپاس پر سفید مکھی کا کیا علاج ہے", "سپرے کریں۔")
+
+    hit = _lookup(cache, "جی کپاس پہ سفید مکھی کا کیا علاج ہے؟")
+
+    assert hit is not None and hit.text == "سپرے کریں۔" and hit.similarity >= 0.85
+    assert _lookup(cache, "گندم کو کتنا پانی دینا چاہیے") is None
+    assert _lookup(cache, "کپاس پر سفید مکھی کا کیا علاج ہے", language="en") is None
+
+
+def test_numbers_crops_and_cities_must_match() -> None:
+    cache = _cache(threshold=0.5)
+    _store(cache, "لاہور میں ٹماٹر کی فصل کو کیا بیماری ہے", "lahore tomato")
+    _store(cache, "ایک ایکڑ میں 50 کلو کھاد ڈالیں؟", "fifty")
+
+    assert _lookup(cache, "لاہور میں ٹماٹر کی فصل کو کون سی بیماری ہے").text == "lahore tomato"  # type: ignore[union-attr]
+    assert _lookup(cache, "ملتان میں ٹماٹر کی فصل کو کیا بیماری ہے") is None
+    assert _lookup(cache, "لاہور میں آلو کی فصل کو کیا بیماری ہے") is None
+    assert _lookup(cache, "ایک ایکڑ میں 80 کلو کھاد ڈالیں؟") is None
+
+
+def test_entries_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = _cache()
+    _store(cache, "کپاس پر سفید مکھی کا کیا علاج ہے", "سپرے کریں۔")
+    later = time.monotonic() + 61
+    monkeypatch.setattr("app.services.semantic_cache.time.monotonic", lambda: later)
+
+    assert _lookup(cache, "کپاس پر سفید مکھی کا کیا علاج ہے") is None
+
+
+def _unit_rows(rng: np.random.Generator, count: int, dimensions: int = 64) -> np.ndarray:
+    rows = rng.standard_normal((count, dimensions)).astype(np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def test_approximate_index_finds_near_neighbours() -> None:
+    rng = np.random.default_rng(1)
+    stored = _unit_rows(rng, 3000)
+    index = VectorIndex(64, max_entries=5000, approximate_threshold=2000, clusters=32, probes=6)
+    for row in stored:
+        index.add(row)
+    assert index.approximate
+
+    queries = rng.choice(len(stored), 200, replace=False)
+    noisy = stored[queries] + 0.1 * _unit_rows(rng, 200)
+    found = [index.search(row / np.linalg.norm(row)) for row in noisy]
+
+    recall = np.mean([hit is not None and hit[0] == query for hit, query in zip(found, queries)])
+    assert recall >= 0.9
+
+
+def test_full_index_overwrites_the_oldest_slot() -> None:
+    rows = _unit_rows(np.random.default_rng(2), 5)
+    index = VectorIndex(64, max_entries=4)
+    slots = [index.add(row) for row in rows]
+
+    assert slots == [0, 1, 2, 3, 0] and len(index) == 4
+    assert index.search(rows[4]) == (0, pytest.approx(1.0))
+
+
+class _Service:
+    def __init__(self) -> None:
+        self.transcripts = ["کپاس پر سفید مکھی کا کیا علاج ہے", "جی کپاس پہ سفید مکھی کا کیا علاج ہے؟"]
+        self.llm_calls = 0
+
+    def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        return TranscriptionResult(text=self.transcripts.pop(0), model="whisper-1", language="ur")
+
+    def generate_response(self, **_: object) -> LLMResult:
+        self.llm_calls += 1
+        return LLMResult(text="سفید مکھی کے لیے سپرے کریں۔", model="gpt-5-mini")
+
+    def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"ID3", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def test_graph_reuses_a_reply_for_a_rephrased_question(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _Service()
+    cache = _cache()
+    monkeypatch.setattr("app.graph.voice_graph.get_openai_service", lambda: service)
+    monkeypatch.setattr("app.graph.voice_graph.get_semantic_cache", lambda: cache)
+    monkeypatch.setattr("app.graph.voice_graph.get_response_cache", lambda: None)
+    state = {"audio_bytes": b"RIFF....", "audio_filename": "q.wav", "language": "ur"}
+
+    first = invoke_voice_graph(dict(state))
+    second = invoke_voice_graph(dict(state))
+
+    assert service.llm_calls == 1
+    assert first["reply_cached"] is False and second["reply_cached"] is True
+    assert second["response_text"] == first["response_text"]
+
+
+class _AsyncService(_Service):
+    async def transcribe_audio(self, **kwargs: object) -> TranscriptionResult:  # type: ignore[override]
+        return super().transcribe_audio(**kwargs)
+
+    async def generate_response(self, **kwargs: object) -> LLMResult:  # type: ignore[override]
+        return super().generate_response(**kwargs)
+
+    async def synthesize_speech(self, **kwargs: object) -> SpeechResult:  # type: ignore[override]
+        return super().synthesize_speech(**kwargs)
+
+
+async def test_async_graph_searches_and_trains_the_index_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    threads: dict[str, int] = {}
+    train, search = VectorIndex.train, VectorIndex.search
+
+    def _train(index: VectorIndex) -> None:
+        threads["train"] = threading.get_ident()
+        train(index)
+
+    def _search(index: VectorIndex, vector: np.ndarray):
+        threads["search"] = threading.get_ident()
+        return search(index, vector)
+
+    monkeypatch.setattr(VectorIndex, "train", _train)
+    monkeypatch.setattr(VectorIndex, "search", _search)
+    service = _AsyncService()
+    cache = _cache(approximate_threshold=1)
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+    monkeypatch.setattr("app.graph.voice_graph.get_semantic_cache", lambda: cache)
+    monkeypatch.setattr("app.graph.voice_graph.get_response_cache", lambda: None)
+    state = {"audio_bytes": b"RIFF....", "audio_filename": "q.wav", "language": "ur"}
+
+    await run_voice_graph(dict(state))
+    second = await run_voice_graph(dict(state))
+
+    assert second["reply_cached"] is True and service.llm_calls == 1
+    assert set(threads) == {"train", "search"}
+    assert threading.get_ident() not in threads.values()
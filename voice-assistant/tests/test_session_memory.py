@@ -0,0 +1,118 @@
+"""Tests for per-session conversation memory."""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services.openai_client import LLMResult, SpeechResult, TranscriptionResult
+from app.services.session_memory import SessionMemory, estimate_tokens
+
+
+def _memory(**overrides: float) -> SessionMemory:
+    options = {"max_sessions": 10, "max_turns": 2, "turn_chars": 100, "summary_chars": 60, "ttl_seconds": 60}
+    options.update(overrides)
+    return SessionMemory(**options)  # type: ignore[arg-type]
+
+
+def test_old_turns_fold_into_a_summary() -> None:
+    memory = _memory()
+    for crop in ("ٹماٹر", "گندم", "کپاس"):
+        memory.record("farmer-1", f"{crop} کا ریٹ؟", f"{crop} کا ریٹ 200 روپے ہے۔")
+
+    context = memory.context("farmer-1", max_tokens=400)
+
+    assert context == (
+        "Conversation so far:\n"
+        "Earlier topics: ٹماٹر کا ریٹ؟\n"
+        "Farmer: گندم کا ریٹ؟\n"
+        "Assistant: گندم کا ریٹ 200 روپے ہے۔\n"
+        "Farmer: کپاس کا ریٹ؟\n"
+        "Assistant: کپاس کا ریٹ 200 روپے ہے۔"
+    )
+    assert memory.context("someone-else", max_tokens=400) is None
+
+
+def test_context_keeps_newest_turns_within_the_token_budget() -> None:
+    memory = _memory(max_turns=10, turn_chars=1000)
+    for turn in range(10):
+        memory.record("farmer-1", f"question {turn} " + "x" * 200, f"answer {turn} " + "y" * 200)
+
+    context = memory.context("farmer-1", max_tokens=200)
+
+    assert context is not None
+    assert "question 9" in context and "question 7" not in context
+    assert estimate_tokens(context) <= 200 + 10
+    assert memory.context("farmer-1", max_tokens=10) is None
+
+
+def test_summary_and_turns_are_clipped() -> None:
+    memory = _memory(max_turns=1, turn_chars=20, summary_chars=30)
+    for turn in range(6):
+        memory.record("farmer-1", f"question number {turn} about pests", "a" * 50)
+
+    context = memory.context("farmer-1", max_tokens=400) or ""
+
+    summary = context.splitlines()[1].removeprefix("Earlier topics: ")
+    assert len(summary) <= 30 and summary.startswith("…") and summary.endswith("number 4 a…")
+    assert context.splitlines()[-1] == "Assistant: " + "a" * 19 + "…"
+
+
+def test_least_recently_used_sessions_are_evicted(monkeypatch: pytest.MonkeyPatch) -> None:
+    memory = _memory(max_sessions=2)
+    memory.record("a", "q", "r")
+    memory.record("b", "q", "r")
+    memory.context("a", max_tokens=100)
+    memory.record("c", "q", "r")
+
+    assert len(memory) == 2
+    assert memory.context("b", max_tokens=100) is None
+    assert memory.context("a", max_tokens=100) is not None
+
+    later = time.monotonic() + 61
+    monkeypatch.setattr("app.services.session_memory.time.monotonic", lambda: later)
+    assert memory.context("a", max_tokens=100) is None
+
+
+class _AsyncService:
+    def __init__(self) -> None:
+        self.contexts: list[Optional[str]] = []
+
+    async def transcribe_audio(self, *, filename: str, **_: object) -> TranscriptionResult:
+        text = "اور گندم کا؟" if filename == "second.wav" else "ٹماٹر کا ریٹ کیا ہے؟"
+        return TranscriptionResult(text=text, model="whisper-1", language="ur")
+
+    async def generate_response(self, *, context: Optional[str] = None, **_: object) -> LLMResult:
+        self.contexts.append(context)
+        return LLMResult(text="ٹماٹر 220 روپے فی کلو ہے۔", model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"ID3", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def test_follow_up_requests_get_their_session_history(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _AsyncService()
+    memory = _memory()
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+    monkeypatch.setattr("app.graph.voice_graph.get_session_memory", lambda: memory)
+    monkeypatch.setattr("app.graph.voice_graph.get_response_cache", lambda: None)
+    client = TestClient(create_app())
+
+    def post(name: str, session: Optional[str]):
+        headers = {"X-Session-ID": session} if session else {}
+        return client.post("/v1/voice-interact", files={"audio": (name, b"RIFF....", "audio/wav")}, headers=headers)
+
+    assert post("first.wav", "farmer-42").status_code == 200
+    assert post("second.wav", "farmer-42").status_code == 200
+    assert post("second.wav", None).status_code == 200
+
+    assert service.contexts[0] is None
+    assert service.contexts[1] == (
+        "Conversation so far:\nFarmer: ٹماٹر کا ریٹ کیا ہے؟\nAssistant: ٹماٹر 220 روپے فی کلو ہے۔"
+    )
+    assert service.contexts[2] is None
+    assert post("first.wav", "bad id!").status_code == 422
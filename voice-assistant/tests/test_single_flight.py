@@ -0,0 +1,141 @@
+"""Single-flight sharing of identical in-flight reply and speech calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+
+from app.metrics import UPSTREAM_EVENTS
+from app.services.openai_client import AsyncOpenAIService, OpenAIService
+from app.services.single_flight import SingleFlight
+from fake_openai import RESPONSES, SPEECH, FakeOpenAIServer, FakeProfile, serve
+
+
+@pytest.fixture
+def fake_api() -> Iterator[FakeOpenAIServer]:
+    yield from serve(FakeProfile.fixed(0.3))
+
+
+def _service(server: FakeOpenAIServer, service_cls: type = OpenAIService, **options: object):
+    return service_cls(
+        api_key="test",
+        stt_model="whisper-1",
+        llm_model="gpt-5-mini",
+        tts_model="gpt-4o-mini-tts",
+        tts_voice="alloy",
+        base_url=server.base_url,
+        single_flight=SingleFlight(),
+        **options,
+    )
+
+
+def test_identical_sync_replies_share_one_call(fake_api: FakeOpenAIServer) -> None:
+    service = _service(fake_api)
+    before = UPSTREAM_EVENTS.value(operation="generate_response", event="coalesced")
+    transcripts = ["گندم کا ریٹ کیا ہے؟"] * 7 + ["گندم کا ریٹ کیا ہے"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda text: service.generate_response(transcript=text, language="ur"), transcripts))
+
+    assert fake_api.calls[RESPONSES] == 1
+    assert {result.text for result in results} == {fake_api.reply_text}
+    assert UPSTREAM_EVENTS.value(operation="generate_response", event="coalesced") == before + 7
+
+
+def test_different_requests_are_not_shared(fake_api: FakeOpenAIServer) -> None:
+    service = _service(fake_api)
+    calls = [
+        {"transcript": "گندم کا ریٹ کیا ہے؟", "language": "ur"},
+        {"transcript": "گندم کا ریٹ کیا ہے؟", "language": "en"},
+        {"transcript": "گندم کا ریٹ کیا ہے؟", "language": "ur", "context": "Earlier: کپاس"},
+        {"transcript": "کپاس کا ریٹ کیا ہے؟", "language": "ur"},
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda kwargs: service.generate_response(**kwargs), calls))
+
+    assert fake_api.calls[RESPONSES] == 4
+
+
+async def test_identical_async_speech_shares_one_call(fake_api: FakeOpenAIServer) -> None:
+    service = _service(fake_api, AsyncOpenAIService)
+
+    results = await asyncio.gather(
+        *(service.synthesize_speech(text="سلام", language="ur") for _ in range(6)),
+        service.synthesize_speech(text="سلام", language="ur", voice="nova"),
+    )
+
+    assert fake_api.calls[SPEECH] == 2
+    assert all(result.audio_bytes.startswith(b"ID3") for result in results)
+
+
+async def test_cancelled_waiter_does_not_cancel_the_shared_call() -> None:
+    flight = SingleFlight()
+    started = 0
+
+    async def _slow() -> str:
+        nonlocal started
+        started += 1
+        await asyncio.sleep(0.05)
+        return "reply"
+
+    first = asyncio.ensure_future(flight.acall("generate_response", "key", _slow))
+    second = asyncio.ensure_future(flight.acall("generate_response", "key", _slow))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "reply"
+    assert started == 1 and flight.in_flight() == 0
+
+
+async def test_last_waiter_leaving_cancels_the_call() -> None:
+    flight = SingleFlight()
+    finished = False
+
+    async def _slow() -> str:
+        nonlocal finished
+        await asyncio.sleep(5)
+        finished = True
+        return "reply"
+
+    waiter = asyncio.ensure_future(flight.acall("synthesize", "key", _slow))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0.01)
+
+    assert not finished and flight.in_flight() == 0
+
+
+def test_errors_reach_every_waiter_and_are_not_remembered() -> None:
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = 0
+    before = UPSTREAM_EVENTS.value(operation="synthesize", event="coalesced")
+
+    def _failing() -> str:
+        nonlocal calls
+        calls += 1
+        release.wait(5)
+        raise RuntimeError("upstream down")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(flight.call, "synthesize", "key", _failing) for _ in range(3)]
+        while UPSTREAM_EVENTS.value(operation="synthesize", event="coalesced") < before + 2:
+            time.sleep(0.001)
+        release.set()
+        errors = [future.exception() for future in futures]
+
+    assert calls == 1 and all(isinstance(error, RuntimeError) for error in errors)
+    assert flight.in_flight() == 0
+    assert flight.call("synthesize", "key", lambda: "recovered") == "recovered"
+
+
+def test_operations_outside_the_setting_are_not_shared() -> None:
+    flight = SingleFlight(())
+    assert flight.call("generate_response", "key", lambda: "direct") == "direct"
+    assert flight.in_flight() == 0
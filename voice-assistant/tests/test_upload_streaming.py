@@ -0,0 +1,98 @@
+"""Tests for streaming uploads into STT without intermediate byte copies."""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import tempfile
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from openai import AsyncOpenAI
+
+from app.audio.upload import file_view
+from app.main import create_app
+from app.services.openai_client import AsyncOpenAIService, LLMResult, SpeechResult, TranscriptionResult
+
+
+@pytest.mark.parametrize("rolled", [False, True], ids=["in-memory", "on-disk"])
+def test_file_view_exposes_spooled_upload_without_reading(rolled: bool) -> None:
+    payload = os.urandom(200_000)
+    spool = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    spool.write(payload)
+    if rolled:
+        spool.rollover()
+    spool.seek(123)
+
+    with file_view(spool) as view:
+        assert isinstance(view, mmap.mmap if rolled else memoryview)
+        assert view[:] == payload
+
+    assert spool.tell() == 123
+    spool.close()
+
+
+class _ReadSpy(io.BytesIO):
+    def __init__(self, payload: bytes) -> None:
+        super().__init__(payload)
+        self.read_sizes: list[int] = []
+
+    def read(self, size: int | None = -1) -> bytes:
+        self.read_sizes.append(-1 if size is None else size)
+        return super().read(size)
+
+
+@pytest.mark.asyncio
+async def test_transcribe_streams_file_into_multipart_body() -> None:
+    payload = os.urandom(300_000)
+    upload = _ReadSpy(payload)
+    upload.seek(0, io.SEEK_END)
+    bodies: list[bytes] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(await request.aread())
+        return httpx.Response(200, json={"text": "ٹماٹر", "language": "urdu", "duration": 1.0, "segments": []})
+
+    service = AsyncOpenAIService.__new__(AsyncOpenAIService)
+    service._client = AsyncOpenAI(  # type: ignore[attr-defined]
+        api_key="test", http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    )
+    service._stt_model = "whisper-1"  # type: ignore[attr-defined]
+
+    result = await service.transcribe_audio(audio_file=upload, filename="q.webm", language="ur")
+
+    assert result.text == "ٹماٹر"
+    assert payload in bodies[0]
+    # httpx rewound the file and pulled it in bounded chunks rather than one read().
+    assert upload.read_sizes and all(0 < size <= 64 * 1024 for size in upload.read_sizes)
+
+
+class _RecordingService:
+    def __init__(self) -> None:
+        self.upload: dict[str, object] = {}
+
+    async def transcribe_audio(self, **kwargs: object) -> TranscriptionResult:
+        self.upload = {**kwargs, "content": kwargs["audio_file"].read()}  # type: ignore[union-attr]
+        return TranscriptionResult(text="ٹماٹر کا ریٹ؟", model="whisper-1", language="ur", confidence=0.9)
+
+    async def generate_response(self, **_: object) -> LLMResult:
+        return LLMResult(text="ٹماٹر 220 روپے فی کلو ہے۔", model="gpt-5-mini")
+
+    async def synthesize_speech(self, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"fake", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def test_voice_interact_passes_upload_file_to_stt(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _RecordingService()
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+    payload = b"\x1a\x45\xdf\xa3" + os.urandom(50_000)
+
+    response = TestClient(create_app()).post(
+        "/v1/voice-interact", files={"audio": ("q.webm", payload, "audio/webm")}
+    )
+
+    assert response.status_code == 200
+    assert service.upload["audio_bytes"] is None
+    assert service.upload["content"] == payload
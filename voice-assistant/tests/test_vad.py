@@ -0,0 +1,99 @@
+"""Tests for silence trimming and the no-speech short-circuit."""
+
+from __future__ import annotations
+
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from app.audio.normalize import normalize_audio
+from app.audio.vad import SpeechDetector
+from app.graph.voice_graph import UNHEARD_REPLY, run_voice_graph
+from app.services.openai_client import SpeechResult
+
+RATE = 16_000
+
+
+def _clip(lead: float, speech: float, tail: float, noise_dbfs: float = -70.0) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    total = int((lead + speech + tail) * RATE)
+    samples = rng.normal(0, 10 ** (noise_dbfs / 20), total).astype(np.float32)
+    start = int(lead * RATE)
+    t = np.arange(int(speech * RATE)) / RATE
+    samples[start : start + len(t)] += (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    return samples
+
+
+def _wav(samples: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(RATE)
+        wf.writeframes((samples * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def test_find_speech_trims_to_padded_span() -> None:
+    detector = SpeechDetector(padding_ms=100)
+
+    start, end = detector.find_speech(_clip(3.0, 1.5, 3.5), RATE)
+
+    assert start == pytest.approx(2.9 * RATE, abs=RATE * 0.02)
+    assert end == pytest.approx(4.6 * RATE, abs=RATE * 0.02)
+
+
+@pytest.mark.parametrize(
+    "samples",
+    [np.zeros(RATE * 2, dtype=np.float32), _clip(2.0, 0.0, 0.0, noise_dbfs=-50.0), _clip(1.0, 0.06, 1.0)],
+    ids=["digital-silence", "background-noise", "click"],
+)
+def test_find_speech_rejects_clips_without_speech(samples: np.ndarray) -> None:
+    assert SpeechDetector().find_speech(samples, RATE) is None
+
+
+def test_find_speech_keeps_clip_that_is_speech_throughout() -> None:
+    samples = _clip(0.0, 2.0, 0.0)
+
+    assert SpeechDetector().find_speech(samples, RATE) == (0, len(samples))
+
+
+def test_normalize_trims_silence() -> None:
+    source = _wav(_clip(3.0, 2.0, 3.0))
+
+    result = normalize_audio(source, filename="q.wav", mime_type="audio/wav", detector=SpeechDetector())
+
+    assert result.changed and result.speech_detected
+    assert result.trimmed_seconds == pytest.approx(5.5, abs=0.05)
+    assert len(result.audio_bytes) < len(source) * 0.35
+
+
+class _SilentClipService:
+    async def transcribe_audio(self, **_: object) -> None:
+        raise AssertionError("silent clips must not be uploaded")
+
+    async def generate_response(self, **_: object) -> None:
+        raise AssertionError("silent clips must not reach the LLM")
+
+    async def synthesize_speech(self, **kwargs: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"pinned", model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+@pytest.mark.asyncio
+async def test_silent_clip_short_circuits_to_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: _SilentClipService())
+
+    result = await run_voice_graph(
+        {
+            "audio_bytes": _wav(_clip(8.0, 0.0, 0.0)),
+            "audio_filename": "silence.wav",
+            "audio_mime_type": "audio/wav",
+            "language": "ur",
+        }
+    )
+
+    assert result["speech_detected"] is False
+    assert result["transcript"] == ""
+    assert result["response_text"] == UNHEARD_REPLY
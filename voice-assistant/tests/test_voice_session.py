@@ -0,0 +1,82 @@
+"""Tests for end-of-speech detection and the WebSocket voice session."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.audio.endpointing import EndOfSpeechDetector
+from app.main import create_app
+from app.services.openai_client import SpeechResult, TranscriptionResult
+
+
+RATE = 16_000
+
+
+def _tone(seconds: float) -> bytes:
+    t = np.arange(int(RATE * seconds)) / RATE
+    return (np.sin(2 * np.pi * 220 * t) * 8000).astype("<i2").tobytes()
+
+
+def _silence(seconds: float) -> bytes:
+    return np.zeros(int(RATE * seconds), dtype="<i2").tobytes()
+
+
+class _SessionService:
+    def __init__(self) -> None:
+        self.transcribed: list[int] = []
+
+    async def transcribe_audio(self, *, audio_bytes: bytes, **_: object) -> TranscriptionResult:
+        self.transcribed.append(len(audio_bytes))
+        return TranscriptionResult(text="گندم؟", model="whisper-1", language="ur", confidence=0.8)
+
+    async def stream_response(self, **_: object):
+        yield "گندم کی بوائی نومبر میں کریں۔"
+
+    async def synthesize_speech(self, *, text: str, **_: object) -> SpeechResult:
+        return SpeechResult(audio_bytes=b"mp3:" + text.encode("utf-8"), model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def test_detector_closes_utterance_after_trailing_silence() -> None:
+    detector = EndOfSpeechDetector(sample_rate=RATE, silence_ms=300)
+
+    assert detector.feed(_silence(1.0)) is None
+    assert detector.feed(_tone(0.5)) is None
+    assert detector.in_speech
+
+    utterance = detector.feed(_silence(0.4) + _tone(0.1))
+    assert utterance is not None
+    # 200 ms pre-roll + 500 ms tone + 300 ms closing silence; the rest of the lead-in is dropped.
+    assert len(utterance) == int(1.0 * RATE) * 2
+    assert detector.flush() is None  # the trailing 100 ms blip is too short to count
+
+
+def test_voice_session_handles_multiple_turns(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _SessionService()
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+    monkeypatch.setattr("app.graph.voice_stream.get_async_openai_service", lambda: service)
+    client = TestClient(create_app())
+
+    with client.websocket_connect("/v1/voice-session?language=ur") as ws:
+        assert ws.receive_json()["type"] == "ready"
+
+        for turn in range(2):
+            ws.send_bytes(_tone(0.4))
+            ws.send_bytes(_silence(1.0))
+
+            assert ws.receive_json()["type"] == "speech_end"
+            assert ws.receive_json()["type"] == "transcript"
+            assert ws.receive_json()["type"] == "text"
+            header = ws.receive_json()
+            assert header["type"] == "audio"
+            audio = ws.receive_bytes()
+            assert len(audio) == header["bytes"]
+            done = ws.receive_json()
+            assert done["type"] == "done"
+            assert done["turn"] == turn
+            assert done["metadata"]["time_to_first_audio_ms"] is not None
+
+        ws.send_json({"type": "stop"})
+
+    assert len(service.transcribed) == 2
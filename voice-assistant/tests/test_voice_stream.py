@@ -0,0 +1,70 @@
+"""Tests for the sentence-pipelined streaming voice loop."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.graph.voice_stream import SentenceChunker, stream_voice_reply
+from app.services.openai_client import SpeechResult, TranscriptionResult
+
+
+class _StreamingService:
+    def __init__(self, transcript: str, deltas: list[str]) -> None:
+        self._transcript = transcript
+        self._deltas = deltas
+        self.calls: list[str] = []
+
+    async def transcribe_audio(self, **_: object) -> TranscriptionResult:
+        return TranscriptionResult(text=self._transcript, model="whisper-1", language="ur", confidence=0.9)
+
+    async def stream_response(self, **_: object):
+        for delta in self._deltas:
+            await asyncio.sleep(0)
+            self.calls.append(f"delta:{delta}")
+            yield delta
+        self.calls.append("stream-done")
+
+    async def synthesize_speech(self, *, text: str, **_: object) -> SpeechResult:
+        self.calls.append(f"tts:{text}")
+        return SpeechResult(audio_bytes=text.encode("utf-8"), model="gpt-4o-mini-tts", voice="alloy", format="mp3")
+
+
+def test_sentence_chunker_waits_for_whitespace_after_terminator() -> None:
+    chunker = SentenceChunker()
+
+    assert chunker.feed("Use 2.") == []
+    assert chunker.feed("5 kg urea. Water") == ["Use 2.5 kg urea."]
+    assert chunker.feed(" daily۔ ") == ["Water daily۔"]
+    assert chunker.feed("Done") == []
+    assert chunker.flush() == "Done"
+    assert chunker.flush() is None
+
+
+@pytest.mark.asyncio
+async def test_stream_voice_reply_synthesises_before_stream_finishes(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _StreamingService("ٹماٹر؟", ["پہلا جملہ۔ ", "دوسرا ", "جملہ۔"])
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+    monkeypatch.setattr("app.graph.voice_stream.get_async_openai_service", lambda: service)
+
+    events = [event async for event in stream_voice_reply({"audio_bytes": b"x", "language": "ur"})]
+
+    kinds = [event.event for event in events]
+    assert kinds == ["transcript", "text", "audio", "text", "audio", "done"]
+    assert [e.data["audio_bytes"].decode("utf-8") for e in events if e.event == "audio"] == ["پہلا جملہ۔", "دوسرا جملہ۔"]
+    assert service.calls.index("tts:پہلا جملہ۔") < service.calls.index("stream-done")
+    assert events[-1].data["response_text"] == "پہلا جملہ۔ دوسرا جملہ۔"
+    assert "audio_bytes" not in events[-1].data
+
+
+@pytest.mark.asyncio
+async def test_stream_voice_reply_empty_transcript_skips_llm(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _StreamingService("", ["unused."])
+    monkeypatch.setattr("app.graph.voice_graph.get_async_openai_service", lambda: service)
+    monkeypatch.setattr("app.graph.voice_stream.get_async_openai_service", lambda: service)
+
+    events = [event async for event in stream_voice_reply({"audio_bytes": b"x", "language": "ur"})]
+
+    assert [event.event for event in events] == ["transcript", "text", "audio", "done"]
+    assert not any(call.startswith("delta:") for call in service.calls)